@@ -1,6 +1,6 @@
 """Log Analyzer MCP Server - Analyze and debug log files.
 
-This MCP server provides 14 tools for intelligent log file analysis:
+This MCP server provides 18 tools for intelligent log file analysis:
 - log_analyzer_parse: Parse and detect log format
 - log_analyzer_search: Search patterns with context
 - log_analyzer_extract_errors: Extract errors with stack traces
@@ -12,9 +12,13 @@ This MCP server provides 14 tools for intelligent log file analysis:
 - log_analyzer_suggest_patterns: Suggest useful search patterns
 - log_analyzer_trace: Extract and correlate trace/request IDs
 - log_analyzer_multi: Multi-file analysis (merge, correlate, compare)
+- log_analyzer_pod_logs: Kubernetes pod log directory analysis per pod and container
 - log_analyzer_ask: Natural language query interface
 - log_analyzer_scan_sensitive: Detect PII, credentials, API keys in logs
 - log_analyzer_suggest_format: Analyze file and suggest best parsing format
+- log_analyzer_register_format: Register a custom format from a grok pattern
+- log_analyzer_sequence: Match "A followed by B within T" event sequences per key
+- log_analyzer_redact: Write a redacted copy of a log file
 """
 
 __version__ = "0.4.2"
@@ -40,8 +44,12 @@ from codesdevs_log_analyzer.server import (
     log_analyzer_extract_errors,
     log_analyzer_multi,
     log_analyzer_parse,
+    log_analyzer_pod_logs,
+    log_analyzer_redact,
+    log_analyzer_register_format,
     log_analyzer_scan_sensitive,
     log_analyzer_search,
+    log_analyzer_sequence,
     log_analyzer_suggest_format,
     log_analyzer_suggest_patterns,
     log_analyzer_summarize,
@@ -69,10 +77,14 @@ __all__ = [
     "log_analyzer_watch",
     "log_analyzer_suggest_patterns",
     "log_analyzer_suggest_format",
+    "log_analyzer_register_format",
     "log_analyzer_scan_sensitive",
     "log_analyzer_trace",
     "log_analyzer_multi",
+    "log_analyzer_pod_logs",
     "log_analyzer_ask",
+    "log_analyzer_sequence",
+    "log_analyzer_redact",
     # Models
     "LogFormat",
     "ResponseFormat",
@@ -1,11 +1,18 @@
 """Analyzer modules for log processing."""
 
+from codesdevs_log_analyzer.analyzers.aho_corasick import AhoCorasick
 from codesdevs_log_analyzer.analyzers.correlator import (
     CorrelationResult,
     CorrelationWindow,
     Correlator,
+    MultiAnchorCorrelator,
+    MultiCorrelationResult,
     StreamingCorrelator,
 )
+from codesdevs_log_analyzer.analyzers.drain import (
+    DrainMiner,
+    LogCluster,
+)
 from codesdevs_log_analyzer.analyzers.error_extractor import (
     ErrorExtractionResult,
     ErrorExtractor,
@@ -15,12 +22,14 @@ from codesdevs_log_analyzer.analyzers.log_watcher import (
     LogWatcher,
     WatchResult,
 )
+from codesdevs_log_analyzer.analyzers.minhash import MinHashLSH
 from codesdevs_log_analyzer.analyzers.multi_file import (
     CorrelationCluster,
     MultiFileAnalyzer,
     MultiFileEntry,
     MultiFileResult,
 )
+from codesdevs_log_analyzer.analyzers.normalizer import MessageNormalizer
 from codesdevs_log_analyzer.analyzers.pattern_matcher import (
     PatternMatcher,
     SearchMatch,
@@ -31,6 +40,13 @@ from codesdevs_log_analyzer.analyzers.pattern_suggester import (
     PatternSuggestionResult,
     SuggestedPattern,
 )
+from codesdevs_log_analyzer.analyzers.pod_logs import (
+    PodLogAnalyzer,
+    PodLogFile,
+    PodLogResult,
+    PodLogStats,
+)
+from codesdevs_log_analyzer.analyzers.precursors import PrecursorMiner, PrecursorSequence
 from codesdevs_log_analyzer.analyzers.query_translator import (
     QueryIntent,
     QueryResult,
@@ -42,10 +58,20 @@ from codesdevs_log_analyzer.analyzers.recommendation_engine import (
     RecommendationEngine,
 )
 from codesdevs_log_analyzer.analyzers.sensitive_detector import (
+    RedactionResult,
     SensitiveDataDetector,
     SensitiveDataResult,
     SensitiveMatch,
 )
+from codesdevs_log_analyzer.analyzers.sequence_matcher import (
+    SequenceMatch,
+    SequenceMatcher,
+    SequenceMatchResult,
+)
+from codesdevs_log_analyzer.analyzers.stack_trace import (
+    StackTrace,
+    StackTraceInterner,
+)
 from codesdevs_log_analyzer.analyzers.summarizer import (
     LogSummary,
     PerformanceMetrics,
@@ -64,6 +90,16 @@ __all__ = [
     "ErrorExtractor",
     "ErrorGroup",
     "ErrorExtractionResult",
+    # Message normalization
+    "MessageNormalizer",
+    # Template mining
+    "DrainMiner",
+    "LogCluster",
+    # Near-duplicate merging
+    "MinHashLSH",
+    # Stack trace fingerprinting
+    "StackTrace",
+    "StackTraceInterner",
     # Pattern matching
     "PatternMatcher",
     "SearchMatch",
@@ -73,11 +109,21 @@ __all__ = [
     "LogSummary",
     "PerformanceMetrics",
     "SecurityIndicators",
+    # Multi-literal matching
+    "AhoCorasick",
     # Correlation
     "Correlator",
     "CorrelationWindow",
     "CorrelationResult",
     "StreamingCorrelator",
+    "MultiAnchorCorrelator",
+    "MultiCorrelationResult",
+    "PrecursorMiner",
+    "PrecursorSequence",
+    # Sequence matching
+    "SequenceMatcher",
+    "SequenceMatch",
+    "SequenceMatchResult",
     # Log watching
     "LogWatcher",
     "WatchResult",
@@ -95,6 +141,11 @@ __all__ = [
     "MultiFileEntry",
     "MultiFileResult",
     "CorrelationCluster",
+    # Pod log directories
+    "PodLogAnalyzer",
+    "PodLogFile",
+    "PodLogResult",
+    "PodLogStats",
     # Recommendation engine
     "RecommendationEngine",
     "CausalChain",
@@ -104,6 +155,7 @@ __all__ = [
     "QueryIntent",
     "QueryResult",
     # Sensitive data detection
+    "RedactionResult",
     "SensitiveDataDetector",
     "SensitiveDataResult",
     "SensitiveMatch",
@@ -1,19 +1,103 @@
 """Correlator analyzer - Correlate events around anchor points."""
 
+import heapq
 import re
-from collections import Counter
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter, deque
 from collections.abc import Iterator
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from ..parsers.base import BaseLogParser, ParsedLogEntry
+from .precursors import PrecursorMiner, PrecursorSequence
 from .recommendation_engine import CausalChain, RecommendationEngine
 
 # Output limits
 MAX_ANCHORS = 10
 MAX_EVENTS_PER_WINDOW = 100
-MAX_PRECURSORS = 10
+
+# Evicted slots of the time index are compacted once this many accumulate
+# (and they make up half the index)
+COMPACT_THRESHOLD = 4096
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = _EPOCH.replace(tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _epoch_us(timestamp: datetime) -> int:
+    """Microseconds since the epoch (naive timestamps are taken as UTC)."""
+    epoch = _EPOCH if timestamp.tzinfo is None else _EPOCH_UTC
+    return (timestamp - epoch) // _MICROSECOND
+
+
+def _sort_time(entry: ParsedLogEntry) -> int:
+    """Sort key of a timestamped entry."""
+    return _epoch_us(entry.timestamp) if entry.timestamp is not None else 0
+
+
+class _TimeIndex:
+    """
+    Timestamped entries in time order, searchable by bisecting epoch keys.
+
+    Keys live in a compact int64 array parallel to the entry list. Entries
+    arriving in order are appended; out-of-order entries are either sorted
+    in once before the first search (sort) or inserted in place (insort,
+    for ring buffers that are searched while filling). Evicting the oldest
+    entries only advances a start offset; the evicted slots are dropped in
+    bulk, so eviction is amortized O(1).
+    """
+
+    def __init__(self) -> None:
+        self.times = array("q")
+        self.entries: list[ParsedLogEntry] = []
+        self.start = 0
+        self._sorted = True
+
+    def __len__(self) -> int:
+        return len(self.entries) - self.start
+
+    def add(self, epoch: int, entry: ParsedLogEntry, insort: bool = False) -> None:
+        """Add an entry; out of order it is inserted in place or the index marked unsorted."""
+        if not self.times or epoch >= self.times[-1]:
+            self.times.append(epoch)
+            self.entries.append(entry)
+        elif insort:
+            i = bisect_right(self.times, epoch, self.start)
+            self.times.insert(i, epoch)
+            self.entries.insert(i, entry)
+        else:
+            self.times.append(epoch)
+            self.entries.append(entry)
+            self._sorted = False
+
+    def sort(self) -> None:
+        """Restore time order after out-of-order adds (stable, keeps file order on ties)."""
+        if self._sorted:
+            return
+        times, entries = self.times, self.entries
+        order = sorted(range(self.start, len(entries)), key=times.__getitem__)
+        self.times = array("q", (times[i] for i in order))
+        self.entries = [entries[i] for i in order]
+        self.start = 0
+        self._sorted = True
+
+    def between(self, start: int, end: int) -> Iterator[tuple[int, ParsedLogEntry]]:
+        """Entries with start <= epoch <= end, in time order."""
+        lo = bisect_left(self.times, start, self.start)
+        hi = bisect_right(self.times, end, lo)
+        for i in range(lo, hi):
+            yield self.times[i], self.entries[i]
+
+    def evict_before(self, epoch: int) -> None:
+        """Forget entries older than an epoch."""
+        self.start = bisect_left(self.times, epoch, self.start)
+        if self.start >= COMPACT_THRESHOLD and self.start * 2 >= len(self.entries):
+            del self.times[: self.start]
+            del self.entries[: self.start]
+            self.start = 0
 
 
 @dataclass
@@ -88,6 +172,7 @@ class CorrelationResult:
     total_anchors: int = 0
     windows: list[CorrelationWindow] = field(default_factory=list)
     common_precursors: list[str] = field(default_factory=list)
+    precursor_sequences: list[PrecursorSequence] = field(default_factory=list)
     truncated: bool = False
     # Causal analysis aggregates
     recommendations: list[str] = field(default_factory=list)
@@ -101,6 +186,7 @@ class CorrelationResult:
             "total_anchors": self.total_anchors,
             "windows": [w.to_dict() for w in self.windows],
             "common_precursors": self.common_precursors,
+            "precursor_sequences": [p.to_dict() for p in self.precursor_sequences],
             "truncated": self.truncated,
         }
 
@@ -117,14 +203,85 @@ class CorrelationResult:
         return result
 
 
+# Source prefix of a message such as "db-1: connection lost"
+_SOURCE_PREFIX = re.compile(r"^(\S+):")
+
+
+def _entry_source(entry: ParsedLogEntry) -> str | None:
+    """Extract source identifier from entry."""
+    # Try common metadata fields
+    metadata = entry.metadata
+    for key in ["hostname", "host", "source", "process", "service", "container", "pod"]:
+        if key in metadata:
+            return str(metadata[key])
+
+    # Try to extract from message
+    # Look for common patterns like "hostname:" or "[service]"
+    match = _SOURCE_PREFIX.search(entry.message)
+    if match:
+        return match.group(1)
+
+    return None
+
+
+def _correlation_result(
+    anchor_pattern: str,
+    total_anchors: int,
+    windows: list[CorrelationWindow],
+    miner: PrecursorMiner,
+    key: str = "",
+) -> CorrelationResult:
+    """Aggregate precursors and causal chains of finished windows into a result."""
+    # Aggregate causal chain results
+    recommendations: list[str] = []
+    root_cause_hypotheses: list[str] = []
+    causal_chain_detected = False
+
+    for window in windows:
+        if window.causal_chain:
+            causal_chain_detected = True
+            if window.causal_chain.root_cause_hypothesis:
+                root_cause_hypotheses.append(window.causal_chain.root_cause_hypothesis)
+            for rec in window.causal_chain.recommendations:
+                if rec not in recommendations:
+                    recommendations.append(rec)
+
+    # Generate root cause summary
+    root_cause_summary: str | None = None
+    if root_cause_hypotheses:
+        # Count unique hypotheses and pick most common
+        hypothesis_counts: Counter[str] = Counter(root_cause_hypotheses)
+        most_common = hypothesis_counts.most_common(1)
+        if most_common:
+            root_cause_summary = most_common[0][0]
+
+    return CorrelationResult(
+        anchor_pattern=anchor_pattern,
+        total_anchors=total_anchors,
+        windows=windows,
+        common_precursors=miner.common_precursors(key),
+        precursor_sequences=miner.sequences(key),
+        truncated=total_anchors > len(windows),
+        recommendations=recommendations[:10],  # Limit to top 10
+        root_cause_summary=root_cause_summary,
+        causal_chain_detected=causal_chain_detected,
+    )
+
+
 class Correlator:
     """
     Event correlator that finds events around anchor points.
 
     Two-pass algorithm:
-    1. First pass: Find all anchor points
+    1. First pass: Find anchor points while indexing entries by time
     2. Second pass: Collect events in time windows around anchors
 
+    Entries are kept in a time-sorted index (epoch array plus bisect), so a
+    window costs O(log n + window size) instead of a scan of every entry.
+    With time_ordered=True the index is a ring buffer: windows are built as
+    soon as their after-window has passed and older entries are evicted, so
+    memory is bounded by the window width instead of the file size.
+
     Features:
     - Pattern-based anchor detection
     - Time-window correlation
@@ -145,6 +302,7 @@ class Correlator:
         case_sensitive: bool = False,
         detect_causal_chain: bool = True,
         include_recommendations: bool = True,
+        time_ordered: bool = False,
     ):
         """
         Initialize correlator.
@@ -158,6 +316,9 @@ class Correlator:
             case_sensitive: Case-sensitive pattern matching
             detect_causal_chain: Enable causal chain detection
             include_recommendations: Include actionable recommendations
+            time_ordered: Input is in time order; keep only the entries the
+                windows can still reach (ring buffer). Late entries are still
+                placed correctly while their windows are open
         """
         self.anchor_pattern_str = anchor_pattern
         self.window_before = timedelta(seconds=window_before)
@@ -167,6 +328,9 @@ class Correlator:
         self.case_sensitive = case_sensitive
         self.detect_causal_chain = detect_causal_chain
         self.include_recommendations = include_recommendations
+        self.time_ordered = time_ordered
+        self._before_us = self.window_before // _MICROSECOND
+        self._after_us = self.window_after // _MICROSECOND
 
         # Initialize recommendation engine if needed
         self._recommendation_engine: RecommendationEngine | None = None
@@ -186,9 +350,17 @@ class Correlator:
 
         # State for first pass
         self._anchors: list[ParsedLogEntry] = []
-        self._all_entries: list[ParsedLogEntry] = []  # For correlation
+        self._index = _TimeIndex()  # Timestamped entries for the windows
         self._total_anchors = 0
 
+        # Ring-buffer mode: windows built early, by anchor position, and the
+        # anchors still collecting after-events as (deadline, position, epoch)
+        self._built: dict[int, CorrelationWindow] = {}
+        self._pending: list[tuple[int, int, int]] = []
+
+        # Precursor templates and sequences (fed in time order)
+        self._miner = PrecursorMiner(self.window_before)
+
     def _is_anchor(self, entry: ParsedLogEntry) -> bool:
         """Check if entry matches anchor pattern."""
         return bool(self._pattern.search(entry.message) or self._pattern.search(entry.raw_line))
@@ -199,33 +371,6 @@ class Correlator:
             return False
         return entry.level.upper() in self.ERROR_LEVELS
 
-    def _get_source(self, entry: ParsedLogEntry) -> str | None:
-        """Extract source identifier from entry."""
-        # Try common metadata fields
-        metadata = entry.metadata
-        for key in ["hostname", "host", "source", "process", "service", "container", "pod"]:
-            if key in metadata:
-                return str(metadata[key])
-
-        # Try to extract from message
-        # Look for common patterns like "hostname:" or "[service]"
-        match = re.search(r"^(\S+):", entry.message)
-        if match:
-            return match.group(1)
-
-        return None
-
-    def _normalize_message(self, message: str) -> str:
-        """Normalize message for precursor grouping."""
-        # Replace numbers with <N>
-        result = re.sub(r"\b\d+\b", "<N>", message)
-        # Collapse whitespace
-        result = re.sub(r"\s+", " ", result)
-        # Truncate
-        if len(result) > 100:
-            result = result[:100] + "..."
-        return result.strip()
-
     def process_entry(self, entry: ParsedLogEntry) -> None:
         """
         Process a single log entry (first pass).
@@ -233,14 +378,44 @@ class Correlator:
         Args:
             entry: Parsed log entry
         """
-        # Store all entries for second pass
-        self._all_entries.append(entry)
+        timestamp = entry.timestamp
+        epoch = None if timestamp is None else _epoch_us(timestamp)
+        if epoch is not None and self._pending:
+            self._build_expired(epoch)
 
         # Check if this is an anchor
+        kept = False
         if self._is_anchor(entry):
             self._total_anchors += 1
             if len(self._anchors) < self.max_anchors:
                 self._anchors.append(entry)
+                kept = True
+                if self.time_ordered and epoch is not None:
+                    position = len(self._anchors) - 1
+                    heapq.heappush(self._pending, (epoch + self._after_us, position, epoch))
+
+        if kept and self.time_ordered:
+            self._miner.mark_anchor(epoch)
+
+        # Index entries for the windows (timestamp-less ones cannot fall in any)
+        if epoch is None:
+            return
+        if not self.time_ordered:
+            self._index.add(epoch, entry)
+            return
+        self._miner.add(epoch, entry.message)
+        if self._pending or len(self._anchors) < self.max_anchors:
+            self._index.add(epoch, entry, insort=True)
+            # Windows reach back window_before from their anchor; the heap's
+            # first anchor (earliest deadline) is also the earliest pending one
+            reach = min(epoch, self._pending[0][2]) if self._pending else epoch
+            self._index.evict_before(reach - self._before_us)
+
+    def _build_expired(self, epoch: int) -> None:
+        """Build the windows of pending anchors whose after-window ended before epoch."""
+        while self._pending and self._pending[0][0] < epoch:
+            _, position, _ = heapq.heappop(self._pending)
+            self._built[position] = self._build_window(self._anchors[position])
 
     def _build_window(self, anchor: ParsedLogEntry) -> CorrelationWindow:
         """Build correlation window around an anchor."""
@@ -250,40 +425,32 @@ class Correlator:
             # Can't correlate by time without timestamp
             return window
 
-        time_start = anchor.timestamp - self.window_before
-        time_end = anchor.timestamp + self.window_after
-
+        anchor_epoch = _epoch_us(anchor.timestamp)
         sources: set[str] = set()
 
-        for entry in self._all_entries:
+        # Entries come out of the index in time order
+        for epoch, entry in self._index.between(
+            anchor_epoch - self._before_us, anchor_epoch + self._after_us
+        ):
             if entry.line_number == anchor.line_number:
                 continue  # Skip anchor itself
 
-            if entry.timestamp is None:
-                continue
-
-            # Check if in time window
-            if time_start <= entry.timestamp <= time_end:
-                # Track source
-                source = self._get_source(entry)
-                if source:
-                    sources.add(source)
+            # Track source
+            source = _entry_source(entry)
+            if source:
+                sources.add(source)
 
-                # Categorize entry
-                if entry.timestamp < anchor.timestamp:
-                    if len(window.events_before) < MAX_EVENTS_PER_WINDOW:
-                        window.events_before.append(entry)
-                else:
-                    if len(window.events_after) < MAX_EVENTS_PER_WINDOW:
-                        window.events_after.append(entry)
-
-                # Track related errors
-                if self._is_error(entry):
-                    window.related_errors.append(entry)
+            # Categorize entry
+            if epoch < anchor_epoch:
+                if len(window.events_before) < MAX_EVENTS_PER_WINDOW:
+                    window.events_before.append(entry)
+            else:
+                if len(window.events_after) < MAX_EVENTS_PER_WINDOW:
+                    window.events_after.append(entry)
 
-        # Sort events by timestamp
-        window.events_before.sort(key=lambda e: e.timestamp or datetime.min)
-        window.events_after.sort(key=lambda e: e.timestamp or datetime.min)
+            # Track related errors
+            if self._is_error(entry):
+                window.related_errors.append(entry)
 
         window.unique_sources = list(sources)
 
@@ -296,28 +463,6 @@ class Correlator:
 
         return window
 
-    def _find_common_precursors(self, windows: list[CorrelationWindow]) -> list[str]:
-        """Find events that commonly appear before anchors."""
-        precursor_counts: Counter[str] = Counter()
-
-        for window in windows:
-            seen_in_window: set[str] = set()
-            for entry in window.events_before:
-                normalized = self._normalize_message(entry.message)
-                if normalized not in seen_in_window:
-                    seen_in_window.add(normalized)
-                    precursor_counts[normalized] += 1
-
-        # Return precursors that appear in >50% of windows
-        threshold = len(windows) * 0.5
-        common = [
-            msg
-            for msg, count in precursor_counts.most_common(MAX_PRECURSORS * 2)
-            if count >= threshold
-        ]
-
-        return common[:MAX_PRECURSORS]
-
     def finalize(self) -> CorrelationResult:
         """
         Finalize correlation and return results.
@@ -325,44 +470,30 @@ class Correlator:
         Returns:
             CorrelationResult with all correlation windows
         """
-        # Build windows for each anchor
-        windows = [self._build_window(anchor) for anchor in self._anchors]
-
-        # Find common precursors
-        common_precursors = self._find_common_precursors(windows)
-
-        # Aggregate causal chain results
-        recommendations: list[str] = []
-        root_cause_hypotheses: list[str] = []
-        causal_chain_detected = False
-
-        for window in windows:
-            if window.causal_chain:
-                causal_chain_detected = True
-                if window.causal_chain.root_cause_hypothesis:
-                    root_cause_hypotheses.append(window.causal_chain.root_cause_hypothesis)
-                for rec in window.causal_chain.recommendations:
-                    if rec not in recommendations:
-                        recommendations.append(rec)
-
-        # Generate root cause summary
-        root_cause_summary: str | None = None
-        if root_cause_hypotheses:
-            # Count unique hypotheses and pick most common
-            hypothesis_counts: Counter[str] = Counter(root_cause_hypotheses)
-            most_common = hypothesis_counts.most_common(1)
-            if most_common:
-                root_cause_summary = most_common[0][0]
-
-        return CorrelationResult(
-            anchor_pattern=self.anchor_pattern_str,
-            total_anchors=self._total_anchors,
-            windows=windows,
-            common_precursors=common_precursors,
-            truncated=self._total_anchors > len(windows),
-            recommendations=recommendations[:10],  # Limit to top 10
-            root_cause_summary=root_cause_summary,
-            causal_chain_detected=causal_chain_detected,
+        # Build windows for each anchor not built while streaming
+        self._index.sort()
+        if not self.time_ordered:
+            # Mine precursors in one pass over the time-sorted entries
+            kept = {id(anchor) for anchor in self._anchors}
+            for epoch, entry in zip(
+                self._index.times[self._index.start :],
+                self._index.entries[self._index.start :],
+                strict=True,
+            ):
+                if id(entry) in kept:
+                    self._miner.mark_anchor(epoch)
+                self._miner.add(epoch, entry.message)
+            for anchor in self._anchors:
+                if anchor.timestamp is None:
+                    self._miner.mark_anchor(None)
+        windows = [
+            self._built.get(position) or self._build_window(anchor)
+            for position, anchor in enumerate(self._anchors)
+        ]
+        self._pending = []
+
+        return _correlation_result(
+            self.anchor_pattern_str, self._total_anchors, windows, self._miner
         )
 
     def correlate_file(
@@ -398,65 +529,122 @@ class Correlator:
         return self.finalize()
 
 
-class StreamingCorrelator:
+@dataclass
+class MultiCorrelationResult:
+    """Result of correlating several named anchor patterns in one pass."""
+
+    anchors: dict[str, CorrelationResult] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {"anchors": {name: result.to_dict() for name, result in self.anchors.items()}}
+
+
+@dataclass
+class _AnchorState:
+    """Pattern and collected windows of one named anchor."""
+
+    name: str
+    pattern: re.Pattern[str]
+    total: int = 0
+    opened: int = 0  # Anchors given a window
+    windows: dict[int, CorrelationWindow] = field(default_factory=dict)  # By position
+
+
+class _WindowStream:
     """
-    Memory-efficient streaming correlator.
-    Uses sliding window instead of storing all entries.
-    Suitable for very large files where the standard Correlator would use too much memory.
+    One-pass window collection shared by the streaming correlators.
+
+    Entries within window_before seconds of the newest one are kept in a
+    deque and evicted from the left as time advances (amortized O(1) per
+    entry). Anchors collecting after-events wait in a heap ordered by their
+    deadline, so expired windows are closed without rescanning the others.
+    All anchor patterns share the buffer and the pending windows, so an
+    event inside overlapping windows is buffered and visited once and the
+    windows hold references to the same entry. Entries arriving slightly
+    out of order (merged files) are still classified by their timestamp:
+    a late entry from before an open window's anchor joins its
+    before-events, and causal chains are built once a window closes.
     """
 
     ERROR_LEVELS = {"ERROR", "FATAL", "CRITICAL", "EMERGENCY", "SEVERE"}
 
     def __init__(
         self,
-        anchor_pattern: str,
-        window_before: int = 60,
-        window_after: int = 30,
-        max_anchors: int = MAX_ANCHORS,
-        regex: bool = True,
-        case_sensitive: bool = False,
+        anchors: dict[str, str],
+        window_before: int,
+        window_after: int,
+        max_anchors: int,
+        regex: bool,
+        case_sensitive: bool,
+        detect_causal_chain: bool,
+        include_recommendations: bool,
     ):
-        """
-        Initialize streaming correlator.
-
-        Args:
-            anchor_pattern: Pattern to find anchor events
-            window_before: Seconds before anchor to analyze
-            window_after: Seconds after anchor to analyze
-            max_anchors: Maximum anchor events to analyze
-            regex: Treat pattern as regex
-            case_sensitive: Case-sensitive pattern matching
-        """
-        self.anchor_pattern_str = anchor_pattern
+        if not anchors:
+            raise ValueError("At least one anchor pattern is required")
         self.window_before_secs = window_before
         self.window_after_secs = window_after
         self.max_anchors = min(max_anchors, MAX_ANCHORS)
+        self.detect_causal_chain = detect_causal_chain
+        self.include_recommendations = include_recommendations
+        self._window_before = timedelta(seconds=window_before)
+        # Windows are compared as epoch microseconds, so naive and tz-aware
+        # timestamps mix
+        self._before_us = self._window_before // _MICROSECOND
+        self._after_us = timedelta(seconds=window_after) // _MICROSECOND
 
-        # Compile pattern
+        self._recommendation_engine: RecommendationEngine | None = None
+        if detect_causal_chain or include_recommendations:
+            self._recommendation_engine = RecommendationEngine()
+
+        # Compile patterns
         flags = 0 if case_sensitive else re.IGNORECASE
-        if regex:
+        expressions = {
+            name: pattern if regex else re.escape(pattern) for name, pattern in anchors.items()
+        }
+        self._anchors: list[_AnchorState] = []
+        for name, source in expressions.items():
             try:
-                self._pattern = re.compile(anchor_pattern, flags)
+                self._anchors.append(_AnchorState(name, re.compile(source, flags)))
             except re.error as e:
                 raise ValueError(f"Invalid regex pattern: {e}") from e
-        else:
-            escaped = re.escape(anchor_pattern)
-            self._pattern = re.compile(escaped, flags)
-
-        # State
-        self._total_anchors = 0
-        self._windows: list[CorrelationWindow] = []
 
-        # Sliding window buffer (entries within window_before seconds)
-        self._buffer: list[ParsedLogEntry] = []
-        self._buffer_start_time: datetime | None = None
-
-        # Pending anchors waiting for after-events
-        self._pending_anchors: list[tuple[CorrelationWindow, datetime]] = []  # (window, deadline)
-
-    def _is_anchor(self, entry: ParsedLogEntry) -> bool:
-        """Check if entry matches anchor pattern."""
-        return bool(self._pattern.search(entry.message) or self._pattern.search(entry.raw_line))
+        # Most lines match no anchor; one search of the combined alternation
+        # rules them out before each pattern is tried. Patterns that cannot
+        # be combined (backreferences, duplicate group names) skip it.
+        self._prefilter: re.Pattern[str] | None = None
+        if len(expressions) > 1:
+            try:
+                combined = "|".join(f"(?:{source})" for source in expressions.values())
+                self._prefilter = re.compile(combined, flags)
+            except re.error:
+                self._prefilter = None
+
+        # Sliding window buffer: (epoch, entry) within window_before seconds
+        self._buffer: deque[tuple[int, ParsedLogEntry]] = deque()
+        self._open_slots = self.max_anchors * len(self._anchors)
+
+        # Windows still collecting after-events:
+        # (deadline, sequence, anchor epoch, anchor state, position, window, sources)
+        self._pending: list[
+            tuple[int, int, int, _AnchorState, int, CorrelationWindow, set[str]]
+        ] = []
+        self._sequence = 0
+
+        # Precursor templates and sequences, keyed by anchor name
+        self._miner = PrecursorMiner(self._window_before)
+
+    def _matching_anchors(self, entry: ParsedLogEntry) -> list[_AnchorState]:
+        """Anchor patterns the entry matches."""
+        if self._prefilter is not None and not (
+            self._prefilter.search(entry.message) or self._prefilter.search(entry.raw_line)
+        ):
+            return []
+        return [
+            anchor
+            for anchor in self._anchors
+            if anchor.pattern.search(entry.message) or anchor.pattern.search(entry.raw_line)
+        ]
 
     def _is_error(self, entry: ParsedLogEntry) -> bool:
         """Check if entry is an error."""
@@ -464,30 +652,76 @@ class StreamingCorrelator:
             return False
         return entry.level.upper() in self.ERROR_LEVELS
 
-    def _prune_buffer(self, current_time: datetime) -> None:
-        """Remove old entries from buffer."""
-        cutoff = current_time - timedelta(seconds=self.window_before_secs)
-        self._buffer = [e for e in self._buffer if e.timestamp and e.timestamp >= cutoff]
-
-    def _finalize_pending(self, current_time: datetime | None) -> None:
-        """Finalize pending anchors whose after-window has expired."""
-        if current_time is None:
-            # Finalize all pending
-            for window, _ in self._pending_anchors:
-                if len(self._windows) < self.max_anchors:
-                    self._windows.append(window)
-            self._pending_anchors = []
+    def _prune_buffer(self, epoch: int) -> None:
+        """Evict entries older than window_before from the left of the buffer."""
+        cutoff = epoch - self._before_us
+        buffer = self._buffer
+        while buffer and buffer[0][0] < cutoff:
+            buffer.popleft()
+
+    def _close_expired(self, epoch: int) -> None:
+        """Close windows whose after-window ended before epoch."""
+        while self._pending and self._pending[0][0] < epoch:
+            _, _, _, anchor, position, window, sources = heapq.heappop(self._pending)
+            self._close(anchor, position, window, sources)
+
+    def _close(
+        self,
+        anchor: _AnchorState,
+        position: int,
+        window: CorrelationWindow,
+        sources: set[str],
+    ) -> None:
+        """Store a finished window, building its causal chain from the final before-events."""
+        window.unique_sources = list(sources)
+        if self.detect_causal_chain and self._recommendation_engine:
+            window.causal_chain = self._recommendation_engine.build_causal_chain(
+                anchor=window.anchor_entry,
+                events_before=window.events_before,
+            )
+        anchor.windows[position] = window
+
+    def _open_window(self, anchor: _AnchorState, entry: ParsedLogEntry, epoch: int | None) -> None:
+        """Start a window from the buffered before-events."""
+        position = anchor.opened
+        anchor.opened += 1
+        self._open_slots -= 1
+        window = CorrelationWindow(anchor_entry=entry)
+        if epoch is None:
+            # Can't correlate by time without timestamp
+            anchor.windows[position] = window
             return
 
-        still_pending = []
-        for window, deadline in self._pending_anchors:
-            if current_time > deadline:
-                # Window complete
-                if len(self._windows) < self.max_anchors:
-                    self._windows.append(window)
-            else:
-                still_pending.append((window, deadline))
-        self._pending_anchors = still_pending
+        sources: set[str] = set()
+        start = epoch - self._before_us
+        for event_epoch, event in self._buffer:
+            if event_epoch < start:
+                continue  # Arrived out of order
+            self._add_event(window, sources, event, before=event_epoch < epoch)
+
+        deadline = epoch + self._after_us
+        self._sequence += 1
+        heapq.heappush(
+            self._pending, (deadline, self._sequence, epoch, anchor, position, window, sources)
+        )
+
+    def _add_event(
+        self, window: CorrelationWindow, sources: set[str], entry: ParsedLogEntry, before: bool
+    ) -> None:
+        source = _entry_source(entry)
+        if source:
+            sources.add(source)
+        # Kept in time order even when entries arrive slightly out of order
+        # (merged files), so the earliest MAX_EVENTS_PER_WINDOW are kept
+        events = window.events_before if before else window.events_after
+        if not events or _sort_time(events[-1]) <= _sort_time(entry):
+            if len(events) < MAX_EVENTS_PER_WINDOW:
+                events.append(entry)
+        else:
+            insort(events, entry, key=_sort_time)
+            del events[MAX_EVENTS_PER_WINDOW:]
+        if self._is_error(entry):
+            window.related_errors.append(entry)
 
     def process_entry(self, entry: ParsedLogEntry) -> None:
         """
@@ -496,46 +730,96 @@ class StreamingCorrelator:
         Args:
             entry: Parsed log entry
         """
-        current_time = entry.timestamp
+        epoch = None if entry.timestamp is None else _epoch_us(entry.timestamp)
+
+        if epoch is not None:
+            self._prune_buffer(epoch)
+            self._close_expired(epoch)
+
+            # Every window still pending has not reached its deadline; entries
+            # arriving out of order may still belong before its anchor or
+            # before its start
+            for _, _, anchor_epoch, _, _, window, sources in self._pending:
+                if epoch < anchor_epoch - self._before_us:
+                    continue
+                self._add_event(window, sources, entry, before=epoch < anchor_epoch)
+
+        for anchor in self._matching_anchors(entry):
+            anchor.total += 1
+            if anchor.opened < self.max_anchors:
+                self._open_window(anchor, entry, epoch)
+                self._miner.mark_anchor(epoch, anchor.name)
+        if epoch is not None:
+            self._miner.add(epoch, entry.message)
+
+        # Buffer for future anchors' before-events (none can come once all
+        # windows are taken)
+        if epoch is not None and self._open_slots > 0:
+            self._buffer.append((epoch, entry))
+
+    def _finish(self) -> dict[str, CorrelationResult]:
+        """Close all pending windows and aggregate each anchor's result."""
+        for _, _, _, anchor, position, window, sources in self._pending:
+            self._close(anchor, position, window, sources)
+        self._pending = []
+        self._buffer.clear()
+
+        return {
+            anchor.name: _correlation_result(
+                anchor.pattern.pattern,
+                anchor.total,
+                [anchor.windows[position] for position in sorted(anchor.windows)],
+                self._miner,
+                anchor.name,
+            )
+            for anchor in self._anchors
+        }
 
-        if current_time:
-            # Prune old entries from buffer
-            self._prune_buffer(current_time)
 
-            # Finalize expired pending anchors
-            self._finalize_pending(current_time)
+class StreamingCorrelator(_WindowStream):
+    """
+    Memory-efficient streaming correlator for time-ordered input.
 
-            # Add to pending anchor windows (after-events)
-            for window, deadline in self._pending_anchors:
-                if current_time <= deadline:
-                    if len(window.events_after) < MAX_EVENTS_PER_WINDOW:
-                        window.events_after.append(entry)
-                    if self._is_error(entry):
-                        window.related_errors.append(entry)
+    Memory depends on the window width, not on the file size (see
+    _WindowStream), and windows get the same causal chains, precursors and
+    recommendations as Correlator.
+    """
 
-        # Check if this is an anchor
-        if self._is_anchor(entry):
-            self._total_anchors += 1
+    def __init__(
+        self,
+        anchor_pattern: str,
+        window_before: int = 60,
+        window_after: int = 30,
+        max_anchors: int = MAX_ANCHORS,
+        regex: bool = True,
+        case_sensitive: bool = False,
+        detect_causal_chain: bool = True,
+        include_recommendations: bool = True,
+    ):
+        """
+        Initialize streaming correlator.
 
-            if len(self._windows) + len(self._pending_anchors) < self.max_anchors:
-                # Create new window with buffer contents as before-events
-                window = CorrelationWindow(
-                    anchor_entry=entry,
-                    events_before=list(self._buffer),
-                    events_after=[],
-                    related_errors=[e for e in self._buffer if self._is_error(e)],
-                )
-
-                if current_time:
-                    deadline = current_time + timedelta(seconds=self.window_after_secs)
-                    self._pending_anchors.append((window, deadline))
-                else:
-                    # No timestamp, can't collect after-events
-                    self._windows.append(window)
-
-        # Add to buffer for future anchor before-events
-        if current_time:
-            self._buffer.append(entry)
+        Args:
+            anchor_pattern: Pattern to find anchor events
+            window_before: Seconds before anchor to analyze
+            window_after: Seconds after anchor to analyze
+            max_anchors: Maximum anchor events to analyze
+            regex: Treat pattern as regex
+            case_sensitive: Case-sensitive pattern matching
+            detect_causal_chain: Enable causal chain detection
+            include_recommendations: Include actionable recommendations
+        """
+        super().__init__(
+            {anchor_pattern: anchor_pattern},
+            window_before=window_before,
+            window_after=window_after,
+            max_anchors=max_anchors,
+            regex=regex,
+            case_sensitive=case_sensitive,
+            detect_causal_chain=detect_causal_chain,
+            include_recommendations=include_recommendations,
+        )
+        self.anchor_pattern_str = anchor_pattern
 
     def finalize(self) -> CorrelationResult:
         """
@@ -544,16 +828,9 @@ class StreamingCorrelator:
         Returns:
             CorrelationResult with all correlation windows
         """
-        # Finalize all remaining pending anchors
-        self._finalize_pending(None)
-
-        return CorrelationResult(
-            anchor_pattern=self.anchor_pattern_str,
-            total_anchors=self._total_anchors,
-            windows=self._windows,
-            common_precursors=[],  # Not tracked in streaming mode
-            truncated=self._total_anchors > len(self._windows),
-        )
+        result = self._finish()[self.anchor_pattern_str]
+        result.anchor_pattern = self.anchor_pattern_str
+        return result
 
     def correlate_file(
         self, parser: BaseLogParser, file_path: str, max_lines: int = 10000
@@ -588,6 +865,106 @@ class StreamingCorrelator:
         return self.finalize()
 
 
+class MultiAnchorCorrelator(_WindowStream):
+    """
+    Streaming correlator for several named anchor patterns at once.
+
+    The file is parsed once for all patterns instead of once per pattern;
+    each pattern gets its own windows, precursors and causal analysis, and
+    up to max_anchors windows.
+
+    Usage:
+        correlator = MultiAnchorCorrelator(
+            {"oom": "OOMKilled", "refused": "connection refused"}
+        )
+        result = correlator.correlate_file(parser, "app.log")
+        result.anchors["oom"].windows
+    """
+
+    def __init__(
+        self,
+        anchors: dict[str, str],
+        window_before: int = 60,
+        window_after: int = 30,
+        max_anchors: int = MAX_ANCHORS,
+        regex: bool = True,
+        case_sensitive: bool = False,
+        detect_causal_chain: bool = True,
+        include_recommendations: bool = True,
+    ):
+        """
+        Initialize multi-anchor correlator.
+
+        Args:
+            anchors: Anchor patterns by name
+            window_before: Seconds before anchor to analyze
+            window_after: Seconds after anchor to analyze
+            max_anchors: Maximum anchor events to analyze per pattern
+            regex: Treat patterns as regexes
+            case_sensitive: Case-sensitive pattern matching
+            detect_causal_chain: Enable causal chain detection
+            include_recommendations: Include actionable recommendations
+
+        Raises:
+            ValueError: If no pattern is given or a pattern is invalid
+        """
+        super().__init__(
+            anchors,
+            window_before=window_before,
+            window_after=window_after,
+            max_anchors=max_anchors,
+            regex=regex,
+            case_sensitive=case_sensitive,
+            detect_causal_chain=detect_causal_chain,
+            include_recommendations=include_recommendations,
+        )
+        self.anchor_patterns = dict(anchors)
+
+    def finalize(self) -> MultiCorrelationResult:
+        """
+        Finalize correlation and return results.
+
+        Returns:
+            MultiCorrelationResult with a CorrelationResult per anchor name
+        """
+        results = self._finish()
+        for name, result in results.items():
+            result.anchor_pattern = self.anchor_patterns[name]
+        return MultiCorrelationResult(anchors=results)
+
+    def correlate_file(
+        self, parser: BaseLogParser, file_path: str, max_lines: int = 10000
+    ) -> MultiCorrelationResult:
+        """
+        Correlate events in a log file around every anchor pattern.
+
+        Args:
+            parser: Parser to use for parsing log entries
+            file_path: Path to the log file
+            max_lines: Maximum lines to process
+
+        Returns:
+            MultiCorrelationResult with a CorrelationResult per anchor name
+        """
+        for entry in parser.parse_file(file_path, max_lines=max_lines):
+            self.process_entry(entry)
+        return self.finalize()
+
+    def correlate_entries(self, entries: Iterator[ParsedLogEntry]) -> MultiCorrelationResult:
+        """
+        Correlate events from an iterator of entries around every anchor pattern.
+
+        Args:
+            entries: Iterator of parsed log entries
+
+        Returns:
+            MultiCorrelationResult with a CorrelationResult per anchor name
+        """
+        for entry in entries:
+            self.process_entry(entry)
+        return self.finalize()
+
+
 def correlate_events(
     parser: BaseLogParser,
     file_path: str,
@@ -601,6 +978,7 @@ def correlate_events(
     streaming: bool = False,
     detect_causal_chain: bool = True,
     include_recommendations: bool = True,
+    time_ordered: bool = False,
 ) -> CorrelationResult:
     """
     Convenience function to correlate events in a log file.
@@ -615,15 +993,15 @@ def correlate_events(
         regex: Treat pattern as regex
         case_sensitive: Case-sensitive pattern matching
         max_lines: Maximum lines to process
-        streaming: Use memory-efficient streaming mode
+        streaming: Use the constant-memory streaming correlator (time-ordered input)
         detect_causal_chain: Enable causal chain detection
         include_recommendations: Include actionable recommendations
+        time_ordered: Input is in time order (bounded-memory ring buffer)
 
     Returns:
         CorrelationResult with all correlation windows
     """
     if streaming:
-        # StreamingCorrelator doesn't support causal chains (yet)
         correlator: Correlator | StreamingCorrelator = StreamingCorrelator(
             anchor_pattern=anchor_pattern,
             window_before=window_before,
@@ -631,6 +1009,8 @@ def correlate_events(
             max_anchors=max_anchors,
             regex=regex,
             case_sensitive=case_sensitive,
+            detect_causal_chain=detect_causal_chain,
+            include_recommendations=include_recommendations,
         )
     else:
         correlator = Correlator(
@@ -642,6 +1022,7 @@ def correlate_events(
             case_sensitive=case_sensitive,
             detect_causal_chain=detect_causal_chain,
             include_recommendations=include_recommendations,
+            time_ordered=time_ordered,
         )
 
     return correlator.correlate_file(parser, file_path, max_lines=max_lines)
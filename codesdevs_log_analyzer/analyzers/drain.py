@@ -0,0 +1,228 @@
+"""Online log template mining with a fixed-depth parse tree (Drain).
+
+Regex normalization only replaces variable parts it has a pattern for; user
+names, host names or queue names still split one error into many templates.
+Drain learns the variable positions instead: messages are routed through a
+tree keyed by token count and then by their first few tokens, and in the
+leaf reached they join the most similar template if enough token positions
+agree. Positions that differ become wildcards. A message is assigned with a
+bounded number of dictionary lookups plus a scan of the few templates in its
+leaf, so the cost per message stays flat as the log grows.
+
+Reference: He et al., "Drain: An Online Log Parsing Approach with Fixed
+Depth Tree", ICWS 2017.
+"""
+
+import re
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from .normalizer import ERROR_TEMPLATES, MessageNormalizer
+
+# Strategies for grouping messages into templates
+GROUPING_REGEX = "regex"
+GROUPING_DRAIN = "drain"
+GROUPING_STRATEGIES = (GROUPING_REGEX, GROUPING_DRAIN)
+
+# Token standing for a learned variable position
+WILDCARD = "<*>"
+
+# Tree depth counting the root, token-count layer, leading-token layers and leaves
+DEFAULT_DEPTH = 4
+
+# Share of token positions that must agree to join a template
+DEFAULT_SIMILARITY = 0.4
+
+# Children per tree node; further distinct tokens share a wildcard child
+DEFAULT_MAX_CHILDREN = 100
+
+# Templates kept; the least recently matched are forgotten first
+DEFAULT_MAX_CLUSTERS = 1000
+
+# Placeholders written by the normalizer (<N>, <IP>, ...) and wildcards
+_PLACEHOLDER = re.compile(r"<[A-Z*]+>")
+
+
+def template_pattern(template: str) -> str:
+    """Regex matching the messages of a template (placeholders match \\S+)."""
+    parts = _PLACEHOLDER.split(template)
+    return r"\S+".join(re.escape(part) for part in parts)
+
+
+@dataclass
+class LogCluster:
+    """A mined template and the number of messages assigned to it."""
+
+    cluster_id: int
+    tokens: list[str]
+    size: int = 0
+
+    @property
+    def template(self) -> str:
+        """Template text with wildcards for variable positions."""
+        return " ".join(self.tokens)
+
+
+@dataclass
+class _Node:
+    children: dict[str, "_Node"] = field(default_factory=dict)
+    cluster_ids: list[int] = field(default_factory=list)
+
+
+class DrainMiner:
+    """
+    Online template miner.
+
+    Usage:
+        miner = DrainMiner()
+        cluster = miner.add("Login failed for user alice from 10.0.0.5")
+        miner.add("Login failed for user bob from 10.0.0.7")
+        cluster.template  # "Login failed for user <*> from <IP>"
+    """
+
+    def __init__(
+        self,
+        depth: int = DEFAULT_DEPTH,
+        similarity: float = DEFAULT_SIMILARITY,
+        max_children: int = DEFAULT_MAX_CHILDREN,
+        max_clusters: int | None = DEFAULT_MAX_CLUSTERS,
+        normalizer: MessageNormalizer | None = ERROR_TEMPLATES,
+    ):
+        """
+        Initialize miner.
+
+        Args:
+            depth: Tree depth (at least 3); depth - 3 leading tokens route a message
+            similarity: Share of agreeing token positions needed to join a template
+            max_children: Children per node before tokens share a wildcard child
+            max_clusters: Templates kept (None for no bound)
+            normalizer: Masks known variable parts (numbers, IPs, ...) before
+                tokenizing (None to mine raw messages)
+
+        Raises:
+            ValueError: If depth is below 3
+        """
+        if depth < 3:
+            raise ValueError("Drain depth must be at least 3")
+        self.prefix_depth = depth - 3
+        self.similarity = similarity
+        self.max_children = max_children
+        self.max_clusters = max_clusters
+        self.normalizer = normalizer
+        self._root = _Node()
+        self._clusters: OrderedDict[int, LogCluster] = OrderedDict()
+        self._next_id = 1
+
+    @property
+    def clusters(self) -> list[LogCluster]:
+        """Templates currently kept, least recently matched first."""
+        return list(self._clusters.values())
+
+    def get(self, cluster_id: int) -> LogCluster | None:
+        """Look up a template by id (None if it was forgotten)."""
+        return self._clusters.get(cluster_id)
+
+    def add(self, message: str) -> LogCluster:
+        """
+        Assign a message to a template, creating or generalizing one.
+
+        Args:
+            message: Log message
+
+        Returns:
+            The template the message was assigned to
+        """
+        tokens = self._tokenize(message)
+        leaf = self._leaf(tokens)
+        cluster = self._best_match(leaf, tokens)
+        if cluster is None:
+            cluster = LogCluster(self._next_id, tokens)
+            self._next_id += 1
+            self._clusters[cluster.cluster_id] = cluster
+            leaf.cluster_ids.append(cluster.cluster_id)
+            self._evict()
+        else:
+            for i, (token, new) in enumerate(zip(cluster.tokens, tokens, strict=True)):
+                if token != new and token != WILDCARD:
+                    cluster.tokens[i] = WILDCARD
+            self._clusters.move_to_end(cluster.cluster_id)
+        cluster.size += 1
+        return cluster
+
+    def match(self, message: str) -> LogCluster | None:
+        """Find the template of a message without learning from it."""
+        tokens = self._tokenize(message)
+        leaf = self._find_leaf(tokens)
+        return None if leaf is None else self._best_match(leaf, tokens)
+
+    def _tokenize(self, message: str) -> list[str]:
+        if self.normalizer is not None:
+            message = self.normalizer(message)
+        return message.split()
+
+    def _route(self, tokens: list[str]) -> list[str]:
+        """Tree keys for a token sequence: token count, then leading tokens."""
+        keys = [str(len(tokens))]
+        for token in tokens[: self.prefix_depth]:
+            # Tokens with digits or placeholders are likely variables
+            variable = _PLACEHOLDER.search(token) or any(c.isdigit() for c in token)
+            keys.append(WILDCARD if variable else token)
+        return keys
+
+    def _child(self, node: _Node, key: str, depth: int) -> tuple[str, _Node | None]:
+        """Child for a key; once a token node is full, new tokens share its wildcard."""
+        child = node.children.get(key)
+        if child is None and depth > 0 and len(node.children) >= self.max_children:
+            key = WILDCARD
+            child = node.children.get(key)
+        return key, child
+
+    def _leaf(self, tokens: list[str]) -> _Node:
+        """Walk the tree for a token sequence, adding missing nodes."""
+        node = self._root
+        for depth, key in enumerate(self._route(tokens)):
+            key, child = self._child(node, key, depth)
+            if child is None:
+                child = node.children[key] = _Node()
+            node = child
+        return node
+
+    def _find_leaf(self, tokens: list[str]) -> _Node | None:
+        """Walk the tree for a token sequence without changing it."""
+        node: _Node | None = self._root
+        for depth, key in enumerate(self._route(tokens)):
+            if node is None:
+                return None
+            node = self._child(node, key, depth)[1]
+        return node
+
+    def _best_match(self, leaf: _Node, tokens: list[str]) -> LogCluster | None:
+        """Most similar template in a leaf, if similar enough."""
+        best: LogCluster | None = None
+        best_score = (-1.0, -1)
+        live: list[int] = []
+        for cluster_id in leaf.cluster_ids:
+            cluster = self._clusters.get(cluster_id)
+            if cluster is None:
+                continue  # Forgotten; pruned below
+            live.append(cluster_id)
+            same = 0
+            wildcards = 0
+            for token, new in zip(cluster.tokens, tokens, strict=True):
+                if token == WILDCARD:
+                    wildcards += 1
+                elif token == new:
+                    same += 1
+            score = (same / len(tokens) if tokens else 1.0, wildcards)
+            if score > best_score:
+                best, best_score = cluster, score
+        if len(live) != len(leaf.cluster_ids):
+            leaf.cluster_ids[:] = live
+        if best is None or best_score[0] < self.similarity:
+            return None
+        return best
+
+    def _evict(self) -> None:
+        if self.max_clusters is not None:
+            while len(self._clusters) > self.max_clusters:
+                self._clusters.popitem(last=False)
@@ -6,12 +6,27 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
-from ..parsers.base import BaseLogParser, ParsedLogEntry
+from ..models import MultiLineLogEntry
+from ..parsers.base import BaseLogParser, FieldNeeds, ParsedLogEntry
+from ..parsers.dedup import collapse_repeated_entries, last_timestamp, repeat_count
+from .drain import GROUPING_DRAIN, GROUPING_REGEX, GROUPING_STRATEGIES, DrainMiner
+from .minhash import MinHashLSH
+from .normalizer import ERROR_TEMPLATES
+from .stack_trace import (
+    DEFAULT_FINGERPRINT_FRAMES,
+    StackTrace,
+    StackTraceInterner,
+    is_stack_trace_line,
+)
 
 # Output limits
 MAX_ERRORS = 50
 MAX_SAMPLE_ENTRIES = 3
 MAX_STACK_TRACE_LINES = 30
+MAX_VARIANTS = 10
+
+# Groups tracked before near-duplicate merging (max_errors applies after it)
+MAX_MERGE_GROUPS = 50000
 
 
 @dataclass
@@ -25,16 +40,22 @@ class ErrorGroup:
     sample_entries: list[ParsedLogEntry] = field(default_factory=list)
     stack_trace: str | None = None
     levels: set[str] = field(default_factory=set)
+    exception_type: str | None = None
+    stack_fingerprint: str | None = None
+    cluster_id: int | None = None  # Mined template (drain grouping)
+    variants: list[str] = field(default_factory=list)  # Merged near-duplicate templates
+    variant_count: int = 0  # All merged templates (variants is capped)
 
-    def add_entry(self, entry: ParsedLogEntry, stack_trace: str | None = None) -> None:
-        """Add an entry to this error group."""
-        self.count += 1
+    def add_entry(self, entry: ParsedLogEntry, stack_trace: str | StackTrace | None = None) -> None:
+        """Add an entry (or a collapsed run of repeats) to this error group."""
+        self.count += repeat_count(entry)
 
         if entry.timestamp:
+            run_end = last_timestamp(entry) or entry.timestamp
             if self.first_seen is None or entry.timestamp < self.first_seen:
                 self.first_seen = entry.timestamp
-            if self.last_seen is None or entry.timestamp > self.last_seen:
-                self.last_seen = entry.timestamp
+            if self.last_seen is None or run_end > self.last_seen:
+                self.last_seen = run_end
 
         if entry.level:
             self.levels.add(entry.level.upper())
@@ -42,13 +63,36 @@ class ErrorGroup:
         if len(self.sample_entries) < MAX_SAMPLE_ENTRIES:
             self.sample_entries.append(entry)
 
-        if stack_trace and not self.stack_trace:
+        if isinstance(stack_trace, StackTrace):
+            # Interned traces are already truncated and shared between groups
+            if not self.stack_trace:
+                self.stack_trace = stack_trace.text
+                self.exception_type = stack_trace.exception_type
+                self.stack_fingerprint = stack_trace.fingerprint
+        elif stack_trace and not self.stack_trace:
             # Truncate stack trace if too long
             lines = stack_trace.split("\n")
             if len(lines) > MAX_STACK_TRACE_LINES:
                 lines = lines[:MAX_STACK_TRACE_LINES] + ["... (truncated)"]
             self.stack_trace = "\n".join(lines)
 
+    def merge(self, other: "ErrorGroup") -> None:
+        """Fold a near-duplicate group into this one, keeping its template as a variant."""
+        self.count += other.count
+        if other.first_seen and (self.first_seen is None or other.first_seen < self.first_seen):
+            self.first_seen = other.first_seen
+        if other.last_seen and (self.last_seen is None or other.last_seen > self.last_seen):
+            self.last_seen = other.last_seen
+        self.levels |= other.levels
+        room = MAX_SAMPLE_ENTRIES - len(self.sample_entries)
+        self.sample_entries.extend(other.sample_entries[: max(room, 0)])
+        if not self.stack_trace and other.stack_trace:
+            self.stack_trace = other.stack_trace
+        for template in [other.template, *other.variants]:
+            if len(self.variants) < MAX_VARIANTS:
+                self.variants.append(template)
+        self.variant_count += 1 + other.variant_count
+
 
 @dataclass
 class ErrorExtractionResult:
@@ -59,6 +103,7 @@ class ErrorExtractionResult:
     unique_errors: int = 0
     error_groups: list[ErrorGroup] = field(default_factory=list)
     time_range: tuple[datetime | None, datetime | None] = (None, None)
+    unique_stack_traces: int = 0
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -66,6 +111,7 @@ class ErrorExtractionResult:
             "total_errors": self.total_errors,
             "total_warnings": self.total_warnings,
             "unique_errors": self.unique_errors,
+            "unique_stack_traces": self.unique_stack_traces,
             "error_groups": [
                 {
                     "template": g.template,
@@ -82,7 +128,11 @@ class ErrorExtractionResult:
                         for e in g.sample_entries
                     ],
                     "stack_trace": g.stack_trace,
+                    "exception_type": g.exception_type,
+                    "stack_fingerprint": g.stack_fingerprint,
                     "levels": list(g.levels),
+                    "variants": g.variants,
+                    "variant_count": g.variant_count,
                 }
                 for g in self.error_groups
             ],
@@ -98,63 +148,13 @@ def normalize_error_message(message: str) -> str:
     Normalize error messages for grouping.
     Replace variable parts with placeholders:
     - UUIDs → <UUID>
-    - Numbers → <N>
+    - Numbers → <N> (3-4 digit error codes such as 404 or E1234 are kept)
     - File paths → <PATH>
     - Timestamps → <TIME>
     - IP addresses → <IP>
-    - Hex values → <HEX>
-    - Memory addresses → <ADDR>
+    - Hex values and memory addresses → <HEX>
     """
-    result = message
-
-    # Replace UUIDs (8-4-4-4-12 hex format)
-    result = re.sub(
-        r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}",
-        "<UUID>",
-        result,
-    )
-
-    # Replace IP addresses (IPv4)
-    result = re.sub(r"\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b", "<IP>", result)
-
-    # Replace timestamps (various formats)
-    # ISO 8601
-    result = re.sub(
-        r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?", "<TIME>", result
-    )
-    # Other timestamp formats
-    result = re.sub(r"\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2}", "<TIME>", result)
-    result = re.sub(r"\d{2}:\d{2}:\d{2}(?:,\d+)?", "<TIME>", result)
-
-    # Replace file paths (Unix and Windows)
-    result = re.sub(r"(?:/[\w\-\.]+)+(?:/[\w\-\.]*)?", "<PATH>", result)
-    result = re.sub(r"[A-Za-z]:\\(?:[\w\-\.]+\\)*[\w\-\.]*", "<PATH>", result)
-
-    # Replace hex values (0x...)
-    result = re.sub(r"0x[0-9a-fA-F]+", "<HEX>", result)
-
-    # Replace memory addresses
-    result = re.sub(r"\bat 0x[0-9a-fA-F]+\b", "at <ADDR>", result)
-
-    # Replace numbers (but preserve numbers in common error codes)
-    # First, protect error codes like "404", "500", "E1234"
-    protected = {}
-    for i, match in enumerate(re.finditer(r"\b[A-Z]?\d{3,4}\b", result)):
-        placeholder = f"__ERROR_CODE_{i}__"
-        protected[placeholder] = match.group()
-        result = result.replace(match.group(), placeholder, 1)
-
-    # Now replace remaining numbers
-    result = re.sub(r"\b\d+\b", "<N>", result)
-
-    # Restore protected error codes
-    for placeholder, original in protected.items():
-        result = result.replace(placeholder, original)
-
-    # Collapse multiple spaces
-    result = re.sub(r"\s+", " ", result)
-
-    return result.strip()
+    return ERROR_TEMPLATES(message)
 
 
 class ErrorExtractor:
@@ -167,16 +167,6 @@ class ErrorExtractor:
     ERROR_LEVELS = {"ERROR", "FATAL", "CRITICAL", "EMERGENCY", "SEVERE"}
     WARNING_LEVELS = {"WARN", "WARNING"}
 
-    # Stack trace detection patterns
-    STACK_TRACE_PATTERNS = [
-        re.compile(r"^Traceback \(most recent call last\):"),  # Python
-        re.compile(r"^\s+at\s+[\w\.$]+\("),  # Java/JavaScript
-        re.compile(r'^\s+File\s+"[^"]+",\s+line\s+\d+'),  # Python stack frame
-        re.compile(r"^Caused by:"),  # Java cause chain
-        re.compile(r"^\s+\.{3}\s+\d+\s+more"),  # Java truncated stack
-        re.compile(r"^\s+at\s+"),  # Generic "at" lines
-    ]
-
     # Exception type patterns
     EXCEPTION_PATTERNS = [
         re.compile(r"^(\w+(?:\.\w+)*(?:Error|Exception|Failure))[:\s]"),  # Python/Java
@@ -190,6 +180,10 @@ class ErrorExtractor:
         include_warnings: bool = True,
         max_errors: int = MAX_ERRORS,
         group_similar: bool = True,
+        stack_frames: int = DEFAULT_FINGERPRINT_FRAMES,
+        grouping: str = GROUPING_REGEX,
+        miner: DrainMiner | None = None,
+        merge_threshold: float | None = None,
     ):
         """
         Initialize error extractor.
@@ -198,10 +192,34 @@ class ErrorExtractor:
             include_warnings: Whether to include warnings in extraction
             max_errors: Maximum number of error groups to track
             group_similar: Whether to group similar errors
+            stack_frames: Number of top stack frames that, together with the
+                exception type, group errors carrying a stack trace
+                (0 groups by message template only)
+            grouping: How similar messages are grouped: "regex" (normalized
+                message) or "drain" (templates mined online, see analyzers.drain)
+            miner: Template miner for drain grouping, shared to give several
+                extractors the same templates (a new one by default)
+            merge_threshold: Merge groups whose templates share at least this
+                Jaccard similarity of tokens (MinHash/LSH, see analyzers.minhash)
+                when finalizing; up to MAX_MERGE_GROUPS groups are tracked and
+                max_errors applies to the merged groups (None disables)
+
+        Raises:
+            ValueError: If grouping is unknown or merge_threshold is not in (0, 1]
         """
+        if grouping not in GROUPING_STRATEGIES:
+            raise ValueError(
+                f"Unknown grouping: {grouping}. Valid options: {', '.join(GROUPING_STRATEGIES)}"
+            )
         self.include_warnings = include_warnings
         self.max_errors = max_errors
         self.group_similar = group_similar
+        self.stack_frames = stack_frames
+        self.grouping = grouping
+        self.miner = (miner or DrainMiner()) if grouping == GROUPING_DRAIN else None
+        self.merger = None if merge_threshold is None else MinHashLSH(threshold=merge_threshold)
+        self._group_limit = max(max_errors, MAX_MERGE_GROUPS) if self.merger else max_errors
+        self._interner = StackTraceInterner(top_frames=stack_frames)
 
         # State
         self._error_groups: dict[str, ErrorGroup] = {}
@@ -214,6 +232,14 @@ class ErrorExtractor:
         self._pending_error: ParsedLogEntry | None = None
         self._stack_trace_lines: list[str] = []
 
+    @property
+    def field_needs(self) -> FieldNeeds:
+        """Only errors (and warnings, if included) are read beyond level and timestamp."""
+        levels = self.ERROR_LEVELS
+        if self.include_warnings:
+            levels = levels | self.WARNING_LEVELS
+        return FieldNeeds(levels=frozenset(levels))
+
     def _is_error_level(self, level: str | None) -> bool:
         """Check if level indicates an error."""
         if not level:
@@ -228,7 +254,7 @@ class ErrorExtractor:
 
     def _is_stack_trace_line(self, line: str) -> bool:
         """Check if line is part of a stack trace."""
-        return any(pattern.match(line) for pattern in self.STACK_TRACE_PATTERNS)
+        return is_stack_trace_line(line)
 
     def _update_time_range(self, timestamp: datetime | None) -> None:
         """Update the tracked time range."""
@@ -244,17 +270,35 @@ class ErrorExtractor:
             return
 
         entry = self._pending_error
-        stack_trace = "\n".join(self._stack_trace_lines) if self._stack_trace_lines else None
+        if isinstance(entry, MultiLineLogEntry):
+            # Parser already attached the trace; don't normalize it into the template
+            message = entry.head_message
+            trace_lines = entry.continuation
+        else:
+            message = entry.message
+            trace_lines = self._stack_trace_lines
+
+        trace = self._interner.intern(trace_lines, head=message)
 
         # Get template for grouping
-        template = normalize_error_message(entry.message) if self.group_similar else entry.message
+        cluster_id = None
+        if not self.group_similar:
+            template = message
+        elif self.miner is not None:
+            cluster = self.miner.add(message)
+            template, cluster_id = cluster.template, cluster.cluster_id
+        else:
+            template = normalize_error_message(message)
+        key = template if cluster_id is None else f"drain:{cluster_id}"
+        if trace is not None and trace.frames and self.group_similar and self.stack_frames > 0:
+            key = trace.group_key
 
         # Add to group
-        if template not in self._error_groups and len(self._error_groups) < self.max_errors:
-            self._error_groups[template] = ErrorGroup(template=template)
+        if key not in self._error_groups and len(self._error_groups) < self._group_limit:
+            self._error_groups[key] = ErrorGroup(template=template, cluster_id=cluster_id)
 
-        if template in self._error_groups:
-            self._error_groups[template].add_entry(entry, stack_trace)
+        if key in self._error_groups:
+            self._error_groups[key].add_entry(entry, trace)
 
         # Reset pending state
         self._pending_error = None
@@ -268,6 +312,9 @@ class ErrorExtractor:
             entry: Parsed log entry to process
         """
         self._update_time_range(entry.timestamp)
+        count = repeat_count(entry)
+        if count > 1:
+            self._update_time_range(last_timestamp(entry))
 
         # Check if this is a continuation of a stack trace
         if self._pending_error is not None:
@@ -283,11 +330,11 @@ class ErrorExtractor:
         is_warning = self._is_warning_level(entry.level)
 
         if is_error:
-            self._total_errors += 1
+            self._total_errors += count
             self._pending_error = entry
             self._stack_trace_lines = []
         elif is_warning and self.include_warnings:
-            self._total_warnings += 1
+            self._total_warnings += count
             self._pending_error = entry
             self._stack_trace_lines = []
 
@@ -301,19 +348,49 @@ class ErrorExtractor:
         # Flush any pending error
         self._flush_pending_error()
 
+        # Mined templates generalize as messages arrive; report their final form
+        if self.miner is not None:
+            for group in self._error_groups.values():
+                cluster = self.miner.get(group.cluster_id) if group.cluster_id else None
+                if cluster is not None:
+                    group.template = cluster.template
+
+        groups = list(self._error_groups.values())
+        if self.merger is not None:
+            groups = self._merge_near_duplicates(groups, self.merger)
+
         # Sort error groups by count (most frequent first)
-        sorted_groups = sorted(self._error_groups.values(), key=lambda g: g.count, reverse=True)
+        sorted_groups = sorted(groups, key=lambda g: g.count, reverse=True)
 
         return ErrorExtractionResult(
             total_errors=self._total_errors,
             total_warnings=self._total_warnings,
             unique_errors=len(sorted_groups),
-            error_groups=sorted_groups,
+            error_groups=sorted_groups[: self.max_errors],
             time_range=(self._time_start, self._time_end),
+            unique_stack_traces=self._interner.unique_traces,
         )
 
+    def _merge_near_duplicates(
+        self, groups: list[ErrorGroup], merger: MinHashLSH
+    ) -> list[ErrorGroup]:
+        """Merge groups with near-identical templates into the most frequent one."""
+        # Stack-trace groups are already keyed by their frames
+        candidates = [g for g in groups if g.stack_fingerprint is None]
+        merged = [g for g in groups if g.stack_fingerprint is not None]
+        for cluster in merger.cluster([g.template for g in candidates]):
+            members = sorted((candidates[i] for i in cluster), key=lambda g: g.count, reverse=True)
+            for other in members[1:]:
+                members[0].merge(other)
+            merged.append(members[0])
+        return merged
+
     def analyze_file(
-        self, parser: BaseLogParser, file_path: str, max_lines: int = 10000
+        self,
+        parser: BaseLogParser,
+        file_path: str,
+        max_lines: int = 10000,
+        collapse_repeats: bool = False,
     ) -> ErrorExtractionResult:
         """
         Stream analyze a file for errors.
@@ -322,11 +399,17 @@ class ErrorExtractor:
             parser: Parser to use for parsing log entries
             file_path: Path to the log file
             max_lines: Maximum lines to process
+            collapse_repeats: Collapse runs of repeated entries before analysis
 
         Returns:
             ErrorExtractionResult with all extracted errors
         """
-        for entry in parser.parse_file(file_path, max_lines=max_lines):
+        entries: Iterator[ParsedLogEntry] = parser.parse_file(
+            file_path, max_lines=max_lines, needs=self.field_needs
+        )
+        if collapse_repeats:
+            entries = collapse_repeated_entries(entries)
+        for entry in entries:
             self.process_entry(entry)
         return self.finalize()
 
@@ -352,6 +435,8 @@ def extract_errors(
     max_errors: int = MAX_ERRORS,
     group_similar: bool = True,
     max_lines: int = 10000,
+    grouping: str = GROUPING_REGEX,
+    merge_threshold: float | None = None,
 ) -> ErrorExtractionResult:
     """
     Convenience function to extract errors from a log file.
@@ -363,11 +448,18 @@ def extract_errors(
         max_errors: Maximum number of error groups
         group_similar: Whether to group similar errors
         max_lines: Maximum lines to process
+        grouping: "regex" or "drain" grouping of similar errors
+        merge_threshold: Token similarity for merging near-duplicate groups
+            (None disables)
 
     Returns:
         ErrorExtractionResult with all extracted errors
     """
     extractor = ErrorExtractor(
-        include_warnings=include_warnings, max_errors=max_errors, group_similar=group_similar
+        include_warnings=include_warnings,
+        max_errors=max_errors,
+        group_similar=group_similar,
+        grouping=grouping,
+        merge_threshold=merge_threshold,
     )
     return extractor.analyze_file(parser, file_path, max_lines=max_lines)
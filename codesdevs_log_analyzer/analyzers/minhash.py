@@ -0,0 +1,167 @@
+"""Near-duplicate clustering of message templates with MinHash and LSH.
+
+Normalization leaves templates that differ by a single unmasked token (a
+user name, a table, a queue). Comparing every pair of templates to merge
+them is quadratic, so each template's token set is reduced to a MinHash
+signature whose agreement rate estimates Jaccard similarity, and the
+signature is cut into bands: templates sharing any band land in the same
+bucket and only those candidates are compared exactly. Clustering costs
+roughly linear time in the number of templates.
+
+Reference: Leskovec, Rajaraman and Ullman, "Mining of Massive Datasets",
+chapter 3 (locality-sensitive hashing of documents).
+"""
+
+import hashlib
+import struct
+from collections.abc import Sequence
+
+# Token-set Jaccard similarity at or above which templates merge (five-token
+# templates differing in one token score 4/6)
+DEFAULT_THRESHOLD = 0.6
+
+# Hash functions per signature
+DEFAULT_NUM_PERM = 128
+
+# Chance that a pair exactly at the threshold becomes a candidate
+TARGET_RECALL = 0.95
+
+# Exact comparisons a new template makes against bucket representatives,
+# newest first; buckets keep one representative per cluster, unbounded
+MAX_BUCKET_PROBES = 8
+
+# Bound on the per-token hash cache before it is reset
+MAX_TOKEN_CACHE_SIZE = 100000
+
+_MAX_HASH = (1 << 32) - 1
+
+
+def _bands_for(threshold: float, num_perm: int) -> tuple[int, int]:
+    """
+    Bands and rows per band for a similarity threshold.
+
+    Two templates of similarity s become candidates with probability
+    1 - (1 - s^rows)^bands. More rows per band admit fewer dissimilar
+    candidates, so the most rows that still reach TARGET_RECALL at the
+    threshold are taken; false candidates are removed by the exact check.
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        if 1 - (1 - threshold**rows) ** bands >= TARGET_RECALL:
+            best = (bands, rows)
+    return best
+
+
+class MinHashLSH:
+    """
+    Cluster near-duplicate texts by token-set Jaccard similarity.
+
+    Usage:
+        lsh = MinHashLSH(threshold=0.6)
+        lsh.cluster(["Queue orders is full", "Queue billing is full", "Disk full"])
+        # [[0, 1], [2]]
+    """
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, num_perm: int = DEFAULT_NUM_PERM):
+        """
+        Initialize clusterer.
+
+        Args:
+            threshold: Jaccard similarity (0-1] of token sets to merge at
+            num_perm: Hash functions per signature (more is more accurate
+                and slower)
+
+        Raises:
+            ValueError: If threshold is not in (0, 1] or num_perm < 1
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError(f"Similarity threshold must be in (0, 1], got {threshold}")
+        if num_perm < 1:
+            raise ValueError(f"num_perm must be at least 1, got {num_perm}")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = _bands_for(threshold, num_perm)
+        # Tokens repeat across templates; each token's hashes are computed once
+        self._token_hashes: dict[str, tuple[int, ...]] = {}
+        self._unpack = struct.Struct(f"<{num_perm}I").unpack
+
+    def _hashes(self, token: str) -> tuple[int, ...]:
+        """One 32-bit hash per permutation, cut from a single extendable-output digest."""
+        hashes = self._token_hashes.get(token)
+        if hashes is None:
+            hashes = self._unpack(hashlib.shake_256(token.encode()).digest(4 * self.num_perm))
+            if len(self._token_hashes) >= MAX_TOKEN_CACHE_SIZE:
+                self._token_hashes.clear()
+            self._token_hashes[token] = hashes
+        return hashes
+
+    def signature(self, tokens: frozenset[str]) -> tuple[int, ...]:
+        """MinHash signature of a token set."""
+        if not tokens:
+            return (_MAX_HASH,) * self.num_perm
+        # Column-wise minimum over the tokens' permuted hashes
+        return tuple(map(min, zip(*map(self._hashes, tokens), strict=True)))
+
+    def cluster(self, texts: Sequence[str]) -> list[list[int]]:
+        """
+        Group texts whose token sets are at least threshold-similar.
+
+        Similarity is applied transitively: A and C share a cluster when A
+        matches B and B matches C.
+
+        Args:
+            texts: Texts to cluster, tokenized on whitespace
+
+        Returns:
+            Clusters as lists of indices into texts, in order of first member
+        """
+        token_sets = [frozenset(text.split()) for text in texts]
+        parent = list(range(len(texts)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        # One bucket table per band, keyed by that band of the signature
+        tables: list[dict[tuple[int, ...], list[int]]] = [{} for _ in range(self.bands)]
+        rows = self.rows
+        for i, tokens in enumerate(token_sets):
+            signature = self.signature(tokens)
+            # Candidates are shared between bands, so each is compared once
+            compared: set[int] = set()
+            for start, table in zip(range(0, self.num_perm, rows), tables, strict=True):
+                key = signature[start : start + rows]
+                bucket = table.setdefault(key, [])
+                represented = False
+                for j in reversed(bucket):
+                    root_i, root_j = find(i), find(j)
+                    if root_i == root_j:
+                        represented = True
+                        continue
+                    if j in compared:
+                        continue
+                    if len(compared) >= MAX_BUCKET_PROBES:
+                        break
+                    compared.add(j)
+                    if _jaccard(tokens, token_sets[j]) >= self.threshold:
+                        parent[max(root_i, root_j)] = min(root_i, root_j)
+                        represented = True
+                # A cluster already in the bucket needs no second representative
+                if not represented:
+                    bucket.append(i)
+
+        clusters: dict[int, list[int]] = {}
+        for i in range(len(texts)):
+            clusters.setdefault(find(i), []).append(i)
+        return list(clusters.values())
+
+
+def _jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
@@ -7,8 +7,9 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Any
 
-from ..parsers import detect_format
+from ..parsers import detect_format_with_profiles, get_parser
 from ..parsers.base import BaseLogParser, ParsedLogEntry
+from .normalizer import ERROR_PATTERNS
 
 
 @dataclass
@@ -216,6 +217,7 @@ class MultiFileAnalyzer:
         time_window: int = 60,
         max_entries: int = 1000,
         max_clusters: int = 50,
+        format_hint: str | None = None,
     ):
         """
         Initialize multi-file analyzer.
@@ -224,14 +226,21 @@ class MultiFileAnalyzer:
             time_window: Time window in seconds for correlation
             max_entries: Maximum entries to return in merge results
             max_clusters: Maximum clusters in correlation results
+            format_hint: Format name or grok spec for every file (None to
+                auto-detect each file)
         """
         self.time_window = timedelta(seconds=time_window)
         self.max_entries = max_entries
         self.max_clusters = max_clusters
+        self.format_hint = format_hint
 
     def _get_parser(self, file_path: str) -> BaseLogParser:
-        """Get the best parser for a file."""
-        parser, _ = detect_format(file_path)
+        """Get the hinted or best parser for a file."""
+        if self.format_hint and self.format_hint.lower() != "auto":
+            parser = get_parser(self.format_hint)
+            parser.prime_file(file_path)
+            return parser
+        parser, _ = detect_format_with_profiles(file_path)
         return parser
 
     def _is_error(self, entry: ParsedLogEntry) -> bool:
@@ -241,29 +250,6 @@ class MultiFileAnalyzer:
         level_str = entry.level.value if hasattr(entry.level, "value") else str(entry.level)
         return level_str.upper() in self.ERROR_LEVELS
 
-    def _normalize_error(self, message: str) -> str:
-        """Normalize error message for comparison."""
-        import re
-
-        # Replace common variable patterns
-        result = message
-        result = re.sub(r"\b\d+\b", "<N>", result)  # Numbers
-        result = re.sub(r"0x[a-fA-F0-9]+", "<HEX>", result)  # Hex
-        result = re.sub(
-            r"[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}",
-            "<UUID>",
-            result,
-            flags=re.IGNORECASE,
-        )
-        result = re.sub(r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}", "<IP>", result)
-        result = re.sub(r"\s+", " ", result).strip()
-
-        # Truncate
-        if len(result) > 100:
-            result = result[:100]
-
-        return result
-
     def merge_files(
         self,
         file_paths: list[str],
@@ -519,7 +505,7 @@ class MultiFileAnalyzer:
 
                     if level.upper() in self.ERROR_LEVELS:
                         error_count += 1
-                        normalized = self._normalize_error(entry.message)
+                        normalized = ERROR_PATTERNS(entry.message)
                         errors.add(normalized)
                     elif level.upper() in self.WARN_LEVELS:
                         warn_count += 1
@@ -0,0 +1,129 @@
+"""Message normalization shared by the analyzers.
+
+Grouping errors, comparing files, suggesting patterns and mining precursors
+all turn messages into templates by replacing variable parts (UUIDs, IPs,
+timestamps, paths, numbers) with placeholders. Every variable-part pattern
+is one named branch of a single alternation, so a message is tokenized in
+one regex pass, and results are memoized per raw message because error
+messages repeat heavily.
+"""
+
+import re
+from collections.abc import Callable
+from functools import lru_cache
+
+# Normalized messages remembered per normalizer
+DEFAULT_CACHE_SIZE = 8192
+
+# Longer messages are normalized without being memoized
+MAX_MEMO_LENGTH = 2048
+
+# Variable-part tokens in match priority order: (name, pattern, placeholder).
+# A placeholder of None keeps the matched text (protected error codes).
+TOKENS: list[tuple[str, str, str | None]] = [
+    (
+        "uuid",
+        r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}",
+        "<UUID>",
+    ),
+    (
+        "time",
+        r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?"
+        r"|\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2}"
+        r"|\d{2}:\d{2}:\d{2}(?:,\d+)?",
+        "<TIME>",
+    ),
+    ("ip", r"\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b", "<IP>"),
+    ("path", r"(?:/[\w\-\.]+)+(?:/[\w\-\.]*)?|[A-Za-z]:\\(?:[\w\-\.]+\\)*[\w\-\.]*", "<PATH>"),
+    ("hex", r"0x[0-9a-fA-F]+", "<HEX>"),
+    ("single_quoted", r"'[^']+?'", "'<VAL>'"),
+    ("double_quoted", r'"[^"]+?"', '"<VAL>"'),
+    ("code", r"\b[A-Z]?\d{3,4}\b", None),
+    ("id", r"\b\d{10,}\b", "<ID>"),
+    ("number", r"\b\d+\b", "<N>"),
+]
+
+_TOKEN_NAMES = {name for name, _, _ in TOKENS}
+
+# Characters one of which every token match contains besides digits (a UUID
+# without any digit is rare enough not to justify scanning every message)
+_TOKEN_MARKERS = {"path": "/\\\\", "single_quoted": "'", "double_quoted": '"'}
+
+
+class MessageNormalizer:
+    """
+    Replace variable parts of messages with placeholders.
+
+    The selected tokens are compiled into one alternation (kept in TOKENS
+    priority order, whatever order they are given in); whitespace runs are
+    then collapsed with str.split. Messages without a digit or other marker
+    character (a slash for paths, quotes) skip the alternation entirely.
+    Calls are memoized in an LRU cache keyed on the raw message.
+    """
+
+    def __init__(
+        self,
+        tokens: tuple[str, ...],
+        max_length: int | None = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        """
+        Initialize normalizer.
+
+        Args:
+            tokens: Names from TOKENS to replace
+            max_length: Truncate templates to this length, marked with "..."
+            cache_size: Messages memoized (0 disables the memo)
+
+        Raises:
+            ValueError: If a token name is unknown
+        """
+        unknown = set(tokens) - _TOKEN_NAMES
+        if unknown:
+            raise ValueError(f"Unknown normalizer tokens: {', '.join(sorted(unknown))}")
+
+        self.tokens = tuple(name for name, _, _ in TOKENS if name in tokens)
+        self.max_length = max_length
+        self._placeholders: dict[str | None, str | None] = {
+            name: placeholder for name, _, placeholder in TOKENS if name in tokens
+        }
+        branches = [f"(?P<{name}>{pattern})" for name, pattern, _ in TOKENS if name in tokens]
+        self.pattern = re.compile("|".join(branches))
+        markers = "".join(_TOKEN_MARKERS.get(name, "") for name in self.tokens)
+        self._marker = re.compile(f"[\\d{markers}]")
+        self._memo: Callable[[str], str] = (
+            lru_cache(maxsize=cache_size)(self._normalize) if cache_size else self._normalize
+        )
+
+    def __call__(self, message: str) -> str:
+        """Return the normalized template of a message."""
+        if len(message) > MAX_MEMO_LENGTH:
+            return self._normalize(message)
+        return self._memo(message)
+
+    def _replace(self, match: re.Match[str]) -> str:
+        placeholder = self._placeholders[match.lastgroup]
+        return match.group() if placeholder is None else placeholder
+
+    def _normalize(self, message: str) -> str:
+        if self._marker.search(message) is not None:
+            message = self.pattern.sub(self._replace, message)
+        result = " ".join(message.split())
+        if self.max_length is not None and len(result) > self.max_length:
+            result = result[: self.max_length] + "..."
+        return result
+
+
+# Error grouping templates (ErrorExtractor); HTTP and error codes are kept
+ERROR_TEMPLATES = MessageNormalizer(("uuid", "time", "ip", "path", "hex", "code", "number"))
+
+# Error patterns compared across files (MultiFileAnalyzer, PodLogAnalyzer)
+ERROR_PATTERNS = MessageNormalizer(("uuid", "ip", "hex", "number"), max_length=100)
+
+# Error templates offered as search patterns (PatternSuggester)
+SUGGESTION_TEMPLATES = MessageNormalizer(
+    ("uuid", "ip", "path", "single_quoted", "double_quoted", "id", "number"), max_length=100
+)
+
+# Events grouped as anomaly precursors (Correlator)
+PRECURSOR_TEMPLATES = MessageNormalizer(("number",), max_length=100)
@@ -10,6 +10,8 @@ from typing import Any
 
 from ..parsers.base import BaseLogParser
 from ..utils.file_handler import stream_file
+from .drain import GROUPING_DRAIN, GROUPING_REGEX, GROUPING_STRATEGIES, DrainMiner, template_pattern
+from .normalizer import SUGGESTION_TEMPLATES
 
 
 @dataclass
@@ -174,8 +176,23 @@ class PatternSuggester:
     ERROR_LEVELS = {"ERROR", "CRITICAL", "FATAL", "EMERGENCY", "ERR", "SEVERE"}
     WARNING_LEVELS = {"WARN", "WARNING", "WRN"}
 
-    def __init__(self) -> None:
-        """Initialize the pattern suggester."""
+    def __init__(self, grouping: str = GROUPING_REGEX) -> None:
+        """
+        Initialize the pattern suggester.
+
+        Args:
+            grouping: How error messages are grouped into templates: "regex"
+                (normalized message) or "drain" (templates mined online)
+
+        Raises:
+            ValueError: If grouping is unknown
+        """
+        if grouping not in GROUPING_STRATEGIES:
+            raise ValueError(
+                f"Unknown grouping: {grouping}. Valid options: {', '.join(GROUPING_STRATEGIES)}"
+            )
+        self.grouping = grouping
+        self._miner: DrainMiner | None = None
         self._compiled_patterns: dict[str, re.Pattern[str]] = {}
         self._compile_patterns()
 
@@ -215,6 +232,7 @@ class PatternSuggester:
             PatternSuggestionResult with suggested patterns
         """
         result = PatternSuggestionResult()
+        self._miner = DrainMiner() if self.grouping == GROUPING_DRAIN else None
 
         # Counters for pattern matches
         pattern_matches: dict[str, Counter[str]] = {
@@ -272,6 +290,15 @@ class PatternSuggester:
             if focus in ("all", "errors"):
                 self._extract_http_patterns(raw_line, pattern_matches, pattern_examples)
 
+        # Mined templates are counted by cluster; report their final form
+        if self._miner is not None:
+            mined: Counter[str] = Counter()
+            for key, count in pattern_matches["error_templates"].items():
+                cluster = self._miner.get(int(key))
+                if cluster is not None:
+                    mined[cluster.template] += count
+            pattern_matches["error_templates"] = mined
+
         # Build suggested patterns
         result.patterns = self._build_suggestions(
             pattern_matches, pattern_examples, max_patterns, result
@@ -293,8 +320,11 @@ class PatternSuggester:
             if name in self._compiled_patterns:
                 match = self._compiled_patterns[name].search(message)
                 if match:
-                    # Normalize the error message
-                    normalized = self._normalize_error(message)
+                    # Normalize the error message (or assign it a mined template)
+                    if self._miner is not None:
+                        normalized = str(self._miner.add(message).cluster_id)
+                    else:
+                        normalized = SUGGESTION_TEMPLATES(message)
                     matches["error_templates"][normalized] += 1
                     if len(examples["error_templates"]) < 10:
                         examples["error_templates"].append(message[:200])
@@ -367,30 +397,6 @@ class PatternSuggester:
                     if len(examples["endpoints"]) < 10:
                         examples["endpoints"].append(line[:200])
 
-    def _normalize_error(self, message: str) -> str:
-        """Normalize an error message by replacing variable parts."""
-        normalized = message
-
-        # Replace common variable patterns
-        replacements = [
-            (r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}", "<UUID>"),
-            (r"\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b", "<IP>"),
-            (r"\b\d{10,}\b", "<ID>"),
-            (r"\b\d+\b", "<N>"),
-            (r"'[^']+?'", "'<VAL>'"),
-            (r'"[^"]+?"', '"<VAL>"'),
-            (r"/[a-zA-Z0-9/_-]+/[a-zA-Z0-9._-]+", "<PATH>"),
-        ]
-
-        for pattern, replacement in replacements:
-            normalized = re.sub(pattern, replacement, normalized)
-
-        # Truncate long messages
-        if len(normalized) > 100:
-            normalized = normalized[:100] + "..."
-
-        return normalized
-
     def _build_suggestions(
         self,
         matches: dict[str, Counter[str]],
@@ -404,9 +410,14 @@ class PatternSuggester:
         # Error templates (high priority if errors found)
         for template, count in matches["error_templates"].most_common(3):
             if count >= 2:  # Only suggest if seen multiple times
+                if self._miner is not None:
+                    # Mined wildcards stand for any token
+                    pattern = template_pattern(template)
+                else:
+                    pattern = re.escape(template).replace(r"\<", "<").replace(r"\>", ">")
                 suggestions.append(
                     SuggestedPattern(
-                        pattern=re.escape(template).replace(r"\<", "<").replace(r"\>", ">"),
+                        pattern=pattern,
                         description=f"Error pattern ({count} occurrences)",
                         category="error",
                         match_count=count,
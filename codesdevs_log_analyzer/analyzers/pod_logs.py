@@ -0,0 +1,379 @@
+"""Pod log analyzer - Analyze a kubelet pod log directory tree.
+
+The kubelet writes container output to
+/var/log/pods/<namespace>_<pod>_<uid>/<container>/<restart>.log, rotating
+to <restart>.log.<YYYYMMDD-HHMMSS>[.gz]. Namespace, pod and container are
+read from the path once per file instead of from every line, the format is
+detected once per namespace and container name and reused (after a
+spot-check) for every replica and restart, and files are parsed
+concurrently.
+"""
+
+import copy
+import os
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from fnmatch import fnmatchcase
+from typing import Any
+
+from ..parsers import DockerParser, detect_format, get_parser
+from ..parsers.base import BaseLogParser
+from ..parsers.docker import AUTO_INNER
+from ..parsers.profiles import SPOT_CHECK_TOLERANCE, spot_check
+from .multi_file import MultiFileAnalyzer
+from .normalizer import ERROR_PATTERNS
+
+DEFAULT_POD_LOG_ROOT = "/var/log/pods"
+
+# Error patterns kept per pod and container
+MAX_ERROR_PATTERNS = 5
+
+# <namespace>_<pod>_<uid>; namespaces and pod names cannot contain "_"
+_POD_DIR = re.compile(r"^(?P<namespace>[^_]+)_(?P<pod>[^_]+)_(?P<uid>[^_]+)$")
+
+# <restart>.log, rotated <restart>.log.20260115-103000 or .gz
+_LOG_FILE = re.compile(r"^(?P<restart>\d+)\.log(?:\.\d{8}-\d{6})?(?:\.gz)?$")
+
+
+@dataclass(frozen=True)
+class PodLogFile:
+    """A container log file with the pod identity taken from its path."""
+
+    path: str
+    namespace: str
+    pod: str
+    uid: str
+    container: str
+    restart: int  # Container restart count the file was written under
+
+    @property
+    def pod_key(self) -> str:
+        """Key of the pod: namespace/pod."""
+        return f"{self.namespace}/{self.pod}"
+
+    @property
+    def container_key(self) -> str:
+        """Key of the container: namespace/pod/container."""
+        return f"{self.namespace}/{self.pod}/{self.container}"
+
+
+def parse_pod_log_path(file_path: str) -> PodLogFile | None:
+    """
+    Read namespace, pod, uid, container and restart count from a log path.
+
+    Args:
+        file_path: Path such as /var/log/pods/default_web-7d9f_1a2b/app/0.log
+
+    Returns:
+        PodLogFile, or None if the path is not laid out like a pod log
+    """
+    container_dir, name = os.path.split(file_path)
+    pod_dir, container = os.path.split(container_dir)
+    log_match = _LOG_FILE.match(name)
+    pod_match = _POD_DIR.match(os.path.basename(pod_dir))
+    if log_match is None or pod_match is None or not container:
+        return None
+    return PodLogFile(
+        path=file_path,
+        namespace=pod_match["namespace"],
+        pod=pod_match["pod"],
+        uid=pod_match["uid"],
+        container=container,
+        restart=int(log_match["restart"]),
+    )
+
+
+def find_pod_logs(
+    root: str,
+    namespace: str | None = None,
+    pod: str | None = None,
+    container: str | None = None,
+) -> list[PodLogFile]:
+    """
+    Find the container log files below a pod log directory.
+
+    Args:
+        root: Pod log directory (usually /var/log/pods)
+        namespace: Glob the namespace must match
+        pod: Glob the pod name must match
+        container: Glob the container name must match
+
+    Returns:
+        Log files sorted by namespace, pod, container and path
+    """
+    logs: list[PodLogFile] = []
+    for directory, _, names in os.walk(root):
+        for name in names:
+            log = parse_pod_log_path(os.path.join(directory, name))
+            if log is None:
+                continue
+            if namespace and not fnmatchcase(log.namespace, namespace):
+                continue
+            if pod and not fnmatchcase(log.pod, pod):
+                continue
+            if container and not fnmatchcase(log.container, container):
+                continue
+            logs.append(log)
+    logs.sort(key=lambda log: (log.namespace, log.pod, log.container, log.path))
+    return logs
+
+
+def _utc(timestamp: datetime) -> datetime:
+    """Comparable form of a timestamp (naive timestamps are taken as UTC)."""
+    return timestamp if timestamp.tzinfo is not None else timestamp.replace(tzinfo=timezone.utc)
+
+
+@dataclass
+class PodLogStats:
+    """Counts for one log file, or aggregated over a container or pod."""
+
+    files: int = 0
+    restarts: int = 0
+    entries: int = 0
+    errors: int = 0
+    warnings: int = 0
+    levels: Counter[str] = field(default_factory=Counter)
+    error_patterns: Counter[str] = field(default_factory=Counter)
+    formats: set[str] = field(default_factory=set)
+    time_start: datetime | None = None
+    time_end: datetime | None = None
+
+    def add(self, other: "PodLogStats") -> None:
+        """Fold another file's or container's counts into these."""
+        self.files += other.files
+        self.entries += other.entries
+        self.errors += other.errors
+        self.warnings += other.warnings
+        self.levels.update(other.levels)
+        self.error_patterns.update(other.error_patterns)
+        self.formats |= other.formats
+        if other.time_start:
+            self.widen(other.time_start)
+        if other.time_end:
+            self.widen(other.time_end)
+
+    def widen(self, timestamp: datetime) -> None:
+        """
+        Extend the time range to include a timestamp.
+
+        Files of one pod may mix naive and offset-aware timestamps (CRI
+        files next to application logs), so they are compared as UTC.
+        """
+        if self.time_start is None or _utc(timestamp) < _utc(self.time_start):
+            self.time_start = timestamp
+        if self.time_end is None or _utc(timestamp) > _utc(self.time_end):
+            self.time_end = timestamp
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "files": self.files,
+            "restarts": self.restarts,
+            "entries": self.entries,
+            "errors": self.errors,
+            "warnings": self.warnings,
+            "level_distribution": dict(self.levels),
+            "top_errors": [
+                {"pattern": pattern, "count": count}
+                for pattern, count in self.error_patterns.most_common(MAX_ERROR_PATTERNS)
+            ],
+            "formats": sorted(self.formats),
+            "time_range": {
+                "start": self.time_start.isoformat() if self.time_start else None,
+                "end": self.time_end.isoformat() if self.time_end else None,
+            },
+        }
+
+
+@dataclass
+class PodLogResult:
+    """Result of analyzing a pod log directory."""
+
+    root: str
+    files: int = 0
+    detections: int = 0  # Format detection runs; other files reused a parser
+    total: PodLogStats = field(default_factory=PodLogStats)
+    pods: dict[str, PodLogStats] = field(default_factory=dict)
+    containers: dict[str, PodLogStats] = field(default_factory=dict)
+    failed: dict[str, str] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "root": self.root,
+            "files": self.files,
+            "detections": self.detections,
+            "total": self.total.to_dict(),
+            "pods": {key: stats.to_dict() for key, stats in self.pods.items()},
+            "containers": {key: stats.to_dict() for key, stats in self.containers.items()},
+            "failed": self.failed,
+        }
+
+
+class PodLogAnalyzer(MultiFileAnalyzer):
+    """
+    Analyzer for a kubelet pod log directory.
+
+    Replicas and restarts of a container write the same format, so a parser
+    detected for the first file of a namespace and container name is reused
+    for the others as long as it passes a spot-check. Each file gets a deep
+    copy of the warm parser (detected inner format, header schema) so neither
+    the parser nor an inner parser it wraps is shared across threads.
+    """
+
+    def __init__(
+        self,
+        format_hint: str | None = None,
+        max_lines_per_file: int = 10000,
+        max_files: int = 1000,
+        max_workers: int | None = None,
+    ):
+        """
+        Initialize pod log analyzer.
+
+        Args:
+            format_hint: Format name or grok spec for every file (None to
+                detect per container)
+            max_lines_per_file: Maximum lines to read from each file
+            max_files: Maximum files to analyze
+            max_workers: Threads parsing files (None for min(8, CPU count))
+        """
+        super().__init__(format_hint=format_hint)
+        self.max_lines_per_file = max_lines_per_file
+        self.max_files = max_files
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+
+    def analyze(
+        self,
+        root: str,
+        namespace: str | None = None,
+        pod: str | None = None,
+        container: str | None = None,
+    ) -> PodLogResult:
+        """
+        Analyze every container log below a pod log directory.
+
+        Args:
+            root: Pod log directory (usually /var/log/pods)
+            namespace: Glob the namespace must match
+            pod: Glob the pod name must match
+            container: Glob the container name must match
+
+        Returns:
+            PodLogResult with counts per pod and per container
+        """
+        result = PodLogResult(root=root)
+        logs = find_pod_logs(root, namespace, pod, container)[: self.max_files]
+        result.files = len(logs)
+
+        # Parsers are resolved up front: detection and priming run once per
+        # container name, and the workers only parse
+        warm: dict[tuple[str, str], tuple[BaseLogParser, float]] = {}
+        jobs: list[tuple[PodLogFile, BaseLogParser]] = []
+        for log in logs:
+            try:
+                parser = self._warm_parser(log, warm, result)
+            except (OSError, ValueError) as e:
+                result.failed[log.path] = str(e)
+                continue
+            jobs.append((log, copy.deepcopy(parser)))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            outcomes = list(executor.map(self._analyze_job, jobs))
+
+        pod_keys: dict[str, str] = {}
+        for (log, _), outcome in zip(jobs, outcomes, strict=True):
+            if isinstance(outcome, str):
+                result.failed[log.path] = outcome
+                continue
+            container_stats = result.containers.setdefault(log.container_key, PodLogStats())
+            container_stats.add(outcome)
+            container_stats.restarts = max(container_stats.restarts, log.restart)
+            pod_keys[log.container_key] = log.pod_key
+
+        for key, container_stats in result.containers.items():
+            pod_stats = result.pods.setdefault(pod_keys[key], PodLogStats())
+            pod_stats.add(container_stats)
+            pod_stats.restarts += container_stats.restarts
+            result.total.add(container_stats)
+            result.total.restarts += container_stats.restarts
+
+        return result
+
+    def _warm_parser(
+        self,
+        log: PodLogFile,
+        warm: dict[tuple[str, str], tuple[BaseLogParser, float]],
+        result: PodLogResult,
+    ) -> BaseLogParser:
+        """Reuse the parser of the file's container name, detecting it if needed."""
+        key = (log.namespace, log.container)
+        known = warm.get(key)
+        if known is not None:
+            parser, confidence = known
+            if spot_check(parser, log.path) >= confidence - SPOT_CHECK_TOLERANCE:
+                return parser
+
+        if self.format_hint and self.format_hint.lower() != "auto":
+            parser, confidence = get_parser(self.format_hint), 1.0
+        else:
+            parser, confidence = detect_format(log.path)
+            result.detections += 1
+            if parser.name == "docker":
+                # CRI lines wrap the application's own format
+                parser = DockerParser(inner_format=AUTO_INNER)
+        parser.prime_file(log.path)
+
+        # An empty first file tells nothing about the container's format
+        if known is None and confidence > 0:
+            warm[key] = (parser, confidence)
+        return parser
+
+    def _analyze_job(self, job: tuple[PodLogFile, BaseLogParser]) -> PodLogStats | str:
+        """Count one file's entries; errors are returned as their message."""
+        log, parser = job
+        stats = PodLogStats(files=1, formats={parser.name})
+        try:
+            for entry in parser.parse_file(log.path, max_lines=self.max_lines_per_file):
+                stats.entries += 1
+                if entry.timestamp:
+                    stats.widen(entry.timestamp)
+                if entry.level is None:
+                    continue
+                level = entry.level.value
+                stats.levels[level] += 1
+                if level in self.ERROR_LEVELS:
+                    stats.errors += 1
+                    stats.error_patterns[ERROR_PATTERNS(entry.message)] += 1
+                elif level in self.WARN_LEVELS:
+                    stats.warnings += 1
+        except (OSError, ValueError) as e:
+            return str(e)
+        return stats
+
+
+def analyze_pod_logs(
+    root: str = DEFAULT_POD_LOG_ROOT,
+    namespace: str | None = None,
+    pod: str | None = None,
+    container: str | None = None,
+    max_files: int = 1000,
+) -> PodLogResult:
+    """
+    Convenience function to analyze a pod log directory.
+
+    Args:
+        root: Pod log directory
+        namespace: Glob the namespace must match
+        pod: Glob the pod name must match
+        container: Glob the container name must match
+        max_files: Maximum files to analyze
+
+    Returns:
+        PodLogResult with counts per pod and per container
+    """
+    analyzer = PodLogAnalyzer(max_files=max_files)
+    return analyzer.analyze(root, namespace, pod, container)
@@ -0,0 +1,309 @@
+"""Frequent precursor sequences mined from a log stream.
+
+Events are reduced to template ids (normalized message -> small integer) the
+first time a window needs them, so windows are compared as integer lists
+rather than re-normalized strings. Times are microseconds since the epoch
+(as the correlators index them), so naive and tz-aware timestamps mix. The
+miner keeps a bounded sliding window of recent events; each anchor
+snapshots the window before it (without earlier anchors of its key), and a
+reservoir of windows before randomly chosen events estimates how often a
+sequence shows up anyway. Frequent templates are combined apriori-style
+into ordered pairs and triples (a triple is only tried when its three pairs
+are frequent), and sequences are ranked by lift: their share of anchor
+windows over their background share.
+
+Reference: Mannila, Toivonen and Verkamo, "Discovery of Frequent Episodes
+in Event Sequences", Data Mining and Knowledge Discovery 1(3), 1997.
+"""
+
+import math
+import random
+from bisect import bisect_right
+from collections import Counter, deque
+from dataclasses import dataclass
+from datetime import timedelta
+from itertools import permutations
+from typing import Any
+
+from .normalizer import PRECURSOR_TEMPLATES, MessageNormalizer
+
+# Share of anchor windows a template or sequence must precede to be reported
+DEFAULT_MIN_SUPPORT = 0.5
+
+# Most recent events kept in the sliding window
+DEFAULT_MAX_EVENTS = 100
+
+# Reference windows kept to estimate background rates
+DEFAULT_BACKGROUND_SAMPLES = 256
+
+# Templates (highest lift first) combined into pair and triple candidates
+MAX_SEQUENCE_TEMPLATES = 20
+
+# Templates and sequences must be more common before anchors than this
+# multiple of their background rate
+MIN_LIFT = 2.0
+
+# Output limits
+MAX_PRECURSORS = 10
+MAX_SEQUENCES = 10
+
+
+@dataclass
+class PrecursorSequence:
+    """Templates that precede anchors in this order (not necessarily adjacent)."""
+
+    templates: list[str]
+    support: float  # Share of anchor windows containing the sequence
+    background: float  # Smoothed share of reference windows containing it
+    lift: float  # support / background
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "templates": self.templates,
+            "support": round(self.support, 2),
+            "background": round(self.background, 3),
+            "lift": round(self.lift, 2),
+        }
+
+
+class _Event:
+    """A buffered event; its template id is filled in when first needed."""
+
+    __slots__ = ("epoch", "message", "template_id", "anchor_keys")
+
+    def __init__(self, epoch: int, message: str, anchor_keys: tuple[str, ...]) -> None:
+        self.epoch = epoch
+        self.message = message
+        self.template_id = -1
+        self.anchor_keys = anchor_keys  # Keys it was marked an anchor under
+
+
+# Template id -> positions in a window, ascending
+_Window = dict[int, list[int]]
+
+
+def _window(template_ids: list[int]) -> _Window:
+    positions: _Window = {}
+    for position, template_id in enumerate(template_ids):
+        positions.setdefault(template_id, []).append(position)
+    return positions
+
+
+def _contains(window: _Window, sequence: tuple[int, ...]) -> bool:
+    """Whether the templates occur in the window in order (greedy earliest match)."""
+    after = -1
+    for template_id in sequence:
+        positions = window.get(template_id)
+        if positions is None:
+            return False
+        i = bisect_right(positions, after)
+        if i == len(positions):
+            return False
+        after = positions[i]
+    return True
+
+
+class PrecursorMiner:
+    """
+    Mine templates and ordered template sequences preceding anchor events.
+
+    Feed every timestamped event in time order with add(); call
+    mark_anchor() just before adding an anchor event, and with None for
+    anchors without a timestamp so support is measured against every
+    anchor. Anchors of several patterns can share one miner under
+    different keys.
+
+    Usage:
+        miner = PrecursorMiner(window_before=timedelta(seconds=60))
+        for epoch, entry in entries:
+            if is_anchor(entry):
+                miner.mark_anchor(epoch)
+            miner.add(epoch, entry.message)
+        miner.sequences()  # [PrecursorSequence(["disk full", "write failed"], ...)]
+    """
+
+    def __init__(
+        self,
+        window_before: timedelta,
+        min_support: float = DEFAULT_MIN_SUPPORT,
+        max_events: int = DEFAULT_MAX_EVENTS,
+        background_samples: int = DEFAULT_BACKGROUND_SAMPLES,
+        normalizer: MessageNormalizer = PRECURSOR_TEMPLATES,
+        seed: int = 0,
+    ):
+        """
+        Initialize miner.
+
+        Args:
+            window_before: How far back from an event its window reaches
+            min_support: Share of anchor windows (0-1] a template or
+                sequence must occur in
+            max_events: Most recent events kept per window
+            background_samples: Reference windows kept (reservoir sample
+                over all events)
+            normalizer: Turns messages into templates
+            seed: Seed of the reservoir sampling, for reproducible results
+        """
+        self.window_before = window_before
+        self._before_us = window_before // timedelta(microseconds=1)
+        self.min_support = min_support
+        self.background_samples = background_samples
+        self.normalizer = normalizer
+        self._events: deque[_Event] = deque(maxlen=max_events)
+        self._ids: dict[str, int] = {}
+        self._templates: list[str] = []
+        self._anchor_windows: dict[str, list[_Window]] = {}
+        self._marked: list[str] = []  # Anchor keys of the next event added
+        self._background: list[_Window] = []
+        self._seen = 0
+        self._next_sample = 1 if background_samples > 0 else 0
+        self._weight = 1.0
+        self._random = random.Random(seed)
+
+    def add(self, epoch: int, message: str) -> None:
+        """Add the next event (microseconds since the epoch), sampling the window before it."""
+        self._seen += 1
+        if self._seen == self._next_sample:
+            if len(self._background) < self.background_samples:
+                self._background.append(self._snapshot(epoch))
+                self._next_sample += 1
+                if len(self._background) == self.background_samples:
+                    self._skip_ahead()
+            else:
+                slot = self._random.randrange(self.background_samples)
+                self._background[slot] = self._snapshot(epoch)
+                self._skip_ahead()
+        self._events.append(_Event(epoch, message, tuple(self._marked)))
+        self._marked.clear()
+
+    def _skip_ahead(self) -> None:
+        """
+        Draw the next event to sample once the reservoir is full.
+
+        Li's Algorithm L: the gap to the next replacement is drawn directly,
+        so skipped events cost no random draws.
+        """
+        k = self.background_samples
+        self._weight *= math.exp(math.log(1.0 - self._random.random()) / k)
+        gap = math.log(1.0 - self._random.random()) / math.log1p(-self._weight)
+        self._next_sample = self._seen + int(gap) + 1
+
+    def mark_anchor(self, epoch: int | None, key: str = "") -> None:
+        """Record the window before an anchor event at epoch (None: an empty window)."""
+        windows = self._anchor_windows.setdefault(key, [])
+        if epoch is None:
+            windows.append({})
+            return
+        windows.append(self._snapshot(epoch, key))
+        self._marked.append(key)
+
+    def _template_id(self, event: _Event) -> int:
+        if event.template_id < 0:
+            template = self.normalizer(event.message)
+            template_id = self._ids.get(template)
+            if template_id is None:
+                template_id = self._ids[template] = len(self._templates)
+                self._templates.append(template)
+            event.template_id = template_id
+        return event.template_id
+
+    def _snapshot(self, epoch: int, key: str | None = None) -> _Window:
+        """Template positions of the buffered events before epoch, except anchors of key."""
+        start = epoch - self._before_us
+        events = self._events
+        while events and events[0].epoch < start:
+            events.popleft()
+        return _window(
+            [
+                self._template_id(event)
+                for event in events
+                # Late arrivals may lie outside
+                if start <= event.epoch < epoch and key not in event.anchor_keys
+            ]
+        )
+
+    def _frequent(self, windows: list[_Window]) -> tuple[float, list[tuple[int, int]]]:
+        """Support needed and (template id, count) of frequent templates, most common first."""
+        needed = len(windows) * self.min_support
+        counts: Counter[int] = Counter()
+        for window in windows:
+            counts.update(window.keys())
+        frequent = sorted(
+            (item for item in counts.items() if item[1] >= needed),
+            key=lambda item: (-item[1], item[0]),
+        )
+        return needed, frequent
+
+    def common_precursors(self, key: str = "", limit: int = MAX_PRECURSORS) -> list[str]:
+        """Templates preceding at least min_support of the anchors, most common first."""
+        windows = self._anchor_windows.get(key, [])
+        _, frequent = self._frequent(windows)
+        return [self._templates[template_id] for template_id, _ in frequent[:limit]]
+
+    def sequences(self, key: str = "", limit: int = MAX_SEQUENCES) -> list[PrecursorSequence]:
+        """
+        Ordered pairs and triples preceding at least min_support of the anchors.
+
+        Only templates whose own lift exceeds MIN_LIFT are combined, so
+        sequences are built from events that set anchors apart.
+
+        Args:
+            key: Anchor key passed to mark_anchor
+            limit: Sequences returned
+
+        Returns:
+            Sequences with lift above MIN_LIFT, by descending lift (then
+            longer, then more supported)
+        """
+        windows = self._anchor_windows.get(key, [])
+        if not windows:
+            return []
+        needed, frequent = self._frequent(windows)
+        reference = self._background
+
+        def lift(sequence: tuple[int, ...], found: int) -> tuple[float, float]:
+            background_count = sum(_contains(window, sequence) for window in reference)
+            background = (background_count + 1) / (len(reference) + 2)
+            return background, found / len(windows) / background
+
+        # Templates as common everywhere as before anchors do not set the
+        # anchors apart and would crowd out the ones that do
+        lifts = {template_id: lift((template_id,), found)[1] for template_id, found in frequent}
+        ranked = sorted((t for t in lifts if lifts[t] > MIN_LIFT), key=lambda t: -lifts[t])
+        candidates = ranked[:MAX_SEQUENCE_TEMPLATES]
+
+        def count(sequence: tuple[int, ...]) -> int:
+            return sum(_contains(window, sequence) for window in windows)
+
+        supported: dict[tuple[int, ...], int] = {}
+        for pair in permutations(candidates, 2):
+            found = count(pair)
+            if found >= needed:
+                supported[pair] = found
+        pairs = list(supported)
+        for first, second in pairs:
+            for third in candidates:
+                if third in (first, second):
+                    continue
+                if (second, third) in supported and (first, third) in supported:
+                    triple = (first, second, third)
+                    found = count(triple)
+                    if found >= needed:
+                        supported[triple] = found
+
+        results: list[PrecursorSequence] = []
+        for sequence, found in supported.items():
+            background, sequence_lift = lift(sequence, found)
+            if sequence_lift <= MIN_LIFT:
+                continue  # No likelier before anchors than anywhere else
+            results.append(
+                PrecursorSequence(
+                    templates=[self._templates[template_id] for template_id in sequence],
+                    support=found / len(windows),
+                    background=background,
+                    lift=sequence_lift,
+                )
+            )
+        results.sort(key=lambda s: (-s.lift, -len(s.templates), -s.support))
+        return results[:limit]
@@ -1,17 +1,60 @@
 """Sensitive data detector for log analysis.
 
 Detects PII, credentials, and other sensitive information in log files.
+
+Most patterns cannot match without one of a few literals ("@", "bearer",
+"://"), so every line is first scanned once by an Aho-Corasick automaton
+over those literals and only the patterns whose literals occur are run;
+lines where none occur are skipped outright. Large files are split into
+chunks of lines scanned by a pool of processes, with results merged in
+line order.
+
+redact_file() writes a redacted copy of a whole file: blocks of raw bytes
+cut at newlines are redacted (in worker processes for large files) and
+written in order through a large buffer, optionally as one gzip member per
+block. Everything but the redacted matches is copied byte for byte.
 """
 
 from __future__ import annotations
 
+import contextlib
+import gzip
+import multiprocessing
+import os
 import re
-from collections import Counter
+from collections import Counter, deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, TypeVar
 
 from ..parsers.base import BaseLogParser
-from ..utils.file_handler import stream_file
+from ..utils.file_handler import detect_encoding, is_gzip_file, stream_file
+from .aho_corasick import AhoCorasick
+
+# Files at least this large are scanned in parallel when workers is not given
+PARALLEL_MIN_BYTES = 64 * 1024 * 1024
+
+# Lines per chunk handed to a worker process
+CHUNK_LINES = 50000
+
+# Upper bound on worker processes chosen automatically
+MAX_WORKERS = 8
+
+# Bytes of input redacted per block when writing a redacted copy
+REDACT_BLOCK_BYTES = 4 * 1024 * 1024
+
+# Output buffer of redacted copies
+WRITE_BUFFER_BYTES = 16 * 1024 * 1024
+
+# Compression level of gzip output (each block is compressed as one member)
+GZIP_LEVEL = 6
+
+_T = TypeVar("_T")
+
+# A pattern to run: (name, compiled, category, severity, redaction,
+# required literal bit, required character run)
+_Selected = tuple[str, re.Pattern[str], str, str, str, int, str | None]
 
 
 @dataclass
@@ -62,6 +105,37 @@ class SensitiveDataResult:
         }
 
 
+@dataclass
+class RedactionResult:
+    """Result of writing a redacted copy of a log file."""
+
+    output_path: str = ""
+    compressed: bool = False
+    lines_written: int = 0
+    lines_redacted: int = 0  # Lines with at least one redaction
+    redactions_by_category: dict[str, int] = field(default_factory=dict)
+    bytes_read: int = 0  # Uncompressed input
+    bytes_written: int = 0
+
+    @property
+    def total_redactions(self) -> int:
+        """Matches replaced across all categories."""
+        return sum(self.redactions_by_category.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "output_path": self.output_path,
+            "compressed": self.compressed,
+            "lines_written": self.lines_written,
+            "lines_redacted": self.lines_redacted,
+            "total_redactions": self.total_redactions,
+            "redactions_by_category": self.redactions_by_category,
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+        }
+
+
 class SensitiveDataDetector:
     """
     Detect sensitive data in log files.
@@ -208,6 +282,34 @@ class SensitiveDataDetector:
         ),
     }
 
+    # Literals (any case) a pattern cannot match without; a pattern is only
+    # run on lines containing one of its literals
+    REQUIRED_LITERALS: dict[str, tuple[str, ...]] = {
+        "email": ("@",),
+        "aws_access_key": ("akia", "abia", "acca", "asia"),
+        "aws_secret_key": ("secret",),
+        "api_key_generic": ("api", "secret_key"),
+        "bearer_token": ("bearer",),
+        "jwt_token": ("eyj",),
+        "password_in_url": ("passw", "pwd"),
+        "basic_auth_url": ("://",),
+        "private_key": ("-----begin",),
+        "db_connection_string": ("://",),
+        "github_token": ("ghp_", "gho_", "ghu_", "ghs_", "ghr_"),
+        "slack_token": ("xox",),
+        "ipv4_address": tuple(f"{digit}." for digit in range(10)),
+    }
+
+    # Character runs a pattern cannot match without, for patterns with no
+    # required literal (card numbers, SSNs and phone numbers end in 4 digits)
+    REQUIRED_RUNS: dict[str, str] = {
+        "credit_card_visa": r"\d{4}",
+        "credit_card_mastercard": r"\d{4}",
+        "credit_card_amex": r"\d{4}",
+        "ssn": r"\d{4}",
+        "phone_number": r"\d{4}",
+    }
+
     # Patterns to exclude (false positives)
     EXCLUDE_PATTERNS: list[str] = [
         r"0\.0\.0\.0",  # Not a real IP
@@ -229,9 +331,18 @@ class SensitiveDataDetector:
         self._compile_patterns()
 
     def _compile_patterns(self) -> None:
-        """Pre-compile all regex patterns."""
+        """Pre-compile all regex patterns and their prefilters."""
         for name, (pattern, _, _, _) in self.PATTERNS.items():
             self._compiled_patterns[name] = re.compile(pattern)
+        self._compiled_excludes = [re.compile(pattern) for pattern in self.EXCLUDE_PATTERNS]
+        self._literals = AhoCorasick(
+            {
+                name: literals
+                for name, literals in self.REQUIRED_LITERALS.items()
+                if name in self.PATTERNS
+            }
+        )
+        self._runs = {run: re.compile(run) for run in set(self.REQUIRED_RUNS.values())}
 
     def analyze_file(
         self,
@@ -241,6 +352,7 @@ class SensitiveDataDetector:
         max_matches: int = 100,
         max_lines: int = 100000,
         categories: list[str] | None = None,
+        workers: int | None = None,
     ) -> SensitiveDataResult:
         """
         Scan a log file for sensitive data.
@@ -252,25 +364,86 @@ class SensitiveDataDetector:
             max_matches: Maximum matches to return
             max_lines: Maximum lines to scan
             categories: Filter to specific categories (email, credit_card, etc.)
+            workers: Processes scanning chunks of lines in parallel; None
+                picks one per CPU (up to MAX_WORKERS) for files of at least
+                PARALLEL_MIN_BYTES and more than one chunk, 1 scans in this
+                process. Workers are spawned, so scripts scanning in parallel
+                need an `if __name__ == "__main__":` guard
 
         Returns:
             SensitiveDataResult with matches and statistics
         """
+        if workers is None:
+            workers = 1
+            if max_lines > CHUNK_LINES and os.path.getsize(file_path) >= PARALLEL_MIN_BYTES:
+                workers = min(MAX_WORKERS, os.cpu_count() or 1)
+
+        lines = stream_file(file_path, max_lines=max_lines)
+        if workers > 1:
+            result = self._scan_parallel(lines, redact, max_matches, categories, workers)
+        else:
+            result = self._scan(lines, redact, max_matches, categories)
+        result.summary = self._generate_summary(result)
+
+        return result
+
+    def _select(
+        self, categories: list[str] | None
+    ) -> tuple[list[_Selected], bool, dict[str, re.Pattern[str]]]:
+        """
+        Patterns to run, in PATTERNS order, with their prefilters.
+
+        Returns:
+            (patterns with the literal bit or character run that must be
+            present first (0 / None: always run), whether any pattern always
+            runs, compiled character runs)
+        """
+        bits = self._literals.bits
+        selected = [
+            (
+                pattern_name,
+                self._compiled_patterns[pattern_name],
+                category,
+                severity,
+                redaction,
+                bits.get(pattern_name, 0),
+                self.REQUIRED_RUNS.get(pattern_name) if pattern_name not in bits else None,
+            )
+            for pattern_name, (_, category, severity, redaction) in self.PATTERNS.items()
+            if not categories or category in categories
+        ]
+        always_run = any(bit == 0 and run is None for *_, bit, run in selected)
+        runs = {run: self._runs[run] for *_, run in selected if run is not None}
+        return selected, always_run, runs
+
+    def _scan(
+        self,
+        lines: Iterable[tuple[int, str]],
+        redact: bool,
+        max_matches: int,
+        categories: list[str] | None,
+    ) -> SensitiveDataResult:
+        """Scan numbered lines, without the summary."""
         result = SensitiveDataResult()
         category_counts: Counter[str] = Counter()
         severity_counts: Counter[str] = Counter()
 
-        for line_num, raw_line in stream_file(file_path, max_lines=max_lines):
+        selected, always_run, runs = self._select(categories)
+        scan_literals = self._literals.scan
+
+        for line_num, raw_line in lines:
             result.lines_scanned = line_num
 
+            mask = scan_literals(raw_line.lower().encode())[0]
+            present = {run for run, compiled_run in runs.items() if compiled_run.search(raw_line)}
+            if not mask and not present and not always_run:
+                continue
+
             # Check each pattern
-            for pattern_name, (_, category, severity, redaction) in self.PATTERNS.items():
-                # Skip if filtering by category
-                if categories and category not in categories:
+            for pattern_name, compiled, category, severity, redaction, bit, run in selected:
+                if bit and not mask & bit:
                     continue
-
-                compiled = self._compiled_patterns.get(pattern_name)
-                if not compiled:
+                if run is not None and run not in present:
                     continue
 
                 for match in compiled.finditer(raw_line):
@@ -303,16 +476,237 @@ class SensitiveDataDetector:
 
         result.matches_by_category = dict(category_counts)
         result.matches_by_severity = dict(severity_counts)
-        result.summary = self._generate_summary(result)
+        return result
+
+    def _scan_parallel(
+        self,
+        lines: Iterable[tuple[int, str]],
+        redact: bool,
+        max_matches: int,
+        categories: list[str] | None,
+        workers: int,
+    ) -> SensitiveDataResult:
+        """
+        Scan chunks of lines in worker processes, merging in line order.
+
+        Chunks are read here, so max_lines and encoding handling stay in
+        stream_file.
+        """
+        result = SensitiveDataResult()
+        category_counts: Counter[str] = Counter()
+        severity_counts: Counter[str] = Counter()
+
+        def merge(partial: SensitiveDataResult) -> None:
+            result.total_matches += partial.total_matches
+            category_counts.update(partial.matches_by_category)
+            severity_counts.update(partial.matches_by_severity)
+            result.matches.extend(partial.matches[: max_matches - len(result.matches)])
+            result.lines_scanned = max(result.lines_scanned, partial.lines_scanned)
+
+        def chunks() -> Iterator[tuple[Any, ...]]:
+            chunk: list[str] = []
+            first_line = 1
+            for line_num, raw_line in lines:
+                if not chunk:
+                    first_line = line_num
+                chunk.append(raw_line)
+                if len(chunk) == CHUNK_LINES:
+                    yield first_line, chunk, redact, max_matches, categories
+                    chunk = []
+            if chunk:
+                yield first_line, chunk, redact, max_matches, categories
+
+        for partial in self._map_in_order(_scan_chunk, chunks(), workers):
+            merge(partial)
+
+        result.matches_by_category = dict(category_counts)
+        result.matches_by_severity = dict(severity_counts)
+        return result
+
+    def _map_in_order(
+        self, function: Callable[..., _T], jobs: Iterable[tuple[Any, ...]], workers: int
+    ) -> Iterator[_T]:
+        """
+        Run function(*job) for each job in worker processes, yielding results in job order.
+
+        At most two jobs per worker are in flight at a time, which bounds
+        memory on files of any size.
+        """
+        # Spawned rather than forked, so workers never inherit the state of
+        # threads running in the server process
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=context, initializer=_init_worker, initargs=(self,)
+        ) as executor:
+            pending: deque[Future[_T]] = deque()
+            for job in jobs:
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+                pending.append(executor.submit(function, *job))
+            while pending:
+                yield pending.popleft().result()
+
+    def redact_file(
+        self,
+        file_path: str,
+        output_path: str,
+        categories: list[str] | None = None,
+        compress: bool | None = None,
+        workers: int | None = None,
+    ) -> RedactionResult:
+        """
+        Write a redacted copy of a log file.
+
+        Matches are replaced by their pattern's redaction template, honoring
+        the same exclusions as analyze_file (private IPs unless
+        include_private_ips), so the counts equal analyze_file's
+        matches_by_category; overlapping matches share one placeholder. Line
+        endings, undecodable bytes and a missing final newline are kept as
+        they are. Gzip input is read transparently.
+
+        Args:
+            file_path: Path to the log file
+            output_path: Path of the redacted copy (replaced once complete if
+                it exists)
+            categories: Redact only these categories (email, credit_card, etc.)
+            compress: Write gzip; None compresses when output_path ends in .gz
+            workers: Processes redacting blocks in parallel; None picks one
+                per CPU (up to MAX_WORKERS) for files of at least
+                PARALLEL_MIN_BYTES, 1 redacts in this process
+
+        Returns:
+            RedactionResult with per-category redaction counts
+
+        Raises:
+            FileNotFoundError: If the log file does not exist
+            ValueError: If output_path is the log file, or its encoding does
+                not encode a newline as one byte (UTF-16, UTF-32)
+        """
+        if not os.path.isfile(file_path):
+            raise FileNotFoundError(f"Log file not found: {file_path}")
+        if os.path.exists(output_path) and os.path.samefile(file_path, output_path):
+            raise ValueError("Output path must differ from the log file")
+        encoding = detect_encoding(file_path)
+        if "\n".encode(encoding) != b"\n":
+            raise ValueError(f"Cannot redact {encoding} files line by line")
+        if compress is None:
+            compress = output_path.endswith(".gz")
+        if workers is None:
+            workers = 1
+            if os.path.getsize(file_path) >= PARALLEL_MIN_BYTES:
+                workers = min(MAX_WORKERS, os.cpu_count() or 1)
+
+        result = RedactionResult(output_path=output_path, compressed=compress)
+        category_counts: Counter[str] = Counter()
 
+        def blocks() -> Iterator[tuple[Any, ...]]:
+            opener = gzip.open if is_gzip_file(file_path) else open
+            with opener(file_path, "rb") as f:
+                pending = b""
+                while True:
+                    data = f.read(REDACT_BLOCK_BYTES)
+                    if not data:
+                        break
+                    data = pending + data
+                    cut = data.rfind(b"\n") + 1
+                    if cut == 0:
+                        pending = data
+                        continue
+                    pending = data[cut:]
+                    yield data[:cut], encoding, categories, compress
+                if pending:
+                    yield pending, encoding, categories, compress
+
+        if workers > 1:
+            redacted = self._map_in_order(_redact_chunk, blocks(), workers)
+        else:
+            redacted = (self._redact_block(*block) for block in blocks())
+
+        # Written next to the output and moved into place, so a failed run
+        # never leaves a partial copy at output_path
+        temp_path = f"{output_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "wb", buffering=WRITE_BUFFER_BYTES) as out:
+                for data, partial in redacted:
+                    out.write(data)
+                    result.lines_written += partial.lines_written
+                    result.lines_redacted += partial.lines_redacted
+                    result.bytes_read += partial.bytes_read
+                    result.bytes_written += len(data)
+                    category_counts.update(partial.redactions_by_category)
+            os.replace(temp_path, output_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(temp_path)
+            raise
+
+        result.redactions_by_category = dict(category_counts)
         return result
 
+    def _redact_block(
+        self, data: bytes, encoding: str, categories: list[str] | None, compress: bool
+    ) -> tuple[bytes, RedactionResult]:
+        """Redact a block of whole lines; returns the output bytes and counts."""
+        partial = RedactionResult(compressed=compress, bytes_read=len(data))
+        category_counts: Counter[str] = Counter()
+        selected, always_run, runs = self._select(categories)
+        scan_literals = self._literals.scan
+
+        # Undecodable bytes round-trip through surrogate escapes
+        lines = data.decode(encoding, errors="surrogateescape").split("\n")
+        partial.lines_written = len(lines) - (lines[-1] == "")
+        for i, line in enumerate(lines):
+            body, ending = (line[:-1], "\r") if line.endswith("\r") else (line, "")
+            mask = scan_literals(body.lower().encode(errors="surrogatepass"))[0]
+            present = {run for run, compiled_run in runs.items() if compiled_run.search(body)}
+            if not mask and not present and not always_run:
+                continue
+
+            # Matched on the original line, like the scan, so counts agree
+            spans: list[tuple[int, int, int, str]] = []
+            for index, (_, compiled, category, _, redaction, bit, run) in enumerate(selected):
+                if bit and not mask & bit:
+                    continue
+                if run is not None and run not in present:
+                    continue
+
+                for match in compiled.finditer(body):
+                    if self._should_exclude(match.group(0), category):
+                        continue
+                    spans.append((match.start(), index, match.end(), redaction))
+                    category_counts[category] += 1
+            if not spans:
+                continue
+
+            # Overlapping matches become one placeholder: the earliest match's
+            # (first in PATTERNS order on ties), stretched over all of them
+            spans.sort()
+            pieces: list[str] = []
+            end = 0
+            span_start, _, span_end, span_redaction = spans[0]
+            for start, _, stop, redaction in spans[1:]:
+                if start < span_end:
+                    span_end = max(span_end, stop)
+                    continue
+                pieces += (body[end:span_start], span_redaction)
+                end = span_end
+                span_start, span_end, span_redaction = start, stop, redaction
+            pieces += (body[end:span_start], span_redaction, body[span_end:])
+            lines[i] = "".join(pieces) + ending
+            partial.lines_redacted += 1
+
+        output = "\n".join(lines).encode(encoding, errors="surrogateescape")
+        if compress:
+            output = gzip.compress(output, compresslevel=GZIP_LEVEL, mtime=0)
+        partial.redactions_by_category = dict(category_counts)
+        return output, partial
+
     def _should_exclude(self, matched_text: str, category: str) -> bool:
         """Check if a match should be excluded (false positive)."""
         # Skip private IPs unless explicitly included
         if category == "ip_address" and not self.include_private_ips:
-            for exclude_pattern in self.EXCLUDE_PATTERNS:
-                if re.match(exclude_pattern, matched_text):
+            for exclude_pattern in self._compiled_excludes:
+                if exclude_pattern.match(matched_text):
                     return True
         return False
 
@@ -360,3 +754,32 @@ class SensitiveDataDetector:
             if compiled:
                 redacted = compiled.sub(redaction, redacted)
         return redacted
+
+
+# Detector of the current worker process, set by _init_worker
+_worker_detector: SensitiveDataDetector | None = None
+
+
+def _init_worker(detector: SensitiveDataDetector) -> None:
+    global _worker_detector
+    _worker_detector = detector
+
+
+def _scan_chunk(
+    first_line: int,
+    lines: list[str],
+    redact: bool,
+    max_matches: int,
+    categories: list[str] | None,
+) -> SensitiveDataResult:
+    """Scan one chunk of lines in a worker process."""
+    detector = _worker_detector or SensitiveDataDetector()
+    return detector._scan(enumerate(lines, first_line), redact, max_matches, categories)
+
+
+def _redact_chunk(
+    data: bytes, encoding: str, categories: list[str] | None, compress: bool
+) -> tuple[bytes, RedactionResult]:
+    """Redact one block of lines in a worker process."""
+    detector = _worker_detector or SensitiveDataDetector()
+    return detector._redact_block(data, encoding, categories, compress)
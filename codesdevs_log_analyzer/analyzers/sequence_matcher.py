@@ -0,0 +1,362 @@
+"""Sequence matcher - Find "A followed by B within T" event sequences.
+
+A sequence of step patterns with a time bound between consecutive steps is
+compiled into a small state machine: state i means the first i steps have
+matched. Partial matches are kept per join key (a request id, a lock name),
+so steps only chain within the same key. Each key holds at most one partial
+match per state, the most recent one, so a burst of first steps keeps a
+single timer running from the latest. Keys are kept in order of last
+activity and dropped once every partial match they hold has outlived the
+longest time bound, which bounds memory by the keys active within that time
+instead of the keys in the file.
+"""
+
+import re
+from collections import Counter, OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any
+
+from ..parsers.base import BaseLogParser, ParsedLogEntry
+
+# Limits
+MAX_STEPS = 10
+MAX_MATCHES = 100
+DEFAULT_MAX_KEYS = 100000
+
+# Join keys reported with their match counts
+MAX_TOP_KEYS = 10
+
+
+@dataclass
+class SequenceMatch:
+    """One completed sequence: an entry per step, in step order."""
+
+    key: str | None
+    entries: list[ParsedLogEntry]
+
+    @property
+    def duration_seconds(self) -> float:
+        """Seconds from the first step to the last."""
+        first, last = self.entries[0].timestamp, self.entries[-1].timestamp
+        if first is None or last is None:
+            return 0.0
+        return (last - first).total_seconds()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "key": self.key,
+            "duration_seconds": self.duration_seconds,
+            "steps": [
+                {
+                    "line_number": e.line_number,
+                    "timestamp": e.timestamp.isoformat() if e.timestamp else None,
+                    "message": e.message[:200],
+                }
+                for e in self.entries
+            ],
+        }
+
+
+@dataclass
+class SequenceMatchResult:
+    """Result of sequence matching."""
+
+    steps: list[str]
+    within_seconds: list[float]
+    key: str | None = None
+    total_lines: int = 0
+    started: int = 0  # First steps seen
+    completed: int = 0
+    expired: int = 0  # Partial matches whose next step did not come in time
+    evicted_keys: int = 0  # Keys dropped to stay under max_keys
+    matches: list[SequenceMatch] = field(default_factory=list)
+    matches_by_key: Counter[str] = field(default_factory=Counter)
+    min_duration: float | None = None
+    max_duration: float | None = None
+    total_duration: float = 0.0
+
+    @property
+    def completion_rate(self) -> float:
+        """Share of first steps that went on to complete the sequence."""
+        return self.completed / self.started if self.started else 0.0
+
+    @property
+    def avg_duration(self) -> float | None:
+        """Mean seconds from first to last step of completed sequences."""
+        return self.total_duration / self.completed if self.completed else None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "steps": self.steps,
+            "within_seconds": self.within_seconds,
+            "key": self.key,
+            "total_lines": self.total_lines,
+            "started": self.started,
+            "completed": self.completed,
+            "expired": self.expired,
+            "evicted_keys": self.evicted_keys,
+            "completion_rate": round(self.completion_rate, 3),
+            "duration_seconds": {
+                "min": self.min_duration,
+                "avg": round(self.avg_duration, 3) if self.avg_duration is not None else None,
+                "max": self.max_duration,
+            },
+            "top_keys": dict(self.matches_by_key.most_common(MAX_TOP_KEYS)),
+            "matches": [m.to_dict() for m in self.matches],
+        }
+
+
+class SequenceMatcher:
+    """
+    Streaming matcher for ordered event sequences with time bounds.
+
+    Usage:
+        matcher = SequenceMatcher(["lock acquired", "lock timeout"], within=30, key="request_id")
+        result = matcher.match_file(parser, "app.log")
+        result.completed  # sequences found
+    """
+
+    def __init__(
+        self,
+        steps: list[str],
+        within: float | list[float] = 60,
+        key: str | None = None,
+        max_matches: int = MAX_MATCHES,
+        max_keys: int = DEFAULT_MAX_KEYS,
+        regex: bool = True,
+        case_sensitive: bool = False,
+    ):
+        """
+        Initialize matcher.
+
+        Args:
+            steps: Patterns of the events, in order (2-10)
+            within: Seconds allowed between consecutive steps, one bound for
+                all or one per gap (len(steps) - 1)
+            key: Join key; steps only chain when the entries share its value,
+                read from entry metadata or a 'key=value' / 'key: value' pair
+                in the message. Entries without it are skipped. None joins
+                all entries
+            max_matches: Completed sequences kept with their entries
+            max_keys: Keys with partial matches kept; the least recently
+                active are dropped beyond this
+            regex: Treat step patterns as regexes
+            case_sensitive: Case-sensitive pattern matching
+
+        Raises:
+            ValueError: If the steps, time bounds or patterns are invalid
+        """
+        if not 2 <= len(steps) <= MAX_STEPS:
+            raise ValueError(f"A sequence needs 2 to {MAX_STEPS} steps, got {len(steps)}")
+        bounds = [float(within)] * (len(steps) - 1) if isinstance(within, int | float) else within
+        if len(bounds) != len(steps) - 1:
+            raise ValueError(
+                f"Expected {len(steps) - 1} time bounds (one per gap between steps), "
+                f"got {len(bounds)}"
+            )
+        if any(bound <= 0 for bound in bounds):
+            raise ValueError("Time bounds must be positive")
+
+        flags = 0 if case_sensitive else re.IGNORECASE
+        self._patterns: list[re.Pattern[str]] = []
+        for step in steps:
+            try:
+                self._patterns.append(re.compile(step if regex else re.escape(step), flags))
+            except re.error as e:
+                raise ValueError(f"Invalid regex pattern: {e}") from e
+
+        self.steps = steps
+        self.within = [float(bound) for bound in bounds]
+        self.key = key
+        self.max_matches = max_matches
+        self.max_keys = max_keys
+        self._bounds = [timedelta(seconds=bound) for bound in self.within]
+        self._ttl = max(self._bounds)
+        self._key_pattern = (
+            re.compile(rf"\b{re.escape(key)}\s*[=:]\s*[\"']?([^\s,;\"'\])}}]+)", re.IGNORECASE)
+            if key
+            else None
+        )
+
+        # Per key: partial matches by state (steps matched so far, 1..n-1),
+        # each the entries matched so far; keys in order of last activity
+        self._partials: OrderedDict[str, dict[int, list[ParsedLogEntry]]] = OrderedDict()
+        self._last_seen: dict[str, datetime] = {}
+        self._result = SequenceMatchResult(steps=list(steps), within_seconds=self.within, key=key)
+
+    def _entry_key(self, entry: ParsedLogEntry) -> str | None:
+        """Join key value of an entry ("" when not joining by key)."""
+        if self.key is None:
+            return ""
+        value = entry.metadata.get(self.key)
+        if value is not None:
+            return str(value)
+        match = self._key_pattern.search(entry.message) if self._key_pattern else None
+        return match.group(1) if match else None
+
+    def _expire(self, now: datetime) -> None:
+        """Drop keys idle for longer than the longest time bound."""
+        partials = self._partials
+        while partials:
+            key = next(iter(partials))
+            if now - self._last_seen[key] <= self._ttl:
+                break
+            self._result.expired += len(partials.pop(key))
+            del self._last_seen[key]
+
+    def process_entry(self, entry: ParsedLogEntry) -> None:
+        """
+        Process a single log entry.
+
+        Args:
+            entry: Parsed log entry
+        """
+        result = self._result
+        result.total_lines += 1
+        now = entry.timestamp
+        if now is None:
+            return  # Time bounds cannot be checked
+
+        self._expire(now)
+        matched = [
+            i
+            for i, pattern in enumerate(self._patterns)
+            if pattern.search(entry.message) or pattern.search(entry.raw_line)
+        ]
+        if not matched:
+            return
+        key = self._entry_key(entry)
+        if key is None:
+            return
+
+        states = self._partials.get(key)
+        # Latest steps first, so one entry cannot advance a match it just started
+        for step in reversed(matched):
+            if step == 0:
+                if states is None:
+                    states = self._partials[key] = {}
+                if 1 in states:
+                    result.expired += 1  # Superseded by this later first step
+                states[1] = [entry]
+                result.started += 1
+                continue
+            partial = states.get(step) if states else None
+            if partial is None or states is None:
+                continue
+            del states[step]
+            last = partial[-1].timestamp
+            if last is None or now - last > self._bounds[step - 1]:
+                result.expired += 1
+                continue
+            if step + 1 < len(self._patterns):
+                if step + 1 in states:
+                    result.expired += 1
+                states[step + 1] = [*partial, entry]
+            else:
+                self._complete(key, [*partial, entry])
+
+        if states is None:
+            return
+        if not states:
+            del self._partials[key]
+            self._last_seen.pop(key, None)
+            return
+        self._last_seen[key] = now
+        self._partials.move_to_end(key)
+        while len(self._partials) > self.max_keys:
+            oldest, dropped = self._partials.popitem(last=False)
+            del self._last_seen[oldest]
+            result.expired += len(dropped)
+            result.evicted_keys += 1
+
+    def _complete(self, key: str, entries: list[ParsedLogEntry]) -> None:
+        result = self._result
+        match = SequenceMatch(key=key if self.key is not None else None, entries=entries)
+        duration = match.duration_seconds
+        result.completed += 1
+        result.total_duration += duration
+        if result.min_duration is None or duration < result.min_duration:
+            result.min_duration = duration
+        if result.max_duration is None or duration > result.max_duration:
+            result.max_duration = duration
+        if self.key is not None:
+            result.matches_by_key[key] += 1
+        if len(result.matches) < self.max_matches:
+            result.matches.append(match)
+
+    def finalize(self) -> SequenceMatchResult:
+        """
+        Finalize matching and return results.
+
+        Returns:
+            SequenceMatchResult; partial matches still open count as expired
+        """
+        result = self._result
+        result.expired += sum(len(states) for states in self._partials.values())
+        self._partials.clear()
+        self._last_seen.clear()
+        return result
+
+    def match_file(
+        self, parser: BaseLogParser, file_path: str, max_lines: int | None = None
+    ) -> SequenceMatchResult:
+        """
+        Match sequences in a log file.
+
+        Args:
+            parser: Parser to use for parsing log entries
+            file_path: Path to the log file
+            max_lines: Maximum lines to process (None for all)
+
+        Returns:
+            SequenceMatchResult with the completed sequences
+        """
+        for entry in parser.parse_file(file_path, max_lines=max_lines):
+            self.process_entry(entry)
+        return self.finalize()
+
+    def match_entries(self, entries: Iterator[ParsedLogEntry]) -> SequenceMatchResult:
+        """
+        Match sequences from an iterator of entries.
+
+        Args:
+            entries: Iterator of parsed log entries
+
+        Returns:
+            SequenceMatchResult with the completed sequences
+        """
+        for entry in entries:
+            self.process_entry(entry)
+        return self.finalize()
+
+
+def match_sequence(
+    parser: BaseLogParser,
+    file_path: str,
+    steps: list[str],
+    within: float | list[float] = 60,
+    key: str | None = None,
+    max_matches: int = MAX_MATCHES,
+    max_lines: int | None = None,
+) -> SequenceMatchResult:
+    """
+    Convenience function to find event sequences in a log file.
+
+    Args:
+        parser: Parser to use for parsing log entries
+        file_path: Path to the log file
+        steps: Patterns of the events, in order
+        within: Seconds allowed between consecutive steps (one or per gap)
+        key: Join key field (None to join all entries)
+        max_matches: Completed sequences kept with their entries
+        max_lines: Maximum lines to process (None for all)
+
+    Returns:
+        SequenceMatchResult with the completed sequences
+    """
+    matcher = SequenceMatcher(steps, within=within, key=key, max_matches=max_matches)
+    return matcher.match_file(parser, file_path, max_lines=max_lines)
@@ -0,0 +1,262 @@
+"""Stack trace fingerprinting and interning.
+
+Identical stack traces tend to repeat thousands of times in a log file. This
+module detects frame lines with a single combined pattern, normalizes frames
+(line numbers, addresses, generated class suffixes) and hashes them into a
+fingerprint so each unique trace is stored once and errors can be grouped by
+exception type plus their top frames.
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass, field
+
+# Number of leading frames used for the grouping fingerprint
+DEFAULT_FINGERPRINT_FRAMES = 5
+
+# Maximum lines kept in an interned trace's text
+MAX_TRACE_TEXT_LINES = 30
+
+# Bound on the raw-lines lookup cache before it is reset
+MAX_RAW_CACHE_SIZE = 10000
+
+# All stack-trace line shapes in one alternation, tried with a single match()
+STACK_TRACE_LINE_PATTERN = re.compile(
+    r"Traceback \(most recent call last\):"  # Python
+    r"|\s+at\s+"  # Java/JavaScript frames and generic "at" lines
+    r'|\s+File\s+"[^"]+",\s+line\s+\d+'  # Python stack frame
+    r"|Caused by:"  # Java cause chain
+    r"|\s+\.{3}\s+\d+\s+more"  # Java truncated stack
+)
+
+# Frame lines only (used for fingerprinting); named groups pick the location
+FRAME_PATTERN = re.compile(
+    r"^\s+at\s+(?P<java>[\w.$<>/]+)(?:\((?P<source>[^):]*)(?::\d+)?\))?"
+    r'|^\s+File\s+"(?P<file>[^"]+)",\s+line\s+\d+(?:,\s+in\s+(?P<func>\S+))?'
+)
+
+# Exception type detection, tried against the head message and trace lines
+EXCEPTION_TYPE_PATTERN = re.compile(
+    r"^(?:Caused by:\s*)?(?P<type>\w+(?:\.\w+)*(?:Error|Exception|Failure|Throwable))(?::|\s|$)"
+)
+
+# Generated/synthetic identifiers that vary between runs
+_SYNTHETIC_SUFFIX = re.compile(r"\$\$?(?:Lambda|Proxy|EnhancerBy\w*)?\$?\d+(?:/0x[0-9a-fA-F]+)?")
+
+
+def is_stack_trace_line(line: str) -> bool:
+    """
+    Check if a line is part of a stack trace.
+
+    Args:
+        line: Raw log line
+
+    Returns:
+        True if the line looks like a frame, cause or traceback header
+    """
+    return STACK_TRACE_LINE_PATTERN.match(line) is not None
+
+
+def normalize_frame(line: str) -> str | None:
+    """
+    Normalize a stack frame line for fingerprinting.
+
+    Line numbers, memory addresses and generated class suffixes are dropped so
+    the same call site produces the same frame across builds and runs.
+
+    Args:
+        line: Raw stack trace line
+
+    Returns:
+        Normalized frame string, or None if the line is not a frame
+    """
+    match = FRAME_PATTERN.match(line)
+    if match is None:
+        return None
+
+    java = match.group("java")
+    if java is not None:
+        frame = _SYNTHETIC_SUFFIX.sub("$", java)
+        source = match.group("source")
+        return f"{frame}({source})" if source else frame
+
+    func = match.group("func") or "?"
+    return f"{match.group('file')}:{func}"
+
+
+def _match_exception_type(line: str) -> str | None:
+    """Return the exception type a single line starts with, if any."""
+    match = EXCEPTION_TYPE_PATTERN.match(line.strip())
+    return match.group("type") if match else None
+
+
+def _exception_type_from_lines(lines: list[str]) -> tuple[str | None, bool]:
+    """
+    Find the exception type named inside the trace lines.
+
+    Returns:
+        Tuple of (exception type or None, whether the trace is a Python traceback)
+    """
+    if lines and lines[0].startswith("Traceback"):
+        for line in reversed(lines):
+            exception_type = _match_exception_type(line)
+            if exception_type:
+                return exception_type, True
+        return None, True
+
+    for line in lines:
+        if FRAME_PATTERN.match(line):
+            continue
+        exception_type = _match_exception_type(line)
+        if exception_type:
+            return exception_type, False
+    return None, False
+
+
+def extract_exception_type(head: str, lines: list[str]) -> str | None:
+    """
+    Find the exception type for a trace.
+
+    Python tracebacks put the exception last; Java traces put it first
+    (either in the head message or the first trace line).
+
+    Args:
+        head: Message of the entry that owns the trace
+        lines: Stack trace lines
+
+    Returns:
+        Exception class name, or None if none is found
+    """
+    lines_type, is_python = _exception_type_from_lines(lines)
+    if is_python:
+        return lines_type
+    return _match_exception_type(head) or lines_type
+
+
+def fingerprint_frames(frames: list[str] | tuple[str, ...]) -> str:
+    """
+    Hash normalized frames into a short hex fingerprint.
+
+    Args:
+        frames: Normalized frame strings
+
+    Returns:
+        16-character hex digest
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for frame in frames:
+        digest.update(frame.encode("utf-8", "replace"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class StackTrace:
+    """An interned, fingerprinted stack trace."""
+
+    fingerprint: str  # Hash of exception type and all normalized frames
+    top_fingerprint: str  # Hash of the first N normalized frames
+    exception_type: str | None
+    frames: tuple[str, ...]
+    text: str  # Display text, truncated to MAX_TRACE_TEXT_LINES
+
+    @property
+    def group_key(self) -> str:
+        """Grouping key: exception type plus top-frame fingerprint."""
+        return f"{self.exception_type or 'UnknownError'}@{self.top_fingerprint}"
+
+
+@dataclass(frozen=True)
+class _RawTrace:
+    """Per-verbatim-trace work cached by the interner."""
+
+    frames: tuple[str, ...]
+    frames_fingerprint: str
+    top_fingerprint: str
+    lines_exception_type: str | None
+    is_python: bool
+    text: str
+
+
+@dataclass
+class StackTraceInterner:
+    """
+    Intern stack traces so each unique trace is normalized and stored once.
+
+    Repeats of a byte-identical trace are resolved through a raw-lines cache
+    without re-normalizing; traces that differ only in line numbers or
+    addresses resolve to the same interned StackTrace by fingerprint.
+    """
+
+    top_frames: int = DEFAULT_FINGERPRINT_FRAMES
+    _traces: dict[str, StackTrace] = field(default_factory=dict)
+    _raw_cache: dict[tuple[str, ...], _RawTrace] = field(default_factory=dict)
+    _counts: dict[str, int] = field(default_factory=dict)
+
+    def intern(self, lines: list[str], head: str = "") -> StackTrace | None:
+        """
+        Intern a stack trace.
+
+        Args:
+            lines: Stack trace lines (as they appeared in the log)
+            head: Message of the entry that owns the trace
+
+        Returns:
+            Shared StackTrace instance, or None if lines is empty
+        """
+        if not lines:
+            return None
+
+        raw_key = tuple(lines)
+        raw = self._raw_cache.get(raw_key)
+        if raw is None:
+            raw = self._analyze(lines)
+            if len(self._raw_cache) >= MAX_RAW_CACHE_SIZE:
+                self._raw_cache.clear()
+            self._raw_cache[raw_key] = raw
+
+        exception_type = raw.lines_exception_type
+        if not raw.is_python:
+            exception_type = _match_exception_type(head) or exception_type
+
+        fingerprint = fingerprint_frames((exception_type or "", raw.frames_fingerprint))
+        trace = self._traces.get(fingerprint)
+        if trace is None:
+            trace = StackTrace(
+                fingerprint=fingerprint,
+                top_fingerprint=raw.top_fingerprint,
+                exception_type=exception_type,
+                frames=raw.frames,
+                text=raw.text,
+            )
+            self._traces[fingerprint] = trace
+
+        self._counts[fingerprint] = self._counts.get(fingerprint, 0) + 1
+        return trace
+
+    def _analyze(self, lines: list[str]) -> _RawTrace:
+        """Normalize frames and build display text for a verbatim trace."""
+        frames = tuple(f for f in (normalize_frame(line) for line in lines) if f is not None)
+        lines_type, is_python = _exception_type_from_lines(lines)
+
+        text_lines = lines
+        if len(text_lines) > MAX_TRACE_TEXT_LINES:
+            text_lines = [*lines[:MAX_TRACE_TEXT_LINES], "... (truncated)"]
+
+        return _RawTrace(
+            frames=frames,
+            frames_fingerprint=fingerprint_frames(frames),
+            top_fingerprint=fingerprint_frames(frames[: self.top_frames]),
+            lines_exception_type=lines_type,
+            is_python=is_python,
+            text="\n".join(text_lines),
+        )
+
+    @property
+    def unique_traces(self) -> int:
+        """Number of distinct fingerprints interned."""
+        return len(self._traces)
+
+    def occurrences(self, fingerprint: str) -> int:
+        """Number of times a fingerprint was interned."""
+        return self._counts.get(fingerprint, 0)
@@ -4,12 +4,15 @@ import os
 from collections import Counter
 from collections.abc import Iterator
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
+from itertools import repeat
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 from ..models import Anomaly, FileInfo, LogFormat, TimeRange
-from ..parsers.base import BaseLogParser, ParsedLogEntry
+from ..parsers.base import BaseLogParser, FieldNeeds, ParsedLogEntry
+from ..parsers.dedup import collapse_repeated_entries, last_timestamp, repeat_count
+from .aho_corasick import AhoCorasick
 from .error_extractor import ErrorExtractor, ErrorGroup
 
 # Output limits
@@ -239,6 +242,9 @@ class Summarizer:
         "capability",
     ]
 
+    # Security literal automata (see _security_automata)
+    _automata: ClassVar[tuple[AhoCorasick, AhoCorasick]]
+
     def __init__(
         self,
         file_path: str | Path,
@@ -294,6 +300,13 @@ class Summarizer:
         self._entries_per_minute: Counter[str] = Counter()  # minute bucket -> count
         self._last_timestamp: datetime | None = None
 
+    @property
+    def field_needs(self) -> FieldNeeds:
+        """Security and performance checks read every message; otherwise only errors are."""
+        if self.include_security or self.include_performance:
+            return FieldNeeds()
+        return self._error_extractor.field_needs
+
     def _update_time_range(self, timestamp: datetime | None) -> None:
         """Update tracked time range."""
         if timestamp:
@@ -302,40 +315,42 @@ class Summarizer:
             if self._time_end is None or timestamp > self._time_end:
                 self._time_end = timestamp
 
-    def _check_auth_failure(self, message: str) -> bool:
-        """Check if message indicates an auth failure."""
-        message_lower = message.lower()
-        return any(pattern in message_lower for pattern in self.AUTH_FAILURE_PATTERNS)
-
-    def _check_sql_injection(self, text: str) -> bool:
-        """Check if text contains SQL injection patterns."""
-        text_lower = text.lower()
-        return any(pattern in text_lower for pattern in self.SQL_INJECTION_PATTERNS)
-
-    def _check_path_traversal(self, text: str) -> bool:
-        """Check if text contains path traversal patterns."""
-        text_lower = text.lower()
-        return any(pattern in text_lower for pattern in self.PATH_TRAVERSAL_PATTERNS)
-
-    def _check_xss(self, text: str) -> bool:
-        """Check if text contains XSS patterns."""
-        text_lower = text.lower()
-        return any(pattern in text_lower for pattern in self.XSS_PATTERNS)
-
-    def _check_privilege_escalation(self, text: str) -> bool:
-        """Check if text contains privilege escalation patterns."""
-        text_lower = text.lower()
-        return any(pattern in text_lower for pattern in self.PRIVILEGE_ESCALATION_PATTERNS)
-
-    def _check_suspicious_user_agent(self, user_agent: str) -> bool:
-        """Check if user agent is suspicious."""
-        ua_lower = user_agent.lower()
-        return any(pattern in ua_lower for pattern in self.SUSPICIOUS_USER_AGENTS)
+    @classmethod
+    def _security_automata(cls) -> tuple[AhoCorasick, AhoCorasick]:
+        """Automata for the message checks and user agents, built once per class."""
+        automata = cls.__dict__.get("_automata")
+        if automata is None:
+            checks = AhoCorasick(
+                {
+                    "auth": cls.AUTH_FAILURE_PATTERNS,
+                    "privilege": cls.PRIVILEGE_ESCALATION_PATTERNS,
+                    "sql": cls.SQL_INJECTION_PATTERNS,
+                    "path_traversal": cls.PATH_TRAVERSAL_PATTERNS,
+                    "xss": cls.XSS_PATTERNS,
+                }
+            )
+            automata = (checks, AhoCorasick({"user_agent": cls.SUSPICIOUS_USER_AGENTS}))
+            cls._automata = automata
+        return automata
 
     def _get_minute_bucket(self, timestamp: datetime) -> str:
         """Get minute bucket key for timestamp."""
         return timestamp.strftime("%Y-%m-%d %H:%M")
 
+    def _add_minute_counts(self, start: datetime, end: datetime | None, count: int) -> None:
+        """Spread a collapsed run's count evenly over the minutes it spans."""
+        first_minute = start.replace(second=0, microsecond=0)
+        span = 0
+        if end is not None and end > start:
+            span = int((end - first_minute).total_seconds() // 60)
+
+        buckets = min(span + 1, count)
+        share, remainder = divmod(count, buckets)
+        for i in range(buckets):
+            offset = i * span // (buckets - 1) if buckets > 1 else 0
+            bucket = self._get_minute_bucket(first_minute + timedelta(minutes=offset))
+            self._entries_per_minute[bucket] += share + (1 if i < remainder else 0)
+
     def process_entry(self, entry: ParsedLogEntry) -> None:
         """
         Process a single log entry.
@@ -343,21 +358,30 @@ class Summarizer:
         Args:
             entry: Parsed log entry
         """
-        self._total_entries += 1
+        # Collapsed runs stand for several identical lines
+        count = repeat_count(entry)
+        run_end = last_timestamp(entry) if count > 1 else None
+
+        self._total_entries += count
         self._update_time_range(entry.timestamp)
+        if run_end is not None:
+            self._update_time_range(run_end)
 
         # Track level distribution
         level = (entry.level or "UNKNOWN").upper()
-        self._level_counts[level] += 1
+        self._level_counts[level] += count
 
         # Delegate error tracking
         self._error_extractor.process_entry(entry)
 
         # Track entries per minute for anomaly detection
         if entry.timestamp:
-            bucket = self._get_minute_bucket(entry.timestamp)
-            self._entries_per_minute[bucket] += 1
-            self._last_timestamp = entry.timestamp
+            if count > 1:
+                self._add_minute_counts(entry.timestamp, run_end, count)
+            else:
+                bucket = self._get_minute_bucket(entry.timestamp)
+                self._entries_per_minute[bucket] += 1
+            self._last_timestamp = run_end or entry.timestamp
 
         # Extract metadata for performance/security
         metadata = entry.metadata
@@ -369,51 +393,57 @@ class Summarizer:
             if response_time is not None:
                 try:
                     rt_ms = float(response_time)
-                    self._response_times.append(rt_ms)
+                    self._response_times.extend(repeat(rt_ms, count))
                     if entry.timestamp:
-                        self._request_times.append(entry.timestamp)
+                        self._request_times.extend(repeat(entry.timestamp, count))
                 except (ValueError, TypeError):
                     pass
 
         # Security metrics
         if self.include_security:
+            checks, user_agents = self._security_automata()
+            bits = checks.bits
+
+            # One lowercasing and one scan of the message, continued over the
+            # request path: auth and privilege checks read the message only,
+            # attack patterns the message and request data
+            message_mask, state = checks.scan(entry.message.lower().encode())
+            attack_mask = message_mask
+            path = metadata.get("path") or metadata.get("url") or metadata.get("request") or ""
+            if path:
+                attack_mask |= checks.scan(f" {path}".lower().encode(), state)[0]
+
             # Check for auth failures
             client_ip = metadata.get("client_ip") or metadata.get("ip")
-            if self._check_auth_failure(entry.message):
-                self._auth_failures += 1
+            if message_mask & bits["auth"]:
+                self._auth_failures += count
                 # Track auth failures per IP for brute force detection
                 if client_ip:
-                    self._ip_auth_failures[str(client_ip)] += 1
+                    self._ip_auth_failures[str(client_ip)] += count
 
             # Track IP addresses
             if client_ip:
-                self._ip_counter[str(client_ip)] += 1
-
-            # Check for attack patterns in message and request data
-            combined_text = entry.message
-            path = metadata.get("path") or metadata.get("url") or metadata.get("request") or ""
-            if path:
-                combined_text = f"{combined_text} {path}"
-
-            # Check for SQL injection attempts
-            if self._check_sql_injection(combined_text):
-                self._sql_injection_count += 1
-
-            # Check for path traversal attempts
-            if self._check_path_traversal(combined_text):
-                self._path_traversal_count += 1
+                self._ip_counter[str(client_ip)] += count
 
-            # Check for XSS attempts
-            if self._check_xss(combined_text):
-                self._xss_count += 1
+            # Check for SQL injection, path traversal and XSS attempts
+            if attack_mask & bits["sql"]:
+                self._sql_injection_count += count
+            if attack_mask & bits["path_traversal"]:
+                self._path_traversal_count += count
+            if attack_mask & bits["xss"]:
+                self._xss_count += count
 
             # Check for privilege escalation indicators
-            if self._check_privilege_escalation(entry.message):
-                self._privilege_escalation_count += 1
+            if message_mask & bits["privilege"]:
+                self._privilege_escalation_count += count
 
             # Check user agent for suspicious patterns
             user_agent = metadata.get("user_agent") or metadata.get("http_user_agent") or ""
-            if user_agent and self._check_suspicious_user_agent(user_agent) and user_agent not in self._suspicious_user_agents:
+            if (
+                user_agent
+                and user_agent not in self._suspicious_user_agents
+                and user_agents.scan(str(user_agent).lower().encode())[0]
+            ):
                 self._suspicious_user_agents.append(user_agent)
 
             # Track status codes (for web logs)
@@ -421,12 +451,12 @@ class Summarizer:
             if status is not None:
                 try:
                     status_int = int(status)
-                    self._status_codes[status_int] += 1
+                    self._status_codes[status_int] += count
 
                     # Track paths with errors
                     if status_int >= 400:
                         error_path = metadata.get("path") or metadata.get("url") or "unknown"
-                        self._path_errors[str(error_path)] += 1
+                        self._path_errors[str(error_path)] += count
                 except (ValueError, TypeError):
                     pass
 
@@ -695,18 +725,29 @@ class Summarizer:
             total_entries=self._total_entries,
         )
 
-    def summarize_file(self, parser: BaseLogParser, max_lines: int = 10000) -> LogSummary:
+    def summarize_file(
+        self,
+        parser: BaseLogParser,
+        max_lines: int = 10000,
+        collapse_repeats: bool = False,
+    ) -> LogSummary:
         """
         Generate summary for a log file.
 
         Args:
             parser: Parser to use for parsing log entries
             max_lines: Maximum lines to process
+            collapse_repeats: Collapse runs of repeated entries before analysis
 
         Returns:
             LogSummary with all analysis results
         """
-        for entry in parser.parse_file(self.file_path, max_lines=max_lines):
+        entries: Iterator[ParsedLogEntry] = parser.parse_file(
+            self.file_path, max_lines=max_lines, needs=self.field_needs
+        )
+        if collapse_repeats:
+            entries = collapse_repeated_entries(entries)
+        for entry in entries:
             self.process_entry(entry)
         return self.finalize()
 
@@ -1,10 +1,17 @@
 """Pydantic models for log-analyzer-mcp inputs and outputs."""
 
+from collections.abc import Callable
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Any, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import (
+    BaseModel,
+    Field,
+    PrivateAttr,
+    SerializerFunctionWrapHandler,
+    model_serializer,
+)
 
 
 class LogFormat(str, Enum):
@@ -18,7 +25,13 @@ class LogFormat(str, Enum):
     PYTHON = "python"
     JAVA = "java"
     KUBERNETES = "kubernetes"
+    LOGFMT = "logfmt"
+    W3C = "w3c"
+    ELB = "elb"
+    CSV = "csv"
+    TSV = "tsv"
     GENERIC = "generic"
+    MIXED = "mixed"
     AUTO = "auto"
 
 
@@ -29,6 +42,15 @@ class ResponseFormat(str, Enum):
     JSON = "json"
 
 
+class EntryField(str, Enum):
+    """Fields of a parsed entry an analyzer can declare it reads."""
+
+    LEVEL = "level"
+    TIMESTAMP = "timestamp"
+    MESSAGE = "message"
+    METADATA = "metadata"
+
+
 class LogLevel(str, Enum):
     """Standard log severity levels."""
 
@@ -133,6 +155,214 @@ class ParsedLogEntry(BaseModel):
         json_encoders = {datetime: lambda v: v.isoformat() if v else None}
 
 
+_EntryT = TypeVar("_EntryT", bound=ParsedLogEntry)
+
+
+def _construct_partial(
+    cls: type[_EntryT], fields: dict[str, Any], private: dict[str, Any]
+) -> _EntryT:
+    """
+    Build an entry subclass without validation, leaving missing fields unset.
+
+    Like model_construct, but defaults are not filled in (so lazily computed
+    fields reach __getattr__) and the per-call default-factory introspection
+    that dominates model_construct's cost on hot paths is skipped.
+    """
+    entry = cls.__new__(cls)
+    object.__setattr__(entry, "__dict__", fields)
+    object.__setattr__(entry, "__pydantic_fields_set__", set(fields))
+    object.__setattr__(entry, "__pydantic_extra__", None)
+    object.__setattr__(entry, "__pydantic_private__", private)
+    return entry
+
+
+class MultiLineLogEntry(ParsedLogEntry):
+    """
+    A parsed entry that owns continuation lines (e.g. a stack trace).
+
+    The head message and the continuation lines are kept separately and only
+    joined into ``message`` the first time it is read, so consumers that never
+    look at the message (level counts, time filters) skip the join entirely.
+    """
+
+    _head_message: str = PrivateAttr(default="")
+    _continuation: list[str] = PrivateAttr(default_factory=list)
+    _truncated_lines: int = PrivateAttr(default=0)
+
+    @classmethod
+    def from_entry(
+        cls,
+        entry: ParsedLogEntry,
+        continuation: list[str],
+        truncated_lines: int = 0,
+    ) -> "MultiLineLogEntry":
+        """
+        Wrap an already-parsed head entry with its continuation lines.
+
+        The head entry's metadata dict is reused rather than copied.
+
+        Args:
+            entry: Entry parsed from the first line
+            continuation: Continuation lines kept for the message
+            truncated_lines: Number of continuation lines dropped by a cap
+
+        Returns:
+            MultiLineLogEntry whose message is materialized on first access
+        """
+        metadata = entry.metadata
+        metadata["continuation_lines"] = len(continuation) + truncated_lines
+        if truncated_lines:
+            metadata["continuation_truncated"] = truncated_lines
+
+        return _construct_partial(
+            cls,
+            {
+                "line_number": entry.line_number,
+                "raw_line": entry.raw_line,
+                "timestamp": entry.timestamp,
+                "level": entry.level,
+                "metadata": metadata,
+            },
+            {
+                "_head_message": entry.message,
+                "_continuation": continuation,
+                "_truncated_lines": truncated_lines,
+            },
+        )
+
+    @property
+    def head_message(self) -> str:
+        """Message parsed from the first line, without continuation lines."""
+        return self._head_message
+
+    @property
+    def continuation(self) -> list[str]:
+        """Continuation lines attached to this entry (after any cap)."""
+        return self._continuation
+
+    def _materialize(self) -> str:
+        """Join head and continuation lines into the message field."""
+        message = self.__dict__.get("message")
+        if message is None:
+            parts = [self._head_message, *self._continuation]
+            if self._truncated_lines:
+                parts.append(f"... ({self._truncated_lines} lines truncated)")
+            message = "\n".join(parts)
+            self.__dict__["message"] = message
+            self.__pydantic_fields_set__.add("message")
+        return message
+
+    def __getattr__(self, item: str) -> Any:
+        """Materialize ``message`` lazily; defer everything else to pydantic."""
+        if item == "message":
+            return self._materialize()
+        return super().__getattr__(item)  # type: ignore[misc]
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with materialized messages on both sides."""
+        self._materialize()
+        if isinstance(other, MultiLineLogEntry):
+            other._materialize()
+        return super().__eq__(other)
+
+    def __repr_args__(self) -> Any:
+        """Include the materialized message in repr()."""
+        self._materialize()
+        return super().__repr_args__()
+
+    @model_serializer(mode="wrap")
+    def _serialize(self, handler: SerializerFunctionWrapHandler) -> Any:
+        """Materialize the message before pydantic serializes the fields."""
+        self._materialize()
+        return handler(self)
+
+
+class LazyLogEntry(ParsedLogEntry):
+    """
+    An entry from the cheap scan phase of parsing.
+
+    Only the level and timestamp are extracted up front. ``message`` and
+    ``metadata`` are filled in by a full parse of the raw line the first time
+    either is read, so entries that analyzers filter out by level or time are
+    never fully parsed.
+    """
+
+    _parse: Callable[[str, int], ParsedLogEntry | None] | None = PrivateAttr(default=None)
+
+    @classmethod
+    def from_scan(
+        cls,
+        line_number: int,
+        raw_line: str,
+        timestamp: datetime | None,
+        level: LogLevel | None,
+        parse: Callable[[str, int], ParsedLogEntry | None],
+    ) -> "LazyLogEntry":
+        """
+        Build an entry from scan-phase fields.
+
+        Args:
+            line_number: Line number in source file
+            raw_line: Original raw line
+            timestamp: Timestamp extracted by the scan
+            level: Level extracted by the scan
+            parse: Full line parser (usually the parser's parse_line)
+
+        Returns:
+            LazyLogEntry whose message and metadata are extracted on first access
+        """
+        return _construct_partial(
+            cls,
+            {
+                "line_number": line_number,
+                "raw_line": raw_line,
+                "timestamp": timestamp,
+                "level": level,
+            },
+            {"_parse": parse},
+        )
+
+    @property
+    def is_resolved(self) -> bool:
+        """Whether the full parse has run."""
+        return "message" in self.__dict__
+
+    def resolve(self) -> None:
+        """Run the full parse now and fill in message and metadata."""
+        if self.is_resolved:
+            return
+        full = self._parse(self.raw_line, self.line_number) if self._parse else None
+        self.__dict__["message"] = full.message if full is not None else self.raw_line
+        self.__dict__["metadata"] = full.metadata if full is not None else {}
+        self.__pydantic_fields_set__.update(("message", "metadata"))
+        self._parse = None
+
+    def __getattr__(self, item: str) -> Any:
+        """Resolve ``message``/``metadata`` lazily; defer everything else to pydantic."""
+        if item in ("message", "metadata"):
+            self.resolve()
+            return self.__dict__[item]
+        return super().__getattr__(item)  # type: ignore[misc]
+
+    def __eq__(self, other: object) -> bool:
+        """Compare fully parsed entries."""
+        self.resolve()
+        if isinstance(other, LazyLogEntry):
+            other.resolve()
+        return super().__eq__(other)
+
+    def __repr_args__(self) -> Any:
+        """Include the resolved fields in repr()."""
+        self.resolve()
+        return super().__repr_args__()
+
+    @model_serializer(mode="wrap")
+    def _serialize(self, handler: SerializerFunctionWrapHandler) -> Any:
+        """Resolve before pydantic serializes the fields."""
+        self.resolve()
+        return handler(self)
+
+
 # ============================================================================
 # Tool Input Models
 # ============================================================================
@@ -2,15 +2,48 @@
 
 from codesdevs_log_analyzer.models import LogFormat, ParsedLogEntry
 from codesdevs_log_analyzer.parsers.apache import ApacheAccessParser, ApacheErrorParser
-from codesdevs_log_analyzer.parsers.base import BaseLogParser
+from codesdevs_log_analyzer.parsers.base import SCAN_FIELDS, BaseLogParser, BlockParser, FieldNeeds
+from codesdevs_log_analyzer.parsers.batch import ParsedBatch
+from codesdevs_log_analyzer.parsers.dedup import (
+    collapse_repeated_entries,
+    last_timestamp,
+    repeat_count,
+)
+from codesdevs_log_analyzer.parsers.delimited import CSVParser, ELBParser, TSVParser, W3CParser
+from codesdevs_log_analyzer.parsers.detection import (
+    DetectionResult,
+    SampleLine,
+    cache_detection,
+    cache_key,
+    cached_detection,
+    clear_detection_cache,
+    detect,
+    sample_file,
+)
 from codesdevs_log_analyzer.parsers.docker import DockerParser
 from codesdevs_log_analyzer.parsers.generic import GenericParser
+from codesdevs_log_analyzer.parsers.grok import GrokParser, compile_grok, grok_parser_class
 from codesdevs_log_analyzer.parsers.java import JavaLogParser
 from codesdevs_log_analyzer.parsers.jsonl import JSONLParser
 from codesdevs_log_analyzer.parsers.kubernetes import KubernetesParser
+from codesdevs_log_analyzer.parsers.logfmt import LogfmtParser, parse_logfmt
+from codesdevs_log_analyzer.parsers.mixed import MixedFormatParser
+from codesdevs_log_analyzer.parsers.profiles import (
+    SPOT_CHECK_TOLERANCE,
+    FormatProfile,
+    ProfileStore,
+    directory_pattern,
+    get_profile_store,
+    spot_check,
+)
 from codesdevs_log_analyzer.parsers.python_log import PythonLogParser
+from codesdevs_log_analyzer.parsers.synthesis import (
+    SYNTHESIZED_NAME,
+    synthesize_parser,
+    synthesize_spec,
+    synthesized_class,
+)
 from codesdevs_log_analyzer.parsers.syslog import SyslogParser
-from codesdevs_log_analyzer.utils.file_handler import stream_file
 
 # Parser registry mapping format names to parser classes
 PARSER_REGISTRY: dict[str, type[BaseLogParser]] = {
@@ -22,7 +55,13 @@ PARSER_REGISTRY: dict[str, type[BaseLogParser]] = {
     "java": JavaLogParser,
     "docker": DockerParser,
     "kubernetes": KubernetesParser,
+    "logfmt": LogfmtParser,
+    "w3c": W3CParser,
+    "elb": ELBParser,
+    "csv": CSVParser,
+    "tsv": TSVParser,
     "generic": GenericParser,
+    "mixed": MixedFormatParser,
 }
 
 # Mapping from LogFormat enum to parser names
@@ -35,29 +74,49 @@ FORMAT_TO_PARSER: dict[LogFormat, str] = {
     LogFormat.JAVA: "java",
     LogFormat.DOCKER: "docker",
     LogFormat.KUBERNETES: "kubernetes",
+    LogFormat.LOGFMT: "logfmt",
+    LogFormat.W3C: "w3c",
+    LogFormat.ELB: "elb",
+    LogFormat.CSV: "csv",
+    LogFormat.TSV: "tsv",
     LogFormat.GENERIC: "generic",
+    LogFormat.MIXED: "mixed",
 }
 
 # Detection order - more specific parsers first
 DETECTION_ORDER: list[str] = [
     "docker",  # Very specific format
     "kubernetes",  # Specific structured format
+    "logfmt",  # key=value pairs (after kubernetes, which takes timestamp-prefixed ones)
+    "w3c",  # Directive header and date/time columns
+    "elb",  # Fixed load balancer column layout
     "apache_access",  # Specific combined log format
     "apache_error",  # Specific error format
     "jsonl",  # JSON format
     "java",  # Java logging format
     "python",  # Python logging format
     "syslog",  # Common syslog format
+    "csv",  # Header row, comma-separated
+    "tsv",  # Header row, tab-separated
     "generic",  # Fallback (always last)
 ]
 
+# Below this single-format confidence, check whether the sample is mixed
+MIXED_DETECTION_THRESHOLD = 0.8
+
 
 def get_parser(format_name: str | LogFormat) -> BaseLogParser:
     """
     Get parser instance by format name.
 
+    A string containing grok references (`%{NAME:field}`) is compiled into a
+    custom parser (see parsers.grok) instead of being looked up by name.
+    "docker:<format>" returns a Docker parser that also parses the
+    application lines inside the records ("docker:auto" detects them).
+
     Args:
-        format_name: Parser name string or LogFormat enum
+        format_name: Parser name string, inline grok spec, docker:<format>,
+            or LogFormat enum
 
     Returns:
         Instantiated parser
@@ -70,10 +129,15 @@ def get_parser(format_name: str | LogFormat) -> BaseLogParser:
         if format_name == LogFormat.AUTO:
             raise ValueError("Use detect_format() for auto-detection")
         format_name = FORMAT_TO_PARSER.get(format_name, "generic")
+    elif "%{" in format_name:
+        return grok_parser_class(format_name)()
 
     # Normalize name
     format_name = format_name.lower().strip()
 
+    if format_name.startswith("docker:"):
+        return DockerParser(inner_format=format_name[len("docker:") :])
+
     if format_name not in PARSER_REGISTRY:
         raise ValueError(
             f"Unknown format: {format_name}. Available formats: {', '.join(PARSER_REGISTRY.keys())}"
@@ -82,6 +146,45 @@ def get_parser(format_name: str | LogFormat) -> BaseLogParser:
     return PARSER_REGISTRY[format_name]()
 
 
+def register_format(
+    name: str,
+    spec: str,
+    description: str | None = None,
+) -> type[BaseLogParser]:
+    """
+    Register a custom format compiled from a grok-style pattern spec.
+
+    The format becomes available by name to get_parser (and so to every
+    tool's format_hint) and takes part in auto-detection before the generic
+    fallback. Registering a name again replaces the earlier custom format.
+
+    Args:
+        name: Format name
+        spec: Grok spec, e.g. "%{TIMESTAMP_ISO8601:ts} %{LOGLEVEL:level} %{GREEDYDATA:msg}"
+        description: Format description
+
+    Returns:
+        Registered parser class
+
+    Raises:
+        ValueError: If the name is taken by a built-in format or the spec is invalid
+    """
+    name = name.lower().strip()
+    if not name or "%{" in name or name == SYNTHESIZED_NAME:
+        raise ValueError(f"Invalid format name: {name!r}")
+    existing = PARSER_REGISTRY.get(name)
+    if existing is not None and not issubclass(existing, GrokParser):
+        raise ValueError(f"Cannot replace built-in format: {name}")
+
+    parser_class = grok_parser_class(spec, name, description)
+    PARSER_REGISTRY[name] = parser_class
+    if name not in DETECTION_ORDER:
+        DETECTION_ORDER.insert(DETECTION_ORDER.index("generic"), name)
+    # Earlier detections did not consider the new format
+    clear_detection_cache()
+    return parser_class
+
+
 def detect_format(
     file_path: str,
     sample_size: int = 100,
@@ -89,8 +192,9 @@ def detect_format(
     """
     Detect log format by analyzing sample lines.
 
-    Reads first sample_size lines and scores each parser's confidence.
-    Returns the best matching parser.
+    Samples lines from the head, middle and tail of the file and scores
+    each parser's confidence. Returns the best matching parser. Results are
+    cached per file until its size or modification time changes.
 
     Args:
         file_path: Path to log file
@@ -99,16 +203,63 @@ def detect_format(
     Returns:
         Tuple of (parser_instance, confidence_score)
     """
-    # Read sample lines
-    sample_lines: list[str] = []
-    for _, line in stream_file(file_path, max_lines=sample_size):
-        sample_lines.append(line)
-
-    if not sample_lines:
+    result = detect_file(file_path, sample_size)
+    parser = result.parser()
+    if parser is None:
         # Empty file - return generic parser with low confidence
         return GenericParser(), 0.0
+    return parser, result.best_confidence
+
+
+def detect_format_with_profiles(
+    file_path: str,
+    sample_size: int = 100,
+    store: ProfileStore | None = None,
+) -> tuple[BaseLogParser, float]:
+    """
+    Detect log format, reusing a learned profile for the file's path.
 
-    return detect_format_from_lines(sample_lines)
+    If a profile matches the file (same rotation pattern or directory) and
+    the remembered parser passes a spot-check of the first lines, detection
+    is skipped. A sibling file's format is a weaker hint than a rotation's,
+    so a directory profile's spot-check gets no tolerance below the
+    profile's confidence. Otherwise the format is detected and the outcome
+    recorded, with the spec of a synthesized parser so it is rebuilt, not
+    re-inferred.
+
+    Args:
+        file_path: Path to log file
+        sample_size: Number of lines to sample if detection runs
+        store: Profile store (defaults to get_profile_store())
+
+    Returns:
+        Tuple of (parser_instance, confidence_score)
+    """
+    if store is None:
+        store = get_profile_store()
+
+    profile = store.lookup(file_path)
+    parser_class: type[BaseLogParser] | None = None
+    if profile is not None and profile.spec is not None:
+        parser_class = synthesized_class(profile.spec)
+    elif profile is not None and profile.format in PARSER_REGISTRY:
+        parser_class = PARSER_REGISTRY[profile.format]
+    if profile is not None and parser_class is not None:
+        parser = parser_class()
+        parser.prime_file(file_path)
+        tolerance = SPOT_CHECK_TOLERANCE
+        if profile.pattern == directory_pattern(file_path):
+            tolerance = 0.0
+        if spot_check(parser, file_path) >= profile.confidence - tolerance:
+            store.verify(profile)
+            return parser, profile.confidence
+
+    parser, confidence = detect_format(file_path, sample_size)
+    spec = None
+    if isinstance(parser, GrokParser) and parser.name == SYNTHESIZED_NAME:
+        spec = parser.spec.spec
+    store.record(file_path, parser.name, confidence, spec)
+    return parser, confidence
 
 
 def detect_format_from_lines(
@@ -123,31 +274,58 @@ def detect_format_from_lines(
     Returns:
         Tuple of (parser_instance, confidence_score)
     """
-    if not sample_lines:
+    sample = [SampleLine(line, line_number) for line_number, line in enumerate(sample_lines, 1)]
+    result = _detect_sample(sample)
+    parser = result.parser()
+    if parser is None:
         return GenericParser(), 0.0
+    return parser, result.best_confidence
 
-    best_parser: BaseLogParser | None = None
-    best_confidence = 0.0
-
-    # Test each parser in detection order
-    for parser_name in DETECTION_ORDER:
-        parser_class = PARSER_REGISTRY[parser_name]
-        confidence = parser_class.detect_confidence(sample_lines)
 
-        # Update best if this parser has higher confidence
-        if confidence > best_confidence:
-            best_confidence = confidence
-            best_parser = parser_class()
+def detect_file(file_path: str, sample_size: int = 100) -> DetectionResult:
+    """
+    Run (or reuse) format detection for a file.
 
-            # Early exit if we have high confidence
-            if confidence >= 0.9:
-                break
+    The returned DetectionResult keeps the sample and every per-line parse
+    result computed so far; call its score() to fully score more parsers.
 
-    # Ensure we always return a parser
-    if best_parser is None:
-        return GenericParser(), 0.0
+    Args:
+        file_path: Path to log file
+        sample_size: Number of lines to sample for detection
 
-    return best_parser, best_confidence
+    Returns:
+        Cached or fresh DetectionResult
+    """
+    key = cache_key(file_path, sample_size)
+    result = cached_detection(key)
+    if result is None:
+        result = _detect_sample(sample_file(file_path, sample_size))
+        cache_detection(key, result)
+    return result
+
+
+def _detect_sample(sample: list[SampleLine]) -> DetectionResult:
+    """Pick the best parser for a sample, falling back to mixed or synthesized parsers."""
+    result = detect(sample, PARSER_REGISTRY, DETECTION_ORDER, MIXED_DETECTION_THRESHOLD)
+
+    # No single format fits well - dispatch per line if several formats interleave
+    if result.best_name is not None and result.best_confidence < MIXED_DETECTION_THRESHOLD:
+        mixed_confidence = result.score(MixedFormatParser.name)
+        if mixed_confidence > result.best_confidence:
+            result.best_name = MixedFormatParser.name
+            result.best_confidence = mixed_confidence
+
+    # Only the generic fallback fits - try a parser built for this sample's structure
+    if result.best_name == GenericParser.name:
+        synthesized = synthesize_parser(result.lines)
+        if synthesized is not None:
+            result.synthesized = synthesized
+            confidence = result.score(synthesized.name)
+            if confidence > result.best_confidence:
+                result.best_name = synthesized.name
+                result.best_confidence = confidence
+
+    return result
 
 
 def list_formats() -> list[dict[str, str]]:
@@ -204,7 +382,32 @@ __all__ = [
     "JavaLogParser",
     "DockerParser",
     "KubernetesParser",
+    "LogfmtParser",
+    "W3CParser",
+    "ELBParser",
+    "CSVParser",
+    "TSVParser",
     "GenericParser",
+    "MixedFormatParser",
+    "GrokParser",
+    # Two-phase parsing
+    "FieldNeeds",
+    "SCAN_FIELDS",
+    # Batch parsing
+    "BlockParser",
+    "ParsedBatch",
+    # Detection
+    "DetectionResult",
+    "SampleLine",
+    # Format profiles
+    "FormatProfile",
+    "ProfileStore",
+    "get_profile_store",
+    # Custom formats
+    "compile_grok",
+    "register_format",
+    "SYNTHESIZED_NAME",
+    "synthesize_spec",
     # Registry
     "PARSER_REGISTRY",
     "DETECTION_ORDER",
@@ -212,6 +415,14 @@ __all__ = [
     "get_parser",
     "detect_format",
     "detect_format_from_lines",
+    "detect_format_with_profiles",
+    "detect_file",
+    "clear_detection_cache",
     "list_formats",
     "get_parser_for_format",
+    "parse_logfmt",
+    # Post-parse stages
+    "collapse_repeated_entries",
+    "repeat_count",
+    "last_timestamp",
 ]
@@ -5,10 +5,11 @@ from datetime import datetime, timedelta, timezone
 from typing import ClassVar
 
 from codesdevs_log_analyzer.models import LogLevel, ParsedLogEntry
-from codesdevs_log_analyzer.parsers.base import BaseLogParser
+from codesdevs_log_analyzer.parsers.base import BlockParser
+from codesdevs_log_analyzer.parsers.batch import EntryFields
 
 
-class ApacheAccessParser(BaseLogParser):
+class ApacheAccessParser(BlockParser):
     """
     Parser for Apache/Nginx combined access log format.
 
@@ -35,6 +36,19 @@ class ApacheAccessParser(BaseLogParser):
         r'(?:\s+"(?P<referer>[^"]*)"\s+"(?P<user_agent>[^"]*)")?'
     )
 
+    # COMBINED_PATTERN for finditer over a block of lines
+    BLOCK_PATTERN = re.compile(
+        r"^(?P<client_ip>\S+)[^\S\n]+"
+        r"(?P<ident>\S+)[^\S\n]+"
+        r"(?P<user>\S+)[^\S\n]+"
+        r"\[(?P<timestamp>[^\]\n]+)\][^\S\n]+"
+        r'"(?P<request>[^"\n]*)"[^\S\n]+'
+        r"(?P<status>\d{3})[^\S\n]+"
+        r"(?P<bytes>\S+)"
+        r'(?:[^\S\n]+"(?P<referer>[^"\n]*)"[^\S\n]+"(?P<user_agent>[^"\n]*)")?',
+        re.MULTILINE,
+    )
+
     # Month mapping for Apache date format
     MONTHS = {
         "Jan": 1,
@@ -77,6 +91,18 @@ class ApacheAccessParser(BaseLogParser):
         if not match:
             return None
 
+        timestamp, level, message, metadata = self._fields_from_match(match)
+        return self.create_entry(
+            line_number=line_number,
+            raw_line=line,
+            message=message,
+            timestamp=timestamp,
+            level=level,
+            metadata=metadata,
+        )
+
+    def _fields_from_match(self, match: re.Match[str]) -> EntryFields:
+        """Extract entry fields from a combined log format match."""
         groups = match.groupdict()
 
         # Parse timestamp
@@ -114,13 +140,22 @@ class ApacheAccessParser(BaseLogParser):
             "user_agent": groups.get("user_agent"),
         }
 
-        return self.create_entry(
-            line_number=line_number,
-            raw_line=line,
-            message=message,
-            timestamp=timestamp,
-            level=level,
-            metadata=metadata,
+        return timestamp, level, message, metadata
+
+    def scan_line(self, line: str, line_number: int) -> ParsedLogEntry | None:
+        """Extract level (from the status code) and timestamp only."""
+        if not line:
+            return None
+
+        match = self.COMBINED_PATTERN.match(line)
+        if not match:
+            return None
+
+        return self.defer_entry(
+            line_number,
+            line,
+            timestamp=self._parse_timestamp(match.group("timestamp")),
+            level=self._status_to_level(int(match.group("status"))),
         )
 
     def _parse_timestamp(self, ts_str: str) -> datetime | None:
@@ -180,7 +215,7 @@ class ApacheAccessParser(BaseLogParser):
         return LogLevel.DEBUG
 
 
-class ApacheErrorParser(BaseLogParser):
+class ApacheErrorParser(BlockParser):
     """
     Parser for Apache/Nginx error log format.
 
@@ -213,6 +248,16 @@ class ApacheErrorParser(BaseLogParser):
         r"(?P<message>.*)$"
     )
 
+    # ERROR_PATTERN for finditer over a block of lines
+    BLOCK_PATTERN = re.compile(
+        r"^\[(?P<timestamp>[^\]\n]+)\][^\S\n]+"
+        r"\[(?:(?P<module>\w+):)?(?P<level>\w+)\][^\S\n]+"
+        r"(?:\[pid[^\S\n]+(?P<pid>\d+)(?::tid[^\S\n]+\d+)?\][^\S\n]+)?"
+        r"(?:\[client[^\S\n]+(?P<client>[^\]\n]+)\][^\S\n]+)?"
+        r"(?P<message>.*)$",
+        re.MULTILINE,
+    )
+
     # Level mapping
     LEVEL_MAP = {
         "emerg": LogLevel.EMERGENCY,
@@ -251,6 +296,18 @@ class ApacheErrorParser(BaseLogParser):
         if not match:
             return None
 
+        timestamp, level, message, metadata = self._fields_from_match(match)
+        return self.create_entry(
+            line_number=line_number,
+            raw_line=line,
+            message=message,
+            timestamp=timestamp,
+            level=level,
+            metadata=metadata,
+        )
+
+    def _fields_from_match(self, match: re.Match[str]) -> EntryFields:
+        """Extract entry fields from an error log match."""
         groups = match.groupdict()
 
         # Parse timestamp
@@ -282,14 +339,7 @@ class ApacheErrorParser(BaseLogParser):
             else:
                 metadata["client_ip"] = client
 
-        return self.create_entry(
-            line_number=line_number,
-            raw_line=line,
-            message=message,
-            timestamp=timestamp,
-            level=level,
-            metadata=metadata,
-        )
+        return timestamp, level, message, metadata
 
     def _parse_timestamp(self, ts_str: str) -> datetime | None:
         """Parse Apache error log timestamp."""
@@ -1,14 +1,69 @@
 """Base parser interface for all log format parsers."""
 
+import re
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, ClassVar
 
-from codesdevs_log_analyzer.models import LogLevel, ParsedLogEntry
-from codesdevs_log_analyzer.utils.file_handler import stream_file
+from codesdevs_log_analyzer.models import (
+    EntryField,
+    LazyLogEntry,
+    LogLevel,
+    MultiLineLogEntry,
+    ParsedLogEntry,
+)
+from codesdevs_log_analyzer.parsers.batch import EntryFields, ParsedBatch, iter_block_matches
+from codesdevs_log_analyzer.utils.file_handler import DEFAULT_BLOCK_SIZE, stream_blocks, stream_file
 
-__all__ = ["BaseLogParser", "ParsedLogEntry", "LogLevel"]
+# Default cap on continuation lines (stack frames) kept per multi-line entry
+MAX_CONTINUATION_LINES = 200
+
+# Head lines handed to prime() by prime_file()
+PRIME_LINES = 100
+
+__all__ = ["BaseLogParser", "FieldNeeds", "ParsedLogEntry", "LogLevel"]
+
+# Fields that need a full parse of the line (the scan phase yields the others)
+_FULL_PARSE_FIELDS = frozenset({EntryField.MESSAGE, EntryField.METADATA})
+
+
+@dataclass(frozen=True)
+class FieldNeeds:
+    """
+    Entry fields an analyzer reads, used to defer full parsing.
+
+    Parsers run a cheap scan (level and timestamp) first. Entries are fully
+    parsed up front only when the analyzer reads message or metadata and the
+    entry's level is in ``levels``; other entries stay lazy and are parsed
+    only if something reads their message or metadata later.
+    """
+
+    fields: frozenset[EntryField] = frozenset(EntryField)
+    levels: frozenset[str] | None = None  # Upper-case levels that need all fields (None = all)
+
+    @property
+    def deferrable(self) -> bool:
+        """Whether any entry can skip the full parse."""
+        return self.levels is not None or not (self.fields & _FULL_PARSE_FIELDS)
+
+    def needs_full_parse(self, level: str | None) -> bool:
+        """Check if an entry with this level should be fully parsed up front."""
+        if not self.fields & _FULL_PARSE_FIELDS:
+            return False
+        return self.levels is None or (level is not None and level.upper() in self.levels)
+
+    def union(self, other: "FieldNeeds") -> "FieldNeeds":
+        """Combine the needs of two analyzers reading the same entries."""
+        levels = None
+        if self.levels is not None and other.levels is not None:
+            levels = self.levels | other.levels
+        return FieldNeeds(fields=self.fields | other.fields, levels=levels)
+
+
+# Enough for level histograms and time ranges
+SCAN_FIELDS = FieldNeeds(fields=frozenset({EntryField.LEVEL, EntryField.TIMESTAMP}))
 
 
 class BaseLogParser(ABC):
@@ -65,11 +120,105 @@ class BaseLogParser(ABC):
         """
         ...
 
+    def prime(self, sample_lines: list[str]) -> None:
+        """
+        Learn file-level state from sampled lines before parsing.
+
+        Formats whose schema lives in the file (a header row or a #Fields
+        directive) read it here, so lines handed over from the middle or end
+        of the file (tail, follow mode) still map to columns. The default
+        does nothing.
+
+        Args:
+            sample_lines: Lines sampled from the file, head first
+        """
+        return
+
+    def prime_file(self, file_path: str, encoding: str | None = None) -> None:
+        """
+        Prime from the first non-blank lines of a file.
+
+        For parsers that did not come from detection (a format hint or a
+        remembered profile) and may be handed lines from anywhere in the
+        file. Parsers without file-level state skip the read.
+
+        Args:
+            file_path: Path to log file
+            encoding: File encoding (auto-detected if None)
+        """
+        if type(self).prime is BaseLogParser.prime:
+            return
+        head = stream_file(file_path, encoding=encoding, max_lines=PRIME_LINES, skip_empty=True)
+        self.prime([line for _, line in head])
+
+    def scan_line(self, line: str, line_number: int) -> ParsedLogEntry | None:
+        """
+        Cheap first parsing phase: extract only the level and timestamp.
+
+        Parsers with a cheaper scan than parse_line override this and return a
+        LazyLogEntry (see defer_entry). The default runs the full parse.
+
+        Args:
+            line: Raw log line
+            line_number: 1-indexed line number
+
+        Returns:
+            Entry with at least level and timestamp set, None if unparseable
+        """
+        return self.parse_line(line, line_number)
+
+    def defer_entry(
+        self,
+        line_number: int,
+        raw_line: str,
+        timestamp: datetime | None = None,
+        level: LogLevel | None = None,
+    ) -> LazyLogEntry:
+        """
+        Helper to create a scan-phase entry that parses fully on demand.
+
+        Args:
+            line_number: Line number in source file
+            raw_line: Original raw line
+            timestamp: Parsed timestamp
+            level: Log level
+
+        Returns:
+            LazyLogEntry backed by this parser's parse_line
+        """
+        return LazyLogEntry.from_scan(line_number, raw_line, timestamp, level, self.parse_line)
+
+    def parse_entry(
+        self,
+        line: str,
+        line_number: int,
+        needs: FieldNeeds | None = None,
+    ) -> ParsedLogEntry | None:
+        """
+        Parse a line, deferring full extraction according to field needs.
+
+        Args:
+            line: Raw log line
+            line_number: 1-indexed line number
+            needs: Fields the consumer reads (None parses every field)
+
+        Returns:
+            ParsedLogEntry (possibly lazy) or None if unparseable
+        """
+        if needs is None or not needs.deferrable:
+            return self.parse_line(line, line_number)
+
+        entry = self.scan_line(line, line_number)
+        if isinstance(entry, LazyLogEntry) and needs.needs_full_parse(entry.level):
+            entry.resolve()
+        return entry
+
     def parse_file(
         self,
         file_path: str,
         max_lines: int | None = None,
         encoding: str | None = None,
+        needs: FieldNeeds | None = None,
     ) -> Iterator[ParsedLogEntry]:
         """
         Stream parse a log file.
@@ -78,15 +227,99 @@ class BaseLogParser(ABC):
             file_path: Path to log file
             max_lines: Maximum lines to parse (None for all)
             encoding: File encoding (auto-detected if None)
+            needs: Fields the consumer reads; entries it filters out are only
+                scanned for level and timestamp (None parses every field)
 
         Yields:
             ParsedLogEntry for each successfully parsed line
         """
-        for line_num, line in stream_file(file_path, encoding=encoding, max_lines=max_lines):
-            entry = self.parse_line(line, line_num)
+        for line_num, line, fields in self._read_lines(file_path, max_lines, encoding, needs):
+            entry = self._line_entry(line, line_num, fields, needs)
             if entry is not None:
                 yield entry
 
+    def _read_lines(
+        self,
+        file_path: str,
+        max_lines: int | None,
+        encoding: str | None,
+        needs: FieldNeeds | None,
+    ) -> Iterator[tuple[int, str, EntryFields | None]]:
+        """
+        Numbered lines of a file, with entry fields if already extracted.
+
+        Lines come one at a time here; BlockParser extracts the fields of its
+        layout's lines a block at a time.
+        """
+        for line_num, line in stream_file(file_path, encoding=encoding, max_lines=max_lines):
+            yield line_num, line, None
+
+    def _line_entry(
+        self,
+        line: str,
+        line_number: int,
+        fields: EntryFields | None,
+        needs: FieldNeeds | None,
+    ) -> ParsedLogEntry | None:
+        """Build the entry of a line from _read_lines."""
+        if fields is None:
+            return self.parse_entry(line, line_number, needs)
+        timestamp, level, message, metadata = fields
+        return self.create_entry(
+            line_number=line_number,
+            raw_line=line,
+            message=message,
+            timestamp=timestamp,
+            level=level,
+            metadata=metadata,
+        )
+
+    def parse_batch(self, block: str, first_line_number: int = 1) -> ParsedBatch:
+        """
+        Parse a block of newline-separated lines.
+
+        Lines are parsed one at a time (BlockParser matches its layout with
+        one finditer over the block). Continuation lines of multi-line
+        parsers are not attached (use parse_file for stack traces).
+
+        Args:
+            block: Decoded lines joined by "\n"
+            first_line_number: Line number of the first line in the block
+
+        Returns:
+            ParsedBatch with one row per parsed line
+        """
+        batch = ParsedBatch()
+        for offset, line in enumerate(block.split("\n")):
+            entry = self.parse_line(line, first_line_number + offset)
+            if entry is not None:
+                batch.append_entry(entry)
+        return batch
+
+    def parse_file_batches(
+        self,
+        file_path: str,
+        max_lines: int | None = None,
+        encoding: str | None = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ) -> Iterator[ParsedBatch]:
+        """
+        Stream parse a log file a block at a time.
+
+        Args:
+            file_path: Path to log file
+            max_lines: Maximum lines to parse (None for all)
+            encoding: File encoding (auto-detected if None)
+            block_size: Approximate characters per block
+
+        Yields:
+            ParsedBatch for each block of the file
+        """
+        for first_line_number, block in stream_blocks(
+            file_path, encoding=encoding, block_size=block_size, max_lines=max_lines
+        ):
+            yield self.parse_batch(block, first_line_number)
+
     @classmethod
     def detect_confidence(cls, sample_lines: list[str]) -> float:
         """
@@ -101,24 +334,45 @@ class BaseLogParser(ABC):
         Returns:
             Confidence score between 0.0 and 1.0
         """
-        if not sample_lines:
+        lines = [line for line in sample_lines if line.strip()]
+        if not lines:
             return 0.0
 
         # Create temporary instance for parsing
         parser = cls()
+        results = [(parser.can_parse(line), parser.parse_line(line, 0)) for line in lines]
+        return cls.score_results(lines, results)
+
+    @classmethod
+    def score_results(
+        cls,
+        lines: list[str],
+        results: list[tuple[bool, ParsedLogEntry | None]],
+    ) -> float:
+        """
+        Score already computed per-line results for format detection.
+
+        Split out of detect_confidence so detection can parse a sample once
+        and share the results (see parsers.detection).
+
+        Args:
+            lines: Non-blank sample lines
+            results: (can_parse, parse_line result) for each line
+
+        Returns:
+            Confidence score between 0.0 and 1.0
+        """
+        if not lines:
+            return 0.0
 
         # Count successfully parsed lines
         parsed_count: float = 0
         can_parse_count = 0
 
-        for line in sample_lines:
-            if not line.strip():
-                continue
-
-            if parser.can_parse(line):
+        for can_parse, entry in results:
+            if can_parse:
                 can_parse_count += 1
 
-            entry = parser.parse_line(line, 0)
             if entry is not None:
                 # Check if we extracted meaningful data
                 if entry.timestamp is not None or entry.level is not None:
@@ -127,9 +381,7 @@ class BaseLogParser(ABC):
                     # Parser extracted something different from raw line
                     parsed_count += 0.5
 
-        total_lines = len([line for line in sample_lines if line.strip()])
-        if total_lines == 0:
-            return 0.0
+        total_lines = len(lines)
 
         # Weight both can_parse and actual parsing success
         can_parse_ratio = can_parse_count / total_lines
@@ -192,8 +444,28 @@ class MultiLineParser(BaseLogParser):
     Base class for parsers that handle multi-line log entries.
 
     Subclasses should implement is_continuation() to detect continuation lines.
+    Continuation lines are kept as a list on a MultiLineLogEntry and only joined
+    into the message when it is read. Continuations beyond
+    max_continuation_lines are counted but not stored.
     """
 
+    def __init__(
+        self,
+        default_year: int | None = None,
+        max_continuation_lines: int | None = MAX_CONTINUATION_LINES,
+    ) -> None:
+        """
+        Initialize parser.
+
+        Args:
+            default_year: Year to use for timestamps without year
+            max_continuation_lines: Cap on continuation lines kept per entry
+                (None for no cap). Dropped lines are recorded in the entry's
+                ``continuation_truncated`` metadata.
+        """
+        super().__init__(default_year=default_year)
+        self.max_continuation_lines = max_continuation_lines
+
     @abstractmethod
     def is_continuation(self, line: str) -> bool:
         """
@@ -209,61 +481,129 @@ class MultiLineParser(BaseLogParser):
         """
         ...
 
+    def _attach_continuation(
+        self,
+        entry: ParsedLogEntry,
+        continuation_lines: list[str],
+        truncated_lines: int,
+    ) -> ParsedLogEntry:
+        """Wrap entry with its continuation lines, if it has any."""
+        if not continuation_lines and not truncated_lines:
+            return entry
+        return MultiLineLogEntry.from_entry(entry, continuation_lines, truncated_lines)
+
     def parse_file(
         self,
         file_path: str,
         max_lines: int | None = None,
         encoding: str | None = None,
+        needs: FieldNeeds | None = None,
     ) -> Iterator[ParsedLogEntry]:
         """
         Stream parse with multi-line support.
 
         Accumulates continuation lines with their parent entry.
         """
+        cap = self.max_continuation_lines
         current_entry: ParsedLogEntry | None = None
         continuation_lines: list[str] = []
+        truncated_lines = 0
 
-        for line_num, line in stream_file(file_path, encoding=encoding, max_lines=max_lines):
+        for line_num, line, fields in self._read_lines(file_path, max_lines, encoding, needs):
             if self.is_continuation(line):
-                # Accumulate continuation line
-                continuation_lines.append(line)
+                # Accumulate continuation line, counting (not storing) past the cap
+                if cap is None or len(continuation_lines) < cap:
+                    continuation_lines.append(line)
+                else:
+                    truncated_lines += 1
                 continue
 
             # Not a continuation - emit previous entry if exists
             if current_entry is not None:
-                if continuation_lines:
-                    # Append continuations to message
-                    full_message = current_entry.message + "\n" + "\n".join(continuation_lines)
-                    current_entry = self.create_entry(
-                        line_number=current_entry.line_number,
-                        raw_line=current_entry.raw_line,
-                        message=full_message,
-                        timestamp=current_entry.timestamp,
-                        level=current_entry.level,
-                        metadata={
-                            **current_entry.metadata,
-                            "continuation_lines": len(continuation_lines),
-                        },
-                    )
-                yield current_entry
+                yield self._attach_continuation(current_entry, continuation_lines, truncated_lines)
 
             # Parse new entry
-            current_entry = self.parse_line(line, line_num)
+            current_entry = self._line_entry(line, line_num, fields, needs)
             continuation_lines = []
+            truncated_lines = 0
 
         # Emit final entry
         if current_entry is not None:
-            if continuation_lines:
-                full_message = current_entry.message + "\n" + "\n".join(continuation_lines)
-                current_entry = self.create_entry(
-                    line_number=current_entry.line_number,
-                    raw_line=current_entry.raw_line,
-                    message=full_message,
-                    timestamp=current_entry.timestamp,
-                    level=current_entry.level,
-                    metadata={
-                        **current_entry.metadata,
-                        "continuation_lines": len(continuation_lines),
-                    },
-                )
-            yield current_entry
+            yield self._attach_continuation(current_entry, continuation_lines, truncated_lines)
+
+
+class BlockParser(BaseLogParser):
+    """
+    Base class for parsers whose main layout is matched a block at a time.
+
+    BLOCK_PATTERN is the layout's line pattern written for re.MULTILINE:
+    its whitespace and negated classes exclude newlines, so a match never
+    runs past its line. One finditer over a decoded block finds the lines
+    in that layout and _fields_from_match extracts their fields, saving the
+    per-line read, dispatch and pattern tries; other lines fall back to
+    parse_line. parse_file and parse_batch read this way unless field needs
+    defer the full parse (scan_line is cheaper then).
+
+    Parsers that also handle continuation lines list MultiLineParser after
+    this class.
+    """
+
+    BLOCK_PATTERN: ClassVar[re.Pattern[str]]
+
+    @abstractmethod
+    def _fields_from_match(self, match: re.Match[str]) -> EntryFields:
+        """
+        Extract entry fields from a BLOCK_PATTERN (or equivalent line pattern) match.
+
+        Args:
+            match: Match of the layout's pattern against one line
+
+        Returns:
+            Tuple of (timestamp, level, message, metadata)
+        """
+        ...
+
+    def _read_lines(
+        self,
+        file_path: str,
+        max_lines: int | None,
+        encoding: str | None,
+        needs: FieldNeeds | None,
+    ) -> Iterator[tuple[int, str, EntryFields | None]]:
+        """Numbered lines a block at a time, with fields for the lines BLOCK_PATTERN matches."""
+        if needs is not None and needs.deferrable:
+            yield from super()._read_lines(file_path, max_lines, encoding, needs)
+            return
+
+        for first_line_number, block in stream_blocks(
+            file_path, encoding=encoding, max_lines=max_lines
+        ):
+            for line_num, line, match in iter_block_matches(
+                self.BLOCK_PATTERN, block, first_line_number
+            ):
+                yield line_num, line, None if match is None else self._fields_from_match(match)
+
+    def parse_batch(self, block: str, first_line_number: int = 1) -> ParsedBatch:
+        """
+        Parse a block of newline-separated lines with one BLOCK_PATTERN finditer.
+
+        Lines the pattern does not match fall back to parse_line.
+
+        Args:
+            block: Decoded lines joined by "\n"
+            first_line_number: Line number of the first line in the block
+
+        Returns:
+            ParsedBatch with one row per parsed line
+        """
+        batch = ParsedBatch()
+        for line_number, line, match in iter_block_matches(
+            self.BLOCK_PATTERN, block, first_line_number
+        ):
+            if match is not None:
+                batch.append(line_number, line, self._fields_from_match(match))
+            elif line:
+                entry = self.parse_line(line, line_number)
+                if entry is not None:
+                    batch.append_entry(entry)
+        return batch
@@ -0,0 +1,120 @@
+"""Column-oriented batch parsing of multi-line text blocks.
+
+Parsing a line at a time costs a method call, a regex match and a pydantic
+model per line. Parsers with a block pattern (see BlockParser) instead run
+one MULTILINE finditer over a whole decoded block and append the captured
+fields to the columns of a ParsedBatch; entries are only built if the batch
+is iterated.
+"""
+
+import re
+from array import array
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from codesdevs_log_analyzer.models import LogLevel, ParsedLogEntry
+
+# Fields a parser extracts from a match: timestamp, level, message, metadata
+EntryFields = tuple[datetime | None, LogLevel | None, str, dict[str, Any]]
+
+
+def iter_block_matches(
+    pattern: re.Pattern[str],
+    block: str,
+    first_line_number: int = 1,
+) -> Iterator[tuple[int, str, re.Match[str] | None]]:
+    """
+    Walk every line of a block, pairing matched lines with their match.
+
+    Args:
+        pattern: MULTILINE pattern whose matches stay within one line
+        block: Newline-separated lines without a trailing newline
+        first_line_number: Line number of the first line in the block
+
+    Yields:
+        Tuples of (line_number, line, match) with match None for lines the
+        pattern did not match
+    """
+    line_number = first_line_number
+    pos = 0  # Start of the next line not yet yielded
+
+    for match in pattern.finditer(block):
+        start = match.start()
+        if start > pos:
+            for line in block[pos : start - 1].split("\n"):
+                yield line_number, line, None
+                line_number += 1
+
+        end = block.find("\n", match.end())
+        if end == -1:
+            end = len(block)
+        yield line_number, block[start:end], match
+        line_number += 1
+        pos = end + 1
+
+    if pos <= len(block):
+        for line in block[pos:].split("\n"):
+            yield line_number, line, None
+            line_number += 1
+
+
+@dataclass
+class ParsedBatch:
+    """
+    Parse results for a block of lines, stored column by column.
+
+    Each index is one parsed entry. Line numbers live in a compact integer
+    array; entries are materialized only when iterated or indexed.
+    """
+
+    line_numbers: "array[int]" = field(default_factory=lambda: array("q"))
+    raw_lines: list[str] = field(default_factory=list)
+    timestamps: list[datetime | None] = field(default_factory=list)
+    levels: list[LogLevel | None] = field(default_factory=list)
+    messages: list[str] = field(default_factory=list)
+    metadata: list[dict[str, Any]] = field(default_factory=list)
+
+    def append(self, line_number: int, raw_line: str, fields: EntryFields) -> None:
+        """Append one entry from its extracted fields."""
+        timestamp, level, message, metadata = fields
+        self.line_numbers.append(line_number)
+        self.raw_lines.append(raw_line)
+        self.timestamps.append(timestamp)
+        self.levels.append(level)
+        self.messages.append(message)
+        self.metadata.append(metadata)
+
+    def append_entry(self, entry: ParsedLogEntry) -> None:
+        """Append an already-built entry (per-line fallback path)."""
+        self.append(
+            entry.line_number,
+            entry.raw_line,
+            (entry.timestamp, entry.level, entry.message, entry.metadata),
+        )
+
+    def __len__(self) -> int:
+        """Number of parsed entries."""
+        return len(self.line_numbers)
+
+    def __getitem__(self, index: int) -> ParsedLogEntry:
+        """Build the entry at an index."""
+        return ParsedLogEntry.model_construct(
+            line_number=self.line_numbers[index],
+            raw_line=self.raw_lines[index],
+            timestamp=self.timestamps[index],
+            level=self.levels[index],
+            message=self.messages[index],
+            metadata=self.metadata[index],
+        )
+
+    def __iter__(self) -> Iterator[ParsedLogEntry]:
+        """Build entries in line order."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def level_counts(self) -> Counter[str]:
+        """Count entries per level without building entries."""
+        return Counter(level.value for level in self.levels if level is not None)
@@ -0,0 +1,123 @@
+"""Run-length collapsing of repeated log entries.
+
+Chatty services emit long runs of identical or near-identical lines (health
+checks, retry loops). This optional post-parse stage collapses consecutive
+entries with the same level and normalized message into the first entry of
+the run, annotated with how many lines it stands for and when the run ended.
+Analyzers read the annotation through repeat_count() / last_timestamp() and
+weight their counters instead of iterating every duplicate.
+"""
+
+import re
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+
+from codesdevs_log_analyzer.models import LazyLogEntry, MultiLineLogEntry, ParsedLogEntry
+
+# Metadata keys set on the surviving entry of a collapsed run
+REPEAT_COUNT_KEY = "repeat_count"
+LAST_TIMESTAMP_KEY = "last_timestamp"
+LAST_LINE_NUMBER_KEY = "last_line_number"
+
+# Digit runs (counters, durations, ports, embedded times) vary within a run
+_DIGIT_RUN = re.compile(r"\d+")
+
+
+def repeat_count(entry: ParsedLogEntry) -> int:
+    """
+    Number of log lines an entry stands for.
+
+    Args:
+        entry: Parsed (possibly collapsed) log entry
+
+    Returns:
+        Repeat count, 1 for entries that were not collapsed
+    """
+    if _unresolved(entry):
+        return 1
+    count: int = entry.metadata.get(REPEAT_COUNT_KEY, 1)
+    return count
+
+
+def last_timestamp(entry: ParsedLogEntry) -> datetime | None:
+    """
+    Timestamp of the last line in an entry's run.
+
+    Args:
+        entry: Parsed (possibly collapsed) log entry
+
+    Returns:
+        Last timestamp of the run, or the entry's own timestamp
+    """
+    if _unresolved(entry):
+        return entry.timestamp
+    last: datetime | None = entry.metadata.get(LAST_TIMESTAMP_KEY, entry.timestamp)
+    return last
+
+
+def _unresolved(entry: ParsedLogEntry) -> bool:
+    """Scan-phase entries were never collapsed (collapsing writes metadata)."""
+    return isinstance(entry, LazyLogEntry) and not entry.is_resolved
+
+
+def _run_key(entry: ParsedLogEntry) -> tuple[str | None, str]:
+    """Key identifying entries that belong to the same run."""
+    message = entry.head_message if isinstance(entry, MultiLineLogEntry) else entry.message
+    return entry.level, _DIGIT_RUN.sub("0", message)
+
+
+def _same_trace(a: ParsedLogEntry, b: ParsedLogEntry) -> bool:
+    """Multi-line entries only collapse when their continuation lines match."""
+    a_lines = a.continuation if isinstance(a, MultiLineLogEntry) else None
+    b_lines = b.continuation if isinstance(b, MultiLineLogEntry) else None
+    return a_lines == b_lines
+
+
+def _close_run(
+    first: ParsedLogEntry, last: ParsedLogEntry, count: int
+) -> ParsedLogEntry:
+    """Annotate the first entry of a run with its length and end."""
+    if count > 1:
+        first.metadata[REPEAT_COUNT_KEY] = count
+        first.metadata[LAST_TIMESTAMP_KEY] = last.timestamp or first.timestamp
+        first.metadata[LAST_LINE_NUMBER_KEY] = last.line_number
+    return first
+
+
+def collapse_repeated_entries(
+    entries: Iterable[ParsedLogEntry],
+) -> Iterator[ParsedLogEntry]:
+    """
+    Collapse consecutive entries with the same level and normalized message.
+
+    Messages are compared after replacing digit runs, so "retry 1 of 5" and
+    "retry 2 of 5" collapse together. The first entry of each run is kept and
+    annotated with repeat_count, last_timestamp and last_line_number metadata;
+    metadata of the dropped entries (client IPs, paths) is not merged.
+
+    Args:
+        entries: Parsed entries in file order
+
+    Yields:
+        One entry per run of repeated entries
+    """
+    first: ParsedLogEntry | None = None
+    last: ParsedLogEntry | None = None
+    key: tuple[str | None, str] | None = None
+    count = 0
+
+    for entry in entries:
+        entry_key = _run_key(entry)
+        if first is not None and last is not None:
+            if entry_key == key and _same_trace(first, entry):
+                last = entry
+                count += 1
+                continue
+            yield _close_run(first, last, count)
+
+        first = last = entry
+        key = entry_key
+        count = 1
+
+    if first is not None and last is not None:
+        yield _close_run(first, last, count)
@@ -0,0 +1,584 @@
+"""Header-driven delimited log parsers: W3C extended (IIS), AWS ELB/ALB, CSV and TSV.
+
+Delimited logs carry their schema outside the data lines: a `#Fields:`
+directive (W3C), a documented fixed column order (load balancers) or a header
+row (CSV/TSV). The schema is turned into a column-index plan once, each data
+line is a plain split, and known columns become typed metadata under the names
+the analyzers read (status_code, response_time in milliseconds, bytes_sent,
+client_ip, method, path, user_agent).
+"""
+
+import csv
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, ClassVar
+
+from codesdevs_log_analyzer.models import LogLevel, ParsedLogEntry
+from codesdevs_log_analyzer.parsers.base import BaseLogParser
+from codesdevs_log_analyzer.parsers.jsonl import JSONLParser
+from codesdevs_log_analyzer.utils.time_utils import parse_timestamp
+
+Converter = Callable[[str], Any]
+
+# A header row: short identifier-like names only (no timestamps or numbers)
+_HEADER_NAME = re.compile(r"[A-Za-z_][\w .()/:-]{0,63}")
+
+
+def _text(value: str) -> str | None:
+    """Column text, with the conventional "-" placeholder as missing."""
+    return None if value in ("", "-") else value
+
+
+def _int(value: str) -> int | None:
+    return int(value) if value.isdigit() else None
+
+
+def _float(value: str) -> float | None:
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _plus_text(value: str) -> str | None:
+    """W3C text column, where IIS writes spaces as "+"."""
+    return None if value in ("", "-") else value.replace("+", " ")
+
+
+def _status_level(status: int) -> LogLevel:
+    """Level for an HTTP status code (as for Apache access logs)."""
+    if status >= 500:
+        return LogLevel.ERROR
+    if status >= 400:
+        return LogLevel.WARN
+    if status >= 300:
+        return LogLevel.INFO
+    return LogLevel.DEBUG
+
+
+def _parse_time(value: str) -> datetime | None:
+    """Parse an ISO 8601 column value, falling back to the general parser."""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return parse_timestamp(value, fuzzy=False)
+
+
+def _split_quoted(line: str, delimiter: str) -> list[str]:
+    """
+    Split a line whose double-quoted fields may contain the delimiter.
+
+    Segments between quotes alternate between unquoted runs (split on the
+    delimiter) and whole quoted fields, so no per-character scan is needed.
+    """
+    segments = line.split('"')
+    if len(segments) % 2 == 0:
+        return line.split(delimiter)  # Unbalanced quotes
+    last = len(segments) - 1
+    values: list[str] = []
+    for i, segment in enumerate(segments):
+        if i % 2:
+            values.append(segment)
+            continue
+        if i > 0 and segment.startswith(delimiter):
+            segment = segment[len(delimiter) :]
+        if i < last and segment.endswith(delimiter):
+            segment = segment[: -len(delimiter)]
+        if segment:
+            values.extend(segment.split(delimiter))
+    return values
+
+
+@dataclass(frozen=True)
+class Schema:
+    """Column-index plan for one column layout."""
+
+    fields: tuple[str, ...]
+    typed: tuple[tuple[int, str, Converter], ...]  # (index, metadata key, converter)
+    plain: tuple[tuple[int, str], ...]  # (index, metadata key) kept as text
+    timestamp: tuple[int, ...]  # One column, or separate date and time columns
+    level: int | None
+    message: int | None
+    required: int  # Fewest values a data line must split into
+
+
+@lru_cache(maxsize=64)
+def build_schema(
+    fields: tuple[str, ...],
+    columns: tuple[tuple[str, tuple[str, Converter]], ...],
+    required: int | None = None,
+) -> Schema:
+    """
+    Build (once per layout) the column-index plan for a list of column names.
+
+    Args:
+        fields: Column names in line order
+        columns: Lower-case column name to (metadata key, converter) for typed columns
+        required: Fewest values per line (defaults to every column)
+
+    Returns:
+        Schema for splitting and converting data lines
+    """
+    names = [name.lower() for name in fields]
+    index = {name: i for i, name in reversed(list(enumerate(names)))}
+
+    timestamp: tuple[int, ...] = ()
+    if "date" in index and "time" in index:
+        timestamp = (index["date"], index["time"])
+    else:
+        timestamp = next(
+            ((index[name],) for name in JSONLParser.TIMESTAMP_FIELDS if name in index), ()
+        )
+    level = next((index[name] for name in JSONLParser.LEVEL_FIELDS if name in index), None)
+    message = next((index[name] for name in JSONLParser.MESSAGE_FIELDS if name in index), None)
+
+    typed_columns = dict(columns)
+    special = {*timestamp, level, message}
+    typed: list[tuple[int, str, Converter]] = []
+    plain: list[tuple[int, str]] = []
+    for i, (field, name) in enumerate(zip(fields, names, strict=True)):
+        if i in special:
+            continue
+        if name in typed_columns:
+            key, converter = typed_columns[name]
+            typed.append((i, key, converter))
+        else:
+            plain.append((i, field))
+
+    return Schema(
+        fields=fields,
+        typed=tuple(typed),
+        plain=tuple(plain),
+        timestamp=timestamp,
+        level=level,
+        message=message,
+        required=len(fields) if required is None else required,
+    )
+
+
+class DelimitedParser(BaseLogParser):
+    """
+    Base class for delimited formats with a column schema.
+
+    Subclasses set the delimiter, the default schema and the typed columns,
+    and override read_header() for formats whose schema is in the file.
+    """
+
+    name: ClassVar[str] = "delimited"
+    description: ClassVar[str] = "Delimited columns"
+
+    DELIMITER: ClassVar[str] = " "
+    QUOTED: ClassVar[bool] = False  # Fields may be double-quoted around the delimiter
+    FIELDS: ClassVar[tuple[str, ...]] = ()  # Schema until a header is read
+    COLUMNS: ClassVar[dict[str, tuple[str, Converter]]] = {}
+
+    def __init__(self, default_year: int | None = None) -> None:
+        """
+        Initialize parser.
+
+        Args:
+            default_year: Year to use for timestamps without year
+        """
+        super().__init__(default_year)
+        self.schema: Schema | None = None
+        if self.FIELDS:
+            self.set_fields(self.FIELDS)
+
+    def set_fields(self, fields: tuple[str, ...] | list[str], required: int | None = None) -> None:
+        """Use a new column layout for the following lines."""
+        self.schema = build_schema(tuple(fields), tuple(self.COLUMNS.items()), required)
+
+    def read_header(self, line: str) -> bool:
+        """
+        Consume a header or directive line.
+
+        Returns:
+            True if the line described the schema and holds no entry
+        """
+        return False
+
+    def prime(self, sample_lines: list[str]) -> None:
+        """Read the schema from the sampled header or directive lines."""
+        for line in sample_lines:
+            self.read_header(line)
+
+    def split(self, line: str) -> list[str]:
+        """Split a data line into column values."""
+        if self.QUOTED and '"' in line:
+            return _split_quoted(line, self.DELIMITER)
+        return line.split(self.DELIMITER)
+
+    def schema_for(self, values: list[str]) -> Schema | None:
+        """Schema for a split data line (one layout unless overridden)."""
+        return self.schema
+
+    def can_parse(self, line: str) -> bool:
+        """Check if line has the schema's column count."""
+        if not line:
+            return False
+        values = self.split(line)
+        schema = self.schema_for(values)
+        return schema is not None and len(values) >= schema.required
+
+    def parse_line(self, line: str, line_number: int) -> ParsedLogEntry | None:
+        """Parse a delimited data line (header and directive lines yield None)."""
+        if not line or self.read_header(line):
+            return None
+
+        values = self.split(line)
+        schema = self.schema_for(values)
+        count = len(values)
+        if schema is None or count < schema.required:
+            return None
+
+        metadata: dict[str, Any] = {}
+        for i, key in schema.plain:
+            if i < count and values[i] not in ("", "-"):
+                metadata[key] = values[i]
+        for i, key, converter in schema.typed:
+            if i < count:
+                value = converter(values[i])
+                if value is not None:
+                    metadata[key] = value
+        self.enrich(metadata)
+
+        timestamp = None
+        if len(schema.timestamp) == 2:
+            # Separate date and time columns are UTC (W3C)
+            date_index, time_index = schema.timestamp
+            timestamp = _parse_time(f"{values[date_index]}T{values[time_index]}")
+            if timestamp is not None and timestamp.tzinfo is None:
+                timestamp = timestamp.replace(tzinfo=timezone.utc)
+        elif schema.timestamp:
+            timestamp = _parse_time(values[schema.timestamp[0]])
+
+        level = None
+        if schema.level is not None:
+            level = self.normalize_level(values[schema.level])
+        status = metadata.get("status_code")
+        if level is None and isinstance(status, int):
+            level = _status_level(status)
+
+        if schema.message is not None:
+            message = values[schema.message]
+        elif "method" in metadata or "path" in metadata:
+            message = f"{metadata.get('method', '')} {metadata.get('path', '')} - {status}".strip()
+        else:
+            message = line
+
+        return self.create_entry(
+            line_number=line_number,
+            raw_line=line,
+            message=message,
+            timestamp=timestamp,
+            level=level,
+            metadata=metadata,
+        )
+
+    def enrich(self, metadata: dict[str, Any]) -> None:
+        """Derive metadata from converted columns (nothing by default)."""
+
+    @classmethod
+    def score_results(
+        cls,
+        lines: list[str],
+        results: list[tuple[bool, ParsedLogEntry | None]],
+    ) -> float:
+        """Score data lines only: header and directive lines are accepted but hold no entry."""
+        data = [
+            (line, result)
+            for line, result in zip(lines, results, strict=True)
+            if not (result[0] and result[1] is None)
+        ]
+        return super().score_results([line for line, _ in data], [result for _, result in data])
+
+
+class W3CParser(DelimitedParser):
+    """
+    Parser for W3C extended log files (IIS, some CDNs and proxies).
+
+    Format (space-delimited, schema from the latest #Fields directive):
+        #Fields: date time s-ip cs-method cs-uri-stem cs-uri-query s-port ...
+        2026-01-15 10:30:00 10.0.0.5 GET /api/orders - 443 - 203.0.113.7 ...
+
+    Until a #Fields directive is seen the IIS default field set is assumed.
+    """
+
+    name: ClassVar[str] = "w3c"
+    description: ClassVar[str] = "W3C extended log format (IIS)"
+    patterns: ClassVar[list[str]] = [
+        r"^#(?:Fields|Software|Version|Date):",
+        r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} \S+ [A-Z]+ /",
+    ]
+
+    # IIS default fields
+    FIELDS: ClassVar[tuple[str, ...]] = (
+        "date",
+        "time",
+        "s-ip",
+        "cs-method",
+        "cs-uri-stem",
+        "cs-uri-query",
+        "s-port",
+        "cs-username",
+        "c-ip",
+        "cs(User-Agent)",
+        "cs(Referer)",
+        "sc-status",
+        "sc-substatus",
+        "sc-win32-status",
+        "time-taken",
+    )
+
+    COLUMNS: ClassVar[dict[str, tuple[str, Converter]]] = {
+        "c-ip": ("client_ip", _text),
+        "s-ip": ("server_ip", _text),
+        "cs-method": ("method", _text),
+        "cs-uri-stem": ("path", _text),
+        "cs-uri-query": ("query", _text),
+        "s-port": ("server_port", _int),
+        "cs-username": ("user", _text),
+        "cs-host": ("host", _text),
+        "cs(user-agent)": ("user_agent", _plus_text),
+        "cs(referer)": ("referer", _text),
+        "sc-status": ("status_code", _int),
+        "sc-substatus": ("substatus", _int),
+        "sc-win32-status": ("win32_status", _int),
+        "sc-bytes": ("bytes_sent", _int),
+        "cs-bytes": ("bytes_received", _int),
+        "time-taken": ("response_time", _float),  # IIS writes milliseconds
+    }
+
+    def read_header(self, line: str) -> bool:
+        """Consume directives, switching schema on #Fields."""
+        if not line.startswith("#"):
+            return False
+        if line.startswith("#Fields:"):
+            self.set_fields(line[len("#Fields:") :].split())
+        return True
+
+    def can_parse(self, line: str) -> bool:
+        """Check if line is a W3C directive or a data line of the current schema."""
+        if line.startswith("#"):
+            return line.startswith(("#Fields:", "#Software:", "#Version:", "#Date:", "#Remark:"))
+        return super().can_parse(line)
+
+
+class ELBParser(DelimitedParser):
+    """
+    Parser for AWS load balancer access logs.
+
+    Handles both fixed layouts, told apart by the first column:
+    - Application Load Balancer: http 2026-01-15T10:30:00.123456Z app/my-alb/... ...
+    - Classic Load Balancer: 2026-01-15T10:30:00.123456Z my-elb 203.0.113.7:5123 ...
+
+    The three processing times (seconds) are summed into response_time
+    (milliseconds) unless the load balancer reports -1 for a failed request.
+    """
+
+    name: ClassVar[str] = "elb"
+    description: ClassVar[str] = "AWS Classic/Application Load Balancer access log format"
+    patterns: ClassVar[list[str]] = [
+        r"^(?:https?|h2|grpcs|wss?) \d{4}-\d{2}-\d{2}T\S+ \S+ [\d.:\[\]a-f]+:\d+ ",
+        r"^\d{4}-\d{2}-\d{2}T\S+Z \S+ [\d.:\[\]a-f]+:\d+ ",
+    ]
+
+    QUOTED: ClassVar[bool] = True
+
+    CLASSIC_FIELDS: ClassVar[tuple[str, ...]] = (
+        "timestamp",
+        "elb",
+        "client:port",
+        "backend:port",
+        "request_processing_time",
+        "backend_processing_time",
+        "response_processing_time",
+        "elb_status_code",
+        "backend_status_code",
+        "received_bytes",
+        "sent_bytes",
+        "request",
+        "user_agent",
+        "ssl_cipher",
+        "ssl_protocol",
+    )
+
+    # Later columns are optional: AWS appends new ones over time
+    ALB_FIELDS: ClassVar[tuple[str, ...]] = (
+        "type",
+        "time",
+        "elb",
+        "client:port",
+        "target:port",
+        "request_processing_time",
+        "target_processing_time",
+        "response_processing_time",
+        "elb_status_code",
+        "target_status_code",
+        "received_bytes",
+        "sent_bytes",
+        "request",
+        "user_agent",
+        "ssl_cipher",
+        "ssl_protocol",
+        "target_group_arn",
+        "trace_id",
+        "domain_name",
+        "chosen_cert_arn",
+        "matched_rule_priority",
+        "request_creation_time",
+        "actions_executed",
+        "redirect_url",
+        "error_reason",
+    )
+    ALB_REQUIRED: ClassVar[int] = 16
+
+    COLUMNS: ClassVar[dict[str, tuple[str, Converter]]] = {
+        "client:port": ("client", _text),
+        "backend:port": ("target", _text),
+        "target:port": ("target", _text),
+        "request_processing_time": ("request_processing_time", _float),
+        "backend_processing_time": ("target_processing_time", _float),
+        "target_processing_time": ("target_processing_time", _float),
+        "response_processing_time": ("response_processing_time", _float),
+        "elb_status_code": ("status_code", _int),
+        "backend_status_code": ("target_status_code", _int),
+        "target_status_code": ("target_status_code", _int),
+        "received_bytes": ("bytes_received", _int),
+        "sent_bytes": ("bytes_sent", _int),
+        "request": ("request", _text),
+        "user_agent": ("user_agent", _text),
+        "ssl_cipher": ("ssl_cipher", _text),
+        "ssl_protocol": ("ssl_protocol", _text),
+        "trace_id": ("trace_id", _text),
+        "domain_name": ("domain_name", _text),
+        "error_reason": ("error_reason", _text),
+    }
+
+    _PROCESSING_TIMES = (
+        "request_processing_time",
+        "target_processing_time",
+        "response_processing_time",
+    )
+
+    def __init__(self, default_year: int | None = None) -> None:
+        """
+        Initialize parser.
+
+        Args:
+            default_year: Year to use for timestamps without year
+        """
+        super().__init__(default_year)
+        items = tuple(self.COLUMNS.items())
+        self.classic = build_schema(self.CLASSIC_FIELDS, items)
+        self.alb = build_schema(self.ALB_FIELDS, items, self.ALB_REQUIRED)
+
+    def schema_for(self, values: list[str]) -> Schema | None:
+        """ALB lines start with the request type, Classic ones with the timestamp."""
+        if not values or not values[0]:
+            return None
+        return self.classic if values[0][0].isdigit() else self.alb
+
+    def enrich(self, metadata: dict[str, Any]) -> None:
+        """Split client address and request line; total the processing times."""
+        client = metadata.pop("client", None)
+        if client is not None:
+            host, _, port = client.rpartition(":")
+            metadata["client_ip"] = host or client
+            if port.isdigit():
+                metadata["client_port"] = int(port)
+
+        request = metadata.get("request")
+        if request is not None:
+            parts = request.split(" ")
+            if len(parts) == 3:
+                metadata["method"], metadata["path"], metadata["protocol"] = parts
+
+        total = 0.0
+        for key in self._PROCESSING_TIMES:
+            seconds = metadata.get(key)
+            if seconds is None or seconds < 0:
+                break
+            total += seconds
+        else:
+            metadata["response_time"] = round(total * 1000, 3)
+
+
+class CSVParser(DelimitedParser):
+    """
+    Parser for CSV logs with a header row.
+
+    Format:
+        timestamp,level,status,latency_ms,path,message
+        2026-01-15T10:30:00Z,info,200,12.5,/api/orders,order listed
+
+    Columns named like the JSON Lines fields become timestamp, level and
+    message; common HTTP column names become typed metadata.
+    """
+
+    name: ClassVar[str] = "csv"
+    description: ClassVar[str] = "Comma-separated log with a header row"
+    patterns: ClassVar[list[str]] = [
+        r"^[^,]+,[^,]*,[^,]*",
+    ]
+
+    DELIMITER: ClassVar[str] = ","
+
+    COLUMNS: ClassVar[dict[str, tuple[str, Converter]]] = {
+        **dict.fromkeys(("status", "status_code", "http_status"), ("status_code", _int)),
+        **dict.fromkeys(
+            (
+                "latency",
+                "latency_ms",
+                "duration",
+                "duration_ms",
+                "response_time",
+                "response_time_ms",
+                "elapsed_ms",
+                "time_taken",
+            ),
+            ("response_time", _float),
+        ),
+        **dict.fromkeys(("bytes", "bytes_sent", "body_bytes_sent", "size"), ("bytes_sent", _int)),
+        "bytes_received": ("bytes_received", _int),
+        **dict.fromkeys(("ip", "client_ip", "remote_addr", "src_ip"), ("client_ip", _text)),
+        **dict.fromkeys(("method", "http_method"), ("method", _text)),
+        **dict.fromkeys(("path", "url", "uri", "request_uri"), ("path", _text)),
+        **dict.fromkeys(("user_agent", "http_user_agent"), ("user_agent", _text)),
+        **dict.fromkeys(("referer", "referrer"), ("referer", _text)),
+    }
+
+    def split(self, line: str) -> list[str]:
+        """Split on the delimiter, using the csv module only for quoted lines."""
+        if '"' in line:
+            return next(csv.reader([line], delimiter=self.DELIMITER))
+        return line.split(self.DELIMITER)
+
+    def read_header(self, line: str) -> bool:
+        """Take the first header-like row (and identical repeats) as the schema."""
+        values = self.split(line)
+        if self.schema is not None:
+            return tuple(value.strip() for value in values) == self.schema.fields
+        if len(values) >= 2 and all(_HEADER_NAME.fullmatch(value) for value in values):
+            self.set_fields([value.strip() for value in values])
+            return True
+        return False
+
+
+class TSVParser(CSVParser):
+    """
+    Parser for tab-separated logs with a header row.
+
+    Same column handling as CSVParser.
+    """
+
+    name: ClassVar[str] = "tsv"
+    description: ClassVar[str] = "Tab-separated log with a header row"
+    patterns: ClassVar[list[str]] = [
+        r"^[^\t]+\t[^\t]*\t[^\t]*",
+    ]
+
+    DELIMITER: ClassVar[str] = "\t"
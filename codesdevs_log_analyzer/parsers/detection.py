@@ -0,0 +1,350 @@
+"""Format detection with a signature prefilter and multi-region sampling.
+
+Fully scoring a parser runs can_parse and parse_line on every sample line,
+which for the generic parser includes fuzzy timestamp extraction. Detection
+therefore first scores each parser's cheap `patterns` signatures against the
+sample and fully parses only the best few candidates. The sample is taken
+from the head, middle and tail of the file so a header or a preamble does not
+decide the format on its own, and the per-line parse results are kept on the
+DetectionResult so callers that need them (log_analyzer_suggest_format) do
+not parse the sample again.
+"""
+
+import os
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from codesdevs_log_analyzer.models import ParsedLogEntry
+from codesdevs_log_analyzer.parsers.base import BaseLogParser
+from codesdevs_log_analyzer.utils.file_handler import (
+    PathLike,
+    detect_encoding,
+    is_gzip_file,
+    stream_file,
+)
+
+# Number of parsers fully scored after the signature prefilter
+SIGNATURE_CANDIDATES = 3
+
+# Bytes read around the middle and tail offsets of a large file
+REGION_BYTES = 64 * 1024
+
+# Files up to this size are read whole and sampled by line index
+SMALL_FILE_BYTES = 3 * REGION_BYTES
+
+# Bound on cached detection results (keyed by file identity)
+MAX_CACHED_DETECTIONS = 32
+
+HEAD = "head"
+MIDDLE = "middle"
+TAIL = "tail"
+
+
+@dataclass
+class SampleLine:
+    """One sampled line and where it came from."""
+
+    text: str
+    line_number: int | None  # None when read by byte offset (middle/tail of large files)
+    region: str = HEAD
+
+
+@dataclass
+class ParserScore:
+    """Detection scores for one parser."""
+
+    name: str
+    signature: float
+    confidence: float | None = None  # None until the parser is fully scored
+    parsed_lines: int = 0
+    failed_lines: int = 0
+
+
+@dataclass
+class DetectionResult:
+    """
+    Sample, per-parser scores and per-line parse results for one detection.
+
+    Parsers are fully scored on demand by score(); results for parsers that
+    were already scored are reused.
+    """
+
+    sample: list[SampleLine]
+    parser_classes: dict[str, type[BaseLogParser]]
+    scores: dict[str, ParserScore] = field(default_factory=dict)
+    parses: dict[str, list[ParsedLogEntry | None]] = field(default_factory=dict)
+    best_name: str | None = None
+    best_confidence: float = 0.0
+    # Parser synthesized for this sample when no registered parser fits
+    synthesized: type[BaseLogParser] | None = None
+
+    @property
+    def lines(self) -> list[str]:
+        """Sampled line texts in sample order."""
+        return [line.text for line in self.sample]
+
+    def parser_class(self, name: str) -> type[BaseLogParser]:
+        """Class of a registered or synthesized parser."""
+        if self.synthesized is not None and name == self.synthesized.name:
+            return self.synthesized
+        return self.parser_classes[name]
+
+    def parser(self) -> BaseLogParser | None:
+        """Instance of the best parser primed with the sample, or None if nothing matched."""
+        if self.best_name is None:
+            return None
+        parser = self.parser_class(self.best_name)()
+        parser.prime(self.lines)
+        return parser
+
+    @property
+    def scored(self) -> list[ParserScore]:
+        """Fully scored parsers, best first."""
+        done = [score for score in self.scores.values() if score.confidence is not None]
+        return sorted(done, key=lambda score: score.confidence or 0.0, reverse=True)
+
+    def score(self, name: str) -> float:
+        """
+        Fully score a parser, parsing the sample at most once per parser.
+
+        Args:
+            name: Registered parser name
+
+        Returns:
+            Confidence between 0.0 and 1.0
+        """
+        score = self.scores.get(name)
+        if score is None:
+            score = ParserScore(name=name, signature=0.0)
+            self.scores[name] = score
+        if score.confidence is not None:
+            return score.confidence
+
+        parser_class = self.parser_class(name)
+        parser = parser_class()
+        lines: list[str] = []
+        results: list[tuple[bool, ParsedLogEntry | None]] = []
+        parses: list[ParsedLogEntry | None] = []
+
+        for sampled in self.sample:
+            if not sampled.text.strip():
+                parses.append(None)
+                continue
+            entry = parser.parse_line(sampled.text, sampled.line_number or 0)
+            lines.append(sampled.text)
+            results.append((parser.can_parse(sampled.text), entry))
+            parses.append(entry)
+            if entry is not None and entry.message:
+                score.parsed_lines += 1
+            else:
+                score.failed_lines += 1
+
+        self.parses[name] = parses
+        score.confidence = parser_class.score_results(lines, results)
+        return score.confidence
+
+    def unparsed(self, name: str) -> list[SampleLine]:
+        """Non-blank sample lines a scored parser could not parse."""
+        self.score(name)
+        return [
+            sampled
+            for sampled, entry in zip(self.sample, self.parses[name], strict=True)
+            if entry is None and sampled.text.strip()
+        ]
+
+
+_SIGNATURES: dict[type[BaseLogParser], list[re.Pattern[str]]] = {}
+
+
+def _signatures(parser_class: type[BaseLogParser]) -> list[re.Pattern[str]]:
+    """Compile (once) a parser class's signature patterns."""
+    compiled = _SIGNATURES.get(parser_class)
+    if compiled is None:
+        compiled = [re.compile(pattern) for pattern in parser_class.patterns]
+        _SIGNATURES[parser_class] = compiled
+    return compiled
+
+
+def signature_score(parser_class: type[BaseLogParser], lines: Iterable[str]) -> float:
+    """
+    Fraction of non-blank lines matching any of a parser's signature patterns.
+
+    Args:
+        parser_class: Parser class whose `patterns` are tested
+        lines: Sample lines
+
+    Returns:
+        Score between 0.0 and 1.0 (0.0 for parsers without patterns)
+    """
+    patterns = _signatures(parser_class)
+    total = 0
+    matched = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        total += 1
+        if any(pattern.search(line) for pattern in patterns):
+            matched += 1
+    return matched / total if total else 0.0
+
+
+def detect(
+    sample: list[SampleLine],
+    parser_classes: dict[str, type[BaseLogParser]],
+    order: list[str],
+    full_score_below: float,
+) -> DetectionResult:
+    """
+    Pick the best parser for a sample.
+
+    Parsers are ranked by signature score and the top SIGNATURE_CANDIDATES are
+    fully scored in detection order (stopping at confidence 0.9, as before).
+    If none of them reaches full_score_below, the remaining parsers are fully
+    scored too, so formats whose signatures are incomplete are still found.
+
+    Args:
+        sample: Sampled lines
+        parser_classes: Parser registry
+        order: Parser names in detection priority order
+        full_score_below: Confidence under which every parser is scored
+
+    Returns:
+        DetectionResult with best_name set (None if nothing scored above 0)
+    """
+    result = DetectionResult(sample=sample, parser_classes=parser_classes)
+    lines = result.lines
+    for name in order:
+        result.scores[name] = ParserScore(
+            name=name, signature=signature_score(parser_classes[name], lines)
+        )
+
+    ranked = sorted(
+        (name for name in order if result.scores[name].signature > 0),
+        key=lambda name: result.scores[name].signature,
+        reverse=True,
+    )
+    shortlist = set(ranked[:SIGNATURE_CANDIDATES])
+
+    def run(names: list[str]) -> bool:
+        for name in names:
+            confidence = result.score(name)
+            if confidence > result.best_confidence:
+                result.best_name = name
+                result.best_confidence = confidence
+                # Early exit if we have high confidence
+                if confidence >= 0.9:
+                    return True
+        return False
+
+    if run([name for name in order if name in shortlist]):
+        return result
+    if result.best_confidence < full_score_below:
+        run([name for name in order if name not in shortlist])
+    return result
+
+
+def sample_file(
+    file_path: PathLike,
+    sample_size: int = 100,
+    encoding: str | None = None,
+) -> list[SampleLine]:
+    """
+    Sample lines from the head, middle and tail of a file.
+
+    Half the sample comes from the head and a quarter each from the middle
+    and the tail. Small files are read whole and sampled by line index; large
+    plain files are sampled by seeking, so middle and tail lines carry no line
+    number. Gzip files cannot seek cheaply and are sampled from the head only.
+
+    Args:
+        file_path: Path to log file
+        sample_size: Total number of lines to sample
+        encoding: File encoding (auto-detected if None)
+
+    Returns:
+        Sampled lines in file order
+    """
+    file_path = str(file_path)
+    quarter = sample_size // 4
+    head_size = sample_size - 2 * quarter
+
+    if is_gzip_file(file_path) or quarter == 0:
+        return [
+            SampleLine(line, line_number)
+            for line_number, line in stream_file(file_path, encoding, max_lines=sample_size)
+        ]
+
+    if encoding is None:
+        encoding = detect_encoding(file_path)
+
+    if os.path.getsize(file_path) <= SMALL_FILE_BYTES:
+        numbered = list(stream_file(file_path, encoding))
+        if len(numbered) <= sample_size:
+            return [SampleLine(line, line_number) for line_number, line in numbered]
+        middle_start = (len(numbered) - quarter) // 2
+        regions = (
+            (HEAD, numbered[:head_size]),
+            (MIDDLE, numbered[middle_start : middle_start + quarter]),
+            (TAIL, numbered[-quarter:]),
+        )
+        return [
+            SampleLine(line, line_number, region)
+            for region, chunk in regions
+            for line_number, line in chunk
+        ]
+
+    sample = [
+        SampleLine(line, line_number)
+        for line_number, line in stream_file(file_path, encoding, max_lines=head_size)
+    ]
+    size = os.path.getsize(file_path)
+    middle = _read_region(file_path, size // 2, encoding)[:quarter]
+    tail = _read_region(file_path, max(0, size - REGION_BYTES), encoding)[-quarter:]
+    sample.extend(SampleLine(line, None, MIDDLE) for line in middle)
+    sample.extend(SampleLine(line, None, TAIL) for line in tail)
+    return sample
+
+
+def _read_region(file_path: str, offset: int, encoding: str) -> list[str]:
+    """Read the complete lines within REGION_BYTES after a byte offset."""
+    with open(file_path, "rb") as f:
+        f.seek(offset)
+        data = f.read(REGION_BYTES)
+
+    lines = data.decode(encoding, errors="replace").split("\n")
+    # Drop the partial line at the seek offset and the one cut at the end
+    if offset > 0:
+        lines = lines[1:]
+    if len(data) == REGION_BYTES or lines and not lines[-1]:
+        lines = lines[:-1]
+    return [line.rstrip("\r") for line in lines]
+
+
+_CACHE: dict[tuple[str, int, int, int], DetectionResult] = {}
+
+
+def cache_key(file_path: PathLike, sample_size: int) -> tuple[str, int, int, int]:
+    """Identify a file's current contents for the detection cache."""
+    path = os.path.realpath(file_path)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Log file not found: {file_path}")
+    stat = os.stat(path)
+    return path, stat.st_size, stat.st_mtime_ns, sample_size
+
+
+def cached_detection(key: tuple[str, int, int, int]) -> DetectionResult | None:
+    """Return the cached result for a key, if any."""
+    return _CACHE.get(key)
+
+
+def cache_detection(key: tuple[str, int, int, int], result: DetectionResult) -> None:
+    """Store a result, evicting the oldest entry when the cache is full."""
+    if key not in _CACHE and len(_CACHE) >= MAX_CACHED_DETECTIONS:
+        del _CACHE[next(iter(_CACHE))]
+    _CACHE[key] = result
+
+
+def clear_detection_cache() -> None:
+    """Forget all cached detection results."""
+    _CACHE.clear()
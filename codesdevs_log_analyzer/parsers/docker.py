@@ -2,11 +2,87 @@
 
 import json
 import re
+from collections.abc import Iterator
 from datetime import datetime, timezone
-from typing import ClassVar
+from typing import Any, ClassVar
 
 from codesdevs_log_analyzer.models import LogLevel, ParsedLogEntry
-from codesdevs_log_analyzer.parsers.base import BaseLogParser
+from codesdevs_log_analyzer.parsers.base import BaseLogParser, FieldNeeds
+from codesdevs_log_analyzer.utils.file_handler import stream_file
+
+# Inner format value that detects the application format from the file head
+AUTO_INNER = "auto"
+
+# Messages sampled to detect the inner format
+INNER_SAMPLE_LINES = 50
+
+# Detected inner formats below this confidence are not used
+INNER_MIN_CONFIDENCE = 0.7
+
+# Cap on a reassembled line; fragments past it are emitted as they are
+MAX_REASSEMBLED_CHARS = 1024 * 1024
+
+# Size in bytes of the records the json-file driver splits long lines into
+JSON_SPLIT_BYTES = 16 * 1024
+
+# Fixed key order written by the json-file logging driver
+_JSON_LOG = '{"log":"'
+_JSON_STREAM = '","stream":"'
+_JSON_TIME = '","time":"'
+
+# (message, stream, time, format, partial, extra metadata) of one record
+DockerRecord = tuple[str, str, str, str, bool, dict[str, Any]]
+
+
+def _ends_with_newline_escape(raw: str) -> bool:
+    """Check if a raw JSON string body ends with an escaped newline (\\n)."""
+    if not raw.endswith("n"):
+        return False
+    backslashes = len(raw) - 1 - len(raw[:-1].rstrip("\\"))
+    return backslashes % 2 == 1
+
+
+def _is_split_fragment(message: str) -> bool:
+    """Check if an unterminated log value is a fragment of a split line."""
+    return len(message.encode()) >= JSON_SPLIT_BYTES
+
+
+def scan_json_record(line: str) -> tuple[str, str, str, bool] | None:
+    """
+    Extract log, stream and time from a json-file record without json.loads.
+
+    The driver always writes the keys in the same order and the stream and
+    time values never contain quotes, so the last '","time":"' and the last
+    '","stream":"' before it end the log value (inside the log value a quote
+    is always escaped). The value is unescaped only if it contains a
+    backslash escape besides the trailing newline.
+
+    Args:
+        line: Record such as {"log":"msg\\n","stream":"stdout","time":"..."}
+
+    Returns:
+        (message, stream, time, partial), or None for records with other
+        keys or layouts (those go through json.loads)
+    """
+    if not line.startswith(_JSON_LOG):
+        return None
+    time_start = line.rfind(_JSON_TIME)
+    log_end = line.rfind(_JSON_STREAM, 0, time_start)
+    if time_start < 0 or log_end < len(_JSON_LOG):
+        return None
+    time_end = line.find('"', time_start + len(_JSON_TIME))
+    if time_end < 0 or line[time_end:].rstrip() != '"}':
+        return None
+
+    raw = line[len(_JSON_LOG) : log_end]
+    stream = line[log_end + len(_JSON_STREAM) : time_start]
+    time_str = line[time_start + len(_JSON_TIME) : time_end]
+    terminated = _ends_with_newline_escape(raw)
+    if terminated:
+        raw = raw[:-2]
+    message = json.loads(f'"{raw}"') if "\\" in raw else raw
+    # Lines longer than 16 KB are split into records without the newline
+    return message, stream, time_str, not terminated and _is_split_fragment(message)
 
 
 class DockerParser(BaseLogParser):
@@ -21,6 +97,12 @@ class DockerParser(BaseLogParser):
     Level mapping:
     - stderr → ERROR
     - stdout → INFO
+
+    Lines the runtime split into partial records (16 KB json-file records
+    without a trailing newline, CRI records flagged P) are stitched back
+    together by parse_file. With an inner format, each application line is
+    also parsed by that format's parser, whose level, message and metadata
+    win.
     """
 
     name: ClassVar[str] = "docker"
@@ -45,6 +127,24 @@ class DockerParser(BaseLogParser):
         r"(?P<message>.*)$"
     )
 
+    def __init__(self, default_year: int | None = None, inner_format: str | None = None) -> None:
+        """
+        Initialize parser.
+
+        Args:
+            default_year: Year to use for timestamps without year
+            inner_format: Format of the application lines inside the records
+                (a registered name, or "auto" to detect it from the file head)
+        """
+        super().__init__(default_year)
+        self.inner_format = inner_format
+        self.inner: BaseLogParser | None = None
+        if inner_format and inner_format != AUTO_INNER:
+            from codesdevs_log_analyzer.parsers import get_parser
+
+            self.inner = get_parser(inner_format)
+        self._inner_pending = inner_format == AUTO_INNER
+
     def can_parse(self, line: str) -> bool:
         """Check if line matches Docker log format."""
         if not line:
@@ -61,24 +161,116 @@ class DockerParser(BaseLogParser):
         return False
 
     def parse_line(self, line: str, line_number: int) -> ParsedLogEntry | None:
-        """Parse a Docker log line."""
+        """Parse a Docker log line (partial records are flagged, not stitched)."""
+        record = self._read_record(line)
+        if record is None:
+            return None
+        return self._build_entry(record, line, line_number)
+
+    def prime(self, sample_lines: list[str]) -> None:
+        """Detect the inner format from sampled records when it is "auto"."""
+        if not self._inner_pending:
+            return
+        self._inner_pending = False
+
+        from codesdevs_log_analyzer.parsers import detect_format_from_lines
+
+        # Fragments of split lines would skew detection towards generic
+        messages = [
+            record[0]
+            for record in map(self._read_record, sample_lines[:INNER_SAMPLE_LINES])
+            if record is not None and not record[4]
+        ]
+        if not messages:
+            return
+        parser, confidence = detect_format_from_lines(messages)
+        if confidence >= INNER_MIN_CONFIDENCE and parser.name not in ("docker", "generic"):
+            self.inner = parser
+
+    def parse_file(
+        self,
+        file_path: str,
+        max_lines: int | None = None,
+        encoding: str | None = None,
+        needs: FieldNeeds | None = None,
+    ) -> Iterator[ParsedLogEntry]:
+        """
+        Stream parse, stitching partial records back into complete lines.
+
+        Fragments are collected per stream (stdout and stderr interleave) and
+        the joined line becomes one entry numbered by its first fragment.
+        """
+        if self._inner_pending:
+            head = stream_file(file_path, encoding=encoding, max_lines=INNER_SAMPLE_LINES)
+            self.prime([line for _, line in head])
+
+        pending: dict[str, list[tuple[int, str, DockerRecord]]] = {}
+        for line_num, line in stream_file(file_path, encoding=encoding, max_lines=max_lines):
+            record = self._read_record(line)
+            if record is None:
+                continue
+
+            stream = record[1]
+            fragments = pending.get(stream)
+            if record[4]:
+                if fragments is None:
+                    fragments = pending[stream] = []
+                fragments.append((line_num, line, record))
+                if sum(len(fragment[2][0]) for fragment in fragments) < MAX_REASSEMBLED_CHARS:
+                    continue
+                yield self._join_fragments(pending.pop(stream))
+            elif fragments:
+                fragments.append((line_num, line, record))
+                yield self._join_fragments(pending.pop(stream))
+            else:
+                yield self._build_entry(record, line, line_num)
+
+        # Records cut off by the end of the file (or of max_lines)
+        for fragments in pending.values():
+            yield self._join_fragments(fragments)
+
+    def _join_fragments(self, fragments: list[tuple[int, str, DockerRecord]]) -> ParsedLogEntry:
+        """Build one entry from the records of a split line."""
+        line_num, _, first = fragments[0]
+        last = fragments[-1][2]
+        message = "".join(record[0] for _, _, record in fragments)
+        extra = {**first[5], **last[5], "fragments": len(fragments)}
+        record: DockerRecord = (message, first[1], first[2], first[3], last[4], extra)
+        raw_line = "\n".join(line for _, line, _ in fragments)
+        return self._build_entry(record, raw_line, line_num)
+
+    def _read_record(self, line: str) -> DockerRecord | None:
+        """Extract the record fields from a JSON or native/CRI line."""
         if not line:
             return None
 
-        # Try JSON format first
+        # Try JSON format first: fixed-key fast path, json.loads for the rest
         if line.startswith("{"):
-            return self._parse_json_line(line, line_number)
+            scanned = scan_json_record(line)
+            if scanned is not None:
+                message, stream, time_str, partial = scanned
+                return message, stream, time_str, "json", partial, {}
+            return self._read_json_record(line)
 
         # Try native formats
         for pattern in [self.NATIVE_PATTERN, self.SIMPLE_PATTERN]:
             match = pattern.match(line)
             if match:
-                return self._create_entry_from_match(match, line, line_number)
+                groups = match.groupdict()
+                flag = groups.get("flag")
+                extra: dict[str, Any] = {}
+                if flag:
+                    extra["partial"] = flag == "P"
+                message = groups.get("message", "")
+                # Partial CRI records keep their spacing so fragments join exactly
+                if flag != "P":
+                    message = message.strip()
+                return message, groups["stream"], groups["timestamp"], "native", flag == "P", extra
 
         return None
 
-    def _parse_json_line(self, line: str, line_number: int) -> ParsedLogEntry | None:
-        """Parse Docker JSON log format."""
+    def _read_json_record(self, line: str) -> DockerRecord | None:
+        """Parse a Docker JSON record with json.loads."""
         try:
             data = json.loads(line)
         except json.JSONDecodeError:
@@ -87,69 +279,43 @@ class DockerParser(BaseLogParser):
         if not isinstance(data, dict):
             return None
 
-        # Extract fields
-        message = data.get("log", "").rstrip("\n")
-        stream = data.get("stream", "stdout")
-        time_str = data.get("time", "")
-
-        # Parse timestamp
-        timestamp = self._parse_timestamp(time_str)
-
-        # Determine level from stream
-        level = LogLevel.ERROR if stream == "stderr" else LogLevel.INFO
-
-        # Build metadata
-        metadata = {
-            "stream": stream,
-            "format": "json",
-        }
+        log = str(data.get("log", ""))
+        partial = not log.endswith("\n") and _is_split_fragment(log)
 
         # Include any extra fields
-        for key in data:
-            if key not in ("log", "stream", "time"):
-                metadata[key] = data[key]
-
-        return self.create_entry(
-            line_number=line_number,
-            raw_line=line,
-            message=message,
-            timestamp=timestamp,
-            level=level,
-            metadata=metadata,
-        )
+        extra = {key: value for key, value in data.items() if key not in ("log", "stream", "time")}
+        stream = str(data.get("stream", "stdout"))
+        return log.rstrip("\n"), stream, str(data.get("time", "")), "json", partial, extra
 
-    def _create_entry_from_match(
-        self,
-        match: re.Match[str],
-        line: str,
-        line_number: int,
-    ) -> ParsedLogEntry:
-        """Create entry from regex match."""
-        groups = match.groupdict()
+    def _build_entry(self, record: DockerRecord, raw_line: str, line_number: int) -> ParsedLogEntry:
+        """Create entry from record fields, applying the inner parser if set."""
+        message, stream, time_str, record_format, partial, extra = record
 
         # Parse timestamp
-        timestamp = self._parse_timestamp(groups.get("timestamp", ""))
-
-        # Get stream and determine level
-        stream = groups.get("stream", "stdout")
-        level = LogLevel.ERROR if stream == "stderr" else LogLevel.INFO
+        timestamp = self._parse_timestamp(time_str)
 
-        # Get message
-        message = groups.get("message", "").strip()
+        # Determine level from stream
+        level: LogLevel | None = LogLevel.ERROR if stream == "stderr" else LogLevel.INFO
 
         # Build metadata
-        metadata: dict[str, str | bool | None] = {
+        metadata: dict[str, Any] = {
             "stream": stream,
-            "format": "native",
+            "format": record_format,
         }
+        if partial and record_format == "json":
+            metadata["partial"] = True
+        metadata.update(extra)
 
-        flag = groups.get("flag")
-        if flag:
-            metadata["partial"] = flag == "P"
+        if self.inner is not None:
+            inner = self.inner.parse_line(message, line_number)
+            if inner is not None:
+                metadata = {**inner.metadata, **metadata, "inner_format": self.inner.name}
+                message = inner.message
+                level = inner.level or level
 
         return self.create_entry(
             line_number=line_number,
-            raw_line=line,
+            raw_line=raw_line,
             message=message,
             timestamp=timestamp,
             level=level,
@@ -166,6 +332,23 @@ class DockerParser(BaseLogParser):
         # Short: 2026-01-15T10:30:00.123Z
         # No millis: 2026-01-15T10:30:00Z
 
+        # Fast path: fixed-width fields sliced directly, any fraction length
+        if len(ts_str) >= 20 and ts_str[-1] == "Z" and ts_str[10] == "T" and ts_str[19] in ".Z":
+            fraction = ts_str[20:-1]
+            try:
+                return datetime(
+                    int(ts_str[0:4]),
+                    int(ts_str[5:7]),
+                    int(ts_str[8:10]),
+                    int(ts_str[11:13]),
+                    int(ts_str[14:16]),
+                    int(ts_str[17:19]),
+                    int(fraction[:6].ljust(6, "0")) if fraction else 0,
+                    tzinfo=timezone.utc,
+                )
+            except ValueError:
+                pass
+
         patterns = [
             (r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})\.(\d{9})Z", 9),
             (r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})\.(\d{6})Z", 6),
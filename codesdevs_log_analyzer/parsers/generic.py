@@ -113,6 +113,18 @@ class GenericParser(BaseLogParser):
             metadata=metadata,
         )
 
+    def scan_line(self, line: str, line_number: int) -> ParsedLogEntry | None:
+        """Extract level and timestamp only; message and format hints are built on demand."""
+        if not line:
+            return None
+
+        return self.defer_entry(
+            line_number,
+            line,
+            timestamp=extract_timestamp_from_line(line, self.default_year),
+            level=self._detect_level(line),
+        )
+
     def _detect_level(self, line: str) -> LogLevel | None:
         """
         Detect log level from line content.
@@ -189,38 +201,35 @@ class GenericParser(BaseLogParser):
         return len(parts) >= 3 and all(p.strip() for p in parts[:3])
 
     @classmethod
-    def detect_confidence(cls, sample_lines: list[str]) -> float:
+    def score_results(
+        cls,
+        lines: list[str],
+        results: list[tuple[bool, ParsedLogEntry | None]],
+    ) -> float:
         """
         Return confidence score for generic parser.
 
         Generic parser should have lower base confidence so specific
         parsers are preferred when they match.
         """
-        if not sample_lines:
+        if not lines:
             return 0.0
 
-        parser = cls()
         matched = 0
         timestamp_found = 0
         level_found = 0
 
-        for line in sample_lines:
-            if not line.strip():
-                continue
-
-            if parser.can_parse(line):
+        for can_parse, entry in results:
+            if can_parse:
                 matched += 1
 
-            entry = parser.parse_line(line, 0)
             if entry:
                 if entry.timestamp:
                     timestamp_found += 1
                 if entry.level:
                     level_found += 1
 
-        total = len([line for line in sample_lines if line.strip()])
-        if total == 0:
-            return 0.0
+        total = len(lines)
 
         # Base score from matching
         base_score = matched / total
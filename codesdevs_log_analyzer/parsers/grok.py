@@ -0,0 +1,314 @@
+"""Custom-format parser compiled from grok-style pattern specs.
+
+A spec is a regular expression in which `%{NAME}` references a library
+pattern and `%{NAME:field}` / `%{NAME:field:type}` captures a named field:
+
+    %{TIMESTAMP_ISO8601:ts} %{LOGLEVEL:level} \\[%{DATA:thread}\\] %{GREEDYDATA:msg}
+
+The spec is expanded and compiled once into an anchored regex; fields named
+like timestamps, levels and messages (the JSONL parser's field names) fill
+the entry, `int` / `float` fields are converted, and the rest is metadata.
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, ClassVar
+
+from codesdevs_log_analyzer.models import LogLevel, ParsedLogEntry
+from codesdevs_log_analyzer.parsers.base import BaseLogParser
+from codesdevs_log_analyzer.parsers.jsonl import JSONLParser
+from codesdevs_log_analyzer.utils.time_utils import parse_timestamp
+
+# Library patterns, after the Logstash grok-patterns set (non-capturing)
+GROK_PATTERNS: dict[str, str] = {
+    "USERNAME": r"[a-zA-Z0-9._-]+",
+    "USER": r"%{USERNAME}",
+    "INT": r"(?:[+-]?[0-9]+)",
+    "BASE10NUM": r"(?:[+-]?(?:[0-9]+(?:\.[0-9]+)?|\.[0-9]+))",
+    "NUMBER": r"%{BASE10NUM}",
+    "POSINT": r"\b(?:[1-9][0-9]*)\b",
+    "NONNEGINT": r"\b(?:[0-9]+)\b",
+    "WORD": r"\b\w+\b",
+    "NOTSPACE": r"\S+",
+    "SPACE": r"\s*",
+    "DATA": r".*?",
+    "GREEDYDATA": r".*",
+    "QUOTEDSTRING": r'"(?:[^"\\]|\\.)*"',
+    "QS": r"%{QUOTEDSTRING}",
+    "UUID": r"[A-Fa-f0-9]{8}-(?:[A-Fa-f0-9]{4}-){3}[A-Fa-f0-9]{12}",
+    "IPV4": r"(?<![0-9])(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9]{1,2})\.){3}"
+    r"(?:25[0-5]|2[0-4][0-9]|[01]?[0-9]{1,2})(?![0-9])",
+    "IPV6": r"(?:[A-Fa-f0-9]{0,4}:){2,7}[A-Fa-f0-9]{0,4}",
+    "IP": r"(?:%{IPV6}|%{IPV4})",
+    "HOSTNAME": r"\b(?:[0-9A-Za-z][0-9A-Za-z-]{0,62})(?:\.(?:[0-9A-Za-z][0-9A-Za-z-]{0,62}))*\.?",
+    "IPORHOST": r"(?:%{IP}|%{HOSTNAME})",
+    "UNIXPATH": r"(?:/[\w_%!$@:.,+~-]*)+",
+    "PATH": r"%{UNIXPATH}",
+    "URIPATH": r"(?:/[A-Za-z0-9$.+!*'(){},~:;=@#%&_-]*)+",
+    "MONTH": r"\b(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?"
+    r"|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\b",
+    "MONTHNUM": r"(?:0?[1-9]|1[0-2])",
+    "MONTHDAY": r"(?:0[1-9]|[12][0-9]|3[01]|[1-9])",
+    "DAY": r"(?:Mon(?:day)?|Tue(?:sday)?|Wed(?:nesday)?|Thu(?:rsday)?|Fri(?:day)?"
+    r"|Sat(?:urday)?|Sun(?:day)?)",
+    "YEAR": r"(?:\d\d){1,2}",
+    "HOUR": r"(?:2[0123]|[01]?[0-9])",
+    "MINUTE": r"(?:[0-5][0-9])",
+    "SECOND": r"(?:(?:[0-5]?[0-9]|60)(?:[:.,][0-9]+)?)",
+    "TIME": r"(?<![0-9])%{HOUR}:%{MINUTE}(?::%{SECOND})(?![0-9])",
+    "ISO8601_TIMEZONE": r"(?:Z|[+-]%{HOUR}(?::?%{MINUTE}))",
+    "TIMESTAMP_ISO8601": r"%{YEAR}-%{MONTHNUM}-%{MONTHDAY}[T ]%{HOUR}:?%{MINUTE}"
+    r"(?::?%{SECOND})?%{ISO8601_TIMEZONE}?",
+    "DATE_US": r"%{MONTHNUM}[/-]%{MONTHDAY}[/-]%{YEAR}",
+    "DATE_EU": r"%{MONTHDAY}[./-]%{MONTHNUM}[./-]%{YEAR}",
+    "DATE": r"(?:%{DATE_US}|%{DATE_EU})",
+    "DATESTAMP": r"%{DATE}[- ]%{TIME}",
+    "EPOCH": r"\b1[0-9]{9}(?:[0-9]{3}|\.[0-9]+)?\b",
+    "SYSLOGTIMESTAMP": r"%{MONTH} +%{MONTHDAY} %{TIME}",
+    "HTTPDATE": r"%{MONTHDAY}/%{MONTH}/%{YEAR}:%{TIME} %{INT}",
+    "LOGLEVEL": r"(?:[Aa]lert|ALERT|[Tt]race|TRACE|[Dd]ebug|DEBUG|[Nn]otice|NOTICE|[Ii]nfo|INFO"
+    r"|[Ww]arn?(?:ing)?|WARN?(?:ING)?|[Ee]rr?(?:or)?|ERR?(?:OR)?|[Cc]rit?(?:ical)?"
+    r"|CRIT?(?:ICAL)?|[Ff]atal|FATAL|[Ss]evere|SEVERE|EMERG(?:ENCY)?|[Ee]merg(?:ency)?)",
+}
+
+# %{NAME}, %{NAME:field} or %{NAME:field:type}
+GROK_REFERENCE = re.compile(r"%\{(?P<pattern>\w+)(?::(?P<field>[\w.@-]+))?(?::(?P<type>\w+))?\}")
+
+# Expansion depth guarding against self-referencing library patterns
+MAX_EXPANSION_DEPTH = 16
+
+FIELD_CONVERTERS: dict[str, type[int] | type[float] | type[str]] = {
+    "int": int,
+    "float": float,
+    "str": str,
+}
+
+_TIMESTAMP_FIELDS = frozenset(JSONLParser.TIMESTAMP_FIELDS)
+_LEVEL_FIELDS = frozenset(JSONLParser.LEVEL_FIELDS)
+_MESSAGE_FIELDS = frozenset(JSONLParser.MESSAGE_FIELDS)
+
+
+@dataclass(frozen=True)
+class GrokField:
+    """A captured field: regex group, output name and optional converter name."""
+
+    group: str
+    name: str
+    type: str | None = None
+
+
+@dataclass(frozen=True)
+class GrokSpec:
+    """A compiled grok spec."""
+
+    spec: str
+    regex: re.Pattern[str]
+    fields: tuple[GrokField, ...]
+    timestamp_field: str | None
+    level_field: str | None
+    message_field: str | None
+
+
+def _expand(pattern: str, fields: list[GrokField], depth: int) -> str:
+    """Replace grok references in a pattern, collecting captured fields."""
+    if depth > MAX_EXPANSION_DEPTH:
+        raise ValueError("Grok pattern nests too deeply (recursive definition?)")
+
+    def replace(match: re.Match[str]) -> str:
+        name = match.group("pattern")
+        if name not in GROK_PATTERNS:
+            raise ValueError(f"Unknown grok pattern: {name}")
+        body = _expand(GROK_PATTERNS[name], fields, depth + 1)
+
+        field = match.group("field")
+        if field is None:
+            return f"(?:{body})"
+
+        field_type = match.group("type")
+        if field_type is not None and field_type not in FIELD_CONVERTERS:
+            raise ValueError(
+                f"Unknown grok field type: {field_type}. "
+                f"Available types: {', '.join(FIELD_CONVERTERS)}"
+            )
+        group = f"f{len(fields)}"
+        fields.append(GrokField(group, field, field_type))
+        return f"(?P<{group}>{body})"
+
+    return GROK_REFERENCE.sub(replace, pattern)
+
+
+def _first_field(fields: tuple[GrokField, ...], names: frozenset[str]) -> str | None:
+    """Name of the first captured field whose (lowercased) name is in names."""
+    for field in fields:
+        if field.name.lower() in names:
+            return field.name
+    return None
+
+
+def grok_regex(spec: str) -> str:
+    """
+    Expand a grok spec into an unanchored regular expression source.
+
+    Args:
+        spec: Pattern with %{NAME[:field[:type]]} references
+
+    Returns:
+        Regex source (captured fields become groups f0, f1, ...)
+
+    Raises:
+        ValueError: If the spec references unknown patterns or types
+    """
+    return _expand(spec, [], 0)
+
+
+@lru_cache(maxsize=128)
+def compile_grok(spec: str) -> GrokSpec:
+    """
+    Compile a grok spec into an anchored regex (cached per spec).
+
+    Args:
+        spec: Pattern with %{NAME[:field[:type]]} references
+
+    Returns:
+        Compiled GrokSpec
+
+    Raises:
+        ValueError: If the spec references unknown patterns or types, captures
+            no fields, or is not a valid regular expression
+    """
+    collected: list[GrokField] = []
+    expanded = _expand(spec, collected, 0)
+    fields = tuple(collected)
+    if not fields:
+        raise ValueError("Grok pattern must capture at least one field, e.g. %{LOGLEVEL:level}")
+
+    try:
+        regex = re.compile(f"^{expanded}$")
+    except re.error as e:
+        raise ValueError(f"Invalid grok pattern: {e}") from e
+
+    return GrokSpec(
+        spec=spec,
+        regex=regex,
+        fields=fields,
+        timestamp_field=_first_field(fields, _TIMESTAMP_FIELDS),
+        level_field=_first_field(fields, _LEVEL_FIELDS),
+        message_field=_first_field(fields, _MESSAGE_FIELDS),
+    )
+
+
+class GrokParser(BaseLogParser):
+    """
+    Parser for a custom format defined by a grok-style pattern spec.
+
+    Use grok_parser_class() for a registrable class bound to one spec, or
+    pass the spec to the constructor directly.
+
+    Examples:
+        GrokParser(spec="%{TIMESTAMP_ISO8601:ts} %{LOGLEVEL:level} %{GREEDYDATA:msg}")
+    """
+
+    name: ClassVar[str] = "grok"
+    description: ClassVar[str] = "Custom format from a grok-style pattern"
+    patterns: ClassVar[list[str]] = []
+
+    # Spec bound by grok_parser_class (instances may override it)
+    SPEC: ClassVar[GrokSpec | None] = None
+
+    def __init__(self, default_year: int | None = None, spec: str | GrokSpec | None = None) -> None:
+        """
+        Initialize parser.
+
+        Args:
+            default_year: Year to use for timestamps without year
+            spec: Grok spec or compiled spec (defaults to the class's SPEC)
+
+        Raises:
+            ValueError: If no spec is given or bound, or the spec is invalid
+        """
+        super().__init__(default_year=default_year)
+        if isinstance(spec, str):
+            spec = compile_grok(spec)
+        if spec is None:
+            spec = self.SPEC
+        if spec is None:
+            raise ValueError("GrokParser requires a pattern spec")
+        self.spec = spec
+
+    def can_parse(self, line: str) -> bool:
+        """Check if the line matches the spec."""
+        return self.spec.regex.match(line) is not None
+
+    def parse_line(self, line: str, line_number: int) -> ParsedLogEntry | None:
+        """Parse a line into the spec's fields."""
+        match = self.spec.regex.match(line)
+        if match is None:
+            return None
+
+        spec = self.spec
+        timestamp: datetime | None = None
+        level: LogLevel | None = None
+        message: str | None = None
+        metadata: dict[str, Any] = {}
+
+        for field in spec.fields:
+            value = match.group(field.group)
+            if value is None:
+                continue
+            if field.name == spec.timestamp_field:
+                timestamp = parse_timestamp(value, self.default_year, fuzzy=False)
+            elif field.name == spec.level_field:
+                level = self.normalize_level(value)
+            elif field.name == spec.message_field:
+                message = value
+            elif field.type is not None:
+                try:
+                    metadata[field.name] = FIELD_CONVERTERS[field.type](value)
+                except ValueError:
+                    metadata[field.name] = value
+            else:
+                metadata[field.name] = value
+
+        return self.create_entry(
+            line_number=line_number,
+            raw_line=line,
+            message=message if message is not None else line,
+            timestamp=timestamp,
+            level=level,
+            metadata=metadata,
+        )
+
+
+@lru_cache(maxsize=128)
+def grok_parser_class(
+    spec: str,
+    name: str = GrokParser.name,
+    description: str | None = None,
+) -> type[GrokParser]:
+    """
+    Build (once per arguments) a GrokParser subclass bound to a spec.
+
+    The subclass can be instantiated without arguments, so it can live in
+    PARSER_REGISTRY; its compiled regex doubles as the detection signature.
+
+    Args:
+        spec: Grok spec
+        name: Format name reported by the parser
+        description: Format description
+
+    Returns:
+        GrokParser subclass
+
+    Raises:
+        ValueError: If the spec is invalid
+    """
+    compiled = compile_grok(spec)
+    attributes: dict[str, Any] = {
+        "name": name,
+        "description": description or f"Custom format: {spec}",
+        "patterns": [compiled.regex.pattern],
+        "SPEC": compiled,
+    }
+    return type(f"GrokParser_{name}", (GrokParser,), attributes)
@@ -5,10 +5,11 @@ from datetime import datetime
 from typing import ClassVar
 
 from codesdevs_log_analyzer.models import LogLevel, ParsedLogEntry
-from codesdevs_log_analyzer.parsers.base import MultiLineParser
+from codesdevs_log_analyzer.parsers.base import BlockParser, MultiLineParser
+from codesdevs_log_analyzer.parsers.batch import EntryFields
 
 
-class JavaLogParser(MultiLineParser):
+class JavaLogParser(BlockParser, MultiLineParser):
     """
     Parser for Java/Log4j logging format.
 
@@ -55,6 +56,18 @@ class JavaLogParser(MultiLineParser):
         r"(?P<message>.*)$"
     )
 
+    # LOG4J_PATTERN for finditer over a block of lines (other layouts fall
+    # back to parse_line)
+    BLOCK_PATTERN = re.compile(
+        r"^(?P<timestamp>\d{4}-\d{2}-\d{2}[^\S\n]+\d{2}:\d{2}:\d{2}[,\.]\d{3})[^\S\n]+"
+        r"(?P<level>[A-Z]+)[^\S\n]+"
+        r"\[(?P<thread>[^\]\n]+)\][^\S\n]+"
+        r"(?P<logger>\S+)[^\S\n]*"
+        r"[-–][^\S\n]*"
+        r"(?P<message>.*)$",
+        re.MULTILINE,
+    )
+
     # Stack trace patterns
     STACK_FRAME = re.compile(r"^\s+at\s+[\w.$]+\([^)]*\)")
     CAUSED_BY = re.compile(r"^Caused by:\s+")
@@ -117,6 +130,23 @@ class JavaLogParser(MultiLineParser):
 
         return None
 
+    def scan_line(self, line: str, line_number: int) -> ParsedLogEntry | None:
+        """Extract level and timestamp only; the message is parsed on demand."""
+        if not line:
+            return None
+
+        for pattern in [self.LOG4J_PATTERN, self.LOGBACK_PATTERN, self.SIMPLE_PATTERN]:
+            match = pattern.match(line)
+            if match:
+                return self.defer_entry(
+                    line_number,
+                    line,
+                    timestamp=self._parse_timestamp(match.group("timestamp")),
+                    level=self.normalize_level(match.group("level")),
+                )
+
+        return self.parse_line(line, line_number)
+
     def _create_entry_from_match(
         self,
         match: re.Match[str],
@@ -124,6 +154,18 @@ class JavaLogParser(MultiLineParser):
         line_number: int,
     ) -> ParsedLogEntry:
         """Create entry from regex match."""
+        timestamp, level, message, metadata = self._fields_from_match(match)
+        return self.create_entry(
+            line_number=line_number,
+            raw_line=line,
+            message=message,
+            timestamp=timestamp,
+            level=level,
+            metadata=metadata,
+        )
+
+    def _fields_from_match(self, match: re.Match[str]) -> EntryFields:
+        """Extract entry fields from a regex match."""
         groups = match.groupdict()
 
         # Parse timestamp
@@ -142,14 +184,7 @@ class JavaLogParser(MultiLineParser):
             "logger": groups.get("logger"),
         }
 
-        return self.create_entry(
-            line_number=line_number,
-            raw_line=line,
-            message=message,
-            timestamp=timestamp,
-            level=level,
-            metadata=metadata,
-        )
+        return timestamp, level, message, metadata
 
     def _parse_timestamp(self, ts_str: str) -> datetime | None:
         """Parse Java logging timestamp."""
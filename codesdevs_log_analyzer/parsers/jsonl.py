@@ -131,6 +131,27 @@ class JSONLParser(BaseLogParser):
             metadata=metadata,
         )
 
+    def scan_line(self, line: str, line_number: int) -> ParsedLogEntry | None:
+        """Extract level and timestamp only; message and metadata are built on demand."""
+        stripped = line.strip()
+        if not stripped:
+            return None
+
+        try:
+            data = json.loads(stripped)
+        except json.JSONDecodeError:
+            return None
+
+        if not isinstance(data, dict):
+            return None
+
+        return self.defer_entry(
+            line_number,
+            stripped,
+            timestamp=self._extract_timestamp(data),
+            level=self._extract_level(data),
+        )
+
     def _extract_timestamp(self, data: dict[str, Any]) -> datetime | None:
         """Extract and parse timestamp from JSON data."""
         for field in self.TIMESTAMP_FIELDS:
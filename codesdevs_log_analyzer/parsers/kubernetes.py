@@ -7,6 +7,7 @@ from typing import Any, ClassVar
 
 from codesdevs_log_analyzer.models import LogLevel, ParsedLogEntry
 from codesdevs_log_analyzer.parsers.base import BaseLogParser
+from codesdevs_log_analyzer.parsers.logfmt import parse_logfmt
 from codesdevs_log_analyzer.utils.time_utils import parse_timestamp
 
 
@@ -237,6 +238,11 @@ class KubernetesParser(BaseLogParser):
 
     def _parse_kv_pairs(self, text: str) -> dict[str, str]:
         """Parse key=value pairs from text."""
+        # logfmt tokenizer handles escaped quotes; bare words are not pairs here
+        pairs = parse_logfmt(text)
+        if pairs is not None:
+            return {key: value for key, value in pairs.items() if value}
+
         result: dict[str, str] = {}
 
         for match in self.KV_PATTERN.finditer(text):
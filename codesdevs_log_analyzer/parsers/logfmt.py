@@ -0,0 +1,186 @@
+"""logfmt structured log parser."""
+
+import re
+from datetime import datetime, timezone
+from typing import Any, ClassVar
+
+from codesdevs_log_analyzer.models import ParsedLogEntry
+from codesdevs_log_analyzer.parsers.base import BaseLogParser
+from codesdevs_log_analyzer.parsers.jsonl import JSONLParser
+from codesdevs_log_analyzer.utils.time_utils import parse_timestamp
+
+# A logfmt line starts with a bare key directly followed by "="
+_LEADING_KEY = re.compile(r"[\w.@/-]+=")
+
+# Backslash escapes inside quoted values
+_ESCAPE = re.compile(r"\\(.)")
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r"}
+
+# Numeric timestamps above this are milliseconds
+_EPOCH_MILLIS = 1e12
+
+
+def _unescape(value: str) -> str:
+    """Resolve backslash escapes in a quoted value."""
+    return _ESCAPE.sub(lambda m: _ESCAPES.get(m.group(1), m.group(1)), value)
+
+
+def parse_logfmt(text: str) -> dict[str, str] | None:
+    """
+    Split a logfmt line into key/value pairs in one pass.
+
+    The tokenizer jumps between delimiters with str.find instead of matching
+    a regex per pair: unquoted values end at the next space, quoted values at
+    the next quote not preceded by an odd run of backslashes. Keys without
+    "=" are flags with an empty value; later duplicates win.
+
+    Args:
+        text: logfmt text such as 'level=error msg="a \\"quoted\\" word" n=3'
+
+    Returns:
+        Pairs in line order, or None for malformed text (empty key or an
+        unterminated quoted value)
+    """
+    pairs: dict[str, str] = {}
+    length = len(text)
+    i = 0
+    while i < length:
+        if text[i] == " ":
+            i += 1
+            continue
+
+        space = text.find(" ", i)
+        if space < 0:
+            space = length
+        equals = text.find("=", i, space)
+        if equals < 0:
+            pairs[text[i:space]] = ""
+            i = space
+            continue
+        if equals == i:
+            return None
+
+        key = text[i:equals]
+        start = equals + 1
+        if start < length and text[start] == '"':
+            quote = text.find('"', start + 1)
+            while quote > 0:
+                backslash = quote
+                while text[backslash - 1] == "\\":
+                    backslash -= 1
+                if (quote - backslash) % 2 == 0:
+                    break
+                quote = text.find('"', quote + 1)
+            if quote < 0:
+                return None
+            value = text[start + 1 : quote]
+            pairs[key] = _unescape(value) if "\\" in value else value
+            i = quote + 1
+        else:
+            pairs[key] = text[start:space]
+            i = space
+    return pairs
+
+
+class LogfmtParser(BaseLogParser):
+    """
+    Parser for logfmt structured logs.
+
+    Each line is a sequence of key=value pairs, as emitted by Go's log/slog
+    and go-kit, logrus' text formatter and Heroku:
+
+        ts=2026-01-15T10:30:00Z level=error msg="payment failed" order=1234
+
+    Well-known keys (the same names as for JSON Lines) become timestamp,
+    level and message; every other pair is kept in metadata.
+    """
+
+    name: ClassVar[str] = "logfmt"
+    description: ClassVar[str] = "logfmt key=value structured log format"
+    patterns: ClassVar[list[str]] = [
+        r"^[\w.@/-]+=",
+    ]
+
+    TIMESTAMP_FIELDS = JSONLParser.TIMESTAMP_FIELDS
+    LEVEL_FIELDS = JSONLParser.LEVEL_FIELDS
+    MESSAGE_FIELDS = JSONLParser.MESSAGE_FIELDS
+
+    # Keys that mark a key=value line as a log record rather than stray text
+    _KNOWN_FIELDS = frozenset(TIMESTAMP_FIELDS + LEVEL_FIELDS + MESSAGE_FIELDS)
+
+    def can_parse(self, line: str) -> bool:
+        """Check if line is logfmt with at least one well-known key."""
+        line = line.strip()
+        if not _LEADING_KEY.match(line):
+            return False
+        pairs = parse_logfmt(line)
+        if pairs is None or len(pairs) < 2:
+            return False
+        return any(key.lower() in self._KNOWN_FIELDS for key in pairs)
+
+    def parse_line(self, line: str, line_number: int) -> ParsedLogEntry | None:
+        """Parse a logfmt line."""
+        line = line.strip()
+        if not _LEADING_KEY.match(line):
+            return None
+
+        pairs = parse_logfmt(line)
+        if not pairs:
+            return None
+
+        fields = {key.lower(): key for key in pairs}
+        metadata: dict[str, Any] = dict(pairs)
+
+        timestamp = None
+        for name in self.TIMESTAMP_FIELDS:
+            key = fields.get(name)
+            if key is not None:
+                timestamp = self._parse_time(pairs[key])
+                if timestamp is not None:
+                    del metadata[key]
+                    break
+
+        level = None
+        for name in self.LEVEL_FIELDS:
+            key = fields.get(name)
+            if key is not None:
+                level = self.normalize_level(pairs[key])
+                if level is not None:
+                    del metadata[key]
+                    break
+
+        message = None
+        for name in self.MESSAGE_FIELDS:
+            key = fields.get(name)
+            if key is not None:
+                message = metadata.pop(key)
+                break
+
+        return self.create_entry(
+            line_number=line_number,
+            raw_line=line,
+            message=line if message is None else message,
+            timestamp=timestamp,
+            level=level,
+            metadata=metadata,
+        )
+
+    def _parse_time(self, value: str) -> datetime | None:
+        """Parse a Unix epoch (seconds or milliseconds) or RFC 3339 timestamp."""
+        try:
+            epoch = float(value)
+        except ValueError:
+            pass
+        else:
+            try:
+                if epoch > _EPOCH_MILLIS:
+                    epoch /= 1000
+                return datetime.fromtimestamp(epoch, tz=timezone.utc)
+            except (OSError, ValueError, OverflowError):
+                return None
+
+        # RFC 3339 is by far the common case; fromisoformat skips dateutil
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return parse_timestamp(value, fuzzy=False)
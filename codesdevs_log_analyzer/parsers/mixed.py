@@ -0,0 +1,320 @@
+"""Mixed-format parser with per-line dispatch."""
+
+from collections.abc import Iterator
+from typing import ClassVar
+
+from codesdevs_log_analyzer.models import LazyLogEntry, ParsedLogEntry
+from codesdevs_log_analyzer.parsers.base import (
+    MAX_CONTINUATION_LINES,
+    BaseLogParser,
+    FieldNeeds,
+    MultiLineParser,
+)
+from codesdevs_log_analyzer.parsers.generic import GenericParser
+from codesdevs_log_analyzer.utils.file_handler import stream_file
+
+# Number of collapsed character classes that make up a line signature
+SIGNATURE_LENGTH = 8
+
+# Bound on cached signatures; lines past it are classified but not cached
+MAX_SIGNATURES = 1024
+
+# Lines of a signature that must pick the same parser before it is cached
+CONFIRM_LINES = 2
+
+# Metadata key recording which parser produced an entry
+SOURCE_FORMAT_KEY = "source_format"
+
+
+def line_signature(line: str) -> str:
+    """
+    Compute a cheap shape signature for a line prefix.
+
+    Each character is mapped to a class (digit, lower, upper, whitespace, or
+    the punctuation character itself) and runs of the same class collapse, so
+    "Jan 15 10:30:00 host" and "Feb  3 08:15:30 other" share a signature while
+    '{"level":' and '[Thu Jan' do not.
+
+    Args:
+        line: Raw log line
+
+    Returns:
+        Signature string of at most SIGNATURE_LENGTH classes
+    """
+    classes: list[str] = []
+    for char in line:
+        if char.isdigit():
+            cls = "9"
+        elif char.isalpha():
+            cls = "A" if char.isupper() else "a"
+        elif char.isspace():
+            cls = " "
+        else:
+            cls = char
+
+        if not classes or classes[-1] != cls:
+            classes.append(cls)
+            if len(classes) >= SIGNATURE_LENGTH:
+                break
+    return "".join(classes)
+
+
+def _parses_fully(entry: ParsedLogEntry) -> bool:
+    """Whether an entry has structure and no field padded with the line's spacing."""
+    if entry.timestamp is None and entry.level is None:
+        return False
+    # A padded field means the pattern split the line at the wrong separator
+    # (e.g. "INFO:     127.0.0.1:62266 - ..." read as level:module:message)
+    return not any(
+        isinstance(value, str) and value != value.strip() for value in entry.metadata.values()
+    )
+
+
+class MixedFormatParser(MultiLineParser):
+    """
+    Parser for files that interleave several log formats.
+
+    Each line is classified by its prefix signature (see line_signature). A
+    line is offered to every candidate parser in detection order and the
+    first one that parses it fully (a timestamp or level, and no field
+    padded with whitespace) claims it. Once CONFIRM_LINES lines of a
+    signature picked the same parser it is cached, and later lines with the
+    signature go straight to it. Lines no parser claims (tracebacks printed
+    as plain text, indented frames) are attached to the preceding entry as
+    continuation lines, or kept as generic entries before the first one.
+
+    Examples:
+        {"level":"error","msg":"request failed"}
+        Traceback (most recent call last):
+          File "app.py", line 10, in handler
+        ValueError: bad input
+        2026-01-15 10:30:00,123 - worker - INFO - Job done
+    """
+
+    name: ClassVar[str] = "mixed"
+    description: ClassVar[str] = "Mixed formats dispatched per line"
+    patterns: ClassVar[list[str]] = []
+
+    def __init__(
+        self,
+        default_year: int | None = None,
+        parsers: list[BaseLogParser] | None = None,
+        max_continuation_lines: int | None = MAX_CONTINUATION_LINES,
+    ) -> None:
+        """
+        Initialize parser.
+
+        Args:
+            default_year: Year to use for timestamps without year
+            parsers: Candidate parsers in priority order (defaults to every
+                registered parser in detection order)
+            max_continuation_lines: Cap on continuation lines kept per entry
+        """
+        super().__init__(default_year=default_year, max_continuation_lines=max_continuation_lines)
+        if parsers is None:
+            from codesdevs_log_analyzer.parsers import DETECTION_ORDER, PARSER_REGISTRY
+
+            parsers = [
+                PARSER_REGISTRY[name](default_year=default_year)
+                for name in DETECTION_ORDER
+                if name != self.name
+            ]
+        self.parsers = parsers
+        self._fallback = next(
+            (parser for parser in parsers if isinstance(parser, GenericParser)),
+            GenericParser(default_year=default_year),
+        )
+        self._dispatch: dict[str, BaseLogParser | None] = {}
+        # Signatures classified but not yet confirmed: (parser, lines that picked it)
+        self._unconfirmed: dict[str, tuple[BaseLogParser | None, int]] = {}
+
+    @property
+    def signatures(self) -> dict[str, str | None]:
+        """Cached signature to parser-name assignments."""
+        return {
+            signature: parser.name if parser else None
+            for signature, parser in self._dispatch.items()
+        }
+
+    def _classify(self, line: str) -> BaseLogParser | None:
+        """Find the first candidate that parses a line fully."""
+        # Traceback headers and exception lines belong to the entry before them
+        if any(
+            isinstance(parser, MultiLineParser) and parser.is_continuation(line)
+            for parser in self.parsers
+        ):
+            return None
+
+        for parser in self.parsers:
+            if not parser.can_parse(line):
+                continue
+            entry = parser.parse_line(line, 0)
+            if entry is not None and _parses_fully(entry):
+                return parser
+        return None
+
+    def parser_for(self, line: str) -> BaseLogParser | None:
+        """
+        Return the parser assigned to a line's signature.
+
+        Args:
+            line: Raw log line
+
+        Returns:
+            Cached or newly classified parser, or None if no parser claims it
+        """
+        signature = line_signature(line)
+        if signature in self._dispatch:
+            return self._dispatch[signature]
+
+        parser = self._classify(line)
+        previous, count = self._unconfirmed.get(signature, (None, 0))
+        count = count + 1 if previous is parser else 1
+        if count >= CONFIRM_LINES:
+            self._unconfirmed.pop(signature, None)
+            if len(self._dispatch) < MAX_SIGNATURES:
+                self._dispatch[signature] = parser
+        elif len(self._unconfirmed) < MAX_SIGNATURES:
+            self._unconfirmed[signature] = (parser, count)
+        return parser
+
+    def can_parse(self, line: str) -> bool:
+        """Check if any candidate parser claims the line."""
+        return bool(line) and self.parser_for(line) is not None
+
+    def is_continuation(self, line: str) -> bool:
+        """Indented lines and lines no parser claims continue the previous entry."""
+        if not line:
+            return False
+        if line[0] in " \t":
+            return True
+        return self.parser_for(line) is None
+
+    def parse_line(self, line: str, line_number: int) -> ParsedLogEntry | None:
+        """Parse a line with the parser assigned to its signature."""
+        if not line:
+            return None
+
+        parser = self.parser_for(line)
+        if parser is None:
+            return None
+
+        entry = parser.parse_line(line, line_number)
+        if entry is None:
+            # Signature collision with a different shape further in; classify afresh
+            parser = self._classify(line)
+            if parser is None:
+                return None
+            entry = parser.parse_line(line, line_number)
+            if entry is None:
+                return None
+
+        entry.metadata[SOURCE_FORMAT_KEY] = parser.name
+        return entry
+
+    def scan_line(self, line: str, line_number: int) -> ParsedLogEntry | None:
+        """Scan a line with the parser assigned to its signature."""
+        parser = self.parser_for(line) if line else None
+        if parser is None:
+            return None
+
+        entry = parser.scan_line(line, line_number)
+        if not isinstance(entry, LazyLogEntry):
+            return self.parse_line(line, line_number)
+        # Re-bind the full parse to this parser so source_format is recorded
+        return self.defer_entry(line_number, line, entry.timestamp, entry.level)
+
+    def parse_file(
+        self,
+        file_path: str,
+        max_lines: int | None = None,
+        encoding: str | None = None,
+        needs: FieldNeeds | None = None,
+    ) -> Iterator[ParsedLogEntry]:
+        """
+        Stream parse a mixed-format file.
+
+        Lines before the first parsed entry that no parser claims become
+        generic entries; afterwards they are attached to the preceding entry.
+        """
+        cap = self.max_continuation_lines
+        current_entry: ParsedLogEntry | None = None
+        continuation_lines: list[str] = []
+        truncated_lines = 0
+
+        for line_num, line in stream_file(file_path, encoding=encoding, max_lines=max_lines):
+            entry = None if self.is_continuation(line) else self.parse_entry(line, line_num, needs)
+
+            if entry is None and current_entry is None and line:
+                entry = self._fallback.parse_line(line, line_num)
+                if entry is not None:
+                    entry.metadata[SOURCE_FORMAT_KEY] = self._fallback.name
+
+            if entry is None:
+                if current_entry is None or not line:
+                    continue
+                if cap is None or len(continuation_lines) < cap:
+                    continuation_lines.append(line)
+                else:
+                    truncated_lines += 1
+                continue
+
+            if current_entry is not None:
+                yield self._attach_continuation(current_entry, continuation_lines, truncated_lines)
+
+            current_entry = entry
+            continuation_lines = []
+            truncated_lines = 0
+
+        if current_entry is not None:
+            yield self._attach_continuation(current_entry, continuation_lines, truncated_lines)
+
+    @classmethod
+    def detect_confidence(cls, sample_lines: list[str]) -> float:
+        """
+        Return confidence that the sample interleaves several formats.
+
+        Scores the share of lines that start a parsed entry or continue one,
+        and returns 0.0 when only one format is present so single-format files
+        keep their dedicated parser.
+        """
+        parser = cls()
+        formats: dict[str, int] = {}
+        covered = 0
+        total = 0
+        started = False
+
+        for line in sample_lines:
+            if not line.strip():
+                continue
+            total += 1
+            if parser.is_continuation(line):
+                covered += started
+                continue
+            entry = parser.parse_line(line, 0)
+            if entry is None:
+                continue
+            started = True
+            covered += 1
+            source = entry.metadata[SOURCE_FORMAT_KEY]
+            formats[source] = formats.get(source, 0) + 1
+
+        entries = sum(formats.values())
+        if total == 0 or len(formats) < 2:
+            return 0.0
+
+        # A second format must account for a meaningful share of entries
+        minority = entries - max(formats.values())
+        if minority / entries < 0.1:
+            return 0.0
+
+        return covered / total
+
+    @classmethod
+    def score_results(
+        cls,
+        lines: list[str],
+        results: list[tuple[bool, ParsedLogEntry | None]],
+    ) -> float:
+        """Score a sample; continuation tracking needs the lines, not results."""
+        return cls.detect_confidence(lines)
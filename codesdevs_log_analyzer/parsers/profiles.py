@@ -0,0 +1,289 @@
+"""Learned format profiles per directory and file-name pattern.
+
+Rotated files (app.log, app.log.1, app.log.2.gz) and files in one service's
+log directory nearly always share a format. Detection outcomes are recorded
+in a small JSON store keyed by a path pattern derived from the file name and
+by the file's directory; a new file matching a known profile skips detection
+and only has its first few lines spot-checked against the remembered parser.
+"""
+
+import json
+import os
+import re
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from fnmatch import fnmatchcase
+from typing import Any
+
+from codesdevs_log_analyzer.parsers.base import BaseLogParser, MultiLineParser
+from codesdevs_log_analyzer.utils.file_handler import stream_file
+
+# Environment variable naming the JSON file profiles persist to; unset or
+# empty keeps them in memory for the life of the process
+PROFILE_PATH_ENV = "LOG_ANALYZER_PROFILES"
+
+# Detections below this confidence are not remembered
+PROFILE_MIN_CONFIDENCE = 0.5
+
+# Directory profiles (shared by unrelated files) need a surer detection
+DIRECTORY_MIN_CONFIDENCE = 0.8
+
+# Fallback formats that parse almost any text, so they would pass the
+# spot-check of any file: never remembered
+UNREMEMBERED_FORMATS = frozenset({"generic"})
+
+# Lines read for the spot-check of a remembered format
+SPOT_CHECK_LINES = 10
+
+# A spot-check passes if its share is within this of the profile confidence
+SPOT_CHECK_TOLERANCE = 0.2
+
+# Seconds between persisted re-verifications of the same profile
+VERIFY_SAVE_INTERVAL = 60
+
+# Bound on stored profiles; the least recently verified are dropped first
+MAX_PROFILES = 256
+
+# Rotation suffixes stripped from a file name: .1, -1, .2026-01-15, -20260115
+_ROTATION_SUFFIX = re.compile(r"[.-](?:\d{4}-?\d{2}-?\d{2}(?:[.-]?\d+)?|\d+)$")
+_DIGITS = re.compile(r"\d+")
+
+
+def profile_pattern(file_path: str) -> str:
+    """
+    Derive the name pattern shared by a file and its rotations.
+
+    Compression and rotation suffixes are stripped and remaining digit runs
+    become wildcards, so /var/log/app/app.log.2.gz and /var/log/app/app.log
+    both map to /var/log/app/app.log*.
+
+    Args:
+        file_path: Path to a log file
+
+    Returns:
+        Absolute glob pattern matching the file's siblings in rotation
+    """
+    directory, name = os.path.split(os.path.abspath(file_path))
+    if name.endswith(".gz"):
+        name = name[:-3]
+    while True:
+        stripped = _ROTATION_SUFFIX.sub("", name)
+        if stripped == name or not stripped:
+            break
+        name = stripped
+    return os.path.join(directory, _DIGITS.sub("*", name) + "*")
+
+
+def directory_pattern(file_path: str) -> str:
+    """Pattern matching every file in a file's directory."""
+    return os.path.join(os.path.dirname(os.path.abspath(file_path)), "*")
+
+
+def _matches(pattern: str, path: str) -> bool:
+    """Match a file against a pattern in the same directory only."""
+    directory, name = os.path.split(pattern)
+    path_directory, path_name = os.path.split(path)
+    return directory == path_directory and fnmatchcase(path_name, name)
+
+
+@dataclass
+class FormatProfile:
+    """A remembered detection outcome for a path pattern."""
+
+    pattern: str
+    format: str | None  # None for directories whose files disagree
+    confidence: float
+    verified_at: str  # ISO 8601 UTC
+    hits: int = 0
+    spec: str | None = None  # Grok spec of a synthesized format
+
+
+class ProfileStore:
+    """
+    Persistent store of format profiles.
+
+    The JSON file is loaded on first use and rewritten after every change.
+    Read or write failures leave the store working in memory only.
+    """
+
+    def __init__(self, path: str | None) -> None:
+        """
+        Initialize store.
+
+        Args:
+            path: JSON file backing the store (None keeps it in memory)
+        """
+        self.path = os.path.expanduser(path) if path else None
+        self._profiles: dict[str, FormatProfile] | None = None
+
+    @property
+    def profiles(self) -> dict[str, FormatProfile]:
+        """Profiles keyed by pattern, loaded on first access."""
+        if self._profiles is None:
+            self._profiles = self._load()
+        return self._profiles
+
+    def _load(self) -> dict[str, FormatProfile]:
+        if self.path is None:
+            return {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            profiles = [FormatProfile(**item) for item in data.get("profiles", [])]
+        except (OSError, ValueError, TypeError, AttributeError):
+            return {}
+        return {profile.pattern: profile for profile in profiles}
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        data: dict[str, Any] = {
+            "version": 1,
+            "profiles": [asdict(profile) for profile in self.profiles.values()],
+        }
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(temp_path, self.path)
+        except OSError:
+            pass
+
+    def lookup(self, file_path: str) -> FormatProfile | None:
+        """
+        Find the most specific profile matching a file.
+
+        Name patterns win over directory profiles; among name patterns the
+        longest (most literal) one wins. Directories holding files of
+        different formats, and directory profiles of fallback or weakly
+        detected formats, have no usable profile.
+
+        Args:
+            file_path: Path to a log file
+
+        Returns:
+            Matching profile or None
+        """
+        path = os.path.abspath(file_path)
+        directory = directory_pattern(path)
+        matches = [
+            profile
+            for profile in self.profiles.values()
+            if profile.format is not None
+            and profile.format not in UNREMEMBERED_FORMATS
+            and _matches(profile.pattern, path)
+            and (profile.pattern != directory or profile.confidence >= DIRECTORY_MIN_CONFIDENCE)
+        ]
+        if not matches:
+            return None
+        return max(matches, key=lambda profile: len(os.path.basename(profile.pattern)))
+
+    def record(
+        self,
+        file_path: str,
+        format_name: str,
+        confidence: float,
+        spec: str | None = None,
+    ) -> None:
+        """
+        Remember a detection outcome for a file's name pattern and directory.
+
+        Fallback formats and detections below PROFILE_MIN_CONFIDENCE are not
+        remembered at all. Any other detection marks the directory as mixed
+        if it disagrees with the directory's profile, but only one of at
+        least DIRECTORY_MIN_CONFIDENCE starts a directory profile.
+
+        Args:
+            file_path: Path to the detected file
+            format_name: Registered parser name
+            confidence: Detection confidence
+            spec: Grok spec for formats synthesized from the file
+        """
+        if confidence < PROFILE_MIN_CONFIDENCE or format_name in UNREMEMBERED_FORMATS:
+            return
+        now = datetime.now(timezone.utc).isoformat()
+        pattern = profile_pattern(file_path)
+        self.profiles[pattern] = FormatProfile(pattern, format_name, confidence, now, spec=spec)
+
+        directory = directory_pattern(file_path)
+        known = self.profiles.get(directory)
+        if known is not None and (known.format, known.spec) != (format_name, spec):
+            known.format = None
+            known.verified_at = now
+        elif known is None and confidence >= DIRECTORY_MIN_CONFIDENCE:
+            self.profiles[directory] = FormatProfile(
+                directory, format_name, confidence, now, spec=spec
+            )
+        self._evict()
+        self._save()
+
+    def verify(self, profile: FormatProfile) -> None:
+        """
+        Mark a profile as just confirmed by a spot-check.
+
+        The store is rewritten at most once per VERIFY_SAVE_INTERVAL per
+        profile so busy tools do not rewrite it on every call.
+        """
+        now = datetime.now(timezone.utc)
+        last = datetime.fromisoformat(profile.verified_at)
+        profile.verified_at = now.isoformat()
+        profile.hits += 1
+        if (now - last).total_seconds() >= VERIFY_SAVE_INTERVAL:
+            self._save()
+
+    def forget(self, pattern: str) -> None:
+        """Drop a profile."""
+        if self.profiles.pop(pattern, None) is not None:
+            self._save()
+
+    def _evict(self) -> None:
+        excess = len(self.profiles) - MAX_PROFILES
+        if excess > 0:
+            oldest = sorted(self.profiles.values(), key=lambda profile: profile.verified_at)
+            for profile in oldest[:excess]:
+                del self.profiles[profile.pattern]
+
+
+def spot_check(parser: BaseLogParser, file_path: str) -> float:
+    """
+    Share of a file's first non-blank lines a parser extracts structure from.
+
+    Continuation lines of multi-line parsers count as handled.
+
+    Args:
+        parser: Parser remembered for the file
+        file_path: Path to log file
+
+    Returns:
+        Share between 0.0 and 1.0 (0.0 for an empty file)
+    """
+    handled = 0
+    total = 0
+    for line_number, line in stream_file(file_path, max_lines=SPOT_CHECK_LINES, skip_empty=True):
+        total += 1
+        if isinstance(parser, MultiLineParser) and parser.is_continuation(line):
+            handled += total > 1
+            continue
+        entry = parser.parse_line(line, line_number)
+        if entry is not None and (entry.timestamp is not None or entry.level is not None):
+            handled += 1
+    return handled / total if total else 0.0
+
+
+_STORES: dict[str | None, ProfileStore] = {}
+
+
+def get_profile_store() -> ProfileStore:
+    """
+    Return the process-wide store for the configured path.
+
+    Profiles are only written to disk when the LOG_ANALYZER_PROFILES
+    environment variable names a file; otherwise they are kept in memory.
+    """
+    path = os.environ.get(PROFILE_PATH_ENV) or None
+    store = _STORES.get(path)
+    if store is None:
+        store = ProfileStore(path)
+        _STORES[path] = store
+    return store
@@ -5,10 +5,11 @@ from datetime import datetime
 from typing import ClassVar
 
 from codesdevs_log_analyzer.models import LogLevel, ParsedLogEntry
-from codesdevs_log_analyzer.parsers.base import MultiLineParser
+from codesdevs_log_analyzer.parsers.base import BlockParser, MultiLineParser
+from codesdevs_log_analyzer.parsers.batch import EntryFields
 
 
-class PythonLogParser(MultiLineParser):
+class PythonLogParser(BlockParser, MultiLineParser):
     """
     Parser for Python standard library logging format.
 
@@ -59,6 +60,19 @@ class PythonLogParser(MultiLineParser):
         r"(?P<message>.*)$"
     )
 
+    # DEFAULT_PATTERN for finditer over a block of lines (other layouts fall
+    # back to parse_line)
+    BLOCK_PATTERN = re.compile(
+        r"^(?P<timestamp>\d{4}-\d{2}-\d{2}[^\S\n]+\d{2}:\d{2}:\d{2}(?:[,\.]\d{3})?)[^\S\n]*"
+        r"[-–][^\S\n]*"
+        r"(?P<module>\S+)[^\S\n]*"
+        r"[-–][^\S\n]*"
+        r"(?P<level>[A-Z]+)[^\S\n]*"
+        r"[-–][^\S\n]*"
+        r"(?P<message>.*)$",
+        re.MULTILINE,
+    )
+
     # Stack trace patterns
     TRACEBACK_START = re.compile(r"^Traceback \(most recent call last\):")
     STACK_FRAME = re.compile(r'^\s+File ".*", line \d+')
@@ -134,6 +148,29 @@ class PythonLogParser(MultiLineParser):
 
         return None
 
+    def scan_line(self, line: str, line_number: int) -> ParsedLogEntry | None:
+        """Extract level and timestamp only; the message is parsed on demand."""
+        if not line:
+            return None
+
+        for pattern in [
+            self.DEFAULT_PATTERN,
+            self.BRACKET_PATTERN,
+            self.ALT_PATTERN,
+            self.BASIC_PATTERN,
+        ]:
+            match = pattern.match(line)
+            if match:
+                ts_str = match.groupdict().get("timestamp")
+                return self.defer_entry(
+                    line_number,
+                    line,
+                    timestamp=self._parse_timestamp(ts_str) if ts_str else None,
+                    level=self.normalize_level(match.group("level")),
+                )
+
+        return self.parse_line(line, line_number)
+
     def _create_entry_from_match(
         self,
         match: re.Match[str],
@@ -141,6 +178,18 @@ class PythonLogParser(MultiLineParser):
         line_number: int,
     ) -> ParsedLogEntry:
         """Create entry from regex match."""
+        timestamp, level, message, metadata = self._fields_from_match(match)
+        return self.create_entry(
+            line_number=line_number,
+            raw_line=line,
+            message=message,
+            timestamp=timestamp,
+            level=level,
+            metadata=metadata,
+        )
+
+    def _fields_from_match(self, match: re.Match[str]) -> EntryFields:
+        """Extract entry fields from a regex match."""
         groups = match.groupdict()
 
         # Parse timestamp
@@ -161,14 +210,7 @@ class PythonLogParser(MultiLineParser):
             "module": groups.get("module"),
         }
 
-        return self.create_entry(
-            line_number=line_number,
-            raw_line=line,
-            message=message,
-            timestamp=timestamp,
-            level=level,
-            metadata=metadata,
-        )
+        return timestamp, level, message, metadata
 
     def _parse_timestamp(self, ts_str: str) -> datetime | None:
         """Parse Python logging timestamp."""
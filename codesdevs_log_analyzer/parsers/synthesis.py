@@ -0,0 +1,212 @@
+"""Synthesis of grok specs for formats without a dedicated parser.
+
+When detection falls back to the generic parser, the sample is inspected for
+a fixed structure: a timestamp at the start of the line (optionally
+bracketed), a delimiter that separates leading columns, and a column that
+always holds the log level. The structure is written out as a grok spec (see
+parsers.grok), so the synthesized parser is an ordinary anchored regex that
+extracts timestamp, level and message in one match instead of the generic
+parser's per-line search over every timestamp and level pattern.
+"""
+
+import re
+from collections import Counter
+
+from codesdevs_log_analyzer.parsers.grok import (
+    GrokParser,
+    compile_grok,
+    grok_parser_class,
+    grok_regex,
+)
+
+# Format name reported by synthesized parsers
+SYNTHESIZED_NAME = "synthesized"
+
+# Share of sample lines a structural feature (and the final spec) must cover
+MIN_COVERAGE = 0.8
+
+# Fewest non-blank sample lines worth synthesizing from
+MIN_SAMPLE_LINES = 5
+
+# Leading columns searched for the level token
+MAX_COLUMNS = 6
+
+# Timestamp library patterns tried at the start of the line, most specific first
+TIMESTAMP_PATTERNS = [
+    "TIMESTAMP_ISO8601",
+    "HTTPDATE",
+    "SYSLOGTIMESTAMP",
+    "DATESTAMP",
+    "EPOCH",
+]
+
+# Column delimiters tried in order
+DELIMITERS = [" | ", " - ", "\t", " "]
+
+_LEVEL = re.compile(grok_regex("%{LOGLEVEL}"))
+_BRACKETED = re.compile(r"\[[^\]]*\]")
+_INTEGER = re.compile(r"[+-]?\d+")
+
+
+def _escape(text: str) -> str:
+    """Escape regex metacharacters, leaving spaces readable."""
+    return re.escape(text).replace("\\ ", " ")
+
+
+def _majority(flags: list[bool]) -> bool:
+    """True if at least MIN_COVERAGE of the flags are set."""
+    return bool(flags) and sum(flags) / len(flags) >= MIN_COVERAGE
+
+
+def _find_timestamp(lines: list[str]) -> tuple[str, list[str]] | None:
+    """Find a timestamp pattern at the start of most lines; return spec and remainders."""
+    for name in TIMESTAMP_PATTERNS:
+        source = grok_regex(f"%{{{name}}}")
+        for opening, closing in (("", ""), ("[", "]")):
+            prefix = re.compile(_escape(opening) + f"(?:{source})" + _escape(closing))
+            matches = [prefix.match(line) for line in lines]
+            if _majority([match is not None for match in matches]):
+                remainders = [
+                    line[match.end() :] for line, match in zip(lines, matches, strict=True) if match
+                ]
+                spec = _escape(opening) + f"%{{{name}:timestamp}}" + _escape(closing)
+                return spec, remainders
+    return None
+
+
+def _level_token(token: str) -> tuple[bool, bool] | None:
+    """Classify a token as a level: (bracketed, trailing colon) or None."""
+    bracketed = token.startswith("[") and token.endswith("]")
+    core = token[1:-1] if bracketed else token
+    colon = core.endswith(":")
+    if colon:
+        core = core[:-1]
+    if _LEVEL.fullmatch(core) is None:
+        return None
+    return bracketed, colon
+
+
+def _column_spec(tokens: list[str], index: int, delimiter: str) -> str:
+    """Grok spec for a non-level column inferred from its sampled values."""
+    field = f"field{index + 1}"
+    if all(_BRACKETED.fullmatch(token) for token in tokens):
+        return rf"\[%{{DATA:{field}}}\]"
+    if all(_INTEGER.fullmatch(token) for token in tokens):
+        return f"%{{INT:{field}:int}}"
+    return f"%{{NOTSPACE:{field}}}" if delimiter == " " else f"%{{DATA:{field}}}"
+
+
+def _find_columns(remainders: list[str], leading: bool) -> str | None:
+    """
+    Find a delimiter and level column shared by most lines.
+
+    Args:
+        remainders: Lines with the timestamp removed (or whole lines)
+        leading: Whether lines must start with the delimiter (after a timestamp)
+
+    Returns:
+        Spec for the columns and message, or None if no level column is found
+    """
+    for delimiter in DELIMITERS:
+        columns: list[list[str]] = []
+        for remainder in remainders:
+            if leading:
+                # Runs of spaces after a timestamp count as one delimiter
+                stripped = remainder.lstrip(" ") if delimiter == " " else remainder
+                if delimiter != " " and not stripped.startswith(delimiter):
+                    columns.append([])
+                    continue
+                remainder = stripped[len(delimiter) :] if delimiter != " " else stripped
+            columns.append(remainder.split(delimiter, MAX_COLUMNS))
+
+        positions: list[int | None] = []
+        for parts in columns:
+            position = next(
+                (i for i, token in enumerate(parts[:MAX_COLUMNS]) if _level_token(token)), None
+            )
+            positions.append(position)
+
+        counted = Counter(position for position in positions if position is not None)
+        if not counted:
+            continue
+        level_index, hits = counted.most_common(1)[0]
+        if hits / len(remainders) < MIN_COVERAGE:
+            continue
+
+        matching = [
+            parts for parts, pos in zip(columns, positions, strict=True) if pos == level_index
+        ]
+        styles = Counter(
+            style for parts in matching if (style := _level_token(parts[level_index])) is not None
+        )
+        bracketed, colon = styles.most_common(1)[0][0]
+        level = "%{LOGLEVEL:level}"
+        if bracketed:
+            level = rf"\[{level}\]"
+        if colon:
+            level += ":"
+
+        separator = r"\s+" if delimiter == " " else _escape(delimiter)
+        parts_spec = [
+            _column_spec([parts[i] for parts in matching], i, delimiter) for i in range(level_index)
+        ]
+        parts_spec.append(level)
+        spec = separator.join(parts_spec) + f"(?:{separator}%{{GREEDYDATA:message}})?"
+        if leading:
+            spec = separator + spec
+        return spec
+    return None
+
+
+def synthesize_spec(sample_lines: list[str]) -> str | None:
+    """
+    Infer a grok spec describing most of the sample lines.
+
+    Args:
+        sample_lines: Sample log lines
+
+    Returns:
+        Grok spec covering at least MIN_COVERAGE of the non-blank lines, or
+        None if no timestamp or level structure is shared
+    """
+    lines = [line for line in sample_lines if line.strip()]
+    if len(lines) < MIN_SAMPLE_LINES:
+        return None
+
+    timestamp = _find_timestamp(lines)
+    if timestamp is not None:
+        timestamp_spec, remainders = timestamp
+        columns = _find_columns(remainders, leading=True)
+        spec = timestamp_spec + (columns or r"(?:\s+%{GREEDYDATA:message})?")
+    else:
+        columns = _find_columns(lines, leading=False)
+        if columns is None:
+            return None
+        spec = columns
+
+    regex = compile_grok(spec).regex
+    covered = sum(1 for line in lines if regex.match(line))
+    if covered / len(lines) < MIN_COVERAGE:
+        return None
+    return spec
+
+
+def synthesize_parser(sample_lines: list[str]) -> type[GrokParser] | None:
+    """
+    Build a parser class for the structure shared by the sample lines.
+
+    Args:
+        sample_lines: Sample log lines
+
+    Returns:
+        GrokParser subclass named SYNTHESIZED_NAME, or None
+    """
+    spec = synthesize_spec(sample_lines)
+    if spec is None:
+        return None
+    return synthesized_class(spec)
+
+
+def synthesized_class(spec: str) -> type[GrokParser]:
+    """Parser class for a previously synthesized spec."""
+    return grok_parser_class(spec, SYNTHESIZED_NAME, f"Synthesized from sample: {spec}")
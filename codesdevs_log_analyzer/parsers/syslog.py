@@ -7,10 +7,11 @@ from typing import ClassVar
 from dateutil.tz import tzlocal
 
 from codesdevs_log_analyzer.models import LogLevel, ParsedLogEntry
-from codesdevs_log_analyzer.parsers.base import BaseLogParser
+from codesdevs_log_analyzer.parsers.base import BlockParser
+from codesdevs_log_analyzer.parsers.batch import EntryFields
 
 
-class SyslogParser(BaseLogParser):
+class SyslogParser(BlockParser):
     """
     Parser for syslog format logs.
 
@@ -37,6 +38,17 @@ class SyslogParser(BaseLogParser):
         r"(?P<message>.*)$"
     )
 
+    # SYSLOG_PATTERN for finditer over a block of lines
+    BLOCK_PATTERN = re.compile(
+        r"^(?P<month>[A-Z][a-z]{2})[^\S\n]+"
+        r"(?P<day>\d{1,2})[^\S\n]+"
+        r"(?P<time>\d{2}:\d{2}:\d{2})[^\S\n]+"
+        r"(?P<hostname>\S+)[^\S\n]+"
+        r"(?P<process>\S+?)(?:\[(?P<pid>\d+)\])?:[^\S\n]*"
+        r"(?P<message>.*)$",
+        re.MULTILINE,
+    )
+
     # Month mapping
     MONTHS = {
         "Jan": 1,
@@ -82,6 +94,18 @@ class SyslogParser(BaseLogParser):
         if not match:
             return None
 
+        timestamp, level, message, metadata = self._fields_from_match(match)
+        return self.create_entry(
+            line_number=line_number,
+            raw_line=line,
+            message=message,
+            timestamp=timestamp,
+            level=level,
+            metadata=metadata,
+        )
+
+    def _fields_from_match(self, match: re.Match[str]) -> EntryFields:
+        """Extract entry fields from a syslog match."""
         groups = match.groupdict()
 
         # Parse timestamp
@@ -103,13 +127,24 @@ class SyslogParser(BaseLogParser):
         if groups.get("pid"):
             metadata["pid"] = int(groups["pid"])
 
-        return self.create_entry(
-            line_number=line_number,
-            raw_line=line,
-            message=message,
-            timestamp=timestamp,
-            level=level,
-            metadata=metadata,
+        return timestamp, level, message, metadata
+
+    def scan_line(self, line: str, line_number: int) -> ParsedLogEntry | None:
+        """Extract level and timestamp only; metadata is parsed on demand."""
+        if not line:
+            return None
+
+        match = self.SYSLOG_PATTERN.match(line)
+        if not match:
+            return None
+
+        return self.defer_entry(
+            line_number,
+            line,
+            timestamp=self._parse_timestamp(
+                match.group("month"), match.group("day"), match.group("time")
+            ),
+            level=self._detect_level(match.group("message") or "", match.group("process")),
         )
 
     def _parse_timestamp(
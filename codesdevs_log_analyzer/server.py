@@ -1,6 +1,6 @@
 """FastMCP server for log analysis tools.
 
-This MCP server provides 14 tools for intelligent log file analysis and debugging
+This MCP server provides 18 tools for intelligent log file analysis and debugging
 assistance. All tools follow MCP best practices with proper annotations.
 """
 
@@ -14,12 +14,18 @@ from mcp.server.fastmcp import FastMCP
 from mcp.types import ToolAnnotations
 
 from codesdevs_log_analyzer.analyzers import (
-    Correlator,
+    CorrelationResult,
+    CorrelationWindow,
+    DrainMiner,
     ErrorExtractor,
     LogWatcher,
+    MultiAnchorCorrelator,
     MultiFileAnalyzer,
     PatternSuggester,
+    PodLogAnalyzer,
     QueryTranslator,
+    SequenceMatcher,
+    StreamingCorrelator,
     Summarizer,
     TraceExtractor,
 )
@@ -29,8 +35,15 @@ from codesdevs_log_analyzer.models import (
 )
 from codesdevs_log_analyzer.parsers import (
     PARSER_REGISTRY,
-    detect_format,
+    SCAN_FIELDS,
+    SYNTHESIZED_NAME,
+    BaseLogParser,
+    GrokParser,
+    compile_grok,
+    detect_file,
+    detect_format_with_profiles,
     get_parser,
+    register_format,
 )
 from codesdevs_log_analyzer.utils import (
     read_tail,
@@ -67,6 +80,15 @@ def handle_tool_error(error: Exception, file_path: str) -> str:
     return f"Error: {type(error).__name__}: {str(error)}"
 
 
+def _resolve_parser(file_path: str, format_hint: str | None) -> tuple[BaseLogParser, float]:
+    """Get the hinted parser (format name or inline grok spec) or auto-detect one."""
+    if format_hint and format_hint.lower() != "auto":
+        parser = get_parser(format_hint)  # User specified
+        parser.prime_file(file_path)
+        return parser, 1.0
+    return detect_format_with_profiles(file_path)
+
+
 def get_file_info(file_path: str) -> dict[str, Any]:
     """Get basic file information."""
     stat = os.stat(file_path)
@@ -139,7 +161,12 @@ def log_analyzer_parse(
     Args:
         file_path: Path to the log file to analyze
         format_hint: Force specific format (syslog, apache_access, apache_error, jsonl,
-                     docker, python, java, kubernetes, generic) or None for auto-detect
+                     docker, python, java, kubernetes, logfmt, w3c, elb, csv, tsv,
+                     generic, mixed, docker:<format> or docker:auto to also parse
+                     the lines inside container records, or a name
+                     registered with log_analyzer_register_format), an inline grok
+                     pattern such as "%{TIMESTAMP_ISO8601:ts} %{LOGLEVEL:level}
+                     %{GREEDYDATA:msg}", or None for auto-detect
         max_lines: Maximum lines to parse (100-100000, default 10000)
         response_format: Output format - 'markdown' or 'json'
 
@@ -155,14 +182,10 @@ def log_analyzer_parse(
         file_info = get_file_info(file_path)
 
         # Get parser
-        if format_hint and format_hint.lower() != "auto":
-            try:
-                parser = get_parser(format_hint.lower())
-                confidence = 1.0  # User specified
-            except ValueError as e:
-                return f"Error: {e}\nAvailable formats: {', '.join(PARSER_REGISTRY.keys())}"
-        else:
-            parser, confidence = detect_format(file_path)
+        try:
+            parser, confidence = _resolve_parser(file_path, format_hint)
+        except ValueError as e:
+            return f"Error: {e}\nAvailable formats: {', '.join(PARSER_REGISTRY.keys())}"
 
         # Parse entries
         entries: list[ParsedLogEntry] = []
@@ -172,9 +195,10 @@ def log_analyzer_parse(
         total_lines = 0
         parsed_lines = 0
 
+        # Only the sample entries are read beyond level and timestamp
         for line_num, line in stream_file(file_path, max_lines=max_lines):
             total_lines = line_num
-            entry = parser.parse_line(line, line_num)
+            entry = parser.parse_entry(line, line_num, SCAN_FIELDS)
             if entry:
                 parsed_lines += 1
                 entries.append(entry)
@@ -275,6 +299,7 @@ def log_analyzer_search(
     context_lines: int = 3,
     max_matches: int = 50,
     level_filter: str | None = None,
+    format_hint: str | None = None,
     response_format: str = "markdown",
 ) -> str:
     """
@@ -288,6 +313,8 @@ def log_analyzer_search(
         context_lines: Lines of context before/after match (0-10, default: 3)
         max_matches: Maximum matches to return (1-200, default: 50)
         level_filter: Filter by log level (ERROR, WARN, INFO, DEBUG)
+        format_hint: Force a format by name or inline grok pattern (see
+                     log_analyzer_parse), or None for auto-detect
         response_format: Output format - 'markdown' or 'json'
 
     Returns:
@@ -308,7 +335,7 @@ def log_analyzer_search(
             return f"Error: Invalid regex pattern: {e}"
 
         # Get parser for level filtering
-        parser, _ = detect_format(file_path)
+        parser, _ = _resolve_parser(file_path, format_hint)
 
         # Normalize level filter
         level_filter_upper = level_filter.upper() if level_filter else None
@@ -430,6 +457,10 @@ def log_analyzer_extract_errors(
     include_warnings: bool = False,
     group_similar: bool = True,
     max_errors: int = 100,
+    collapse_repeats: bool = False,
+    format_hint: str | None = None,
+    grouping: str = "regex",
+    merge_threshold: float | None = None,
     response_format: str = "markdown",
 ) -> str:
     """
@@ -440,6 +471,16 @@ def log_analyzer_extract_errors(
         include_warnings: Include WARN level entries (default: False)
         group_similar: Group similar error messages (default: True)
         max_errors: Maximum errors to return (1-500, default: 100)
+        collapse_repeats: Collapse runs of repeated identical lines before
+                          analysis (default: False)
+        format_hint: Force a format by name or inline grok pattern (see
+                     log_analyzer_parse), or None for auto-detect
+        grouping: How similar errors are grouped - 'regex' (mask numbers, IPs,
+                  paths...) or 'drain' (also learn variable words such as
+                  user or host names from the log itself) (default: 'regex')
+        merge_threshold: Merge error groups whose templates share at least
+                         this fraction of tokens (0-1, e.g. 0.6), listing the
+                         merged templates as variants; None disables (default)
         response_format: Output format - 'markdown' or 'json'
 
     Returns:
@@ -451,22 +492,25 @@ def log_analyzer_extract_errors(
             return handle_tool_error(FileNotFoundError(), file_path)
 
         # Detect format and get parser
-        parser, _ = detect_format(file_path)
+        parser, _ = _resolve_parser(file_path, format_hint)
 
         # Extract errors using analyzer
         extractor = ErrorExtractor(
             include_warnings=include_warnings,
             max_errors=max_errors,
             group_similar=group_similar,
+            grouping=grouping.lower(),
+            merge_threshold=merge_threshold,
         )
 
-        result = extractor.analyze_file(parser, file_path)
+        result = extractor.analyze_file(parser, file_path, collapse_repeats=collapse_repeats)
 
         output = {
             "file": file_path,
             "total_errors": result.total_errors,
             "total_warnings": result.total_warnings,
             "unique_errors": result.unique_errors,
+            "unique_stack_traces": result.unique_stack_traces,
             "time_range": {
                 "start": result.time_range[0].isoformat() if result.time_range[0] else None,
                 "end": result.time_range[1].isoformat() if result.time_range[1] else None,
@@ -486,6 +530,10 @@ def log_analyzer_extract_errors(
                         for e in g.sample_entries[:3]
                     ],
                     "stack_trace": g.stack_trace[:1000] if g.stack_trace else None,
+                    "exception_type": g.exception_type,
+                    "stack_fingerprint": g.stack_fingerprint,
+                    "variants": g.variants,
+                    "variant_count": g.variant_count,
                 }
                 for g in result.error_groups
             ],
@@ -517,6 +565,12 @@ def log_analyzer_extract_errors(
                 md += f"- **Last seen:** {group.last_seen.isoformat()}\n"
             if group.levels:
                 md += f"- **Levels:** {', '.join(group.levels)}\n"
+            if group.exception_type:
+                md += f"- **Exception:** `{group.exception_type}` (trace `{group.stack_fingerprint}`)\n"
+            if group.variant_count:
+                md += f"- **Merged variants:** {group.variant_count}\n"
+                for variant in group.variants[:3]:
+                    md += f"  - `{variant[:100]}`\n"
 
             if group.stack_trace:
                 md += f"\n```\n{group.stack_trace[:500]}{'...' if len(group.stack_trace) > 500 else ''}\n```\n"
@@ -546,6 +600,8 @@ def log_analyzer_summarize(
     file_path: str,
     focus: str = "all",
     max_lines: int = 10000,
+    collapse_repeats: bool = False,
+    format_hint: str | None = None,
     response_format: str = "markdown",
 ) -> str:
     """
@@ -555,6 +611,10 @@ def log_analyzer_summarize(
         file_path: Path to the log file
         focus: Focus area - 'errors', 'performance', 'security', or 'all' (default)
         max_lines: Maximum lines to analyze (100-100000, default: 10000)
+        collapse_repeats: Collapse runs of repeated identical lines before
+                          analysis (default: False)
+        format_hint: Force a format by name or inline grok pattern (see
+                     log_analyzer_parse), or None for auto-detect
         response_format: Output format - 'markdown' or 'json'
 
     Returns:
@@ -566,7 +626,7 @@ def log_analyzer_summarize(
             return handle_tool_error(FileNotFoundError(), file_path)
 
         file_info = get_file_info(file_path)
-        parser, confidence = detect_format(file_path)
+        parser, confidence = _resolve_parser(file_path, format_hint)
 
         # Use summarizer analyzer - requires file_path in constructor
         summarizer = Summarizer(
@@ -575,7 +635,9 @@ def log_analyzer_summarize(
             include_security=(focus == "all" or focus == "security"),
             detected_format=parser.format if hasattr(parser, "format") else LogFormat.AUTO,
         )
-        summary = summarizer.summarize_file(parser, max_lines=max_lines)
+        summary = summarizer.summarize_file(
+            parser, max_lines=max_lines, collapse_repeats=collapse_repeats
+        )
 
         # Count total raw lines for consistency with parse tool
         total_raw_lines = 0
@@ -727,6 +789,7 @@ def log_analyzer_tail(
     file_path: str,
     lines: int = 100,
     level_filter: str | None = None,
+    format_hint: str | None = None,
     response_format: str = "markdown",
 ) -> str:
     """
@@ -736,6 +799,8 @@ def log_analyzer_tail(
         file_path: Path to the log file
         lines: Number of lines to return (1-1000, default: 100)
         level_filter: Filter by log level (ERROR, WARN, INFO, DEBUG)
+        format_hint: Force a format by name or inline grok pattern (see
+                     log_analyzer_parse), or None for auto-detect
         response_format: Output format - 'markdown' or 'json'
 
     Returns:
@@ -749,7 +814,7 @@ def log_analyzer_tail(
         tail_lines = read_tail(file_path, lines)
 
         # Parse with detected format
-        parser, _ = detect_format(file_path)
+        parser, _ = _resolve_parser(file_path, format_hint)
 
         # Normalize level filter
         level_filter_upper = level_filter.upper() if level_filter else None
@@ -823,9 +888,11 @@ def log_analyzer_tail(
 )
 def log_analyzer_correlate(
     file_path: str,
-    anchor_pattern: str,
+    anchor_pattern: str = "",
     window_seconds: int = 60,
     max_anchors: int = 10,
+    format_hint: str | None = None,
+    anchors: dict[str, str] | None = None,
     response_format: str = "markdown",
 ) -> str:
     """
@@ -835,63 +902,80 @@ def log_analyzer_correlate(
         file_path: Path to the log file
         anchor_pattern: Pattern to anchor correlation around (regex)
         window_seconds: Time window in seconds around anchor (1-3600, default: 60)
-        max_anchors: Maximum anchor points to analyze (1-50, default: 10)
+        max_anchors: Maximum anchor points to analyze (1-50, default: 10),
+                     per pattern when several are given
+        format_hint: Force a format by name or inline grok pattern (see
+                     log_analyzer_parse), or None for auto-detect
+        anchors: Several named anchor patterns correlated in one pass, e.g.
+                 {"oom": "OOMKilled", "refused": "connection refused"};
+                 anchor_pattern, if also given, is added under its own text
         response_format: Output format - 'markdown' or 'json'
 
     Returns:
         Correlated events around each anchor point, showing what happened
-        before and after the anchor event.
+        before and after the anchor event (per named pattern when anchors
+        is given).
     """
     try:
         if not os.path.isfile(file_path):
             return handle_tool_error(FileNotFoundError(), file_path)
 
-        # Validate anchor pattern (Correlator will compile it)
-        try:
-            re.compile(anchor_pattern, re.IGNORECASE)
-        except re.error as e:
-            return f"Error: Invalid regex pattern: {e}"
-
-        parser, _ = detect_format(file_path)
-
-        # Use correlator analyzer - requires anchor_pattern in constructor
-        correlator = Correlator(
-            anchor_pattern=anchor_pattern,
-            window_before=window_seconds,
-            window_after=window_seconds,
-            max_anchors=max_anchors,
-            regex=True,
-            case_sensitive=False,
-        )
-
-        result = correlator.correlate_file(
-            parser=parser,
-            file_path=file_path,
-        )
+        named = dict(anchors or {})
+        if anchor_pattern and anchors:
+            named.setdefault(anchor_pattern, anchor_pattern)
+        if not named and not anchor_pattern:
+            return "Error: Provide anchor_pattern or anchors"
 
-        output = {
-            "file": file_path,
-            "anchor_pattern": anchor_pattern,
-            "window_seconds": window_seconds,
-            "anchors_found": len(result.windows),
-            "common_precursors": result.common_precursors[:5],
-            "windows": [
-                {
-                    "anchor_time": w.anchor_entry.timestamp.isoformat()
-                    if w.anchor_entry and w.anchor_entry.timestamp
-                    else None,
-                    "anchor_line": w.anchor_entry.line_number if w.anchor_entry else None,
-                    "anchor_message": w.anchor_entry.message[:200] if w.anchor_entry else None,
-                    "events_before": len(w.events_before),
-                    "events_after": len(w.events_after),
-                    "related_errors": [
-                        {"line": e.line_number, "message": e.message[:100]}
-                        for e in w.related_errors[:3]
-                    ],
-                }
-                for w in result.windows
-            ],
+        # Validate anchor patterns (the correlator will compile them)
+        for pattern in [anchor_pattern, *named.values()]:
+            try:
+                re.compile(pattern, re.IGNORECASE)
+            except re.error as e:
+                return f"Error: Invalid regex pattern: {e}"
+
+        parser, _ = _resolve_parser(file_path, format_hint)
+
+        if named:
+            # One pass for every pattern
+            multi = MultiAnchorCorrelator(
+                named,
+                window_before=window_seconds,
+                window_after=window_seconds,
+                max_anchors=max_anchors,
+                regex=True,
+                case_sensitive=False,
+            )
+            results = multi.correlate_file(parser=parser, file_path=file_path).anchors
+        else:
+            # Streaming correlator: memory bounded by the window, not the file
+            correlator = StreamingCorrelator(
+                anchor_pattern=anchor_pattern,
+                window_before=window_seconds,
+                window_after=window_seconds,
+                max_anchors=max_anchors,
+                regex=True,
+                case_sensitive=False,
+            )
+            results = {anchor_pattern: correlator.correlate_file(parser=parser, file_path=file_path)}
+
+        sections = {
+            name: {
+                "anchor_pattern": result.anchor_pattern,
+                "anchors_found": len(result.windows),
+                "common_precursors": result.common_precursors[:5],
+                "precursor_sequences": [p.to_dict() for p in result.precursor_sequences[:5]],
+                "windows": [_correlation_window_summary(w) for w in result.windows],
+            }
+            for name, result in results.items()
         }
+        if named:
+            output: dict[str, Any] = {
+                "file": file_path,
+                "window_seconds": window_seconds,
+                "anchors": sections,
+            }
+        else:
+            output = {"file": file_path, "window_seconds": window_seconds, **sections[anchor_pattern]}
 
         if response_format.lower() == "json":
             return json.dumps(output, indent=2)
@@ -900,31 +984,15 @@ def log_analyzer_correlate(
         md = f"""## Correlation Results
 
 **File:** `{file_path}`
-**Anchor Pattern:** `{anchor_pattern}`
-**Time Window:** ±{window_seconds} seconds
-**Anchors Found:** {len(result.windows)}
-
 """
-        if result.common_precursors:
-            md += "### Common Precursor Patterns\n"
-            for precursor in result.common_precursors[:5]:
-                md += f"- `{precursor}`\n"
-            md += "\n"
-
-        for i, window in enumerate(result.windows, 1):
-            md += f"### Anchor {i}\n"
-            if window.anchor_entry:
-                md += f"**Line {window.anchor_entry.line_number}:** `{window.anchor_entry.message[:100]}`\n"
-            if window.anchor_entry and window.anchor_entry.timestamp:
-                md += f"**Time:** {window.anchor_entry.timestamp.isoformat()}\n"
-            md += f"- Events before: {len(window.events_before)}\n"
-            md += f"- Events after: {len(window.events_after)}\n"
-
-            if window.related_errors:
-                md += "\n**Related Errors:**\n"
-                for err in window.related_errors[:3]:
-                    md += f"- Line {err.line_number}: `{err.message[:80]}`\n"
-            md += "\n"
+        if not named:
+            md += f"**Anchor Pattern:** `{anchor_pattern}`\n"
+        md += f"**Time Window:** ±{window_seconds} seconds\n"
+        for name, result in results.items():
+            if named:
+                md += f"\n### {name}\n**Anchor Pattern:** `{result.anchor_pattern}`\n"
+            md += f"**Anchors Found:** {len(result.windows)}\n\n"
+            md += _correlation_markdown(result, heading="####" if named else "###")
 
         return md
 
@@ -932,6 +1000,54 @@ def log_analyzer_correlate(
         return handle_tool_error(e, file_path)
 
 
+def _correlation_window_summary(window: CorrelationWindow) -> dict[str, Any]:
+    """Compact JSON form of a correlation window for the correlate tool."""
+    anchor = window.anchor_entry
+    return {
+        "anchor_time": anchor.timestamp.isoformat() if anchor and anchor.timestamp else None,
+        "anchor_line": anchor.line_number if anchor else None,
+        "anchor_message": anchor.message[:200] if anchor else None,
+        "events_before": len(window.events_before),
+        "events_after": len(window.events_after),
+        "related_errors": [
+            {"line": e.line_number, "message": e.message[:100]} for e in window.related_errors[:3]
+        ],
+    }
+
+
+def _correlation_markdown(result: CorrelationResult, heading: str) -> str:
+    """Markdown precursors and windows of one anchor pattern."""
+    md = ""
+    if result.common_precursors:
+        md += f"{heading} Common Precursor Patterns\n"
+        for precursor in result.common_precursors[:5]:
+            md += f"- `{precursor}`\n"
+        md += "\n"
+
+    if result.precursor_sequences:
+        md += f"{heading} Precursor Sequences\n"
+        for sequence in result.precursor_sequences[:5]:
+            steps = " then ".join(f"`{template}`" for template in sequence.templates)
+            md += f"- {steps} (before {sequence.support:.0%} of anchors, lift {sequence.lift:.1f})\n"
+        md += "\n"
+
+    for i, window in enumerate(result.windows, 1):
+        md += f"{heading} Anchor {i}\n"
+        if window.anchor_entry:
+            md += f"**Line {window.anchor_entry.line_number}:** `{window.anchor_entry.message[:100]}`\n"
+        if window.anchor_entry and window.anchor_entry.timestamp:
+            md += f"**Time:** {window.anchor_entry.timestamp.isoformat()}\n"
+        md += f"- Events before: {len(window.events_before)}\n"
+        md += f"- Events after: {len(window.events_after)}\n"
+
+        if window.related_errors:
+            md += "\n**Related Errors:**\n"
+            for err in window.related_errors[:3]:
+                md += f"- Line {err.line_number}: `{err.message[:80]}`\n"
+        md += "\n"
+    return md
+
+
 # =============================================================================
 # Tool 7: log_analyzer_diff (P2)
 # =============================================================================
@@ -953,6 +1069,8 @@ def log_analyzer_diff(
     time_range_a_end: str | None = None,
     time_range_b_start: str | None = None,
     time_range_b_end: str | None = None,
+    format_hint: str | None = None,
+    grouping: str = "regex",
     response_format: str = "markdown",
 ) -> str:
     """
@@ -965,6 +1083,11 @@ def log_analyzer_diff(
         time_range_a_end: End time for first period (ISO format)
         time_range_b_start: Start time for second period (ISO format)
         time_range_b_end: End time for second period (ISO format)
+        format_hint: Force a format by name or inline grok pattern (see
+                     log_analyzer_parse), or None for auto-detect
+        grouping: How errors are matched across both sides - 'regex' or
+                  'drain' (templates mined from both sides together)
+                  (default: 'regex')
         response_format: Output format - 'markdown' or 'json'
 
     Returns:
@@ -977,7 +1100,7 @@ def log_analyzer_diff(
         if file_path_b and not os.path.isfile(file_path_b):
             return handle_tool_error(FileNotFoundError(), file_path_b)
 
-        parser_a, _ = detect_format(file_path_a)
+        parser_a, _ = _resolve_parser(file_path_a, format_hint)
 
         # Parse time ranges
         def parse_time(ts: str | None) -> datetime | None:
@@ -993,6 +1116,10 @@ def log_analyzer_diff(
         t_b_start = parse_time(time_range_b_start)
         t_b_end = parse_time(time_range_b_end)
 
+        # Both sides share one miner so the same error gets the same template
+        grouping = grouping.lower()
+        miner = DrainMiner() if grouping == "drain" else None
+
         # Extract errors from both sources
         def extract_errors_filtered(
             file_path: str,
@@ -1001,7 +1128,9 @@ def log_analyzer_diff(
             end: datetime | None,
         ) -> dict[str, int]:
             """Extract error patterns with optional time filtering."""
-            extractor = ErrorExtractor(include_warnings=False, group_similar=True)
+            extractor = ErrorExtractor(
+                include_warnings=False, group_similar=True, grouping=grouping, miner=miner
+            )
             errors: dict[str, int] = {}
 
             for entry in parser.parse_file(file_path):
@@ -1016,20 +1145,34 @@ def log_analyzer_diff(
 
             result = extractor.finalize()
             for group in result.error_groups:
-                errors[group.template] = group.count
+                # Stack-trace groups can share a template; merge their counts
+                key = group.template if group.cluster_id is None else str(group.cluster_id)
+                errors[key] = errors.get(key, 0) + group.count
 
             return errors
 
+        def mined_templates(errors: dict[str, int]) -> dict[str, int]:
+            """Re-key cluster ids to templates once both sides are mined."""
+            templates: dict[str, int] = {}
+            for key, count in errors.items():
+                cluster = miner.get(int(key)) if miner and key.isdigit() else None
+                template = cluster.template if cluster else key
+                templates[template] = templates.get(template, 0) + count
+            return templates
+
         errors_a = extract_errors_filtered(file_path_a, parser_a, t_a_start, t_a_end)
 
         if file_path_b:
-            parser_b, _ = detect_format(file_path_b)
+            parser_b, _ = _resolve_parser(file_path_b, format_hint)
             errors_b = extract_errors_filtered(file_path_b, parser_b, t_b_start, t_b_end)
             comparison_desc = f"{file_path_a} vs {file_path_b}"
         else:
             errors_b = extract_errors_filtered(file_path_a, parser_a, t_b_start, t_b_end)
             comparison_desc = f"Time period comparison in {file_path_a}"
 
+        if miner is not None:
+            errors_a, errors_b = mined_templates(errors_a), mined_templates(errors_b)
+
         # Calculate differences
         new_errors = {k: v for k, v in errors_b.items() if k not in errors_a}
         resolved_errors = {k: v for k, v in errors_a.items() if k not in errors_b}
@@ -1131,6 +1274,7 @@ def log_analyzer_watch(
     max_lines: int = 100,
     level_filter: str | None = None,
     pattern_filter: str | None = None,
+    format_hint: str | None = None,
     response_format: str = "markdown",
 ) -> str:
     """
@@ -1148,6 +1292,8 @@ def log_analyzer_watch(
         max_lines: Maximum lines to read per call (1-1000, default: 100)
         level_filter: Filter by log levels, comma-separated (e.g., "ERROR,WARN")
         pattern_filter: Regex pattern to filter messages
+        format_hint: Force a format by name or inline grok pattern (see
+                     log_analyzer_parse), or None for auto-detect
         response_format: Output format - 'markdown' or 'json'
 
     Returns:
@@ -1159,7 +1305,7 @@ def log_analyzer_watch(
             return handle_tool_error(FileNotFoundError(), file_path)
 
         # Get parser for this file
-        parser, _ = detect_format(file_path)
+        parser, _ = _resolve_parser(file_path, format_hint)
 
         # Use the watcher
         watcher = LogWatcher()
@@ -1259,6 +1405,8 @@ def log_analyzer_suggest_patterns(
     focus: str = "all",
     max_patterns: int = 10,
     max_lines: int = 10000,
+    format_hint: str | None = None,
+    grouping: str = "regex",
     response_format: str = "markdown",
 ) -> str:
     """
@@ -1277,6 +1425,10 @@ def log_analyzer_suggest_patterns(
                or 'identifiers' (default: 'all')
         max_patterns: Maximum patterns to suggest (1-20, default: 10)
         max_lines: Maximum lines to analyze (100-100000, default: 10000)
+        format_hint: Force a format by name or inline grok pattern (see
+                     log_analyzer_parse), or None for auto-detect
+        grouping: How error templates are built - 'regex' or 'drain'
+                  (templates mined from the log) (default: 'regex')
         response_format: Output format - 'markdown' or 'json'
 
     Returns:
@@ -1292,11 +1444,11 @@ def log_analyzer_suggest_patterns(
             return f"Error: Invalid focus '{focus}'. Valid options: {', '.join(valid_focuses)}"
 
         # Get parser for this file
-        parser, confidence = detect_format(file_path)
+        parser, confidence = _resolve_parser(file_path, format_hint)
         file_info = get_file_info(file_path)
 
         # Use the pattern suggester
-        suggester = PatternSuggester()
+        suggester = PatternSuggester(grouping=grouping.lower())
         result = suggester.analyze_file(
             file_path=file_path,
             parser=parser,
@@ -1400,6 +1552,7 @@ def log_analyzer_trace(
     trace_id: str | None = None,
     max_traces: int = 100,
     max_lines: int = 10000,
+    format_hint: str | None = None,
     response_format: str = "markdown",
 ) -> str:
     """
@@ -1413,6 +1566,8 @@ def log_analyzer_trace(
         trace_id: Specific trace ID to filter for (None for all traces)
         max_traces: Maximum number of trace groups to return (1-500, default: 100)
         max_lines: Maximum lines to process (100-100000, default: 10000)
+        format_hint: Force a format by name or inline grok pattern (see
+                     log_analyzer_parse), or None for auto-detect
         response_format: Output format - 'markdown' or 'json'
 
     Returns:
@@ -1424,7 +1579,7 @@ def log_analyzer_trace(
             return handle_tool_error(FileNotFoundError(), file_path)
 
         file_info = get_file_info(file_path)
-        parser, confidence = detect_format(file_path)
+        parser, confidence = _resolve_parser(file_path, format_hint)
 
         # Use trace extractor
         extractor = TraceExtractor(
@@ -1534,6 +1689,7 @@ def log_analyzer_multi(
     operation: str = "merge",
     time_window: int = 60,
     max_entries: int = 1000,
+    format_hint: str | None = None,
     response_format: str = "markdown",
 ) -> str:
     """
@@ -1549,6 +1705,8 @@ def log_analyzer_multi(
         operation: Analysis operation - 'merge', 'correlate', or 'compare' (default: 'merge')
         time_window: Time window in seconds for correlation (1-3600, default: 60)
         max_entries: Maximum entries to return (100-5000, default: 1000)
+        format_hint: Force a format by name or inline grok pattern (see
+                     log_analyzer_parse), or None for auto-detect
         response_format: Output format - 'markdown' or 'json'
 
     Returns:
@@ -1576,6 +1734,7 @@ def log_analyzer_multi(
         analyzer = MultiFileAnalyzer(
             time_window=min(max(time_window, 1), 3600),
             max_entries=min(max(max_entries, 100), 5000),
+            format_hint=format_hint,
         )
 
         op = operation.lower()
@@ -1741,6 +1900,7 @@ def log_analyzer_ask(
     file_path: str,
     question: str,
     max_results: int = 50,
+    format_hint: str | None = None,
     response_format: str = "markdown",
 ) -> str:
     """
@@ -1760,6 +1920,8 @@ def log_analyzer_ask(
         file_path: Path to the log file to analyze
         question: Natural language question about the logs
         max_results: Maximum supporting entries to include (10-200, default: 50)
+        format_hint: Force a format by name or inline grok pattern (see
+                     log_analyzer_parse), or None for auto-detect
         response_format: Output format - 'markdown' or 'json'
 
     Returns:
@@ -1770,7 +1932,7 @@ def log_analyzer_ask(
             return handle_tool_error(FileNotFoundError(), file_path)
 
         # Detect format and get parser
-        parser, _confidence = detect_format(file_path)
+        parser, _confidence = _resolve_parser(file_path, format_hint)
 
         # Initialize query translator
         translator = QueryTranslator()
@@ -1809,7 +1971,7 @@ def log_analyzer_ask(
                 # Use the first error template as anchor
                 first_group = error_result.error_groups[0]
                 error_pattern = first_group.template[:50] if first_group.template else "error"
-                correlator = Correlator(
+                correlator = StreamingCorrelator(
                     anchor_pattern=re.escape(error_pattern),
                     window_before=60,
                     window_after=30,
@@ -2031,6 +2193,7 @@ def log_analyzer_scan_sensitive(
     include_ips: bool = False,
     max_matches: int = 100,
     max_lines: int = 100000,
+    format_hint: str | None = None,
     response_format: str = "markdown",
 ) -> str:
     """
@@ -2057,6 +2220,8 @@ def log_analyzer_scan_sensitive(
         include_ips: Include IP address detection (default: False)
         max_matches: Maximum matches to return (1-500, default: 100)
         max_lines: Maximum lines to scan (1-1000000, default: 100000)
+        format_hint: Force a format by name or inline grok pattern (see
+                     log_analyzer_parse), or None for auto-detect
         response_format: Output format - 'markdown' or 'json'
 
     Returns:
@@ -2067,7 +2232,7 @@ def log_analyzer_scan_sensitive(
             return handle_tool_error(FileNotFoundError(), file_path)
 
         # Get parser
-        parser, _ = detect_format(file_path)
+        parser, _ = _resolve_parser(file_path, format_hint)
 
         # Create detector
         from codesdevs_log_analyzer.analyzers import SensitiveDataDetector
@@ -2202,51 +2367,30 @@ def log_analyzer_suggest_format(
         if not os.path.isfile(file_path):
             return handle_tool_error(FileNotFoundError(), file_path)
 
-        # Read sample lines
-        sample_lines: list[str] = []
-        for _, line in stream_file(file_path, max_lines=sample_size):
-            sample_lines.append(line)
+        # Sample head, middle and tail; reuse the parses from auto-detection
+        detection = detect_file(file_path, sample_size)
+        sample_lines = detection.lines
 
         if not sample_lines:
             return json.dumps({"error": "Empty file"}) if response_format.lower() == "json" else "**Error:** File is empty"
 
-        # Test all parsers and collect confidence scores
-        parser_scores: list[tuple[str, float, int, int]] = []  # (name, confidence, parsed_count, failed_count)
-
+        # Score the parsers detection skipped and collect confidence scores
         for parser_name in PARSER_REGISTRY:
-            parser_class = PARSER_REGISTRY[parser_name]
-            confidence = parser_class.detect_confidence(sample_lines)
-
-            # Count parsed vs failed lines
-            parser = parser_class()
-            parsed_count = 0
-            failed_count = 0
-
-            for i, line in enumerate(sample_lines[:50], 1):  # Test first 50 lines
-                entry = parser.parse_line(line, i)
-                if entry and entry.message:
-                    parsed_count += 1
-                else:
-                    failed_count += 1
-
-            parser_scores.append((parser_name, confidence, parsed_count, failed_count))
-
-        # Sort by confidence
-        parser_scores.sort(key=lambda x: x[1], reverse=True)
+            detection.score(parser_name)
+        parser_scores: list[tuple[str, float, int, int]] = [  # (name, confidence, parsed_count, failed_count)
+            (score.name, score.confidence or 0.0, score.parsed_lines, score.failed_lines)
+            for score in detection.scored
+        ]
 
         # Get best parser
         best_parser_name = parser_scores[0][0]
         best_confidence = parser_scores[0][1]
-        best_parser = PARSER_REGISTRY[best_parser_name]()
 
         # Find unparseable lines with the best parser
-        unparseable_lines: list[tuple[int, str]] = []
-        for i, line in enumerate(sample_lines, 1):
-            entry = best_parser.parse_line(line, i)
-            if entry is None or not entry.message:
-                unparseable_lines.append((i, line[:200]))
-                if len(unparseable_lines) >= 5:
-                    break
+        unparseable_lines: list[tuple[int | None, str]] = [
+            (sampled.line_number, sampled.text[:200])
+            for sampled in detection.unparsed(best_parser_name)[:5]
+        ]
 
         # Generate pattern suggestions for generic parser
         pattern_suggestions: list[str] = []
@@ -2258,7 +2402,7 @@ def log_analyzer_suggest_format(
         # Get format descriptions
         format_info: list[dict[str, Any]] = []
         for name, conf, parsed, failed in parser_scores[:5]:  # Top 5
-            parser_class = PARSER_REGISTRY[name]
+            parser_class = detection.parser_class(name)
             format_info.append({
                 "name": name,
                 "description": parser_class.description,
@@ -2267,6 +2411,10 @@ def log_analyzer_suggest_format(
                 "failed_lines": failed,
             })
 
+        # Pattern inferred for an otherwise unrecognized structure
+        synthesized = detection.synthesized() if detection.synthesized else None
+        synthesized_pattern = synthesized.spec.spec if isinstance(synthesized, GrokParser) else None
+
         # Build output
         output: dict[str, Any] = {
             "recommended_format": best_parser_name,
@@ -2279,8 +2427,9 @@ def log_analyzer_suggest_format(
                 for num, line in unparseable_lines
             ],
             "pattern_suggestions": pattern_suggestions,
+            "synthesized_pattern": synthesized_pattern,
             "recommendations": _generate_format_recommendations(
-                best_parser_name, best_confidence, unparseable_lines, parser_scores
+                best_parser_name, best_confidence, unparseable_lines, parser_scores, synthesized_pattern
             ),
         }
 
@@ -2295,7 +2444,7 @@ def log_analyzer_suggest_format(
 ### Recommended Format
 {confidence_emoji} **{best_parser_name}** (confidence: {best_confidence:.0%})
 
-{PARSER_REGISTRY[best_parser_name].description}
+{detection.parser_class(best_parser_name).description}
 
 ### Format Rankings
 | Format | Confidence | Parsed | Failed |
@@ -2308,9 +2457,14 @@ def log_analyzer_suggest_format(
             md += f"\n### Unparseable Lines ({len(unparseable_lines)} samples)\n"
             md += "These lines couldn't be parsed with the recommended format:\n```\n"
             for num, line in unparseable_lines:
-                md += f"L{num}: {line}\n"
+                md += f"L{num if num is not None else '?'}: {line}\n"
             md += "```\n"
 
+        if synthesized_pattern:
+            md += "\n### Synthesized Pattern\n"
+            md += "Inferred from the sample; usable as `format_hint` or with `log_analyzer_register_format`:\n"
+            md += f"```\n{synthesized_pattern}\n```\n"
+
         if pattern_suggestions:
             md += "\n### Pattern Suggestions\n"
             md += "If using the generic parser, consider these patterns:\n"
@@ -2368,13 +2522,19 @@ def _analyze_line_patterns(sample_lines: list[str]) -> list[str]:
 def _generate_format_recommendations(
     best_format: str,
     confidence: float,
-    unparseable: list[tuple[int, str]],
+    unparseable: list[tuple[int | None, str]],
     all_scores: list[tuple[str, float, int, int]],
+    synthesized_pattern: str | None = None,
 ) -> list[str]:
     """Generate actionable recommendations based on analysis."""
     recommendations: list[str] = []
 
-    if confidence >= 0.9:
+    if synthesized_pattern and best_format == SYNTHESIZED_NAME:
+        recommendations.append(
+            "No built-in format matched; a pattern was synthesized from the sample. "
+            "Pass it as `format_hint` or name it with `log_analyzer_register_format`."
+        )
+    elif confidence >= 0.9:
         recommendations.append(f"High confidence detection. Use `--format-hint {best_format}` for best results.")
     elif confidence >= 0.7:
         recommendations.append(f"Good detection. Consider using `--format-hint {best_format}` to skip auto-detection.")
@@ -2389,6 +2549,9 @@ def _generate_format_recommendations(
     else:
         recommendations.append("Low confidence - file may have mixed or custom format.")
         recommendations.append("Use `--format-hint generic` for timestamp-only parsing.")
+        recommendations.append(
+            "For an in-house format, describe it with a grok pattern via `log_analyzer_register_format`."
+        )
         recommendations.append("Consider checking if the file has multiple log formats mixed together.")
 
     if unparseable and len(unparseable) > 3:
@@ -2397,6 +2560,430 @@ def _generate_format_recommendations(
     return recommendations
 
 
+# =============================================================================
+# Tool 15: log_analyzer_register_format (P2)
+# =============================================================================
+
+
+@mcp.tool(
+    annotations=ToolAnnotations(
+        title="Register Custom Log Format",
+        readOnlyHint=False,
+        destructiveHint=False,
+        idempotentHint=True,
+        openWorldHint=False,
+    ),
+)
+def log_analyzer_register_format(
+    name: str,
+    pattern: str,
+    description: str | None = None,
+    file_path: str | None = None,
+    response_format: str = "markdown",
+) -> str:
+    """
+    Register a custom log format from a grok-style pattern.
+
+    The pattern is compiled once into an anchored regex. Reference library
+    patterns as %{NAME}, capture fields as %{NAME:field} and convert them with
+    %{NAME:field:int} or %{NAME:field:float}. Fields named like timestamps
+    (ts, time, timestamp), levels (level, severity) and messages (msg, message)
+    fill the parsed entry; the rest become metadata. The registered name can
+    then be passed to any tool as format_hint and is tried by auto-detection.
+
+    Args:
+        name: Name for the format (must not clash with a built-in format)
+        pattern: Grok pattern, e.g. "%{TIMESTAMP_ISO8601:ts} %{LOGLEVEL:level} %{GREEDYDATA:msg}"
+        description: Optional format description
+        file_path: Optional log file to test the pattern against (first 100 lines)
+        response_format: Output format - 'markdown' or 'json'
+
+    Returns:
+        Registered format details and, if a file was given, its match rate
+    """
+    try:
+        try:
+            parser_class = register_format(name, pattern, description)
+        except ValueError as e:
+            return f"Error: {e}"
+
+        spec = compile_grok(pattern)
+        output: dict[str, Any] = {
+            "name": parser_class.name,
+            "description": parser_class.description,
+            "fields": [field.name for field in spec.fields],
+            "timestamp_field": spec.timestamp_field,
+            "level_field": spec.level_field,
+            "message_field": spec.message_field,
+        }
+
+        if file_path is not None:
+            if not os.path.isfile(file_path):
+                return handle_tool_error(FileNotFoundError(), file_path)
+            parser = parser_class()
+            sampled = 0
+            matched = 0
+            unmatched: list[dict[str, Any]] = []
+            for line_num, line in stream_file(file_path, max_lines=100, skip_empty=True):
+                sampled += 1
+                if parser.can_parse(line):
+                    matched += 1
+                elif len(unmatched) < 5:
+                    unmatched.append({"line_number": line_num, "content": line[:200]})
+            output["test"] = {
+                "file_path": file_path,
+                "lines_sampled": sampled,
+                "lines_matched": matched,
+                "match_rate": matched / sampled if sampled else 0.0,
+                "unmatched_sample": unmatched,
+            }
+
+        if response_format.lower() == "json":
+            return json.dumps(output, indent=2)
+
+        md = f"""## Registered Format: {output["name"]}
+
+{output["description"]}
+
+**Fields:** {", ".join(f"`{field}`" for field in output["fields"])}
+**Timestamp:** `{output["timestamp_field"]}` | **Level:** `{output["level_field"]}` | **Message:** `{output["message_field"]}`
+
+Use `format_hint="{output["name"]}"` with any tool.
+"""
+        if "test" in output:
+            test = output["test"]
+            md += f"\n### Test on {file_path}\n"
+            md += f"Matched {test['lines_matched']}/{test['lines_sampled']} lines ({test['match_rate']:.0%})\n"
+            if test["unmatched_sample"]:
+                md += "```\n"
+                for item in test["unmatched_sample"]:
+                    md += f"L{item['line_number']}: {item['content']}\n"
+                md += "```\n"
+
+        return md
+
+    except Exception as e:
+        return handle_tool_error(e, file_path or name)
+
+
+# =============================================================================
+# Tool 16: log_analyzer_pod_logs (P1)
+# =============================================================================
+
+
+@mcp.tool(
+    annotations=ToolAnnotations(
+        title="Pod Log Directory Analysis",
+        readOnlyHint=True,
+        destructiveHint=False,
+        idempotentHint=True,
+        openWorldHint=False,
+    ),
+)
+def log_analyzer_pod_logs(
+    directory: str = "/var/log/pods",
+    namespace: str | None = None,
+    pod: str | None = None,
+    container: str | None = None,
+    max_files: int = 500,
+    max_lines_per_file: int = 10000,
+    format_hint: str | None = None,
+    response_format: str = "markdown",
+) -> str:
+    """
+    Analyze a Kubernetes pod log directory and aggregate results per pod and container.
+
+    Walks <directory>/<namespace>_<pod>_<uid>/<container>/<restart>.log,
+    takes namespace, pod and container from the paths, detects the format
+    once per container name and parses the files concurrently.
+
+    Args:
+        directory: Pod log directory (default: /var/log/pods)
+        namespace: Only namespaces matching this glob (e.g. 'prod-*')
+        pod: Only pods matching this glob (e.g. 'checkout-*')
+        container: Only containers matching this glob
+        max_files: Maximum log files to analyze (1-5000, default: 500)
+        max_lines_per_file: Maximum lines per file (100-100000, default: 10000)
+        format_hint: Force a format by name or inline grok pattern (see
+                     log_analyzer_parse), or None to detect per container
+        response_format: Output format - 'markdown' or 'json'
+
+    Returns:
+        Entry, error and warning counts, restarts, top error patterns and time
+        ranges per pod and per container.
+    """
+    try:
+        if not os.path.isdir(directory):
+            return f"Error: Directory not found: {directory}\nPlease check the path and try again."
+
+        analyzer = PodLogAnalyzer(
+            format_hint=format_hint,
+            max_lines_per_file=min(max(max_lines_per_file, 100), 100000),
+            max_files=min(max(max_files, 1), 5000),
+        )
+        result = analyzer.analyze(directory, namespace, pod, container)
+
+        if result.files == 0:
+            return (
+                f"No pod logs found under {directory}. Expected "
+                "<namespace>_<pod>_<uid>/<container>/<N>.log files."
+            )
+
+        if response_format.lower() == "json":
+            return json.dumps(result.to_dict(), indent=2)
+
+        total = result.total
+        md = f"""## Pod Log Analysis
+
+**Directory:** `{directory}`
+**Files:** {result.files:,} ({len(result.pods)} pods, {len(result.containers)} containers)
+**Entries:** {total.entries:,} ({total.errors:,} errors, {total.warnings:,} warnings)
+**Format Detections:** {result.detections}
+"""
+        if total.time_start and total.time_end:
+            md += f"**Time Range:** {total.time_start.isoformat()} to {total.time_end.isoformat()}\n"
+
+        md += "\n### Pods\n| Pod | Files | Restarts | Entries | Errors | Warnings |\n"
+        md += "|-----|-------|----------|---------|--------|----------|\n"
+        for key, stats in sorted(result.pods.items(), key=lambda item: -item[1].errors):
+            md += (
+                f"| {key} | {stats.files} | {stats.restarts} | {stats.entries:,} "
+                f"| {stats.errors:,} | {stats.warnings:,} |\n"
+            )
+
+        md += "\n### Containers\n| Container | Format | Restarts | Entries | Errors |\n"
+        md += "|-----------|--------|----------|---------|--------|\n"
+        for key, stats in sorted(result.containers.items(), key=lambda item: -item[1].errors):
+            md += (
+                f"| {key} | {', '.join(sorted(stats.formats))} | {stats.restarts} "
+                f"| {stats.entries:,} | {stats.errors:,} |\n"
+            )
+
+        failing = [
+            (key, stats) for key, stats in result.containers.items() if stats.error_patterns
+        ]
+        if failing:
+            md += "\n### Top Errors by Container\n"
+            for key, stats in sorted(failing, key=lambda item: -item[1].errors)[:10]:
+                md += f"\n**{key}:**\n"
+                for pattern, count in stats.error_patterns.most_common(3):
+                    md += f"- {count}x `{pattern[:80]}`\n"
+
+        if result.failed:
+            md += "\n### Unreadable Files\n"
+            for path, error in list(result.failed.items())[:10]:
+                md += f"- `{path}`: {error}\n"
+
+        return md
+
+    except Exception as e:
+        return handle_tool_error(e, directory)
+
+
+# =============================================================================
+# Tool 17: log_analyzer_sequence (P2)
+# =============================================================================
+
+
+@mcp.tool(
+    annotations=ToolAnnotations(
+        title="Match Event Sequences",
+        readOnlyHint=True,
+        destructiveHint=False,
+        idempotentHint=True,
+        openWorldHint=False,
+    ),
+)
+def log_analyzer_sequence(
+    file_path: str,
+    steps: list[str],
+    within_seconds: float | list[float] = 30,
+    key: str | None = None,
+    max_matches: int = 20,
+    max_lines: int = 100000,
+    format_hint: str | None = None,
+    response_format: str = "markdown",
+) -> str:
+    """
+    Find events followed by other events within a time bound, optionally per key.
+
+    Answers questions like "how often is 'lock acquired' followed by 'lock
+    timeout' within 30s for the same request_id" in one streaming pass.
+
+    Args:
+        file_path: Path to the log file
+        steps: Event patterns (regex) in order, 2-10 steps,
+               e.g. ["lock acquired", "lock timeout"]
+        within_seconds: Seconds allowed between consecutive steps; one value
+                        for every gap or one per gap (default: 30)
+        key: Join key, e.g. 'request_id': steps only chain when they share its
+             value (from parsed fields or 'key=value' in the message)
+        max_matches: Matched sequences listed with their lines (1-100, default: 20)
+        max_lines: Maximum lines to process (100-1000000, default: 100000)
+        format_hint: Force a format by name or inline grok pattern (see
+                     log_analyzer_parse), or None for auto-detect
+        response_format: Output format - 'markdown' or 'json'
+
+    Returns:
+        How many sequences started, completed and timed out, step-to-step
+        durations, the keys with most matches and sample matched sequences.
+    """
+    try:
+        if not os.path.isfile(file_path):
+            return handle_tool_error(FileNotFoundError(), file_path)
+
+        try:
+            matcher = SequenceMatcher(
+                steps,
+                within=within_seconds,
+                key=key,
+                max_matches=min(max(max_matches, 1), 100),
+            )
+        except ValueError as e:
+            return f"Error: {e}"
+
+        parser, _ = _resolve_parser(file_path, format_hint)
+        result = matcher.match_file(
+            parser, file_path, max_lines=min(max(max_lines, 100), 1000000)
+        )
+
+        if response_format.lower() == "json":
+            output = result.to_dict()
+            output["file"] = file_path
+            return json.dumps(output, indent=2)
+
+        sequence = " → ".join(f"`{step}`" for step in steps)
+        md = f"""## Sequence Matches
+
+**File:** `{file_path}`
+**Sequence:** {sequence}
+**Within:** {", ".join(f"{bound:g}s" for bound in result.within_seconds)}
+"""
+        if key:
+            md += f"**Join Key:** `{key}`\n"
+        md += f"""
+| Started | Completed | Timed Out | Completion Rate |
+|---------|-----------|-----------|-----------------|
+| {result.started:,} | {result.completed:,} | {result.expired:,} | {result.completion_rate:.1%} |
+"""
+        if result.completed and result.avg_duration is not None:
+            md += (
+                f"\n**Duration:** min {result.min_duration:.1f}s, "
+                f"avg {result.avg_duration:.1f}s, max {result.max_duration:.1f}s\n"
+            )
+        if result.evicted_keys:
+            md += f"\n*{result.evicted_keys:,} idle keys were dropped to bound memory.*\n"
+
+        if result.matches_by_key:
+            md += "\n### Top Keys\n"
+            for value, count in result.matches_by_key.most_common(10):
+                md += f"- `{value}`: {count}\n"
+
+        if result.matches:
+            md += "\n### Matches\n"
+            for i, match in enumerate(result.matches, 1):
+                label = f" ({match.key})" if match.key else ""
+                md += f"\n**{i}.{label}** {match.duration_seconds:.1f}s\n"
+                for entry in match.entries:
+                    md += f"- Line {entry.line_number}: `{entry.message[:100]}`\n"
+        else:
+            md += "\nNo complete sequences found.\n"
+
+        return md
+
+    except Exception as e:
+        return handle_tool_error(e, file_path)
+
+
+# =============================================================================
+# Tool 18: log_analyzer_redact (P2)
+# =============================================================================
+
+
+@mcp.tool(
+    annotations=ToolAnnotations(
+        title="Write Redacted Copy",
+        readOnlyHint=False,
+        destructiveHint=True,
+        idempotentHint=True,
+        openWorldHint=False,
+    ),
+)
+def log_analyzer_redact(
+    file_path: str,
+    output_path: str,
+    categories: list[str] | None = None,
+    include_ips: bool = False,
+    compress: bool | None = None,
+    overwrite: bool = False,
+    response_format: str = "markdown",
+) -> str:
+    """
+    Write a redacted copy of a whole log file, e.g. to share it with a vendor.
+
+    Every match of the log_analyzer_scan_sensitive patterns is replaced by a
+    placeholder such as [EMAIL_REDACTED] (overlapping matches share one);
+    everything else, including line endings, is copied byte for byte. Large
+    files are redacted in parallel.
+
+    Args:
+        file_path: Path to the log file (plain or gzip)
+        output_path: Path of the redacted copy
+        categories: Redact only these categories. Options:
+                   email, credit_card, api_key, token, password,
+                   ssn, ip_address, phone, connection_string, private_key
+        include_ips: Also redact private IP addresses (default: False)
+        compress: Write gzip; None compresses when output_path ends in .gz
+        overwrite: Replace output_path if it exists (default: False)
+        response_format: Output format - 'markdown' or 'json'
+
+    Returns:
+        Lines written and redacted, with redaction counts per category.
+    """
+    try:
+        if not os.path.isfile(file_path):
+            return handle_tool_error(FileNotFoundError(), file_path)
+        if os.path.exists(output_path) and not overwrite:
+            return f"Error: {output_path} already exists (pass overwrite=True to replace it)"
+
+        from codesdevs_log_analyzer.analyzers import SensitiveDataDetector
+
+        detector = SensitiveDataDetector(include_private_ips=include_ips)
+        try:
+            result = detector.redact_file(
+                file_path, output_path, categories=categories, compress=compress
+            )
+        except ValueError as e:
+            return f"Error: {e}"
+
+        output = {"file": file_path, **result.to_dict()}
+
+        if response_format.lower() == "json":
+            return json.dumps(output, indent=2)
+
+        md = f"""## Redacted Copy Written
+
+**File:** `{file_path}`
+**Output:** `{output_path}`{" (gzip)" if result.compressed else ""}
+**Lines:** {result.lines_written:,} ({result.lines_redacted:,} redacted)
+**Size:** {_format_size(result.bytes_read)} read, {_format_size(result.bytes_written)} written
+**Redactions:** {result.total_redactions:,}
+"""
+        if result.redactions_by_category:
+            md += "\n### By Category\n"
+            for cat, count in sorted(
+                result.redactions_by_category.items(), key=lambda x: x[1], reverse=True
+            ):
+                md += f"- **{cat}**: {count:,}\n"
+        else:
+            md += "\nNo sensitive data found; the copy matches the original.\n"
+
+        return md
+
+    except Exception as e:
+        return handle_tool_error(e, file_path)
+
+
 # =============================================================================
 # Server Entry Point
 # =============================================================================
@@ -11,6 +11,9 @@ import chardet
 # Type alias for file path arguments
 PathLike = str | Path
 
+# Default characters read per block by stream_blocks
+DEFAULT_BLOCK_SIZE = 1024 * 1024
+
 
 def _ensure_str_path(file_path: PathLike) -> str:
     """Convert Path to string if needed."""
@@ -155,6 +158,74 @@ def stream_file(
             )
 
 
+def stream_blocks(
+    file_path: PathLike,
+    encoding: str | None = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    max_lines: int | None = None,
+) -> Iterator[tuple[int, str]]:
+    """
+    Stream a file as blocks of whole lines.
+
+    Blocks are cut at the last newline within roughly block_size characters,
+    so no line is split across blocks. Line endings are normalized to "\n"
+    and the block has no trailing newline.
+
+    Args:
+        file_path: Path to the log file
+        encoding: File encoding (auto-detected if None)
+        block_size: Approximate characters to read per block
+        max_lines: Maximum lines to yield across all blocks (None for all)
+
+    Yields:
+        Tuples of (first_line_number, block) with line numbers 1-indexed
+    """
+    file_path = _ensure_str_path(file_path)
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"Log file not found: {file_path}")
+
+    if encoding is None:
+        encoding = detect_encoding(file_path)
+
+    if is_gzip_file(file_path):
+        opener = gzip.open(file_path, "rt", encoding=encoding, errors="replace")  # noqa: SIM115
+    else:
+        opener = open(file_path, encoding=encoding, errors="replace")  # noqa: SIM115
+
+    line_number = 1
+    remaining = max_lines
+    pending = ""
+
+    with opener as f:
+        while remaining is None or remaining > 0:
+            chunk = f.read(block_size)
+            if not chunk:
+                block = pending
+                pending = ""
+                if not block:
+                    break
+            else:
+                data = pending + chunk
+                cut = data.rfind("\n")
+                if cut == -1:
+                    pending = data
+                    continue
+                block, pending = data[:cut], data[cut + 1 :]
+
+            lines = block.count("\n") + 1
+            if remaining is not None:
+                if lines > remaining:
+                    block = "\n".join(block.split("\n", remaining)[:remaining])
+                    lines = remaining
+                remaining -= lines
+
+            yield line_number, block
+            line_number += lines
+
+            if not chunk:
+                break
+
+
 def stream_file_chunk(
     file_path: PathLike,
     start_line: int = 1,
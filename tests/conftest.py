@@ -11,6 +11,14 @@ import pytest
 TEST_LOGS_DIR = Path(__file__).parent.parent / "test_logs"
 
 
+@pytest.fixture(autouse=True)
+def isolated_format_profiles(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep learned format profiles out of any store set in the environment."""
+    path = tmp_path / "format_profiles.json"
+    monkeypatch.setenv("LOG_ANALYZER_PROFILES", str(path))
+    return path
+
+
 @pytest.fixture
 def test_logs_dir() -> Path:
     """Return path to test_logs directory."""
@@ -163,6 +171,11 @@ SAMPLE_KUBERNETES_LINES = [
     "I0115 10:30:01.234567 12345 controller.go:123] Starting",
 ]
 
+SAMPLE_LOGFMT_LINES = [
+    'ts=2026-01-15T10:30:00.123Z level=info msg="Server starting" port=8080',
+    'ts=2026-01-15T10:30:01.456Z level=error msg="query failed: \\"users\\" locked" db=main',
+]
+
 
 @pytest.fixture
 def sample_syslog_lines() -> list[str]:
@@ -206,6 +219,12 @@ def sample_kubernetes_lines() -> list[str]:
     return SAMPLE_KUBERNETES_LINES.copy()
 
 
+@pytest.fixture
+def sample_logfmt_lines() -> list[str]:
+    """Sample logfmt lines for testing."""
+    return SAMPLE_LOGFMT_LINES.copy()
+
+
 # ============================================================================
 # Fixtures for analyzer tests
 # ============================================================================
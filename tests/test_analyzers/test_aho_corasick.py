@@ -0,0 +1,67 @@
+"""Tests for the Aho-Corasick multi-literal matcher."""
+
+import random
+
+import pytest
+
+from codesdevs_log_analyzer.analyzers.aho_corasick import AhoCorasick
+
+
+class TestAhoCorasick:
+    """Tests for AhoCorasick."""
+
+    def test_labels_found(self):
+        """Test literals of several sets are found in one scan, in any case."""
+        matcher = AhoCorasick({"sql": ["union select", "'; drop"], "xss": ["<script"]})
+
+        assert matcher.find("GET /?q=1 UNION SELECT name") == {"sql"}
+        assert matcher.find("<Script>x'; DROP table") == {"sql", "xss"}
+        assert matcher.find("nothing here") == set()
+
+    def test_overlapping_literals(self):
+        """Test literals inside or overlapping others are found through failure links."""
+        matcher = AhoCorasick({"a": ["he", "hers"], "b": ["she"], "c": ["is"]})
+
+        assert matcher.find("ushers") == {"a", "b"}
+        assert matcher.find("thi") == set()
+        assert matcher.find("this") == {"c"}
+
+    def test_resume_state(self):
+        """Test scanning in chunks finds literals spanning the chunk boundary."""
+        matcher = AhoCorasick({"x": ["document.cookie"]})
+        mask, state = matcher.scan(b"read document")
+        assert mask == 0
+
+        mask, _ = matcher.scan(b".cookie now", state)
+
+        assert matcher.labels_of(mask) == {"x"}
+
+    def test_matches_substring_search(self):
+        """Test results equal per-literal substring checks on random texts."""
+        rng = random.Random(7)
+        literal_sets = {
+            str(i): [
+                "".join(rng.choice("abc-") for _ in range(rng.randint(1, 4))) for _ in range(5)
+            ]
+            for i in range(6)
+        }
+        matcher = AhoCorasick(literal_sets)
+        for _ in range(500):
+            text = "".join(rng.choice("abcd-") for _ in range(rng.randint(0, 20)))
+            expected = {
+                label
+                for label, literals in literal_sets.items()
+                if any(literal in text for literal in literals)
+            }
+            assert matcher.find(text) == expected
+
+    def test_non_ascii(self):
+        """Test literals and texts outside ASCII are matched as UTF-8."""
+        matcher = AhoCorasick({"x": ["überweisung"]})
+
+        assert matcher.find("ÜBERWEISUNG fehlgeschlagen") == {"x"}
+
+    def test_empty_literal(self):
+        """Test empty literals are rejected."""
+        with pytest.raises(ValueError, match="Empty literal"):
+            AhoCorasick({"x": [""]})
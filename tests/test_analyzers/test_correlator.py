@@ -1,16 +1,23 @@
 """Tests for correlator analyzer."""
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
 
 from codesdevs_log_analyzer.analyzers.correlator import (
     CorrelationResult,
     CorrelationWindow,
     Correlator,
+    MultiAnchorCorrelator,
     StreamingCorrelator,
     correlate_events,
 )
+from codesdevs_log_analyzer.parsers import detect_format
 from codesdevs_log_analyzer.parsers.base import ParsedLogEntry
 
+TEST_LOGS_DIR = Path(__file__).parent.parent.parent / "test_logs"
+
 
 def create_entry(
     line_number: int,
@@ -204,6 +211,7 @@ class TestCorrelator:
         assert "total_anchors" in result_dict
         assert "windows" in result_dict
         assert "common_precursors" in result_dict
+        assert "precursor_sequences" in result_dict
 
     def test_correlate_file(self, mock_parser, sample_log_file):
         """Test correlating a file directly."""
@@ -213,6 +221,134 @@ class TestCorrelator:
         assert isinstance(result, CorrelationResult)
 
 
+class TestCorrelatorIndex:
+    """Tests for the time-indexed and ring-buffer correlator modes."""
+
+    @staticmethod
+    def _entries(count: int, anchor_every: int) -> list[ParsedLogEntry]:
+        base_time = datetime(2024, 1, 15, 10, 0, 0)
+        return [
+            create_entry(
+                i,
+                "CRASH detected" if i % anchor_every == 0 else f"tick {i}",
+                base_time + timedelta(seconds=i),
+                "ERROR" if i % 7 == 0 else "INFO",
+            )
+            for i in range(1, count + 1)
+        ]
+
+    @staticmethod
+    def _lines(result: CorrelationResult) -> list[tuple[list[int], list[int], list[int]]]:
+        return [
+            (
+                [e.line_number for e in w.events_before],
+                [e.line_number for e in w.events_after],
+                [e.line_number for e in w.related_errors],
+            )
+            for w in result.windows
+        ]
+
+    def test_unordered_input(self):
+        """Test out-of-order entries land in the right window, in time order."""
+        entries = self._entries(40, anchor_every=20)
+        correlator = Correlator(anchor_pattern="CRASH", window_before=5, window_after=3)
+        for entry in reversed(entries):
+            correlator.process_entry(entry)
+
+        windows = correlator.finalize().windows
+
+        # Anchors keep input order (line 40 came first)
+        assert [w.anchor_entry.line_number for w in windows] == [40, 20]
+        assert [e.line_number for e in windows[1].events_before] == [15, 16, 17, 18, 19]
+        assert [e.line_number for e in windows[1].events_after] == [21, 22, 23]
+
+    def test_time_ordered_matches_default(self):
+        """Test the ring buffer builds the same windows as the full index."""
+        entries = self._entries(600, anchor_every=97)
+        full = Correlator(anchor_pattern="CRASH", window_before=30, window_after=20)
+        ring = Correlator(
+            anchor_pattern="CRASH", window_before=30, window_after=20, time_ordered=True
+        )
+        for entry in entries:
+            full.process_entry(entry)
+            ring.process_entry(entry)
+
+        full_result, ring_result = full.finalize(), ring.finalize()
+
+        assert len(ring_result.windows) == 6
+        assert self._lines(ring_result) == self._lines(full_result)
+        assert ring_result.common_precursors == full_result.common_precursors
+
+    def test_time_ordered_bounded_memory(self):
+        """Test the ring buffer holds about one window of entries, not the file."""
+        correlator = Correlator(
+            anchor_pattern="CRASH", window_before=60, window_after=30, time_ordered=True
+        )
+        peak = 0
+        for entry in self._entries(20000, anchor_every=1500):
+            correlator.process_entry(entry)
+            peak = max(peak, len(correlator._index))
+
+        result = correlator.finalize()
+
+        assert len(result.windows) == 10
+        assert peak <= 60 + 30 + 2
+        assert len(result.windows[0].events_before) == 60
+
+    def test_aware_timestamps(self):
+        """Test timezone-aware timestamps are indexed by their instant."""
+        utc = datetime(2024, 1, 15, 10, 0, 0, tzinfo=timezone.utc)
+        plus_two = timezone(timedelta(hours=2))
+        correlator = Correlator(anchor_pattern="CRASH", window_before=10, window_after=10)
+        correlator.process_entry(create_entry(1, "before", (utc - timedelta(seconds=5)).astimezone(plus_two)))
+        correlator.process_entry(create_entry(2, "CRASH", utc))
+        correlator.process_entry(create_entry(3, "too late", utc + timedelta(seconds=11)))
+
+        window = correlator.finalize().windows[0]
+
+        assert [e.line_number for e in window.events_before] == [1]
+        assert window.events_after == []
+
+
+class TestSampleLogPrecursors:
+    """Tests for common precursors on the bundled sample logs."""
+
+    @pytest.mark.parametrize("correlator_class", [Correlator, StreamingCorrelator])
+    @pytest.mark.parametrize(
+        ("file_name", "expected"),
+        [
+            (
+                "java_app.log",
+                [
+                    "Starting application",
+                    "Loading configuration",
+                    "User authenticated: user@example.com",
+                    "Cache miss for key: user:<N>",
+                ],
+            ),
+            (
+                "python_app.log",
+                [
+                    "Application starting",
+                    "Loading config from /etc/myapp/config.yaml",
+                    "Connected to database",
+                    "Rate limit approaching for user <N>",
+                    "Processing complete",
+                ],
+            ),
+        ],
+    )
+    def test_support_over_every_anchor(self, correlator_class, file_name, expected):
+        """Test support counts anchors without a timestamp and skips the anchors themselves."""
+        file_path = str(TEST_LOGS_DIR / file_name)
+        parser, _ = detect_format(file_path)
+        correlator = correlator_class(anchor_pattern="exception|fail", regex=True)
+
+        result = correlator.correlate_file(parser, file_path)
+
+        assert result.common_precursors == expected
+
+
 class TestStreamingCorrelator:
     """Tests for StreamingCorrelator class."""
 
@@ -292,6 +428,157 @@ class TestStreamingCorrelator:
         # But shouldn't have stored all 1000 entries
         # (The sliding window should have limited memory usage)
 
+    def test_streaming_matches_correlator(self):
+        """Test streaming windows, precursors and causal chains match Correlator."""
+        entries = TestCorrelatorIndex._entries(600, anchor_every=97)
+        # Same-second entries around an anchor split into before/after alike
+        entries.insert(193, create_entry(1000, "same second", entries[193].timestamp, "WARN"))
+        full = Correlator(anchor_pattern="CRASH", window_before=30, window_after=20)
+        streaming = StreamingCorrelator(anchor_pattern="CRASH", window_before=30, window_after=20)
+        for entry in entries:
+            full.process_entry(entry)
+            streaming.process_entry(entry)
+
+        full_result, streaming_result = full.finalize(), streaming.finalize()
+
+        assert TestCorrelatorIndex._lines(streaming_result) == TestCorrelatorIndex._lines(full_result)
+        assert streaming_result.common_precursors == full_result.common_precursors
+        assert streaming_result.precursor_sequences == full_result.precursor_sequences
+        assert streaming_result.causal_chain_detected == full_result.causal_chain_detected
+        assert streaming_result.root_cause_summary == full_result.root_cause_summary
+        assert [sorted(w.unique_sources) for w in streaming_result.windows] == [
+            sorted(w.unique_sources) for w in full_result.windows
+        ]
+
+    def test_streaming_out_of_order(self):
+        """Test late pre-anchor entries count as before-events, as in Correlator."""
+        base = datetime(2024, 1, 15, 10, 0, 0)
+        events = [(0, "a"), (10, "CRASH"), (5, "b"), (20, "c"), (8, "d"), (-100, "stale")]
+
+        results = []
+        for correlator in (
+            Correlator(anchor_pattern="CRASH", window_before=60, window_after=30),
+            StreamingCorrelator(anchor_pattern="CRASH", window_before=60, window_after=30),
+        ):
+            for i, (offset, message) in enumerate(events, 1):
+                correlator.process_entry(create_entry(i, message, base + timedelta(seconds=offset)))
+            window = correlator.finalize().windows[0]
+            results.append(
+                (
+                    [e.message for e in window.events_before],
+                    [e.message for e in window.events_after],
+                )
+            )
+
+        assert results[1] == results[0] == (["a", "b", "d"], ["c"])
+
+    def test_mixed_timezone_awareness(self):
+        """Test naive (taken as UTC) and tz-aware timestamps share one timeline."""
+        base = datetime(2024, 1, 15, 10, 0, 0)
+        plus_two = timezone(timedelta(hours=2))
+        entries = [
+            create_entry(1, "a", base),
+            create_entry(2, "b", (base + timedelta(seconds=5)).replace(tzinfo=timezone.utc)),
+            create_entry(3, "CRASH", base + timedelta(seconds=10)),
+            create_entry(4, "c", (base + timedelta(hours=2, seconds=20)).replace(tzinfo=plus_two)),
+            create_entry(5, "d", base + timedelta(seconds=8)),
+        ]
+
+        results = []
+        for correlator in (
+            Correlator(anchor_pattern="CRASH", window_before=60, window_after=30),
+            StreamingCorrelator(anchor_pattern="CRASH", window_before=60, window_after=30),
+        ):
+            for entry in entries:
+                correlator.process_entry(entry)
+            window = correlator.finalize().windows[0]
+            results.append(
+                (
+                    [e.message for e in window.events_before],
+                    [e.message for e in window.events_after],
+                )
+            )
+
+        assert results[1] == results[0] == (["a", "b", "d"], ["c"])
+
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_mixed_timezone_sample_log(self, streaming):
+        """Test generic.log, whose stamps are naive, local and UTC, correlates without error."""
+        file_path = str(TEST_LOGS_DIR / "generic.log")
+        parser, _ = detect_format(file_path)
+
+        result = correlate_events(
+            parser, file_path, anchor_pattern="timeout", streaming=streaming
+        )
+
+        assert result.total_anchors == 0
+
+    def test_streaming_buffer_bounded(self):
+        """Test the buffer holds one before-window and stops once all windows are taken."""
+        correlator = StreamingCorrelator(anchor_pattern="CRASH", window_before=60, window_after=30)
+        peak = 0
+        entries = TestCorrelatorIndex._entries(20000, anchor_every=1500)
+        for entry in entries:
+            correlator.process_entry(entry)
+            peak = max(peak, len(correlator._buffer))
+
+        result = correlator.finalize()
+
+        assert len(result.windows) == 10
+        assert peak <= 61
+        assert not correlator._buffer
+        assert [w.anchor_entry.line_number for w in result.windows] == list(range(1500, 15001, 1500))
+
+
+class TestMultiAnchorCorrelator:
+    """Tests for MultiAnchorCorrelator."""
+
+    @staticmethod
+    def _entries() -> list[ParsedLogEntry]:
+        entries = TestCorrelatorIndex._entries(900, anchor_every=97)
+        base_time = entries[0].timestamp
+        for i in range(130, 900, 150):
+            entries[i - 1] = create_entry(i, f"OOMKilled pod {i}", base_time + timedelta(seconds=i - 1), "ERROR")
+        return entries
+
+    def test_matches_separate_runs(self):
+        """Test each named result equals a StreamingCorrelator run of its pattern alone."""
+        anchors = {"crash": "CRASH", "oom": r"OOMKilled pod \d+", "none": "never logged"}
+        entries = self._entries()
+
+        multi = MultiAnchorCorrelator(anchors, window_before=30, window_after=20, max_anchors=4)
+        result = multi.correlate_entries(iter(entries))
+
+        assert list(result.anchors) == ["crash", "oom", "none"]
+        for name, pattern in anchors.items():
+            single = StreamingCorrelator(
+                anchor_pattern=pattern, window_before=30, window_after=20, max_anchors=4
+            ).correlate_entries(iter(entries))
+            combined = result.anchors[name]
+            assert combined.anchor_pattern == pattern
+            assert combined.total_anchors == single.total_anchors
+            assert TestCorrelatorIndex._lines(combined) == TestCorrelatorIndex._lines(single)
+            assert combined.common_precursors == single.common_precursors
+        assert result.anchors["none"].total_anchors == 0
+        assert result.to_dict()["anchors"]["oom"]["total_anchors"] == 6
+
+    def test_uncombinable_patterns(self):
+        """Test patterns that cannot share one alternation are still matched."""
+        multi = MultiAnchorCorrelator({"a": r"(?P<w>CRASH)", "b": r"(?P<w>OOM)\w+"})
+        assert multi._prefilter is None
+
+        result = multi.correlate_entries(iter(self._entries()))
+
+        assert result.anchors["a"].total_anchors == 9
+        assert result.anchors["b"].total_anchors == 6
+
+    def test_rejects_empty_and_invalid(self):
+        """Test an empty anchor set and invalid regexes raise ValueError."""
+        with pytest.raises(ValueError, match="anchor"):
+            MultiAnchorCorrelator({})
+        with pytest.raises(ValueError, match="Invalid regex"):
+            MultiAnchorCorrelator({"bad": "[unclosed"})
+
 
 class TestCorrelationWindow:
     """Tests for CorrelationWindow dataclass."""
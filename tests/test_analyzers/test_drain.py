@@ -0,0 +1,149 @@
+"""Tests for the Drain template miner and drain error grouping."""
+
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+from codesdevs_log_analyzer import log_analyzer_diff, log_analyzer_extract_errors
+from codesdevs_log_analyzer.analyzers import DrainMiner, ErrorExtractor, PatternSuggester
+from codesdevs_log_analyzer.analyzers.drain import WILDCARD, template_pattern
+from codesdevs_log_analyzer.parsers import PythonLogParser
+
+
+def _python_log(path: Path, messages: list[str]) -> Path:
+    path.write_text(
+        "".join(
+            f"2026-01-15 10:30:{i:02d},000 - app - ERROR - {message}\n"
+            for i, message in enumerate(messages)
+        )
+    )
+    return path
+
+
+class TestDrainMiner:
+    """Tests for DrainMiner."""
+
+    def test_variable_words_become_wildcards(self) -> None:
+        """Test messages differing in unmasked words join one template."""
+        miner = DrainMiner()
+        first = miner.add("Login failed for user alice from 10.0.0.5")
+        second = miner.add("Login failed for user bob from 10.0.0.7")
+
+        assert first is second
+        assert second.size == 2
+        assert second.template == f"Login failed for user {WILDCARD} from <IP>"
+
+    def test_different_messages_stay_apart(self) -> None:
+        """Test unrelated messages and different token counts get their own templates."""
+        miner = DrainMiner()
+        miner.add("Connection refused by upstream")
+        miner.add("Disk quota exceeded on volume")
+        miner.add("Connection refused by upstream db-1 now")
+
+        assert len(miner.clusters) == 3
+
+    def test_match_does_not_learn(self) -> None:
+        """Test match finds templates without creating or generalizing them."""
+        miner = DrainMiner()
+        cluster = miner.add("Queue orders is full")
+
+        assert miner.match("Queue payments is full") is cluster
+        assert cluster.template == "Queue orders is full"
+        assert miner.match("Nothing like it at all here") is None
+        assert len(miner.clusters) == 1
+
+    def test_max_clusters_evicts_least_recent(self) -> None:
+        """Test the template count stays bounded, forgetting the least recently matched."""
+        miner = DrainMiner(max_clusters=2)
+        kept = miner.add("alpha event happened")
+        miner.add("beta thing broke down badly")
+        miner.add("alpha event happened")
+        miner.add("gamma")
+
+        assert len(miner.clusters) == 2
+        assert miner.get(kept.cluster_id) is kept
+        assert miner.match("beta thing broke down badly") is None
+
+    def test_rejects_shallow_tree(self) -> None:
+        """Test depths below 3 are rejected."""
+        with pytest.raises(ValueError, match="depth"):
+            DrainMiner(depth=2)
+
+    def test_template_pattern(self) -> None:
+        """Test placeholders match any token and the rest is escaped."""
+        pattern = template_pattern(f"Job {WILDCARD} failed (code <N>)")
+
+        assert re.search(pattern, "Job export failed (code 42)")
+        assert not re.search(pattern, "Job export failed code 42")
+
+
+class TestDrainGrouping:
+    """Tests for drain grouping in the error extractor, suggester and tools."""
+
+    MESSAGES = [
+        "Permission denied for user alice on bucket reports",
+        "Permission denied for user bob on bucket invoices",
+        "Permission denied for user carol on bucket reports",
+        "Database connection lost",
+    ]
+
+    def test_extractor_groups_by_template(self, tmp_path: Path) -> None:
+        """Test drain grouping merges errors regex grouping keeps apart."""
+        path = _python_log(tmp_path / "app.log", self.MESSAGES)
+        parser = PythonLogParser()
+
+        regex = ErrorExtractor().analyze_file(parser, str(path))
+        drain = ErrorExtractor(grouping="drain").analyze_file(parser, str(path))
+
+        assert regex.unique_errors == 4
+        assert drain.unique_errors == 2
+        top = drain.error_groups[0]
+        assert top.count == 3
+        assert top.template == f"Permission denied for user {WILDCARD} on bucket {WILDCARD}"
+        assert top.cluster_id is not None
+
+    def test_unknown_grouping(self) -> None:
+        """Test unknown grouping strategies are rejected."""
+        with pytest.raises(ValueError, match="grouping"):
+            ErrorExtractor(grouping="fuzzy")
+        with pytest.raises(ValueError, match="grouping"):
+            PatternSuggester(grouping="fuzzy")
+
+    def test_suggester_pattern_matches_messages(self, tmp_path: Path) -> None:
+        """Test suggested drain templates are searchable regexes."""
+        path = _python_log(tmp_path / "app.log", self.MESSAGES)
+        result = PatternSuggester(grouping="drain").analyze_file(
+            str(path), PythonLogParser(), focus="errors"
+        )
+
+        errors = [s for s in result.patterns if s.category == "error"]
+        assert errors
+        assert errors[0].match_count == 3
+        assert all(re.search(errors[0].pattern, message) for message in self.MESSAGES[:3])
+
+    def test_extract_errors_tool(self, tmp_path: Path) -> None:
+        """Test the tool passes grouping through and rejects unknown values."""
+        path = str(_python_log(tmp_path / "app.log", self.MESSAGES))
+
+        data = json.loads(
+            log_analyzer_extract_errors(path, grouping="drain", response_format="json")
+        )
+        assert data["unique_errors"] == 2
+        assert log_analyzer_extract_errors(path, grouping="fuzzy").startswith("Error:")
+
+    def test_diff_shares_templates(self, tmp_path: Path) -> None:
+        """Test both sides of a diff are mined into the same templates."""
+        before = _python_log(tmp_path / "a.log", self.MESSAGES[:2])
+        after = _python_log(tmp_path / "b.log", [self.MESSAGES[2], "Cache miss storm detected"])
+
+        data = json.loads(
+            log_analyzer_diff(str(before), str(after), grouping="drain", response_format="json")
+        )
+
+        assert data["summary"]["errors_in_a"] == 1
+        assert [e["pattern"] for e in data["new_errors"]] == ["Cache miss storm detected"]
+        assert data["resolved_errors"] == []
+        assert data["changed_errors"][0]["before"] == 2
+        assert data["changed_errors"][0]["after"] == 1
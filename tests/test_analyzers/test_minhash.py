@@ -0,0 +1,153 @@
+"""Tests for MinHash/LSH near-duplicate merging."""
+
+from datetime import datetime
+
+import pytest
+
+from codesdevs_log_analyzer.analyzers import minhash
+from codesdevs_log_analyzer.analyzers.error_extractor import MAX_VARIANTS, ErrorExtractor
+from codesdevs_log_analyzer.analyzers.minhash import MAX_BUCKET_PROBES, MinHashLSH, _bands_for
+from codesdevs_log_analyzer.parsers.base import ParsedLogEntry
+
+
+def _error(message: str, line: int = 1) -> ParsedLogEntry:
+    return ParsedLogEntry(
+        line_number=line,
+        raw_line=message,
+        timestamp=datetime(2026, 1, 15, 10, 30, line % 60),
+        level="ERROR",
+        message=message,
+    )
+
+
+class TestMinHashLSH:
+    """Tests for MinHashLSH."""
+
+    def test_near_duplicates_cluster(self) -> None:
+        """Test texts differing in one token share a cluster, others stay apart."""
+        lsh = MinHashLSH(threshold=0.6)
+        clusters = lsh.cluster(
+            [
+                "Queue orders is full",
+                "Disk quota exceeded on volume data",
+                "Queue billing is full",
+                "Queue billing is full",
+            ]
+        )
+
+        assert clusters == [[0, 2, 3], [1]]
+
+    def test_transitive_merge(self) -> None:
+        """Test chains of near-duplicates end in one cluster."""
+        texts = [
+            "a b c d e f g h",
+            "a b c d e f g X",
+            "a b c d e f Y X",
+        ]
+        assert MinHashLSH(threshold=0.7).cluster(texts) == [[0, 1, 2]]
+
+    def test_signature_reproducible(self) -> None:
+        """Test signatures are deterministic (no per-process hash seed)."""
+        tokens = frozenset(["Connection", "refused", "by", "upstream"])
+        assert MinHashLSH().signature(tokens) == MinHashLSH().signature(tokens)
+
+    def test_bands_below_threshold(self) -> None:
+        """Test the banding makes pairs at the threshold likely candidates."""
+        bands, rows = _bands_for(0.6, 128)
+        assert bands * rows == 128
+        assert 1 - (1 - 0.6**rows) ** bands >= 0.95
+        # Dissimilar pairs rarely collide
+        assert 1 - (1 - 0.2**rows) ** bands < 0.1
+
+    def test_many_variants_linear(self) -> None:
+        """Test thousands of one-token variants collapse into their base templates."""
+        bases = [
+            "service failed to refresh token cache entry for",
+            "disk quota exceeded on volume while writing segment",
+            "connection reset by peer during tls handshake with",
+            "scheduler skipped job because previous run still active",
+            "invalid signature on webhook payload rejected from",
+        ]
+        texts = [f"{base} user{i}" for i in range(2000) for base in bases]
+
+        assert len(MinHashLSH().cluster(texts)) == len(bases)
+
+    def test_full_bucket_takes_new_members(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test templates past the probe cap still join buckets and find each other."""
+        lsh = MinHashLSH(threshold=0.6)
+        # Every template collides in every band
+        monkeypatch.setattr(lsh, "signature", lambda tokens: (0,) * lsh.num_perm)
+        calls = []
+        jaccard = minhash._jaccard
+
+        def counted(a: frozenset[str], b: frozenset[str]) -> float:
+            calls.append((a, b))
+            return jaccard(a, b)
+
+        monkeypatch.setattr(minhash, "_jaccard", counted)
+        distinct = [f"w{i}a w{i}b w{i}c w{i}d" for i in range(MAX_BUCKET_PROBES + 4)]
+        texts = [*distinct, "Queue orders is full", "Queue billing is full"]
+
+        clusters = lsh.cluster(texts)
+
+        assert len(clusters) == len(distinct) + 1
+        assert clusters[-1] == [len(texts) - 2, len(texts) - 1]
+        assert len(calls) <= MAX_BUCKET_PROBES * len(texts)
+
+    @pytest.mark.parametrize("threshold", [0, 1.5])
+    def test_invalid_threshold(self, threshold: float) -> None:
+        """Test thresholds outside (0, 1] are rejected."""
+        with pytest.raises(ValueError, match="threshold"):
+            MinHashLSH(threshold=threshold)
+
+
+class TestErrorExtractorMerge:
+    """Tests for near-duplicate merging in ErrorExtractor."""
+
+    def test_merges_variants(self) -> None:
+        """Test merged groups sum counts and report their variants."""
+        extractor = ErrorExtractor(merge_threshold=0.6)
+        messages = [
+            "Permission denied for user alice on reports",
+            "Permission denied for user alice on reports",
+            "Permission denied for user bob on reports",
+            "Permission denied for user carol on reports",
+            "Database connection lost",
+        ]
+        for i, message in enumerate(messages, 1):
+            extractor.process_entry(_error(message, i))
+        result = extractor.finalize()
+
+        assert result.unique_errors == 2
+        top = result.error_groups[0]
+        assert top.count == 4
+        assert top.template == "Permission denied for user alice on reports"
+        assert top.variant_count == 2
+        assert sorted(top.variants) == [
+            "Permission denied for user bob on reports",
+            "Permission denied for user carol on reports",
+        ]
+        assert top.first_seen == datetime(2026, 1, 15, 10, 30, 1)
+        assert top.last_seen == datetime(2026, 1, 15, 10, 30, 4)
+        assert result.to_dict()["error_groups"][0]["variant_count"] == 2
+
+    def test_max_errors_after_merge(self) -> None:
+        """Test groups beyond max_errors are tracked so they can be merged first."""
+        extractor = ErrorExtractor(max_errors=1, merge_threshold=0.6)
+        for i in range(MAX_VARIANTS + 5):
+            extractor.process_entry(_error(f"Cache refresh failed for tenant t{i} region eu", i))
+        extractor.process_entry(_error("Database connection lost", 99))
+        result = extractor.finalize()
+
+        assert result.unique_errors == 2
+        assert len(result.error_groups) == 1
+        assert result.error_groups[0].count == MAX_VARIANTS + 5
+        assert result.error_groups[0].variant_count == MAX_VARIANTS + 4
+        assert len(result.error_groups[0].variants) == MAX_VARIANTS
+
+    def test_disabled_by_default(self) -> None:
+        """Test near-duplicates stay separate unless merging is enabled."""
+        extractor = ErrorExtractor()
+        for user in ("alice", "bob"):
+            extractor.process_entry(_error(f"Permission denied for user {user} on reports"))
+        assert extractor.finalize().unique_errors == 2
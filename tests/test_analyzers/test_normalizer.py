@@ -0,0 +1,63 @@
+"""Tests for the shared message normalizer."""
+
+import pytest
+
+from codesdevs_log_analyzer.analyzers.normalizer import (
+    ERROR_PATTERNS,
+    MAX_MEMO_LENGTH,
+    PRECURSOR_TEMPLATES,
+    SUGGESTION_TEMPLATES,
+    MessageNormalizer,
+)
+
+
+class TestMessageNormalizer:
+    """Tests for MessageNormalizer."""
+
+    def test_single_pass_tokens(self) -> None:
+        """Test every selected token kind is replaced in one pass."""
+        normalizer = MessageNormalizer(("uuid", "ip", "time", "number"))
+        message = "req 550e8400-e29b-41d4-a716-446655440000 from 10.0.0.5 at 10:30:00 took  42 ms"
+
+        assert normalizer(message) == "req <UUID> from <IP> at <TIME> took <N> ms"
+
+    def test_priority_ignores_argument_order(self) -> None:
+        """Test longer tokens win over numbers whatever order they are given in."""
+        normalizer = MessageNormalizer(("number", "uuid"))
+        assert normalizer("id 550e8400-e29b-41d4-a716-446655440000") == "id <UUID>"
+
+    def test_codes_kept(self) -> None:
+        """Test protected error codes are kept while other numbers are replaced."""
+        normalizer = MessageNormalizer(("code", "number"))
+        assert normalizer("HTTP 503 after 12345 ms, E1234") == "HTTP 503 after <N> ms, E1234"
+
+    def test_quoted_values(self) -> None:
+        """Test quoted values keep their quote style."""
+        assert SUGGESTION_TEMPLATES("""Missing 'user_id' in "payload" """) == (
+            "Missing '<VAL>' in \"<VAL>\""
+        )
+
+    def test_truncation(self) -> None:
+        """Test templates longer than max_length are cut and marked."""
+        result = PRECURSOR_TEMPLATES("x" * 150)
+        assert result == "x" * 100 + "..."
+
+    def test_hex_before_numbers(self) -> None:
+        """Test hex values and UUIDs are not broken up by the number token."""
+        assert ERROR_PATTERNS("at 0x7fff5f uuid 550e8400-e29b-41d4-a716-446655440000") == (
+            "at <HEX> uuid <UUID>"
+        )
+
+    def test_memoized(self) -> None:
+        """Test repeated messages are served from the memo."""
+        normalizer = MessageNormalizer(("number",))
+        assert normalizer("retry 1") == normalizer("retry 1") == "retry <N>"
+
+        normalizer("n " * MAX_MEMO_LENGTH)
+        info = normalizer._memo.cache_info()  # type: ignore[attr-defined]
+        assert (info.hits, info.currsize) == (1, 1)
+
+    def test_unknown_token(self) -> None:
+        """Test unknown token names are rejected."""
+        with pytest.raises(ValueError, match="bogus"):
+            MessageNormalizer(("number", "bogus"))
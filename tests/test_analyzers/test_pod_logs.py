@@ -0,0 +1,224 @@
+"""Tests for the pod log directory analyzer."""
+
+import gzip
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from codesdevs_log_analyzer import log_analyzer_pod_logs
+from codesdevs_log_analyzer.analyzers.pod_logs import (
+    PodLogAnalyzer,
+    PodLogFile,
+    find_pod_logs,
+    parse_pod_log_path,
+)
+from codesdevs_log_analyzer.parsers import BaseLogParser, DockerParser
+
+APP_LINES = [
+    "2026-01-15 10:30:00,123 - app.api - INFO - Request handled",
+    "2026-01-15 10:30:01,456 - app.db - ERROR - Connection refused to 10.0.0.5",
+    "2026-01-15 10:30:02,789 - app.api - WARNING - Slow response",
+    "2026-01-15 10:30:03,012 - app.db - ERROR - Connection refused to 10.0.0.6",
+]
+
+
+def _cri(lines: list[str], stream: str = "stdout") -> str:
+    """Wrap application lines in CRI records."""
+    return "".join(
+        f"2026-01-15T10:30:0{i}.123456789Z {stream} F {line}\n" for i, line in enumerate(lines)
+    )
+
+
+def _write(root: Path, pod_dir: str, container: str, name: str, text: str) -> Path:
+    path = root / pod_dir / container / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if name.endswith(".gz"):
+        with gzip.open(path, "wt") as f:
+            f.write(text)
+    else:
+        path.write_text(text)
+    return path
+
+
+@pytest.fixture
+def pod_tree(tmp_path: Path) -> Path:
+    """Two replicas of a web pod (one restarted) and a worker pod."""
+    root = tmp_path / "pods"
+    _write(root, "prod_web-7d9f-abcde_0a1b2c3d", "app", "0.log", _cri(APP_LINES))
+    _write(root, "prod_web-7d9f-abcde_0a1b2c3d", "app", "1.log", _cri(APP_LINES[:2]))
+    _write(
+        root, "prod_web-7d9f-abcde_0a1b2c3d", "app", "0.log.20260115-103000.gz", _cri(APP_LINES[:1])
+    )
+    _write(root, "prod_web-7d9f-fghij_4e5f6a7b", "app", "0.log", _cri(APP_LINES[:3]))
+    jsonl = "".join(
+        json.dumps({"timestamp": "2026-01-15T10:30:00Z", "level": level, "message": "job"}) + "\n"
+        for level in ("info", "error", "info")
+    )
+    _write(root, "jobs_worker-1_8c9d0e1f", "worker", "0.log", _cri(jsonl.splitlines()))
+    # Not part of the layout
+    (root / "README").write_text("not a log\n")
+    _write(root, "stray", "app", "0.log", _cri(APP_LINES))
+    return root
+
+
+class TestPodLogPaths:
+    """Tests for reading pod identity from paths."""
+
+    def test_parse_path(self) -> None:
+        """Test namespace, pod, uid, container and restart are read from the path."""
+        log = parse_pod_log_path("/var/log/pods/prod_web-7d9f-abcde_0a1b-2c3d/app/3.log")
+
+        assert log is not None
+        assert (log.namespace, log.pod, log.uid, log.container, log.restart) == (
+            "prod",
+            "web-7d9f-abcde",
+            "0a1b-2c3d",
+            "app",
+            3,
+        )
+        assert log.container_key == "prod/web-7d9f-abcde/app"
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "/var/log/pods/prod_web_uid/app/0.log.20260115-103000",
+            "/var/log/pods/prod_web_uid/app/0.log.20260115-103000.gz",
+        ],
+    )
+    def test_parse_rotated_path(self, path: str) -> None:
+        """Test kubelet-rotated files belong to the same container."""
+        log = parse_pod_log_path(path)
+        assert log is not None
+        assert log.container == "app"
+
+    @pytest.mark.parametrize(
+        "path",
+        ["/var/log/pods/web/app/0.log", "/var/log/pods/prod_web_uid/app/app.log", "0.log"],
+    )
+    def test_parse_other_paths(self, path: str) -> None:
+        """Test paths outside the layout are rejected."""
+        assert parse_pod_log_path(path) is None
+
+    def test_find_with_filters(self, pod_tree: Path) -> None:
+        """Test the walk finds only laid-out files and applies globs."""
+        assert len(find_pod_logs(str(pod_tree))) == 5
+        assert len(find_pod_logs(str(pod_tree), namespace="prod")) == 4
+        assert len(find_pod_logs(str(pod_tree), pod="web-*-fghij")) == 1
+        assert len(find_pod_logs(str(pod_tree), container="worker")) == 1
+
+
+class TestPodLogAnalyzer:
+    """Tests for PodLogAnalyzer."""
+
+    def test_aggregates_per_pod_and_container(self, pod_tree: Path) -> None:
+        """Test counts roll up from files to containers and pods."""
+        result = PodLogAnalyzer(max_workers=4).analyze(str(pod_tree))
+
+        assert result.files == 5
+        assert not result.failed
+        assert set(result.pods) == {"prod/web-7d9f-abcde", "prod/web-7d9f-fghij", "jobs/worker-1"}
+
+        web = result.containers["prod/web-7d9f-abcde/app"]
+        assert web.files == 3
+        assert web.entries == 7
+        assert web.errors == 3
+        assert web.warnings == 1
+        assert web.restarts == 1
+        assert result.pods["prod/web-7d9f-abcde"].restarts == 1
+        assert result.total.entries == 7 + 3 + 3
+
+    def test_reuses_detected_parser(self, pod_tree: Path) -> None:
+        """Test the format is detected once per namespace and container name."""
+        result = PodLogAnalyzer().analyze(str(pod_tree))
+
+        # prod/app and jobs/worker
+        assert result.detections == 2
+
+    def test_files_do_not_share_parsers(
+        self, pod_tree: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test each file gets its own parser and inner parser."""
+        parsers: list[BaseLogParser] = []
+        analyze_job = PodLogAnalyzer._analyze_job
+
+        def record(self: PodLogAnalyzer, job: tuple[PodLogFile, BaseLogParser]) -> Any:
+            parsers.append(job[1])
+            return analyze_job(self, job)
+
+        monkeypatch.setattr(PodLogAnalyzer, "_analyze_job", record)
+        PodLogAnalyzer().analyze(str(pod_tree), namespace="prod")
+
+        assert len(parsers) == 4
+        inner = [parser.inner for parser in parsers if isinstance(parser, DockerParser)]
+        assert len(inner) == 4
+        assert all(parser is not None for parser in inner)
+        assert len({id(parser) for parser in parsers}) == 4
+        assert len({id(parser) for parser in inner}) == 4
+
+    def test_inner_format_levels(self, pod_tree: Path) -> None:
+        """Test application levels inside CRI records are used, not the stream."""
+        result = PodLogAnalyzer().analyze(str(pod_tree))
+
+        worker = result.containers["jobs/worker-1/worker"]
+        assert worker.errors == 1
+        web = result.containers["prod/web-7d9f-fghij/app"]
+        assert web.levels["INFO"] == 1
+        assert web.formats == {"docker"}
+
+    def test_error_patterns_normalized(self, pod_tree: Path) -> None:
+        """Test errors differing only in variables share a pattern."""
+        result = PodLogAnalyzer().analyze(str(pod_tree), namespace="prod")
+
+        patterns = result.pods["prod/web-7d9f-abcde"].error_patterns
+        assert len(patterns) == 1
+        assert next(iter(patterns.values())) == 3
+
+    def test_mixed_timezone_awareness(self, tmp_path: Path) -> None:
+        """Test naive and tz-aware timestamps in one pod merge as UTC."""
+        pod_dir = "prod_web-7d9f-abcde_0a1b2c3d"
+        _write(tmp_path, pod_dir, "proxy", "0.log", _cri(["plain startup line"]))
+        _write(tmp_path, pod_dir, "app", "0.log", "\n".join(APP_LINES) + "\n")
+
+        result = PodLogAnalyzer().analyze(str(tmp_path))
+
+        assert not result.failed
+        pod = result.pods["prod/web-7d9f-abcde"]
+        assert pod.time_start is not None and pod.time_end is not None
+        assert pod.time_start.tzinfo is None
+        assert pod.time_end.tzinfo is None
+
+    def test_max_files(self, pod_tree: Path) -> None:
+        """Test the file cap applies before parsing."""
+        result = PodLogAnalyzer(max_files=2).analyze(str(pod_tree))
+        assert result.files == 2
+        assert sum(stats.files for stats in result.containers.values()) == 2
+
+
+class TestPodLogsTool:
+    """Tests for the log_analyzer_pod_logs tool."""
+
+    def test_markdown(self, pod_tree: Path) -> None:
+        """Test the markdown report lists pods and containers."""
+        output = log_analyzer_pod_logs(str(pod_tree))
+
+        assert "## Pod Log Analysis" in output
+        assert "prod/web-7d9f-abcde/app" in output
+        assert "jobs/worker-1" in output
+
+    def test_json(self, pod_tree: Path) -> None:
+        """Test the JSON report has per-pod and per-container results."""
+        data = json.loads(log_analyzer_pod_logs(str(pod_tree), response_format="json"))
+
+        assert data["files"] == 5
+        assert data["containers"]["prod/web-7d9f-abcde/app"]["restarts"] == 1
+        assert data["pods"]["jobs/worker-1"]["errors"] == 1
+
+    def test_missing_directory(self, tmp_path: Path) -> None:
+        """Test a missing directory is reported."""
+        assert log_analyzer_pod_logs(str(tmp_path / "missing")).startswith("Error:")
+
+    def test_empty_directory(self, tmp_path: Path) -> None:
+        """Test a directory without pod logs is reported."""
+        assert "No pod logs found" in log_analyzer_pod_logs(str(tmp_path))
@@ -0,0 +1,103 @@
+"""Tests for precursor sequence mining."""
+
+from datetime import timedelta
+
+from codesdevs_log_analyzer.analyzers.precursors import PrecursorMiner
+
+SECOND = 1_000_000  # Miner times are microseconds since the epoch
+
+
+def _feed(miner: PrecursorMiner, count: int, steps: dict[int, str], key: str = "") -> None:
+    """One event per second; every 300 seconds the steps (by offset) lead to a crash."""
+    for i in range(count):
+        timestamp = i * SECOND
+        offset = i % 300
+        if offset == 299:
+            miner.mark_anchor(timestamp, key)
+            message = "Application CRASH"
+        else:
+            message = steps.get(offset, f"heartbeat from worker {i % 7} took {i % 13} ms")
+        miner.add(timestamp, message)
+
+
+class TestPrecursorMiner:
+    """Tests for PrecursorMiner."""
+
+    def test_finds_ordered_sequence(self):
+        """Test the steps leading to anchors rank first and background noise is left out."""
+        miner = PrecursorMiner(window_before=timedelta(seconds=60))
+        _feed(miner, 6000, {250: "disk 95% full", 270: "write to segment 4 failed"})
+
+        sequences = miner.sequences()
+
+        assert sequences[0].templates == ["disk <N>% full", "write to segment <N> failed"]
+        assert sequences[0].support == 1.0
+        assert sequences[0].lift > 4  # Background: ~40 of every 300 windows
+        assert all("heartbeat" not in t for s in sequences for t in s.templates)
+        assert ["write to segment <N> failed", "disk <N>% full"] not in [
+            s.templates for s in sequences
+        ]
+
+    def test_triples(self):
+        """Test three steps in order are reported as one sequence."""
+        miner = PrecursorMiner(window_before=timedelta(seconds=60))
+        _feed(miner, 6000, {250: "queue backlog growing", 260: "GC pause", 280: "OOM"})
+
+        templates = [s.templates for s in miner.sequences()]
+
+        assert ["queue backlog growing", "GC pause", "OOM"] in templates
+
+    def test_common_precursors(self):
+        """Test single templates before most anchors are reported, most common first."""
+        miner = PrecursorMiner(window_before=timedelta(seconds=60))
+        _feed(miner, 3000, {250: "Memory warning"})
+
+        assert miner.common_precursors()[0] == "heartbeat from worker <N> took <N> ms"
+        assert "Memory warning" in miner.common_precursors()
+        assert miner.common_precursors("other") == []
+        assert miner.sequences("other") == []
+
+    def test_support_counts_every_anchor(self):
+        """Test anchors without a timestamp count as windows without precursors."""
+        miner = PrecursorMiner(window_before=timedelta(seconds=60))
+        miner.add(0, "disk 95% full")
+        miner.mark_anchor(SECOND, "crash")
+        miner.add(SECOND, "Application CRASH")
+        miner.mark_anchor(None, "crash")
+        miner.mark_anchor(None, "crash")
+
+        assert miner.common_precursors("crash") == []
+
+    def test_anchor_not_own_precursor(self):
+        """Test earlier anchors of the same key are left out of later windows."""
+        miner = PrecursorMiner(window_before=timedelta(seconds=60))
+        for i in range(3):
+            miner.add(i * 10 * SECOND, "disk 95% full")
+            miner.mark_anchor(i * 10 * SECOND + SECOND, "crash")
+            miner.add(i * 10 * SECOND + SECOND, "Application CRASH")
+
+        assert miner.common_precursors("crash") == ["disk <N>% full"]
+        # Another key still sees them
+        miner.mark_anchor(40 * SECOND, "other")
+        assert "Application CRASH" in miner.common_precursors("other")
+
+    def test_bounded_memory(self):
+        """Test the sliding window and reference sample stay bounded on long streams."""
+        miner = PrecursorMiner(
+            window_before=timedelta(seconds=3600), max_events=50, background_samples=32
+        )
+        _feed(miner, 50000, {250: "disk 95% full"})
+
+        assert len(miner._events) == 50
+        assert len(miner._background) == 32
+        assert all(sum(map(len, window.values())) <= 50 for window in miner._background)
+
+    def test_reproducible(self):
+        """Test the same stream gives the same sequences."""
+        results = []
+        for _ in range(2):
+            miner = PrecursorMiner(window_before=timedelta(seconds=60))
+            _feed(miner, 3000, {250: "disk 95% full", 270: "write to segment 4 failed"})
+            results.append(miner.sequences())
+
+        assert results[0] == results[1]
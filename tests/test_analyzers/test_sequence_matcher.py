@@ -0,0 +1,138 @@
+"""Tests for sequence matcher analyzer."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from codesdevs_log_analyzer.analyzers.sequence_matcher import SequenceMatcher
+from codesdevs_log_analyzer.parsers.base import ParsedLogEntry
+
+BASE_TIME = datetime(2024, 1, 15, 10, 0, 0)
+
+
+def _entries(events: list[tuple[int, str]]) -> list[ParsedLogEntry]:
+    """Entries from (second offset, message) pairs."""
+    return [
+        ParsedLogEntry(
+            line_number=i,
+            raw_line=message,
+            timestamp=BASE_TIME + timedelta(seconds=offset),
+            level="INFO",
+            message=message,
+        )
+        for i, (offset, message) in enumerate(events, 1)
+    ]
+
+
+class TestSequenceMatcher:
+    """Tests for SequenceMatcher."""
+
+    def test_followed_within(self):
+        """Test pairs complete only inside the time bound."""
+        entries = _entries(
+            [
+                (0, "lock acquired"),
+                (10, "lock timeout"),
+                (100, "lock acquired"),
+                (200, "lock timeout"),
+            ]
+        )
+        result = SequenceMatcher(["lock acquired", "lock timeout"], within=30).match_entries(
+            iter(entries)
+        )
+
+        assert result.started == 2
+        assert result.completed == 1
+        assert result.expired == 1
+        assert result.completion_rate == 0.5
+        assert [e.line_number for e in result.matches[0].entries] == [1, 2]
+        assert result.matches[0].duration_seconds == 10
+
+    def test_join_key(self):
+        """Test steps chain only within the same key, from metadata or the message."""
+        entries = _entries(
+            [
+                (0, "lock acquired request_id=a"),
+                (1, "lock acquired request_id=b"),
+                (5, "lock timeout request_id=b"),
+                (6, "lock timeout request_id: c"),
+                (7, "lock timeout"),
+            ]
+        )
+        entries[0].metadata["request_id"] = "a"
+        matcher = SequenceMatcher(["lock acquired", "lock timeout"], within=30, key="request_id")
+        result = matcher.match_entries(iter(entries))
+
+        assert result.completed == 1
+        assert result.matches[0].key == "b"
+        assert result.matches_by_key == {"b": 1}
+        assert result.expired == 1  # Key a never timed out
+
+    def test_three_steps_per_gap_bounds(self):
+        """Test each gap has its own bound and one entry advances one step."""
+        entries = _entries(
+            [
+                (0, "job queued"),
+                (5, "job started"),
+                (50, "job failed"),
+                (60, "job queued"),
+                (70, "job started"),
+                (200, "job failed"),
+            ]
+        )
+        matcher = SequenceMatcher(["job queued", "job started", "job failed"], within=[10, 60])
+        result = matcher.match_entries(iter(entries))
+
+        assert result.completed == 1
+        assert [e.line_number for e in result.matches[0].entries] == [1, 2, 3]
+        assert result.expired == 1
+
+        # A line matching every step only starts a sequence
+        result = SequenceMatcher(["job", "job"], within=10).match_entries(
+            iter(_entries([(0, "job"), (1, "job"), (2, "job")]))
+        )
+        assert result.started == 3
+        assert result.completed == 2
+
+    def test_latest_first_step_wins(self):
+        """Test a repeated first step restarts the timer."""
+        entries = _entries([(0, "A"), (25, "A"), (40, "B")])
+        result = SequenceMatcher(["A", "B"], within=30, case_sensitive=True).match_entries(
+            iter(entries)
+        )
+
+        assert result.completed == 1
+        assert result.matches[0].entries[0].line_number == 2
+
+    def test_state_bounded(self):
+        """Test idle keys expire and max_keys caps the keys held."""
+        entries = _entries([(i, f"lock acquired request_id=r{i}") for i in range(1000)])
+        for max_keys, expected_peak in [(100000, 31), (20, 20)]:
+            matcher = SequenceMatcher(
+                ["lock acquired", "lock timeout"], within=30, key="request_id", max_keys=max_keys
+            )
+            peak = 0
+            for entry in entries:
+                matcher.process_entry(entry)
+                peak = max(peak, len(matcher._partials))
+
+            result = matcher.finalize()
+
+            # Keys idle for up to 30s are kept
+            assert peak == expected_peak
+            assert result.expired == 1000
+            assert result.evicted_keys == (0 if max_keys > 1000 else 980)
+
+    @pytest.mark.parametrize(
+        ("steps", "within", "message"),
+        [
+            (["only"], 30, "steps"),
+            (["a", "b", "c"], [10], "time bounds"),
+            (["a", "b"], 0, "positive"),
+            (["a", "[b"], 30, "Invalid regex"),
+        ],
+    )
+    def test_invalid(self, steps, within, message):
+        """Test invalid sequences are rejected."""
+        with pytest.raises(ValueError, match=message):
+            SequenceMatcher(steps, within=within)
@@ -0,0 +1,146 @@
+"""Tests for stack trace fingerprinting and interning."""
+
+from datetime import datetime
+
+from codesdevs_log_analyzer.analyzers.error_extractor import ErrorExtractor
+from codesdevs_log_analyzer.analyzers.stack_trace import (
+    StackTraceInterner,
+    extract_exception_type,
+    is_stack_trace_line,
+    normalize_frame,
+)
+from codesdevs_log_analyzer.models import LogLevel, MultiLineLogEntry, ParsedLogEntry
+
+JAVA_TRACE = [
+    "java.lang.NullPointerException: Cannot invoke method on null object",
+    "\tat com.example.service.DataService.process(DataService.java:45)",
+    "\tat com.example.api.RestController.handleRequest(RestController.java:123)",
+    "Caused by: java.sql.SQLException: Connection pool exhausted",
+    "\t... 10 more",
+]
+
+PYTHON_TRACE = [
+    "Traceback (most recent call last):",
+    '  File "/app/main.py", line 10, in run',
+    "    handler()",
+    '  File "/app/handler.py", line 42, in handler',
+    "    raise ValueError('bad input')",
+    "ValueError: bad input",
+]
+
+
+class TestFrameDetection:
+    """Tests for the combined frame pattern and frame normalization."""
+
+    def test_is_stack_trace_line(self):
+        """Test all supported trace line shapes are detected."""
+        assert is_stack_trace_line("Traceback (most recent call last):")
+        assert is_stack_trace_line("\tat com.example.Foo.bar(Foo.java:12)")
+        assert is_stack_trace_line('  File "/app/x.py", line 3, in main')
+        assert is_stack_trace_line("Caused by: java.io.IOException")
+        assert is_stack_trace_line("\t... 3 more")
+        assert not is_stack_trace_line("2026-01-15 10:30:00 ERROR something")
+
+    def test_normalize_frame_drops_line_numbers(self):
+        """Test frames differing only in line numbers normalize equally."""
+        a = normalize_frame("\tat com.example.Foo.bar(Foo.java:12)")
+        b = normalize_frame("\tat com.example.Foo.bar(Foo.java:99)")
+        assert a == b == "com.example.Foo.bar(Foo.java)"
+
+        c = normalize_frame('  File "/app/x.py", line 3, in main')
+        d = normalize_frame('  File "/app/x.py", line 7, in main')
+        assert c == d == "/app/x.py:main"
+
+    def test_normalize_frame_lambda_suffix(self):
+        """Test generated lambda class suffixes are stripped."""
+        a = normalize_frame("\tat com.example.Foo$$Lambda$123/0x0000000800c0b000.run(Unknown Source)")
+        b = normalize_frame("\tat com.example.Foo$$Lambda$456/0x0000000800d0c000.run(Unknown Source)")
+        assert a == b
+
+    def test_normalize_frame_non_frame(self):
+        """Test non-frame lines return None."""
+        assert normalize_frame("Caused by: java.io.IOException") is None
+
+    def test_extract_exception_type(self):
+        """Test exception type for Java and Python traces."""
+        assert extract_exception_type("Request failed", JAVA_TRACE) == (
+            "java.lang.NullPointerException"
+        )
+        assert extract_exception_type("Unhandled error", PYTHON_TRACE) == "ValueError"
+
+
+class TestStackTraceInterner:
+    """Tests for StackTraceInterner."""
+
+    def test_identical_traces_interned_once(self):
+        """Test identical traces share one StackTrace instance."""
+        interner = StackTraceInterner()
+        first = interner.intern(list(JAVA_TRACE), head="Request failed")
+        second = interner.intern(list(JAVA_TRACE), head="Request failed")
+
+        assert first is not None
+        assert first is second
+        assert interner.unique_traces == 1
+        assert interner.occurrences(first.fingerprint) == 2
+
+    def test_line_number_changes_share_fingerprint(self):
+        """Test traces differing only in line numbers intern to the same trace."""
+        interner = StackTraceInterner()
+        moved = [line.replace(":45)", ":46)") for line in JAVA_TRACE]
+        first = interner.intern(list(JAVA_TRACE))
+        second = interner.intern(moved)
+
+        assert first is second
+
+    def test_empty_trace(self):
+        """Test empty traces are not interned."""
+        assert StackTraceInterner().intern([]) is None
+
+
+class TestErrorExtractorStackGrouping:
+    """Tests for grouping errors by exception type and top frames."""
+
+    def _entry(self, line_number: int, message: str) -> MultiLineLogEntry:
+        head = ParsedLogEntry(
+            line_number=line_number,
+            raw_line=message,
+            timestamp=datetime(2026, 1, 15, 10, 0, line_number),
+            level=LogLevel.ERROR,
+            message=message,
+            metadata={},
+        )
+        return MultiLineLogEntry.from_entry(head, list(JAVA_TRACE))
+
+    def test_groups_by_trace_fingerprint(self):
+        """Test differently worded errors with the same trace group together."""
+        extractor = ErrorExtractor()
+        result = extractor.analyze_entries(
+            iter(
+                [
+                    self._entry(1, "Request for user alice failed"),
+                    self._entry(2, "Request for tenant acme failed"),
+                ]
+            )
+        )
+
+        assert result.unique_errors == 1
+        assert result.unique_stack_traces == 1
+        group = result.error_groups[0]
+        assert group.count == 2
+        assert group.exception_type == "java.lang.NullPointerException"
+        assert group.stack_fingerprint is not None
+        assert group.template == "Request for user alice failed"
+
+    def test_stack_grouping_disabled(self):
+        """Test stack_frames=0 falls back to message templates."""
+        extractor = ErrorExtractor(stack_frames=0)
+        result = extractor.analyze_entries(
+            iter(
+                [
+                    self._entry(1, "Request for user alice failed"),
+                    self._entry(2, "Request for tenant acme failed"),
+                ]
+            )
+        )
+
+        assert result.unique_errors == 2
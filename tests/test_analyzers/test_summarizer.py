@@ -229,6 +229,37 @@ class TestSecurityIndicators:
         assert result.security is not None
         assert result.security.failed_auth_attempts == len(auth_messages)
 
+    def test_attack_patterns(self, tmp_path):
+        """Test attack literals count in message or path, auth and privilege in the message only."""
+        summarizer = Summarizer(file_path=str(tmp_path / "test.log"), include_security=True)
+        base_time = datetime(2024, 1, 15, 10, 0, 0)
+        cases = [
+            ("GET request", {"path": "/search?q=1 UNION SELECT password"}),
+            ("GET request", {"path": "/static/../../etc/passwd"}),
+            ("Rendered <SCRIPT>String.fromCharCode(88)</script>", {}),
+            ("GET request", {"path": "/unauthorized/sudo", "user_agent": "sqlmap/1.7"}),
+            ("sudo session opened", {"user_agent": "Mozilla/5.0"}),
+        ]
+        for i, (message, metadata) in enumerate(cases):
+            summarizer.process_entry(ParsedLogEntry(
+                line_number=i,
+                raw_line=message,
+                timestamp=base_time + timedelta(seconds=i),
+                level="INFO",
+                message=message,
+                metadata=metadata
+            ))
+
+        security = summarizer.finalize().security
+
+        assert security is not None
+        assert security.sql_injection_attempts == 1
+        assert security.path_traversal_attempts == 1
+        assert security.xss_attempts == 1
+        assert security.failed_auth_attempts == 0
+        assert security.suspicious_user_agents == ["sqlmap/1.7"]
+        assert summarizer._privilege_escalation_count == 1
+
 
 class TestPerformanceMetrics:
     """Tests for performance metrics tracking."""
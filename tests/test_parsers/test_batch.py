@@ -0,0 +1,145 @@
+"""Tests for block (batch) parsing."""
+
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+from codesdevs_log_analyzer.models import LogLevel
+from codesdevs_log_analyzer.parsers import (
+    ApacheAccessParser,
+    ApacheErrorParser,
+    BaseLogParser,
+    BlockParser,
+    JavaLogParser,
+    JSONLParser,
+    PythonLogParser,
+    SyslogParser,
+)
+from codesdevs_log_analyzer.parsers.batch import iter_block_matches
+from codesdevs_log_analyzer.utils.file_handler import stream_file
+
+TEST_LOGS_DIR = Path(__file__).parent.parent.parent / "test_logs"
+
+
+class TestBlockPattern:
+    """Tests for block patterns and iter_block_matches."""
+
+    def test_matches_do_not_cross_lines(self):
+        """Test whitespace and negated classes stop at newlines."""
+        pattern = SyslogParser.BLOCK_PATTERN
+        block = "Jan 15 10:30:00\nhost sshd: message\nJan 15 10:30:01 host sshd: ok"
+        matches = list(pattern.finditer(block))
+        assert len(matches) == 1
+        assert matches[0].group("message") == "ok"
+
+    def test_iter_block_matches_covers_every_line(self):
+        """Test matched and unmatched lines are all yielded in order."""
+        pattern = SyslogParser.BLOCK_PATTERN
+        block = "noise\nJan 15 10:30:00 host sshd: one\n\nmore noise\nJan 15 10:30:01 host a: two"
+        walked = [(n, line, m is not None) for n, line, m in iter_block_matches(pattern, block, 5)]
+        assert walked == [
+            (5, "noise", False),
+            (6, "Jan 15 10:30:00 host sshd: one", True),
+            (7, "", False),
+            (8, "more noise", False),
+            (9, "Jan 15 10:30:01 host a: two", True),
+        ]
+
+
+class TestParseBatch:
+    """Tests for BaseLogParser.parse_batch."""
+
+    def test_block_parser_requires_hook(self):
+        """Test a block parser without _fields_from_match cannot be instantiated."""
+
+        class HalfParser(BlockParser):
+            BLOCK_PATTERN = SyslogParser.BLOCK_PATTERN
+
+            def can_parse(self, line: str) -> bool:
+                return True
+
+            def parse_line(self, line: str, line_number: int) -> None:
+                return None
+
+        with pytest.raises(TypeError, match="_fields_from_match"):
+            HalfParser()  # type: ignore[abstract]
+
+    @pytest.mark.parametrize(
+        ("parser", "file_name"),
+        [
+            (SyslogParser(), "syslog.log"),
+            (ApacheAccessParser(), "nginx_access.log"),
+            (ApacheErrorParser(), "nginx_error.log"),
+            (PythonLogParser(), "python_app.log"),
+            (JavaLogParser(), "java_app.log"),
+            (JSONLParser(), "app.jsonl"),
+        ],
+    )
+    def test_batch_matches_per_line_parsing(self, parser: BaseLogParser, file_name: str):
+        """Test block parsing yields the same entries as parse_line."""
+        path = str(TEST_LOGS_DIR / file_name)
+        expected = [
+            entry.model_dump()
+            for line_number, line in stream_file(path)
+            if (entry := parser.parse_line(line, line_number)) is not None
+        ]
+        batched = [
+            entry.model_dump()
+            for batch in parser.parse_file_batches(path, block_size=256)
+            for entry in batch
+        ]
+        assert batched == expected
+
+    def test_batch_columns(self):
+        """Test batch columns and level counts without building entries."""
+        block = "\n".join(
+            [
+                '10.0.0.1 - - [15/Jan/2026:10:30:00 +0000] "GET / HTTP/1.1" 200 5 "-" "curl"',
+                "garbage",
+                '10.0.0.2 - - [15/Jan/2026:10:30:01 +0000] "GET /x HTTP/1.1" 503 0 "-" "curl"',
+            ]
+        )
+        batch = ApacheAccessParser().parse_batch(block, first_line_number=10)
+
+        assert len(batch) == 2
+        assert list(batch.line_numbers) == [10, 12]
+        assert batch.levels == [LogLevel.DEBUG, LogLevel.ERROR]
+        assert batch.level_counts() == {"DEBUG": 1, "ERROR": 1}
+        assert batch[1].metadata["status_code"] == 503
+
+
+class TestBlockParseFile:
+    """Tests for parse_file reading block parsers a block at a time."""
+
+    PARSERS = [
+        (SyslogParser, "syslog.log"),
+        (ApacheAccessParser, "nginx_access.log"),
+        (ApacheErrorParser, "nginx_error.log"),
+        (PythonLogParser, "python_app.log"),
+        (JavaLogParser, "java_app.log"),
+    ]
+
+    @pytest.mark.parametrize(("parser_class", "file_name"), PARSERS)
+    def test_matches_line_at_a_time(self, parser_class: type[BlockParser], file_name: str):
+        """Test entries, including continuation lines, equal line-at-a-time parsing."""
+        path = str(TEST_LOGS_DIR / file_name)
+        per_line = parser_class()
+        per_line._read_lines = partial(BaseLogParser._read_lines, per_line)  # type: ignore[method-assign]
+
+        expected = [entry.model_dump() for entry in per_line.parse_file(path)]
+        assert [entry.model_dump() for entry in parser_class().parse_file(path)] == expected
+        assert [
+            entry.model_dump() for entry in parser_class().parse_file(path, max_lines=7)
+        ] == [entry.model_dump() for entry in per_line.parse_file(path, max_lines=7)]
+
+    def test_matched_lines_skip_parse_line(self, monkeypatch: pytest.MonkeyPatch):
+        """Test lines in the block layout are built from the block match, not parse_line."""
+        parser = SyslogParser()
+        calls: list[int] = []
+        monkeypatch.setattr(parser, "parse_line", lambda line, number: calls.append(number))
+
+        entries = list(parser.parse_file(str(TEST_LOGS_DIR / "syslog.log")))
+
+        assert entries
+        assert calls == []
@@ -0,0 +1,115 @@
+"""Tests for run-length collapsing of repeated entries."""
+
+from datetime import datetime, timedelta
+
+from codesdevs_log_analyzer.analyzers.error_extractor import ErrorExtractor
+from codesdevs_log_analyzer.analyzers.summarizer import Summarizer
+from codesdevs_log_analyzer.models import LogLevel, ParsedLogEntry
+from codesdevs_log_analyzer.parsers.dedup import (
+    collapse_repeated_entries,
+    last_timestamp,
+    repeat_count,
+)
+
+START = datetime(2026, 1, 15, 10, 0, 0)
+
+
+def _entry(line_number: int, message: str, level: LogLevel = LogLevel.INFO) -> ParsedLogEntry:
+    return ParsedLogEntry(
+        line_number=line_number,
+        raw_line=message,
+        timestamp=START + timedelta(seconds=line_number),
+        level=level,
+        message=message,
+        metadata={},
+    )
+
+
+def _chatty_entries() -> list[ParsedLogEntry]:
+    entries = [_entry(i, f"health check ok in {i}ms") for i in range(1, 101)]
+    entries += [_entry(101 + i, f"retry {i} failed", LogLevel.ERROR) for i in range(5)]
+    entries.append(_entry(200, "shutting down"))
+    return entries
+
+
+class TestCollapseRepeatedEntries:
+    """Tests for collapse_repeated_entries."""
+
+    def test_collapses_consecutive_runs(self):
+        """Test near-identical consecutive lines collapse into one entry."""
+        collapsed = list(collapse_repeated_entries(_chatty_entries()))
+
+        assert len(collapsed) == 3
+        health, retry, shutdown = collapsed
+        assert repeat_count(health) == 100
+        assert health.line_number == 1
+        assert health.metadata["last_line_number"] == 100
+        assert last_timestamp(health) == START + timedelta(seconds=100)
+        assert repeat_count(retry) == 5
+        assert repeat_count(shutdown) == 1
+        assert "repeat_count" not in shutdown.metadata
+
+    def test_level_breaks_run(self):
+        """Test same message at different levels is not collapsed."""
+        entries = [_entry(1, "disk usage high"), _entry(2, "disk usage high", LogLevel.WARN)]
+        assert len(list(collapse_repeated_entries(entries))) == 2
+
+    def test_metadata_ignored(self):
+        """Test runs are keyed on level and message only; the first entry's metadata is kept."""
+        entries = [_entry(i, "GET /api/users") for i in range(1, 11)]
+        for i, entry in enumerate(entries):
+            entry.metadata.update(client_ip=f"10.0.0.{i}", status_code=401 if i < 5 else 404)
+
+        collapsed = list(collapse_repeated_entries(entries))
+
+        assert len(collapsed) == 1
+        assert repeat_count(collapsed[0]) == 10
+        assert collapsed[0].metadata["client_ip"] == "10.0.0.0"
+
+    def test_empty_input(self):
+        """Test collapsing nothing yields nothing."""
+        assert list(collapse_repeated_entries([])) == []
+
+
+class TestAnalyzersConsumeCounts:
+    """Tests that analyzers weight collapsed entries by their repeat count."""
+
+    def test_summarizer_counts_match_uncollapsed(self, tmp_path):
+        """Test level distribution and totals are unchanged by collapsing."""
+        log_file = tmp_path / "chatty.log"
+        log_file.write_text("x")
+
+        plain = Summarizer(file_path=str(log_file)).summarize_entries(iter(_chatty_entries()))
+        collapsed = Summarizer(file_path=str(log_file)).summarize_entries(
+            collapse_repeated_entries(_chatty_entries())
+        )
+
+        assert collapsed.total_entries == plain.total_entries == 106
+        assert collapsed.level_distribution == plain.level_distribution
+        assert collapsed.time_range.end == plain.time_range.end
+
+    def test_summarizer_security_matches_uncollapsed(self, tmp_path):
+        """Test auth failure totals are unchanged by collapsing."""
+        log_file = tmp_path / "access.log"
+        log_file.write_text("x")
+        entries = []
+        for i in range(10):
+            entry = _entry(i + 1, "GET /api/users 401 unauthorized")
+            entry.metadata.update(client_ip=f"10.0.0.{i}", status_code=401, path="/api/users")
+            entries.append(entry)
+
+        plain = Summarizer(file_path=str(log_file)).summarize_entries(iter(entries))
+        collapsed = Summarizer(file_path=str(log_file)).summarize_entries(
+            collapse_repeated_entries(entries)
+        )
+
+        assert plain.security is not None and collapsed.security is not None
+        assert collapsed.security.failed_auth_attempts == plain.security.failed_auth_attempts
+
+    def test_error_extractor_counts_repeats(self):
+        """Test error totals and group counts include collapsed repeats."""
+        result = ErrorExtractor().analyze_entries(collapse_repeated_entries(_chatty_entries()))
+
+        assert result.total_errors == 5
+        assert result.error_groups[0].count == 5
+        assert result.error_groups[0].last_seen == START + timedelta(seconds=105)
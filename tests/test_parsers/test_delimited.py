@@ -0,0 +1,220 @@
+"""Tests for header-driven delimited log parsers."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from codesdevs_log_analyzer import log_analyzer_tail
+from codesdevs_log_analyzer.analyzers.summarizer import summarize_log
+from codesdevs_log_analyzer.models import LogLevel
+from codesdevs_log_analyzer.parsers import (
+    CSVParser,
+    ELBParser,
+    TSVParser,
+    W3CParser,
+    detect_format,
+    detect_format_with_profiles,
+)
+
+W3C_LINES = [
+    "#Software: Microsoft Internet Information Services 10.0",
+    "#Fields: date time cs-method cs-uri-stem c-ip cs(User-Agent) sc-status sc-bytes time-taken",
+    "2026-01-15 10:30:00 GET /api/orders 203.0.113.7 Mozilla/5.0+(X11) 200 512 15",
+    "2026-01-15 10:30:01 POST /api/pay 203.0.113.8 curl/8.0 500 64 1203",
+    "2026-01-15 10:30:02 GET /../../etc/passwd 198.51.100.9 sqlmap/1.7 404 0 3",
+]
+
+ALB_LINE = (
+    "https 2026-01-15T10:30:01.123456Z app/my-alb/50dc6c495c0c9188 203.0.113.8:46533 "
+    '10.0.0.66:80 0.001 0.250 0.000 502 502 34 366 "POST https://example.com:443/api/pay HTTP/1.1" '
+    '"Mozilla/5.0 (X11)" ECDHE-RSA-AES128-GCM-SHA256 TLSv1.2 '
+    'arn:aws:elasticloadbalancing:us-east-2:123456789012:targetgroup/t/73e2 "Root=1-5833" '
+    '"example.com" "-" 1 2026-01-15T10:30:01.000000Z "forward" "-" "-" "10.0.0.66:80" "502"'
+)
+
+CLASSIC_LINE = (
+    "2026-01-15T10:30:00.123456Z my-elb 203.0.113.7:2817 10.0.0.1:80 0.000073 0.001048 "
+    '0.000057 200 200 0 29 "GET http://example.com:80/ HTTP/1.1" "curl/7.38.0" - -'
+)
+
+CSV_LINES = [
+    "timestamp,level,status,latency_ms,path,message",
+    "2026-01-15T10:30:00Z,info,200,12.5,/api/orders,order listed",
+    '2026-01-15T10:30:01Z,error,500,950,/api/pay,"gateway timeout, retrying"',
+    "2026-01-15T10:30:02Z,warn,429,3,/api/pay,throttled",
+]
+
+
+def write_lines(path: Path, lines: list[str]) -> Path:
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+class TestW3CParser:
+    """Tests for W3CParser."""
+
+    def test_fields_directive(self) -> None:
+        """Test the #Fields directive sets the columns and typed metadata."""
+        parser = W3CParser()
+        assert parser.parse_line(W3C_LINES[1], 2) is None
+
+        entry = parser.parse_line(W3C_LINES[3], 4)
+
+        assert entry is not None
+        assert entry.level == LogLevel.ERROR
+        assert entry.timestamp is not None and entry.timestamp.tzinfo is not None
+        assert entry.message == "POST /api/pay - 500"
+        assert entry.metadata == {
+            "method": "POST",
+            "path": "/api/pay",
+            "client_ip": "203.0.113.8",
+            "user_agent": "curl/8.0",
+            "status_code": 500,
+            "bytes_sent": 64,
+            "response_time": 1203.0,
+        }
+
+    def test_default_fields(self) -> None:
+        """Test the IIS default field set applies before any directive."""
+        line = (
+            "2026-01-15 10:30:00 10.0.0.5 GET /api/orders id=7 443 - 203.0.113.7 "
+            "Mozilla/5.0+(X11) - 200 0 0 15"
+        )
+        entry = W3CParser().parse_line(line, 1)
+
+        assert entry is not None
+        assert entry.metadata["user_agent"] == "Mozilla/5.0 (X11)"
+        assert entry.metadata["query"] == "id=7"
+        assert "user" not in entry.metadata
+
+    def test_detection_primes_schema(self, tmp_path: Path) -> None:
+        """Test the detected parser knows the file's columns for tail reads."""
+        parser, confidence = detect_format(str(write_lines(tmp_path / "u_ex.log", W3C_LINES)))
+
+        assert isinstance(parser, W3CParser)
+        assert confidence > 0.9
+        entry = parser.parse_line(W3C_LINES[-1], 5)
+        assert entry is not None and entry.metadata["status_code"] == 404
+
+
+class TestELBParser:
+    """Tests for ELBParser."""
+
+    @pytest.fixture
+    def parser(self) -> ELBParser:
+        """Create parser instance."""
+        return ELBParser()
+
+    def test_alb(self, parser: ELBParser) -> None:
+        """Test ALB lines with quoted fields and optional trailing columns."""
+        entry = parser.parse_line(ALB_LINE, 1)
+
+        assert entry is not None
+        assert entry.level == LogLevel.ERROR
+        assert entry.metadata["client_ip"] == "203.0.113.8"
+        assert entry.metadata["client_port"] == 46533
+        assert entry.metadata["method"] == "POST"
+        assert entry.metadata["user_agent"] == "Mozilla/5.0 (X11)"
+        assert entry.metadata["status_code"] == 502
+        assert entry.metadata["response_time"] == 251.0
+
+    def test_classic(self, parser: ELBParser) -> None:
+        """Test Classic ELB lines."""
+        entry = parser.parse_line(CLASSIC_LINE, 1)
+
+        assert entry is not None
+        assert entry.timestamp is not None
+        assert entry.metadata["path"] == "http://example.com:80/"
+        assert entry.metadata["bytes_sent"] == 29
+        assert entry.metadata["response_time"] == pytest.approx(1.178)
+
+    def test_failed_request_has_no_latency(self, parser: ELBParser) -> None:
+        """Test -1 processing times do not produce a response time."""
+        line = ALB_LINE.replace("0.001 0.250 0.000", "-1 -1 -1")
+        entry = parser.parse_line(line, 1)
+
+        assert entry is not None
+        assert "response_time" not in entry.metadata
+
+    def test_rejects_other_formats(self, parser: ELBParser) -> None:
+        """Test short lines are not load balancer records."""
+        assert not parser.can_parse("2026-01-15T10:30:00Z my-elb short line")
+
+
+class TestCSVParser:
+    """Tests for CSVParser and TSVParser."""
+
+    def test_header_row(self) -> None:
+        """Test the header row names the columns."""
+        parser = CSVParser()
+        assert parser.parse_line(CSV_LINES[0], 1) is None
+
+        entry = parser.parse_line(CSV_LINES[2], 3)
+
+        assert entry is not None
+        assert entry.level == LogLevel.ERROR
+        assert entry.message == "gateway timeout, retrying"
+        assert entry.metadata == {"status_code": 500, "response_time": 950.0, "path": "/api/pay"}
+
+    def test_requires_header(self) -> None:
+        """Test data lines are not parsed before a header is seen."""
+        assert CSVParser().parse_line(CSV_LINES[1], 2) is None
+
+    def test_repeated_header_with_padding(self) -> None:
+        """Test a repeated header row is recognized even with padded names."""
+        parser = CSVParser()
+        header = "timestamp ,level ,message"
+        assert parser.parse_line(header, 1) is None
+        assert parser.schema is not None
+        assert parser.schema.fields == ("timestamp", "level", "message")
+
+        assert parser.parse_line(header, 5) is None
+
+    def test_tsv(self) -> None:
+        """Test tab-separated logs use the same column handling."""
+        parser = TSVParser()
+        parser.prime(["time\tstatus\tduration\tip"])
+        entry = parser.parse_line("2026-01-15 10:30:01\t503\t4000\t10.0.0.2", 2)
+
+        assert entry is not None
+        assert entry.level == LogLevel.ERROR
+        assert entry.metadata == {
+            "status_code": 503,
+            "response_time": 4000.0,
+            "client_ip": "10.0.0.2",
+        }
+
+    def test_detection(self, tmp_path: Path) -> None:
+        """Test CSV files are detected over the generic fallback."""
+        parser, confidence = detect_format(str(write_lines(tmp_path / "app.csv", CSV_LINES)))
+        assert isinstance(parser, CSVParser)
+        assert confidence > 0.9
+
+
+@pytest.mark.parametrize("format_hint", ["csv", None])
+def test_tail_reads_header(tmp_path: Path, format_hint: str | None) -> None:
+    """Test tail maps columns for hinted and profiled parsers, not just detected ones."""
+    lines = CSV_LINES + CSV_LINES[1:] * 20
+    write_lines(tmp_path / "app.csv", lines)
+    path = write_lines(tmp_path / "app.csv.1", lines)
+    # Learn a profile so the second file skips detection
+    detect_format_with_profiles(str(tmp_path / "app.csv"))
+
+    result = json.loads(
+        log_analyzer_tail(str(path), lines=3, format_hint=format_hint, response_format="json")
+    )
+
+    assert [entry["level"] for entry in result["entries"]] == ["INFO", "ERROR", "WARN"]
+
+
+def test_summarizer_uses_typed_columns(tmp_path: Path) -> None:
+    """Test performance and security summaries read the typed columns."""
+    path = write_lines(tmp_path / "u_ex.log", W3C_LINES)
+    summary = summarize_log(W3CParser(), str(path))
+
+    assert summary.performance is not None
+    assert summary.performance.max_response_time_ms == 1203.0
+    assert summary.security is not None
+    assert summary.security.path_traversal_attempts == 1
+    assert summary.security.error_5xx_count == 1
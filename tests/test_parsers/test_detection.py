@@ -0,0 +1,152 @@
+"""Tests for the format detection engine."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from codesdevs_log_analyzer.parsers import (
+    PARSER_REGISTRY,
+    GenericParser,
+    JSONLParser,
+    SyslogParser,
+    clear_detection_cache,
+    detect_file,
+    detect_format,
+)
+from codesdevs_log_analyzer.parsers.detection import (
+    MIDDLE,
+    SMALL_FILE_BYTES,
+    TAIL,
+    sample_file,
+    signature_score,
+)
+from codesdevs_log_analyzer.server import log_analyzer_suggest_format
+
+SYSLOG_LINE = "Jan 15 10:30:{:02d} myhost sshd[1234]: Accepted connection {}"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_detection_cache()
+    yield
+    clear_detection_cache()
+
+
+def _syslog_lines(count: int) -> list[str]:
+    return [SYSLOG_LINE.format(i % 60, i) for i in range(count)]
+
+
+class TestSignatureScore:
+    """Tests for the signature prefilter."""
+
+    def test_matching_share(self, sample_syslog_lines: list[str]):
+        """Test the score is the share of lines matching a signature."""
+        assert signature_score(SyslogParser, sample_syslog_lines) == 1.0
+        assert signature_score(JSONLParser, sample_syslog_lines) == 0.0
+        assert signature_score(SyslogParser, sample_syslog_lines + ["{}", ""]) == pytest.approx(
+            len(sample_syslog_lines) / (len(sample_syslog_lines) + 1)
+        )
+
+    def test_score_results_matches_detect_confidence(self, sample_syslog_lines: list[str]):
+        """Test scoring shared results equals the standalone confidence."""
+        for parser_class in (SyslogParser, GenericParser):
+            parser = parser_class()
+            results = [
+                (parser.can_parse(line), parser.parse_line(line, 0)) for line in sample_syslog_lines
+            ]
+            assert parser_class.score_results(sample_syslog_lines, results) == (
+                parser_class.detect_confidence(sample_syslog_lines)
+            )
+
+
+class TestDetection:
+    """Tests for detect_file."""
+
+    def test_only_candidates_fully_scored(self, syslog_file: Path):
+        """Test a clear format is detected without parsing with every parser."""
+        result = detect_file(str(syslog_file))
+
+        assert result.best_name == "syslog"
+        assert "syslog" in result.parses
+        assert "generic" not in result.parses
+        assert result.scores["docker"].confidence is None
+
+    def test_parse_results_shared(self, syslog_file: Path):
+        """Test scoring more parsers reuses the sample and earlier parses."""
+        result = detect_file(str(syslog_file))
+        syslog_parses = result.parses["syslog"]
+
+        for name in PARSER_REGISTRY:
+            result.score(name)
+
+        assert result.parses["syslog"] is syslog_parses
+        assert [score.name for score in result.scored][0] == "syslog"
+
+    def test_cached_until_file_changes(self, tmp_path: Path):
+        """Test detection is reused until the file's size or mtime change."""
+        log = tmp_path / "app.log"
+        log.write_text("\n".join(_syslog_lines(10)) + "\n")
+
+        first = detect_file(str(log))
+        assert detect_file(str(log)) is first
+
+        log.write_text('{"level":"info","msg":"started"}\n' * 10)
+        parser, _ = detect_format(str(log))
+        assert isinstance(parser, JSONLParser)
+
+    def test_suggest_format_reuses_detection(self, syslog_file: Path):
+        """Test suggest_format ranks every parser on the detection sample."""
+        output = json.loads(log_analyzer_suggest_format(str(syslog_file), response_format="json"))
+        result = detect_file(str(syslog_file))
+
+        assert output["recommended_format"] == "syslog"
+        assert set(result.parses) == set(PARSER_REGISTRY)
+        assert output["total_lines_sampled"] == len(result.sample)
+
+    def test_missing_file(self, tmp_path: Path):
+        """Test a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            detect_format(str(tmp_path / "missing.log"))
+
+
+class TestSampling:
+    """Tests for head/middle/tail sampling."""
+
+    def test_small_file_sampled_by_index(self, tmp_path: Path):
+        """Test small files keep real line numbers in every region."""
+        log = tmp_path / "small.log"
+        log.write_text("\n".join(_syslog_lines(400)) + "\n")
+
+        sample = sample_file(str(log), sample_size=100)
+
+        assert len(sample) == 100
+        assert [s.line_number for s in sample[:3]] == [1, 2, 3]
+        assert sample[-1].line_number == 400
+        assert {s.region for s in sample} == {"head", MIDDLE, TAIL}
+
+    def test_large_file_sampled_by_offset(self, tmp_path: Path):
+        """Test large files are sampled by seeking to the middle and tail."""
+        lines = _syslog_lines(SMALL_FILE_BYTES // 40)
+        log = tmp_path / "large.log"
+        log.write_text("\n".join(lines) + "\n")
+        assert os.path.getsize(log) > SMALL_FILE_BYTES
+
+        sample = sample_file(str(log), sample_size=100)
+
+        tail = [s for s in sample if s.region == TAIL]
+        assert len(tail) == 25
+        assert tail[-1].text == lines[-1]
+        assert all(s.line_number is None for s in tail)
+        assert all(s.text in lines for s in sample)
+
+    def test_header_does_not_decide_format(self, tmp_path: Path):
+        """Test a long preamble does not outvote the rest of the file."""
+        log = tmp_path / "preamble.log"
+        preamble = [f'{{"banner":"build {i}"}}' for i in range(150)]
+        log.write_text("\n".join(preamble + _syslog_lines(450)) + "\n")
+
+        parser, _ = detect_format(str(log), sample_size=100)
+
+        assert not isinstance(parser, JSONLParser)
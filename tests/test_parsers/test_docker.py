@@ -1,11 +1,13 @@
 """Tests for Docker log parser."""
 
+import json
 from pathlib import Path
 
 import pytest
 
 from codesdevs_log_analyzer.models import LogLevel
-from codesdevs_log_analyzer.parsers.docker import DockerParser
+from codesdevs_log_analyzer.parsers import get_parser
+from codesdevs_log_analyzer.parsers.docker import DockerParser, scan_json_record
 
 
 class TestDockerParser:
@@ -87,3 +89,189 @@ class TestDockerParser:
         """Test format detection confidence."""
         confidence = DockerParser.detect_confidence(sample_docker_lines)
         assert confidence > 0.7
+
+
+def _json_record(log: str, stream: str = "stdout", second: int = 0) -> str:
+    """Build a json-file driver record the way Docker writes it."""
+    return json.dumps(
+        {"log": log, "stream": stream, "time": f"2026-01-15T10:30:{second:02d}.123456789Z"},
+        separators=(",", ":"),
+    )
+
+
+class TestJsonFastPath:
+    """Tests for the fixed-key json-file scanner."""
+
+    def test_plain_record(self) -> None:
+        """Test fields are sliced out of a plain record."""
+        line = _json_record("hello world\n")
+        assert scan_json_record(line) == (
+            "hello world",
+            "stdout",
+            "2026-01-15T10:30:00.123456789Z",
+            False,
+        )
+
+    def test_escaped_record(self) -> None:
+        """Test escapes, embedded keys and unicode are decoded like json.loads."""
+        log = 'say "hi" \\ <b>","time":"x\n'
+        line = _json_record(log).replace("<", "\\u003c")
+        scanned = scan_json_record(line)
+
+        assert scanned is not None
+        assert scanned[0] == log[:-1]
+        assert scanned[2] == "2026-01-15T10:30:00.123456789Z"
+
+    def test_partial_record(self) -> None:
+        """Test split-size records without a trailing newline are partial."""
+        scanned = scan_json_record(_json_record("A" * 16384))
+        assert scanned is not None
+        assert scanned[3] is True
+
+    @pytest.mark.parametrize("log", ["AAAA", ""])
+    def test_short_unterminated_record(self, log: str) -> None:
+        """Test short or empty records without a newline are complete."""
+        scanned = scan_json_record(_json_record(log))
+        assert scanned is not None
+        assert scanned[3] is False
+
+    def test_other_layout_falls_back(self) -> None:
+        """Test records with other keys are left to json.loads."""
+        line = (
+            '{"log":"x\\n","stream":"stdout","attrs":{"tag":"web"},"time":"2026-01-15T10:30:00Z"}'
+        )
+        assert scan_json_record(line) is None
+
+        entry = DockerParser().parse_line(line, 1)
+        assert entry is not None
+        assert entry.message == "x"
+        assert entry.metadata["attrs"] == {"tag": "web"}
+
+    @pytest.mark.parametrize(
+        ("value", "microsecond"),
+        [
+            ("2026-01-15T10:30:00.123456789Z", 123456),
+            ("2026-01-15T10:30:00.123456Z", 123456),
+            ("2026-01-15T10:30:00.123Z", 123000),
+            ("2026-01-15T10:30:00Z", 0),
+        ],
+    )
+    def test_timestamp_precisions(self, value: str, microsecond: int) -> None:
+        """Test fractions of any length are parsed."""
+        timestamp = DockerParser()._parse_timestamp(value)
+        assert timestamp is not None
+        assert timestamp.second == 0
+        assert timestamp.microsecond == microsecond
+
+
+class TestPartialReassembly:
+    """Tests for stitching lines split by the logging driver."""
+
+    def test_json_fragments_joined(self, tmp_path: Path) -> None:
+        """Test fragments join per stream while the other stream interleaves."""
+        log_file = tmp_path / "container-json.log"
+        log_file.write_text(
+            "\n".join(
+                [
+                    _json_record("A" * 16384),
+                    _json_record("oops\n", stream="stderr", second=1),
+                    _json_record("A" * 16384),
+                    _json_record("AB\n"),
+                    _json_record("next\n", second=2),
+                ]
+            )
+            + "\n"
+        )
+
+        entries = list(DockerParser().parse_file(str(log_file)))
+
+        assert [entry.line_number for entry in entries] == [2, 1, 5]
+        joined = entries[1]
+        assert joined.message == "A" * 32768 + "AB"
+        assert joined.metadata["fragments"] == 3
+        assert "partial" not in joined.metadata
+        assert entries[0].message == "oops"
+
+    def test_cri_fragments_joined(self, tmp_path: Path) -> None:
+        """Test CRI P records are joined up to the next F record."""
+        log_file = tmp_path / "pod.log"
+        log_file.write_text(
+            "2026-01-15T10:30:00.1Z stdout P first half \n"
+            "2026-01-15T10:30:00.2Z stdout F second half\n"
+        )
+
+        entries = list(DockerParser().parse_file(str(log_file)))
+
+        assert len(entries) == 1
+        assert entries[0].message == "first half second half"
+        assert entries[0].metadata["partial"] is False
+        assert entries[0].metadata["fragments"] == 2
+
+    def test_trailing_fragment_flushed(self, tmp_path: Path) -> None:
+        """Test an unterminated line at the end of the file is still emitted."""
+        log_file = tmp_path / "container-json.log"
+        log_file.write_text(_json_record("A" * 16384) + "\n")
+
+        entries = list(DockerParser().parse_file(str(log_file)))
+
+        assert len(entries) == 1
+        assert entries[0].metadata["partial"] is True
+
+    @pytest.mark.parametrize("attrs", [False, True])
+    def test_unterminated_records_not_joined(self, tmp_path: Path, attrs: bool) -> None:
+        """Test short records without a newline stay separate entries."""
+        records = [json.loads(_json_record(f"msg {i}", second=i)) for i in range(5)]
+        records.append(json.loads(_json_record("", second=5)))
+        if attrs:
+            for record in records:
+                record["attrs"] = {"tag": "web"}
+        log_file = tmp_path / "container-json.log"
+        log_file.write_text("".join(json.dumps(record) + "\n" for record in records))
+
+        entries = list(DockerParser().parse_file(str(log_file)))
+
+        assert [entry.message for entry in entries] == [f"msg {i}" for i in range(5)] + [""]
+        assert not any("partial" in entry.metadata for entry in entries)
+
+
+class TestInnerFormat:
+    """Tests for parsing the application lines inside records."""
+
+    PYTHON_LINES = [
+        "2026-01-15 10:30:00,123 - app.db - ERROR - Connection refused\n",
+        "2026-01-15 10:30:01,456 - app.api - INFO - Request handled\n",
+        "2026-01-15 10:30:02,789 - app.api - WARNING - Slow response\n",
+    ]
+
+    def test_named_inner_format(self) -> None:
+        """Test an explicit inner format supplies level and message."""
+        parser = get_parser("docker:python")
+        assert isinstance(parser, DockerParser)
+
+        entry = parser.parse_line(_json_record(self.PYTHON_LINES[0]), 1)
+
+        assert entry is not None
+        assert entry.level == LogLevel.ERROR
+        assert entry.message == "Connection refused"
+        assert entry.metadata["inner_format"] == "python"
+        assert entry.metadata["stream"] == "stdout"
+        # The driver's timestamp is kept
+        assert entry.timestamp is not None
+        assert entry.timestamp.microsecond == 123456
+
+    def test_auto_inner_format(self, tmp_path: Path) -> None:
+        """Test the inner format is detected from the file head."""
+        log_file = tmp_path / "container-json.log"
+        records = [_json_record("A" * 16384)]
+        records += [_json_record(line, second=i) for i, line in enumerate(self.PYTHON_LINES * 4)]
+        log_file.write_text("\n".join(records) + "\n")
+
+        entries = list(DockerParser(inner_format="auto").parse_file(str(log_file)))
+
+        assert entries[1].metadata["inner_format"] == "python"
+        assert entries[2].level == LogLevel.WARNING
+
+    def test_unknown_inner_format(self) -> None:
+        """Test an unknown inner format is rejected."""
+        with pytest.raises(ValueError):
+            get_parser("docker:nope")
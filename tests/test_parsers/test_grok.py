@@ -0,0 +1,157 @@
+"""Tests for grok-style custom format parsers."""
+
+import json
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+
+from codesdevs_log_analyzer.models import LogLevel
+from codesdevs_log_analyzer.parsers import (
+    DETECTION_ORDER,
+    PARSER_REGISTRY,
+    GrokParser,
+    compile_grok,
+    detect_format,
+    get_parser,
+    register_format,
+)
+from codesdevs_log_analyzer.server import (
+    log_analyzer_extract_errors,
+    log_analyzer_register_format,
+)
+
+SPEC = (
+    r"%{TIMESTAMP_ISO8601:ts} \| %{LOGLEVEL:level} \| %{WORD:service} "
+    r"\| %{INT:latency_ms:int}ms \| %{GREEDYDATA:msg}"
+)
+LINES = [
+    "2026-01-15 10:30:00.120 | INFO | billing | 12ms | invoice created",
+    "2026-01-15 10:30:01.350 | ERROR | billing | 950ms | payment gateway timeout",
+    "2026-01-15 10:30:02.010 | WARN | auth | 48ms | token near expiry",
+]
+
+
+@pytest.fixture
+def acme_format() -> Generator[str, None, None]:
+    """Register the test format and remove it afterwards."""
+    register_format("acme", SPEC, "ACME pipe-delimited logs")
+    yield "acme"
+    PARSER_REGISTRY.pop("acme", None)
+    if "acme" in DETECTION_ORDER:
+        DETECTION_ORDER.remove("acme")
+
+
+@pytest.fixture
+def acme_file(tmp_path: Path) -> Path:
+    path = tmp_path / "acme.log"
+    path.write_text("\n".join(LINES) + "\n")
+    return path
+
+
+class TestCompileGrok:
+    """Tests for compile_grok."""
+
+    def test_fields_and_roles(self):
+        """Test fields are collected and well-known names get roles."""
+        spec = compile_grok(SPEC)
+        assert [field.name for field in spec.fields] == [
+            "ts",
+            "level",
+            "service",
+            "latency_ms",
+            "msg",
+        ]
+        assert (spec.timestamp_field, spec.level_field, spec.message_field) == (
+            "ts",
+            "level",
+            "msg",
+        )
+        assert spec.regex.pattern.startswith("^") and spec.regex.pattern.endswith("$")
+
+    def test_cached(self):
+        """Test a spec is compiled once."""
+        assert compile_grok(SPEC) is compile_grok(SPEC)
+
+    @pytest.mark.parametrize(
+        "spec",
+        ["%{NOPE:x}", "%{INT:x:decimal}", "no fields here", "%{WORD:x} ("],
+    )
+    def test_invalid_specs(self, spec: str):
+        """Test unknown patterns, types, fieldless and broken specs are rejected."""
+        with pytest.raises(ValueError):
+            compile_grok(spec)
+
+
+class TestGrokParser:
+    """Tests for GrokParser."""
+
+    def test_parse_line(self):
+        """Test typed fields, level, timestamp and message extraction."""
+        entry = GrokParser(spec=SPEC).parse_line(LINES[1], 2)
+
+        assert entry is not None
+        assert entry.level == LogLevel.ERROR
+        assert entry.timestamp is not None and entry.timestamp.second == 1
+        assert entry.message == "payment gateway timeout"
+        assert entry.metadata == {"service": "billing", "latency_ms": 950}
+
+    def test_anchored(self):
+        """Test lines must match the whole spec."""
+        parser = GrokParser(spec=SPEC)
+        assert not parser.can_parse("prefix " + LINES[0])
+        assert parser.parse_line("Jan 15 10:30:00 host app: hi", 1) is None
+
+    def test_requires_spec(self):
+        """Test the base class needs a spec."""
+        with pytest.raises(ValueError):
+            GrokParser()
+
+
+class TestRegistration:
+    """Tests for register_format and format_hint."""
+
+    def test_registered_by_name(self, acme_format: str):
+        """Test a registered format is available from the registry."""
+        parser = get_parser(acme_format)
+        assert isinstance(parser, GrokParser)
+        assert parser.name == "acme"
+        assert DETECTION_ORDER.index("acme") < DETECTION_ORDER.index("generic")
+
+    def test_inline_spec(self):
+        """Test get_parser compiles an inline spec."""
+        parser = get_parser(SPEC)
+        assert parser.parse_line(LINES[0], 1) is not None
+
+    def test_builtin_names_protected(self):
+        """Test built-in formats cannot be replaced."""
+        with pytest.raises(ValueError):
+            register_format("syslog", SPEC)
+
+    def test_auto_detection(self, acme_format: str, acme_file: Path):
+        """Test auto-detection picks a registered format over the generic fallback."""
+        parser, confidence = detect_format(str(acme_file))
+        assert parser.name == acme_format
+        assert confidence > 0.9
+
+    def test_format_hint_in_tools(self, acme_file: Path):
+        """Test tools accept an inline spec as format_hint."""
+        result = json.loads(
+            log_analyzer_extract_errors(str(acme_file), format_hint=SPEC, response_format="json")
+        )
+        assert result["total_errors"] == 1
+
+    def test_register_tool(self, acme_file: Path):
+        """Test the MCP tool registers a format and reports its match rate."""
+        try:
+            result = json.loads(
+                log_analyzer_register_format(
+                    "acme", SPEC, file_path=str(acme_file), response_format="json"
+                )
+            )
+        finally:
+            PARSER_REGISTRY.pop("acme", None)
+            DETECTION_ORDER.remove("acme")
+
+        assert result["fields"] == ["ts", "level", "service", "latency_ms", "msg"]
+        assert result["test"]["match_rate"] == 1.0
@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from codesdevs_log_analyzer.models import LogLevel
+from codesdevs_log_analyzer.models import LogLevel, MultiLineLogEntry
 from codesdevs_log_analyzer.parsers.java import JavaLogParser
 
 
@@ -80,3 +80,37 @@ class TestJavaLogParser:
         """Test format detection confidence."""
         confidence = JavaLogParser.detect_confidence(sample_java_lines)
         assert confidence > 0.7
+
+    def test_parse_file_attaches_stack_trace(
+        self, parser: JavaLogParser, java_log_file: Path
+    ) -> None:
+        """Test stack frames are attached to their parent entry lazily."""
+        entries = list(parser.parse_file(str(java_log_file)))
+        exception = next(e for e in entries if e.message.startswith("java.lang.NullPointer"))
+
+        assert isinstance(exception, MultiLineLogEntry)
+        assert exception.metadata["continuation_lines"] == 6
+        assert len(exception.continuation) == 6
+        assert exception.message.endswith("... 10 more")
+        assert exception.model_dump()["message"] == exception.message
+
+    def test_parse_file_caps_continuation_lines(self, tmp_path: Path) -> None:
+        """Test long stack traces are capped and the cap is recorded."""
+        log_file = tmp_path / "deep.log"
+        frames = [f"\tat com.example.Frame{i}.call(Frame{i}.java:{i})" for i in range(50)]
+        log_file.write_text(
+            "2026-01-15 10:30:00,123 ERROR [main] com.example.App - Boom\n"
+            + "\n".join(frames)
+            + "\n2026-01-15 10:30:01,000 INFO [main] com.example.App - Recovered\n"
+        )
+
+        parser = JavaLogParser(max_continuation_lines=10)
+        entries = list(parser.parse_file(str(log_file)))
+
+        assert len(entries) == 2
+        error = entries[0]
+        assert error.metadata["continuation_lines"] == 50
+        assert error.metadata["continuation_truncated"] == 40
+        assert error.message.count("\tat ") == 10
+        assert error.message.endswith("... (40 lines truncated)")
+        assert "continuation_lines" not in entries[1].metadata
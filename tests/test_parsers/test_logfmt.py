@@ -0,0 +1,96 @@
+"""Tests for logfmt parser."""
+
+import pytest
+
+from codesdevs_log_analyzer.models import LogLevel
+from codesdevs_log_analyzer.parsers import detect_format_from_lines
+from codesdevs_log_analyzer.parsers.kubernetes import KubernetesParser
+from codesdevs_log_analyzer.parsers.logfmt import LogfmtParser, parse_logfmt
+
+
+class TestParseLogfmt:
+    """Tests for the logfmt tokenizer."""
+
+    def test_plain_and_quoted_values(self) -> None:
+        """Test unquoted, quoted and empty values."""
+        assert parse_logfmt('a=1 b="two words" c= d=""') == {
+            "a": "1",
+            "b": "two words",
+            "c": "",
+            "d": "",
+        }
+
+    def test_escapes(self) -> None:
+        """Test escaped quotes, backslashes and newlines in quoted values."""
+        pairs = parse_logfmt(r'msg="say \"hi\"\nbye" path="C:\\tmp\\" next=1')
+        assert pairs == {"msg": 'say "hi"\nbye', "path": "C:\\tmp\\", "next": "1"}
+
+    def test_bare_keys_and_spacing(self) -> None:
+        """Test flags without values and runs of spaces."""
+        assert parse_logfmt("  debug   a=1  ") == {"debug": "", "a": "1"}
+
+    @pytest.mark.parametrize("text", ['msg="unterminated', "=value a=1"])
+    def test_malformed(self, text: str) -> None:
+        """Test unterminated quotes and empty keys are rejected."""
+        assert parse_logfmt(text) is None
+
+
+class TestLogfmtParser:
+    """Tests for LogfmtParser."""
+
+    @pytest.fixture
+    def parser(self) -> LogfmtParser:
+        """Create parser instance."""
+        return LogfmtParser()
+
+    def test_can_parse(self, parser: LogfmtParser, sample_logfmt_lines: list[str]) -> None:
+        """Test can_parse accepts logfmt records only."""
+        assert all(parser.can_parse(line) for line in sample_logfmt_lines)
+        assert not parser.can_parse("Some text with a=b inside")
+        assert not parser.can_parse("a=1 b=2")
+        assert not parser.can_parse('{"level": "info"}')
+        assert not parser.can_parse("")
+
+    def test_parse_fields(self, parser: LogfmtParser, sample_logfmt_lines: list[str]) -> None:
+        """Test well-known keys map to entry fields and the rest to metadata."""
+        entry = parser.parse_line(sample_logfmt_lines[1], 2)
+
+        assert entry is not None
+        assert entry.level == LogLevel.ERROR
+        assert entry.timestamp is not None and entry.timestamp.second == 1
+        assert entry.message == 'query failed: "users" locked'
+        assert entry.metadata == {"db": "main"}
+
+    def test_alternative_keys(self, parser: LogfmtParser) -> None:
+        """Test alternative key names and epoch timestamps."""
+        entry = parser.parse_line("time=1768473000.5 severity=WARN message=retrying attempt=2", 1)
+
+        assert entry is not None
+        assert entry.level == LogLevel.WARN
+        assert entry.timestamp is not None and entry.timestamp.year == 2026
+        assert entry.message == "retrying"
+        assert entry.metadata == {"attempt": "2"}
+
+    def test_unrecognized_level_kept(self, parser: LogfmtParser) -> None:
+        """Test values that do not map to a field stay in metadata."""
+        entry = parser.parse_line("level=verbose-ish msg=hello", 1)
+
+        assert entry is not None
+        assert entry.level is None
+        assert entry.metadata == {"level": "verbose-ish"}
+
+    def test_detection(self, sample_logfmt_lines: list[str]) -> None:
+        """Test auto-detection picks logfmt for key=value records."""
+        parser, confidence = detect_format_from_lines(sample_logfmt_lines * 5)
+        assert isinstance(parser, LogfmtParser)
+        assert confidence > 0.9
+
+
+def test_kubernetes_structured_escapes() -> None:
+    """Test timestamp-prefixed key=value lines keep escaped quotes."""
+    line = r'2026-01-15T10:30:00Z level=error msg="bad \"token\"" pod=api-1'
+    entry = KubernetesParser().parse_line(line, 1)
+
+    assert entry is not None
+    assert entry.message == 'bad "token"'
+    assert entry.metadata["pod"] == "api-1"
@@ -0,0 +1,130 @@
+"""Tests for the mixed-format parser."""
+
+from pathlib import Path
+
+from codesdevs_log_analyzer.models import LogLevel, MultiLineLogEntry
+from codesdevs_log_analyzer.parsers import (
+    JSONLParser,
+    MixedFormatParser,
+    detect_format,
+    detect_format_from_lines,
+    get_parser,
+)
+from codesdevs_log_analyzer.parsers.mixed import line_signature
+
+TEST_LOGS_DIR = Path(__file__).parent.parent.parent / "test_logs"
+
+MIXED_LINES = [
+    '{"timestamp":"2026-01-15T10:30:00Z","level":"info","msg":"service started"}',
+    '{"timestamp":"2026-01-15T10:30:01Z","level":"error","msg":"request failed"}',
+    "Traceback (most recent call last):",
+    '  File "app.py", line 10, in handler',
+    "    run()",
+    "ValueError: bad input",
+    "2026-01-15 10:30:02,123 - worker - INFO - Job done",
+    "2026-01-15 10:30:03,456 - worker - ERROR - Job failed",
+    '{"timestamp":"2026-01-15T10:30:04Z","level":"warn","msg":"slow response"}',
+]
+
+
+def _write(tmp_path: Path, lines: list[str]) -> str:
+    path = tmp_path / "mixed.log"
+    path.write_text("\n".join(lines) + "\n")
+    return str(path)
+
+
+class TestLineSignature:
+    """Tests for line_signature."""
+
+    def test_same_shape_shares_signature(self):
+        """Test lines differing only in values share a signature."""
+        assert line_signature("Jan 15 10:30:00 host a") == line_signature("Feb  3 08:15:30 other b")
+
+    def test_different_shapes_differ(self):
+        """Test JSON and bracketed lines get distinct signatures."""
+        assert line_signature('{"level":"error"}') != line_signature("[Thu Jan 15] [error]")
+
+
+class TestMixedFormatParser:
+    """Tests for MixedFormatParser."""
+
+    def test_dispatches_each_line(self, tmp_path: Path):
+        """Test each line is parsed by the parser for its format."""
+        parser = MixedFormatParser()
+        entries = list(parser.parse_file(_write(tmp_path, MIXED_LINES)))
+
+        assert [e.metadata["source_format"] for e in entries] == [
+            "jsonl",
+            "jsonl",
+            "python",
+            "python",
+            "jsonl",
+        ]
+        assert [e.level for e in entries] == [
+            LogLevel.INFO,
+            LogLevel.ERROR,
+            LogLevel.INFO,
+            LogLevel.ERROR,
+            LogLevel.WARN,
+        ]
+
+    def test_traceback_attaches_to_previous_entry(self, tmp_path: Path):
+        """Test plain-text traceback lines continue the preceding JSON entry."""
+        parser = MixedFormatParser()
+        entries = list(parser.parse_file(_write(tmp_path, MIXED_LINES)))
+
+        error = entries[1]
+        assert isinstance(error, MultiLineLogEntry)
+        assert error.head_message == "request failed"
+        assert error.continuation[0] == "Traceback (most recent call last):"
+        assert error.continuation[-1] == "ValueError: bad input"
+
+    def test_signature_cache_needs_confirmation(self, tmp_path: Path):
+        """Test a signature is cached once two of its lines picked the same parser."""
+        parser = MixedFormatParser()
+        list(parser.parse_file(_write(tmp_path, MIXED_LINES)))
+
+        assert parser.signatures == {
+            line_signature(MIXED_LINES[0]): "jsonl",
+            line_signature(MIXED_LINES[6]): "python",
+        }
+
+        parser.parser_for("Traceback (most recent call last):")
+        assert parser.signatures[line_signature("Traceback (most recent call last):")] is None
+
+    def test_sample_logfile_keeps_every_line(self):
+        """Test the prompt line is kept and padded uvicorn lines are not split as python."""
+        parser = MixedFormatParser()
+        entries = list(parser.parse_file(str(TEST_LOGS_DIR / "logfile.log")))
+
+        assert entries[0].line_number == 1
+        assert entries[0].raw_line.startswith("➜  polymarket-bot")
+        access = next(e for e in entries if e.line_number == 6)
+        assert access.metadata["source_format"] == "generic"
+        assert access.message == '127.0.0.1:62266 - "GET / HTTP/1.1" 500 Internal Server Error'
+        assert "module" not in access.metadata
+
+    def test_get_parser_by_name(self):
+        """Test the parser is reachable through the registry."""
+        assert isinstance(get_parser("mixed"), MixedFormatParser)
+
+
+class TestMixedDetection:
+    """Tests for mixed-format auto-detection."""
+
+    def test_detects_interleaved_formats(self, tmp_path: Path):
+        """Test detection picks the mixed parser for interleaved formats."""
+        parser, confidence = detect_format(_write(tmp_path, MIXED_LINES))
+        assert isinstance(parser, MixedFormatParser)
+        assert confidence > 0.9
+
+    def test_sample_logfile_not_mixed(self):
+        """Test the uvicorn sample log keeps the generic parser."""
+        parser, _ = detect_format(str(TEST_LOGS_DIR / "logfile.log"))
+        assert parser.name == "generic"
+
+    def test_single_format_keeps_dedicated_parser(self, sample_jsonl_lines: list[str]):
+        """Test single-format samples are not reported as mixed."""
+        assert MixedFormatParser.detect_confidence(sample_jsonl_lines) == 0.0
+        parser, _ = detect_format_from_lines(sample_jsonl_lines)
+        assert isinstance(parser, JSONLParser)
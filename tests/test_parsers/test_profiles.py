@@ -0,0 +1,192 @@
+"""Tests for learned format profiles."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from codesdevs_log_analyzer.parsers import (
+    FormatProfile,
+    JSONLParser,
+    ProfileStore,
+    SyslogParser,
+    detect_format_with_profiles,
+    get_profile_store,
+)
+from codesdevs_log_analyzer.parsers.profiles import profile_pattern
+
+GENERIC = (
+    "[INFO] starting worker pool\n"
+    "ERROR could not open socket on port\n"
+    "[WARN] retrying the connection later\n"
+    "INFO cache warmed\n"
+    "DEBUG all workers ready now\n"
+)
+SYSLOG = "Jan 15 10:30:00 myhost sshd[1234]: Accepted connection\n" * 5
+JSONL = '{"timestamp":"2026-01-15T10:30:00Z","level":"info","msg":"ok"}\n' * 5
+
+
+class CountingStore(ProfileStore):
+    """In-memory store counting detections that ran."""
+
+    recorded = 0
+
+    def record(
+        self, file_path: str, format_name: str, confidence: float, spec: str | None = None
+    ) -> None:
+        self.recorded += 1
+        super().record(file_path, format_name, confidence, spec)
+
+
+class TestProfilePattern:
+    """Tests for profile_pattern."""
+
+    @pytest.mark.parametrize(
+        "name",
+        ["app.log", "app.log.1", "app.log.2.gz", "app.log-20260115", "app.log.2026-01-15.3"],
+    )
+    def test_rotations_share_pattern(self, tmp_path: Path, name: str):
+        """Test rotated names map to the live file's pattern."""
+        assert profile_pattern(str(tmp_path / name)) == str(tmp_path / "app.log*")
+
+    def test_digits_become_wildcards(self, tmp_path: Path):
+        """Test embedded dates and counters become wildcards."""
+        assert profile_pattern(str(tmp_path / "worker-3.2026-01-15.log")) == str(
+            tmp_path / "worker-*.*-*-*.log*"
+        )
+
+
+class TestDetectWithProfiles:
+    """Tests for detect_format_with_profiles."""
+
+    def test_rotated_file_skips_detection(self, tmp_path: Path):
+        """Test a new rotation is spot-checked instead of detected."""
+        store = CountingStore(None)
+        (tmp_path / "app.log").write_text(SYSLOG)
+        (tmp_path / "app.log.1").write_text(SYSLOG)
+
+        detect_format_with_profiles(str(tmp_path / "app.log"), store=store)
+        parser, confidence = detect_format_with_profiles(str(tmp_path / "app.log.1"), store=store)
+
+        assert isinstance(parser, SyslogParser)
+        assert confidence == 1.0
+        assert store.recorded == 1
+        assert store.lookup(str(tmp_path / "app.log.1")).hits == 1
+
+    def test_failed_spot_check_redetects(self, tmp_path: Path):
+        """Test a file that no longer fits its profile is detected again."""
+        store = CountingStore(None)
+        (tmp_path / "app.log").write_text(SYSLOG)
+        (tmp_path / "app.log.1").write_text(JSONL)
+
+        detect_format_with_profiles(str(tmp_path / "app.log"), store=store)
+        parser, _ = detect_format_with_profiles(str(tmp_path / "app.log.1"), store=store)
+
+        assert isinstance(parser, JSONLParser)
+        assert store.recorded == 2
+        assert store.lookup(str(tmp_path / "app.log")).format == "jsonl"
+
+    def test_directory_profile(self, tmp_path: Path):
+        """Test other files in a single-format directory use its profile."""
+        store = CountingStore(None)
+        (tmp_path / "api.log").write_text(JSONL)
+        (tmp_path / "worker.out").write_text(JSONL)
+
+        detect_format_with_profiles(str(tmp_path / "api.log"), store=store)
+        parser, _ = detect_format_with_profiles(str(tmp_path / "worker.out"), store=store)
+
+        assert isinstance(parser, JSONLParser)
+        assert store.recorded == 1
+
+    def test_directory_profile_needs_full_spot_check(self, tmp_path: Path):
+        """Test a sibling passing only a rotation's looser spot-check is detected."""
+        store = CountingStore(None)
+        partial = SYSLOG + "plain text without structure\n" + SYSLOG
+        (tmp_path / "app.log").write_text(SYSLOG)
+        (tmp_path / "app.log.1").write_text(partial)
+        (tmp_path / "other.log").write_text(partial)
+
+        detect_format_with_profiles(str(tmp_path / "app.log"), store=store)
+        detect_format_with_profiles(str(tmp_path / "app.log.1"), store=store)
+        assert store.recorded == 1
+
+        detect_format_with_profiles(str(tmp_path / "other.log"), store=store)
+        assert store.recorded == 2
+
+    def test_generic_file_leaves_siblings_alone(self, tmp_path: Path):
+        """Test a fallback detection does not become the profile of its directory."""
+        store = ProfileStore(None)
+        (tmp_path / "generic.log").write_text(GENERIC)
+        (tmp_path / "sys.log").write_text(SYSLOG)
+
+        generic, _ = detect_format_with_profiles(str(tmp_path / "generic.log"), store=store)
+        parser, confidence = detect_format_with_profiles(str(tmp_path / "sys.log"), store=store)
+
+        assert generic.name == "generic"
+        assert isinstance(parser, SyslogParser)
+        assert confidence == 1.0
+
+    def test_stored_weak_directory_profile_ignored(self, tmp_path: Path):
+        """Test fallback and weak directory profiles from older stores are not used."""
+        store = ProfileStore(None)
+        directory = str(tmp_path / "*")
+        store.profiles[directory] = FormatProfile(directory, "generic", 1.0, "2026-01-15T00:00:00")
+        assert store.lookup(str(tmp_path / "sys.log")) is None
+
+        store.profiles[directory] = FormatProfile(directory, "syslog", 0.6, "2026-01-15T00:00:00")
+        assert store.lookup(str(tmp_path / "sys.log")) is None
+
+    def test_conflicting_directory_has_no_profile(self, tmp_path: Path):
+        """Test a directory with mixed formats stops matching new files."""
+        store = ProfileStore(None)
+        store.record(str(tmp_path / "a.log"), "syslog", 1.0)
+        store.record(str(tmp_path / "b.log"), "jsonl", 1.0)
+
+        assert store.lookup(str(tmp_path / "c.txt")) is None
+
+    def test_low_confidence_not_remembered(self, tmp_path: Path):
+        """Test weak detections are not stored."""
+        store = ProfileStore(None)
+        store.record(str(tmp_path / "a.log"), "generic", 0.2)
+        assert store.profiles == {}
+
+
+class TestPersistence:
+    """Tests for the JSON-backed store."""
+
+    def test_profiles_survive_reload(self, tmp_path: Path):
+        """Test profiles are written to and read back from disk."""
+        path = tmp_path / "profiles.json"
+        ProfileStore(str(path)).record(str(tmp_path / "app.log"), "syslog", 0.9)
+
+        profile = ProfileStore(str(path)).lookup(str(tmp_path / "app.log.4.gz"))
+
+        assert profile is not None
+        assert profile.format == "syslog"
+        assert profile.confidence == 0.9
+        assert json.loads(path.read_text())["version"] == 1
+
+    def test_corrupt_store_ignored(self, tmp_path: Path):
+        """Test an unreadable store behaves as empty."""
+        path = tmp_path / "profiles.json"
+        path.write_text("{not json")
+        assert ProfileStore(str(path)).profiles == {}
+
+    def test_store_path_from_environment(self, isolated_format_profiles: Path, tmp_path: Path):
+        """Test the default store follows LOG_ANALYZER_PROFILES."""
+        (tmp_path / "app.log").write_text(SYSLOG)
+        detect_format_with_profiles(str(tmp_path / "app.log"))
+
+        assert get_profile_store().path == str(isolated_format_profiles)
+        assert isolated_format_profiles.exists()
+
+    def test_in_memory_by_default(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+        """Test profiles are only persisted when a store path is configured."""
+        monkeypatch.delenv("LOG_ANALYZER_PROFILES")
+        monkeypatch.setenv("HOME", str(tmp_path))
+        (tmp_path / "app.log").write_text(SYSLOG)
+        detect_format_with_profiles(str(tmp_path / "app.log"))
+
+        assert get_profile_store().path is None
+        assert get_profile_store().lookup(str(tmp_path / "app.log")) is not None
+        assert not (tmp_path / ".cache").exists()
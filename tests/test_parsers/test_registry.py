@@ -35,6 +35,11 @@ class TestParserRegistry:
             "java",
             "docker",
             "kubernetes",
+            "logfmt",
+            "w3c",
+            "elb",
+            "csv",
+            "tsv",
             "generic",
         ]
         for name in expected:
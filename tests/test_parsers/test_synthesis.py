@@ -0,0 +1,125 @@
+"""Tests for parser synthesis from unknown formats."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from codesdevs_log_analyzer.models import LogLevel
+from codesdevs_log_analyzer.parsers import (
+    SYNTHESIZED_NAME,
+    GenericParser,
+    GrokParser,
+    ProfileStore,
+    detect_format,
+    detect_format_from_lines,
+    detect_format_with_profiles,
+    get_parser,
+    register_format,
+    synthesize_spec,
+)
+from codesdevs_log_analyzer.server import log_analyzer_suggest_format
+
+PIPE_LINES = [
+    f"2026-01-15 10:30:{i:02d} | {level} | worker-{i % 3} | job {i} finished"
+    for i, level in enumerate(["INFO", "WARN", "ERROR", "INFO", "DEBUG", "INFO", "ERROR", "INFO"])
+]
+
+
+class TestSynthesizeSpec:
+    """Tests for synthesize_spec."""
+
+    @pytest.mark.parametrize(
+        "lines",
+        [
+            PIPE_LINES,
+            [f"[2026-01-15 10:30:{i:02d}] [WARN] [db] slow query {i}" for i in range(8)],
+            [f"01/15/2026 10:30:{i:02d} ERROR: disk {i} full" for i in range(8)],
+            [f"17684{i:05d} 4{i} INFO request served" for i in range(8)],
+        ],
+    )
+    def test_structures(self, lines: list[str]):
+        """Test pipe, bracketed, US-date and epoch layouts yield a spec covering every line."""
+        spec = synthesize_spec(lines)
+        assert spec is not None
+        parser = GrokParser(spec=spec)
+        entries = [parser.parse_line(line, i) for i, line in enumerate(lines, 1)]
+        assert all(entry is not None and entry.level is not None for entry in entries)
+
+    def test_fields_extracted(self):
+        """Test columns before the level become metadata and the rest the message."""
+        spec = synthesize_spec(PIPE_LINES)
+        assert spec is not None
+        entry = GrokParser(spec=spec).parse_line(PIPE_LINES[2], 3)
+
+        assert entry is not None
+        assert entry.level == LogLevel.ERROR
+        assert entry.timestamp is not None and entry.timestamp.second == 2
+        assert entry.message == "worker-2 | job 2 finished"
+
+    def test_unstructured_sample(self):
+        """Test lines without a shared structure are not synthesized."""
+        lines = Path("test_logs/generic.log").read_text().splitlines()
+        assert synthesize_spec(lines) is None
+
+    def test_too_few_lines(self):
+        """Test tiny samples are not synthesized."""
+        assert synthesize_spec(PIPE_LINES[:2]) is None
+
+
+class TestDetection:
+    """Tests for synthesis as the generic fallback."""
+
+    def test_replaces_generic(self):
+        """Test detection prefers a synthesized parser over the generic one."""
+        parser, confidence = detect_format_from_lines(PIPE_LINES)
+        generic_confidence = GenericParser.detect_confidence(PIPE_LINES)
+
+        assert isinstance(parser, GrokParser)
+        assert parser.name == SYNTHESIZED_NAME
+        assert confidence > generic_confidence
+
+    def test_known_formats_unaffected(self):
+        """Test files with a dedicated parser are not synthesized."""
+        parser, _ = detect_format("test_logs/syslog.log")
+        assert parser.name == "syslog"
+
+    def test_profile_keeps_spec(self, tmp_path: Path):
+        """Test a remembered synthesized format is rebuilt from its spec."""
+        store = ProfileStore(None)
+        (tmp_path / "jobs.log").write_text("\n".join(PIPE_LINES) + "\n")
+        (tmp_path / "jobs.log.1").write_text("\n".join(PIPE_LINES) + "\n")
+
+        first, _ = detect_format_with_profiles(str(tmp_path / "jobs.log"), store=store)
+        second, _ = detect_format_with_profiles(str(tmp_path / "jobs.log.1"), store=store)
+
+        assert isinstance(first, GrokParser) and isinstance(second, GrokParser)
+        assert second.spec is first.spec
+        assert store.lookup(str(tmp_path / "jobs.log.1")).hits == 1
+
+    def test_name_reserved(self):
+        """Test the synthesized name cannot be registered."""
+        with pytest.raises(ValueError):
+            register_format(SYNTHESIZED_NAME, "%{GREEDYDATA:message}")
+
+
+class TestSuggestFormat:
+    """Tests for the synthesized pattern in log_analyzer_suggest_format."""
+
+    def test_pattern_reported(self, tmp_path: Path):
+        """Test the tool reports a pattern that works as format_hint."""
+        path = tmp_path / "jobs.log"
+        path.write_text("\n".join(PIPE_LINES) + "\n")
+
+        result = json.loads(log_analyzer_suggest_format(str(path), response_format="json"))
+
+        assert result["recommended_format"] == SYNTHESIZED_NAME
+        pattern = result["synthesized_pattern"]
+        assert get_parser(pattern).parse_line(PIPE_LINES[0], 1) is not None
+        assert "format_hint" in result["recommendations"][0]
+
+    def test_markdown(self, tmp_path: Path):
+        """Test the markdown report shows the pattern."""
+        path = tmp_path / "jobs.log"
+        path.write_text("\n".join(PIPE_LINES) + "\n")
+        assert "### Synthesized Pattern" in log_analyzer_suggest_format(str(path))
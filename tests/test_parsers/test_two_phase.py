@@ -0,0 +1,130 @@
+"""Tests for two-phase (scan, then lazy full) parsing."""
+
+from pathlib import Path
+
+from codesdevs_log_analyzer.analyzers.error_extractor import ErrorExtractor
+from codesdevs_log_analyzer.models import EntryField, LazyLogEntry, LogLevel, ParsedLogEntry
+from codesdevs_log_analyzer.parsers import (
+    SCAN_FIELDS,
+    ApacheAccessParser,
+    FieldNeeds,
+    JSONLParser,
+    PythonLogParser,
+    SyslogParser,
+)
+
+SYSLOG_LINE = "Jan 15 10:30:00 myhost sshd[1234]: error: Connection failed"
+
+
+class CountingSyslogParser(SyslogParser):
+    """Syslog parser that counts full parses."""
+
+    full_parses = 0
+
+    def parse_line(self, line: str, line_number: int) -> ParsedLogEntry | None:
+        self.full_parses += 1
+        return super().parse_line(line, line_number)
+
+
+class TestFieldNeeds:
+    """Tests for FieldNeeds."""
+
+    def test_default_needs_everything(self):
+        """Test the default declaration parses every entry fully."""
+        needs = FieldNeeds()
+        assert not needs.deferrable
+        assert needs.needs_full_parse("INFO")
+
+    def test_level_filter(self):
+        """Test only listed levels are fully parsed up front."""
+        needs = FieldNeeds(levels=frozenset({"ERROR"}))
+        assert needs.deferrable
+        assert needs.needs_full_parse("error")
+        assert not needs.needs_full_parse("INFO")
+        assert not needs.needs_full_parse(None)
+
+    def test_scan_fields_never_parse_fully(self):
+        """Test level/timestamp-only needs never force a full parse."""
+        assert SCAN_FIELDS.deferrable
+        assert not SCAN_FIELDS.needs_full_parse("ERROR")
+
+    def test_union(self):
+        """Test combining needs widens fields and levels."""
+        errors = FieldNeeds(levels=frozenset({"ERROR"}))
+        combined = errors.union(FieldNeeds(levels=frozenset({"WARN"})))
+        assert combined.levels == {"ERROR", "WARN"}
+        assert errors.union(FieldNeeds()).levels is None
+        assert SCAN_FIELDS.union(SCAN_FIELDS).fields == {EntryField.LEVEL, EntryField.TIMESTAMP}
+
+
+class TestLazyLogEntry:
+    """Tests for scan-phase entries."""
+
+    def test_scan_defers_full_parse(self):
+        """Test scanning extracts level and timestamp without a full parse."""
+        parser = CountingSyslogParser()
+        entry = parser.scan_line(SYSLOG_LINE, 7)
+
+        assert isinstance(entry, LazyLogEntry)
+        assert entry.level == LogLevel.ERROR
+        assert entry.timestamp is not None
+        assert parser.full_parses == 0
+        assert not entry.is_resolved
+
+    def test_message_access_resolves(self):
+        """Test reading message or metadata runs the full parse once."""
+        parser = CountingSyslogParser()
+        entry = parser.scan_line(SYSLOG_LINE, 7)
+        assert entry is not None
+
+        assert entry.message == "error: Connection failed"
+        assert entry.metadata["hostname"] == "myhost"
+        assert parser.full_parses == 1
+
+    def test_resolved_entry_matches_full_parse(self):
+        """Test a resolved lazy entry equals the eagerly parsed entry."""
+        lines = [
+            (SyslogParser(), SYSLOG_LINE),
+            (
+                ApacheAccessParser(),
+                '10.0.0.1 - - [15/Jan/2026:10:30:00 +0000] "GET /api HTTP/1.1" 503 12 "-" "curl"',
+            ),
+            (JSONLParser(), '{"ts":"2026-01-15T10:30:00Z","level":"warn","msg":"slow","id":3}'),
+            (PythonLogParser(), "2026-01-15 10:30:00,123 - app.db - ERROR - Query failed"),
+        ]
+        for parser, line in lines:
+            lazy = parser.scan_line(line, 3)
+            assert isinstance(lazy, LazyLogEntry), parser.name
+            full = parser.parse_line(line, 3)
+            assert full is not None
+            assert lazy.model_dump() == full.model_dump()
+
+
+class TestParseFileWithNeeds:
+    """Tests for parse_file with declared field needs."""
+
+    def test_only_survivors_fully_parsed(self, tmp_path: Path):
+        """Test entries outside the declared levels stay unresolved."""
+        log = tmp_path / "sys.log"
+        log.write_text(
+            "Jan 15 10:30:00 host app[1]: started\n"
+            f"{SYSLOG_LINE}\n"
+            "Jan 15 10:30:02 host app[1]: request done\n"
+        )
+        parser = CountingSyslogParser()
+        entries = list(parser.parse_file(str(log), needs=FieldNeeds(levels=frozenset({"ERROR"}))))
+
+        assert len(entries) == 3
+        assert parser.full_parses == 1
+        assert [isinstance(e, LazyLogEntry) and e.is_resolved for e in entries] == [
+            False,
+            True,
+            False,
+        ]
+
+    def test_error_extraction_unchanged(self, syslog_file: Path, python_log_file: Path):
+        """Test error extraction gives the same result with deferred parsing."""
+        for parser, path in ((SyslogParser(), syslog_file), (PythonLogParser(), python_log_file)):
+            deferred = ErrorExtractor().analyze_file(parser, str(path))
+            eager = ErrorExtractor().analyze_entries(parser.parse_file(str(path)))
+            assert deferred.to_dict() == eager.to_dict()
@@ -12,7 +12,9 @@ from codesdevs_log_analyzer import (
     log_analyzer_extract_errors,
     log_analyzer_multi,
     log_analyzer_parse,
+    log_analyzer_redact,
     log_analyzer_search,
+    log_analyzer_sequence,
     log_analyzer_suggest_patterns,
     log_analyzer_summarize,
     log_analyzer_tail,
@@ -116,9 +118,9 @@ class TestServerImport:
         assert mcp.name == "log_analyzer_mcp"
 
     def test_all_tools_registered(self):
-        """Test that all 14 tools are registered."""
+        """Test that all 18 tools are registered."""
         tools = mcp._tool_manager._tools
-        assert len(tools) == 14, f"Expected 14 tools, got {len(tools)}"
+        assert len(tools) == 18, f"Expected 18 tools, got {len(tools)}"
 
     def test_tool_functions_callable(self):
         """Test that all tool functions are callable."""
@@ -466,6 +468,135 @@ class TestLogAnalyzerCorrelate:
 
         assert "Error" in result or "Invalid" in result
 
+    def test_correlate_multiple_anchors(self, python_log_file):
+        """Test named anchors are correlated together, one section each."""
+        result = log_analyzer_correlate(
+            python_log_file,
+            anchor_pattern="ERROR",
+            anchors={"connection": "Connection"},
+            response_format="json"
+        )
+
+        data = json.loads(result)
+        assert sorted(data["anchors"]) == ["ERROR", "connection"]
+        assert data["anchors"]["connection"]["anchor_pattern"] == "Connection"
+        assert "windows" in data["anchors"]["ERROR"]
+
+        markdown = log_analyzer_correlate(python_log_file, anchors={"connection": "Connection"})
+        assert "### connection" in markdown
+
+    def test_correlate_requires_anchor(self, python_log_file):
+        """Test correlation without any anchor pattern is an error."""
+        assert log_analyzer_correlate(python_log_file).startswith("Error:")
+
+
+
+# =============================================================================
+# Tool: log_analyzer_sequence Tests
+# =============================================================================
+
+
+class TestLogAnalyzerSequence:
+    """Tests for log_analyzer_sequence tool."""
+
+    @pytest.fixture
+    def lock_log_file(self, tmp_path) -> str:
+        """Lock events for two requests, one of which times out."""
+        lines = [
+            "2024-01-15 10:00:00,000 - app - INFO - lock acquired request_id=r1",
+            "2024-01-15 10:00:01,000 - app - INFO - lock acquired request_id=r2",
+            "2024-01-15 10:00:02,000 - app - INFO - lock released request_id=r1",
+            "2024-01-15 10:00:20,000 - app - ERROR - lock timeout request_id=r2",
+        ]
+        log_file = tmp_path / "locks.log"
+        log_file.write_text("\n".join(lines) + "\n")
+        return str(log_file)
+
+    def test_sequence_json(self, lock_log_file):
+        """Test sequences are joined by key and counted."""
+        result = log_analyzer_sequence(
+            lock_log_file,
+            steps=["lock acquired", "lock timeout"],
+            within_seconds=30,
+            key="request_id",
+            response_format="json"
+        )
+
+        data = json.loads(result)
+        assert data["started"] == 2
+        assert data["completed"] == 1
+        assert data["top_keys"] == {"r2": 1}
+        assert [s["line_number"] for s in data["matches"][0]["steps"]] == [2, 4]
+
+    def test_sequence_markdown(self, lock_log_file):
+        """Test markdown output lists the matches."""
+        result = log_analyzer_sequence(
+            lock_log_file, steps=["lock acquired", "lock timeout"], key="request_id"
+        )
+
+        assert "Sequence Matches" in result
+        assert "`r2`: 1" in result
+
+    def test_sequence_invalid(self, lock_log_file):
+        """Test invalid sequences and missing files are errors."""
+        assert log_analyzer_sequence(lock_log_file, steps=["lock acquired"]).startswith("Error:")
+        assert log_analyzer_sequence("/nonexistent.log", steps=["a", "b"]).startswith("Error")
+
+
+# =============================================================================
+# Tool: log_analyzer_redact Tests
+# =============================================================================
+
+
+class TestLogAnalyzerRedact:
+    """Tests for log_analyzer_redact tool."""
+
+    @pytest.fixture
+    def pii_log_file(self, tmp_path) -> str:
+        """Log with an email and a connection string."""
+        log_file = tmp_path / "pii.log"
+        log_file.write_text(
+            "2024-01-15 10:00:00,000 - app - INFO - signup bob@example.com\n"
+            "2024-01-15 10:00:01,000 - app - INFO - connecting to postgres://db/app\n"
+            "2024-01-15 10:00:02,000 - app - INFO - ready\n"
+        )
+        return str(log_file)
+
+    def test_redact_json(self, pii_log_file, tmp_path):
+        """Test the copy is written and redactions are counted per category."""
+        output = tmp_path / "pii.redacted.log"
+
+        result = log_analyzer_redact(pii_log_file, str(output), response_format="json")
+
+        data = json.loads(result)
+        assert data["lines_written"] == 3
+        assert data["lines_redacted"] == 2
+        assert data["redactions_by_category"] == {"email": 1, "connection_string": 1}
+        assert "bob@example.com" not in output.read_text()
+        assert output.read_text().endswith("ready\n")
+
+    def test_redact_markdown(self, pii_log_file, tmp_path):
+        """Test markdown output and refusing to overwrite without overwrite=True."""
+        output = tmp_path / "pii.log.gz"
+
+        result = log_analyzer_redact(pii_log_file, str(output))
+
+        assert "Redacted Copy Written" in result
+        assert "(gzip)" in result
+        assert log_analyzer_redact(pii_log_file, str(output)).startswith("Error:")
+        assert "Redacted Copy Written" in log_analyzer_redact(
+            pii_log_file, str(output), overwrite=True
+        )
+
+    def test_redact_errors(self, pii_log_file, tmp_path):
+        """Test missing files and writing over the input are errors."""
+        assert log_analyzer_redact("/nonexistent.log", str(tmp_path / "out.log")).startswith(
+            "Error"
+        )
+        assert log_analyzer_redact(pii_log_file, pii_log_file, overwrite=True).startswith(
+            "Error:"
+        )
+
 
 # =============================================================================
 # Tool: log_analyzer_diff Tests
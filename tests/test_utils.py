@@ -12,6 +12,7 @@ from codesdevs_log_analyzer.utils.file_handler import (
     get_file_info,
     is_gzip_file,
     read_tail,
+    stream_blocks,
     stream_file,
 )
 from codesdevs_log_analyzer.utils.formatters import (
@@ -179,6 +180,18 @@ class TestFileHandler:
         with pytest.raises(FileNotFoundError):
             list(stream_file("/nonexistent/file.log"))
 
+    def test_stream_blocks_matches_stream_file(self, tmp_path: Path) -> None:
+        """Test blocks hold whole lines with the same numbering as stream_file."""
+        log = tmp_path / "blocks.log"
+        log.write_text("".join(f"line {i} " + "x" * (i % 7) + "\n" for i in range(1, 51)))
+
+        lines = [
+            (first + offset, line)
+            for first, block in stream_blocks(str(log), block_size=64, max_lines=40)
+            for offset, line in enumerate(block.split("\n"))
+        ]
+        assert lines == list(stream_file(str(log), max_lines=40))
+
     def test_read_tail(self, temp_log_file: Path) -> None:
         """Test reading last N lines."""
         lines = read_tail(str(temp_log_file), n_lines=2)